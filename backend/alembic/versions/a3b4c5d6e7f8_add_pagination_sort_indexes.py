@@ -0,0 +1,33 @@
+"""Add sort indexes for paginated lists
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-19
+
+Keyset pagination (app/db/pagination.py) of the schedules list and the
+recent chat conversations.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3b4c5d6e7f8'
+down_revision = 'f2a3b4c5d6e7'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_schedules_created_at', 'schedules', ['created_at']),
+    ('ix_chat_conversations_active_updated', 'chat_conversations', ['is_active', 'updated_at']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,31 @@
+"""Add renditions column to audio_messages table
+
+Revision ID: a7b8c9d0e1f2
+Revises: d990b0136bba
+Create Date: 2026-10-19
+
+Extra encodings written in the same FFmpeg run as the primary MP3:
+- opus: OGG/Opus mono voice note for messaging
+- web: low-bitrate MP3 for browser playback
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7b8c9d0e1f2'
+down_revision = 'd990b0136bba'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Example: {"opus": {"filename": "tts_..._juan.opus.ogg", "url": "/storage/audio/...", ...}}
+    op.add_column('audio_messages',
+        sa.Column('renditions', sa.JSON(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('audio_messages', 'renditions')
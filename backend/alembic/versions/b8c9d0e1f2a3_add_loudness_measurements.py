@@ -0,0 +1,37 @@
+"""Add EBU R128 loudness measurements to audio_messages and music_tracks
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-19
+
+Measured once per asset (loudnorm analysis) and reused for normalization:
+- music_tracks: loudness_lufs, true_peak_db (measured on upload)
+- audio_messages: loudness_lufs, true_peak_db of the voice take and the
+  normalization gain that was applied
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8c9d0e1f2a3'
+down_revision = 'a7b8c9d0e1f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('audio_messages', sa.Column('loudness_lufs', sa.Float(), nullable=True))
+    op.add_column('audio_messages', sa.Column('true_peak_db', sa.Float(), nullable=True))
+    op.add_column('audio_messages', sa.Column('loudness_gain_db', sa.Float(), nullable=True))
+    op.add_column('music_tracks', sa.Column('loudness_lufs', sa.Float(), nullable=True))
+    op.add_column('music_tracks', sa.Column('true_peak_db', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('music_tracks', 'true_peak_db')
+    op.drop_column('music_tracks', 'loudness_lufs')
+    op.drop_column('audio_messages', 'loudness_gain_db')
+    op.drop_column('audio_messages', 'true_peak_db')
+    op.drop_column('audio_messages', 'loudness_lufs')
@@ -0,0 +1,40 @@
+"""Add background analysis results to music_tracks
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-19
+
+Filled by the music analysis worker pool after upload:
+- analysis_status: pending / done / failed
+- leading_silence, trailing_silence: seconds
+- loop_start, loop_end: loop segment used by jingle generation
+- peaks: normalized waveform peaks (JSON list)
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9d0e1f2a3b4'
+down_revision = 'b8c9d0e1f2a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('music_tracks', sa.Column('analysis_status', sa.String(length=20), nullable=True))
+    op.add_column('music_tracks', sa.Column('leading_silence', sa.Float(), nullable=True))
+    op.add_column('music_tracks', sa.Column('trailing_silence', sa.Float(), nullable=True))
+    op.add_column('music_tracks', sa.Column('loop_start', sa.Float(), nullable=True))
+    op.add_column('music_tracks', sa.Column('loop_end', sa.Float(), nullable=True))
+    op.add_column('music_tracks', sa.Column('peaks', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('music_tracks', 'peaks')
+    op.drop_column('music_tracks', 'loop_end')
+    op.drop_column('music_tracks', 'loop_start')
+    op.drop_column('music_tracks', 'trailing_silence')
+    op.drop_column('music_tracks', 'leading_silence')
+    op.drop_column('music_tracks', 'analysis_status')
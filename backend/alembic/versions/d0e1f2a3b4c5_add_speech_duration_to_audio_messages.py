@@ -0,0 +1,27 @@
+"""Add speech_duration to audio_messages
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-19
+
+Duration of the trimmed voice take before padding or jingle mixing.
+Used to fit each voice's speaking rate (speech_rate.py).
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd0e1f2a3b4c5'
+down_revision = 'c9d0e1f2a3b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('audio_messages', sa.Column('speech_duration', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('audio_messages', 'speech_duration')
@@ -0,0 +1,72 @@
+"""Add pronunciation_entries table
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-19
+
+Pronunciation lexicon applied to all TTS input (lexicon.py), seeded
+with the brand pronunciations used by vehicle announcements.
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1f2a3b4c5d6'
+down_revision = 'd0e1f2a3b4c5'
+branch_labels = None
+depends_on = None
+
+BRAND_PRONUNCIATIONS = {
+    "Chevrolet": "Chévrolet",
+    "Subaru": "Subarú",
+    "Nissan": "Níssan",
+    "Hyundai": "Hiúndai",
+    "Kia": "Kía",
+    "Mazda": "Mázda",
+    "Suzuki": "Suzúki",
+    "Honda": "Hónda",
+    "Mitsubishi": "Mitsubíshi",
+    "Fiat": "Fíat",
+}
+
+
+def upgrade() -> None:
+    table = op.create_table('pronunciation_entries',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('term', sa.String(length=100), nullable=False),
+    sa.Column('replacement', sa.String(length=200), nullable=False),
+    sa.Column('voice_id', sa.String(length=50), nullable=True),
+    sa.Column('case_sensitive', sa.Boolean(), nullable=False),
+    sa.Column('active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['voice_id'], ['voice_settings.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('term', 'voice_id', name='uq_pronunciation_term_voice')
+    )
+    op.create_index(
+        op.f('ix_pronunciation_entries_voice_id'), 'pronunciation_entries', ['voice_id'], unique=False
+    )
+
+    now = datetime.utcnow()
+    op.bulk_insert(table, [
+        {
+            'term': term,
+            'replacement': replacement,
+            'voice_id': None,
+            'case_sensitive': False,
+            'active': True,
+            'created_at': now,
+            'updated_at': now,
+        }
+        for term, replacement in BRAND_PRONUNCIATIONS.items()
+    ])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_pronunciation_entries_voice_id'), table_name='pronunciation_entries')
+    op.drop_table('pronunciation_entries')
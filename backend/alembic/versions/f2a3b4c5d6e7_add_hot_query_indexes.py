@@ -0,0 +1,39 @@
+"""Add indexes for hot queries
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-19
+
+Indexes for the scheduler worker's due scan, library / cleanup listings,
+chat history and schedule logs. Plans are checked in
+tests/test_query_plans.py.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2a3b4c5d6e7'
+down_revision = 'e1f2a3b4c5d6'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_audio_messages_created_at', 'audio_messages', ['created_at']),
+    ('ix_audio_messages_favorite_created', 'audio_messages', ['is_favorite', 'created_at']),
+    ('ix_audio_messages_category_created', 'audio_messages', ['category_id', 'created_at']),
+    ('ix_audio_messages_voice_id', 'audio_messages', ['voice_id', 'id']),
+    ('ix_schedules_active_next', 'schedules', ['active', 'next_execution_at']),
+    ('ix_schedule_logs_schedule_executed', 'schedule_logs', ['schedule_id', 'executed_at']),
+    ('ix_chat_messages_conversation_created', 'chat_messages', ['conversation_id', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
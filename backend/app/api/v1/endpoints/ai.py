@@ -13,6 +13,7 @@ from app.db.session import get_db
 from app.models.category import Category
 from app.services.ai.claude import claude_service
 from app.services.ai.client_manager import ai_client_manager
+from app.services.tts import speech_rate_model, voice_manager
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +62,7 @@ class GenerateAnnouncementsRequest(BaseModel):
     temperature: float = Field(default=0.8, ge=0, le=1, description="Creativity level")
     mode: str = Field(default="normal", pattern="^(normal|automatic)$", description="Generation mode")
     word_limit: Optional[List[int]] = Field(default=None, description="[min, max] words for automatic mode")
+    voice_id: Optional[str] = Field(default=None, description="Voice whose speaking rate sets the word limits")
     campaign_id: Optional[str] = Field(default=None, description="Campaign ID to load AI instructions from")
 
 
@@ -223,6 +225,17 @@ async def generate_announcements(
                 campaign_instructions = category.ai_instructions
                 logger.info(f"📋 Loaded AI instructions from campaign: {request.campaign_id}")
 
+        # Word limits from the voice's fitted speaking rate
+        word_limit = request.word_limit
+        if word_limit is None and request.voice_id:
+            voice = await voice_manager.get_voice_with_settings(request.voice_id, db)
+            speed = (voice.speed if voice else None) or 1.0
+            word_limit = list(
+                await speech_rate_model.word_limits(
+                    request.voice_id, request.duration, db, speed=speed
+                )
+            )
+
         # Generate suggestions
         suggestions = await claude_service.generate_announcements(
             context=request.context,
@@ -234,7 +247,7 @@ async def generate_announcements(
             client_context=client_context,
             campaign_instructions=campaign_instructions,
             mode=request.mode,
-            word_limit=request.word_limit
+            word_limit=word_limit
         )
 
         logger.info(f"✅ Generated {len(suggestions)} announcements")
@@ -7,15 +7,19 @@ import asyncio
 import json
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 
-from app.db.session import get_db
+from app.db.queries import oldest_temporary_messages_query, temporary_messages_count_query
+from app.db.session import get_db, get_read_db
+from app.api.v1.serializers import AUDIO_LIST_COLUMNS
 from app.schemas.audio import (
     AudioGenerateRequest,
     AudioGenerateResponse,
+    DurationPredictionRequest,
+    DurationPredictionResponse,
     VoiceResponse,
     ErrorResponse,
 )
@@ -28,6 +32,11 @@ from app.services.audio.generator import (
     VoiceInactiveError,
 )
 from app.core.config import settings
+from app.core.response_cache import response_cache, SHORTCUTS, VOICES
+from app.services.storage import audio_storage
+from app.services.audio.renditions import audio_renditions, RENDITION_PROFILES
+from app.services.tts import voice_manager, speech_rate_model
+from app.services.tts.speech_rate import DURATION_TOLERANCE
 
 logger = logging.getLogger(__name__)
 
@@ -49,8 +58,7 @@ async def cleanup_old_temporary_messages(db: AsyncSession) -> int:
     """
     try:
         # Count temporary messages
-        count_query = select(func.count()).where(AudioMessage.is_favorite == False)
-        result = await db.execute(count_query)
+        result = await db.execute(temporary_messages_count_query())
         total_temp = result.scalar() or 0
 
         if total_temp <= MAX_RECENT_MESSAGES:
@@ -70,14 +78,9 @@ async def cleanup_old_temporary_messages(db: AsyncSession) -> int:
         shortcut_audio_ids = {row[0] for row in shortcut_result.fetchall()}
 
         # Get oldest temporary messages to delete (excluding those used by shortcuts)
-        query = (
-            select(AudioMessage)
-            .where(AudioMessage.is_favorite == False)
-            .where(AudioMessage.id.notin_(shortcut_audio_ids) if shortcut_audio_ids else True)
-            .order_by(AudioMessage.created_at.asc())
-            .limit(to_delete_count)
+        result = await db.execute(
+            oldest_temporary_messages_query(to_delete_count, shortcut_audio_ids)
         )
-        result = await db.execute(query)
         messages_to_delete = result.scalars().all()
 
         deleted_count = 0
@@ -89,6 +92,7 @@ async def cleanup_old_temporary_messages(db: AsyncSession) -> int:
                     logger.debug(f"🗑️ Deleted file: {msg.file_path}")
                 except Exception as e:
                     logger.warning(f"⚠️ Failed to delete file {msg.file_path}: {e}")
+            audio_renditions.delete_files(msg.renditions)
 
             # Delete from database
             await db.delete(msg)
@@ -196,6 +200,7 @@ async def generate_audio(
             file_size=audio_message.file_size,
             duration=audio_message.duration,
             status=audio_message.status,
+            renditions=audio_message.renditions,
             voice_id=audio_message.voice_id,
             voice_name=snapshot["voice_name"],
             settings_applied=settings_applied,
@@ -225,20 +230,78 @@ async def generate_audio(
         )
 
 
+@router.post(
+    "/predict-duration",
+    response_model=DurationPredictionResponse,
+    summary="Predict Speech Duration",
+    description="Predict how long a text takes to speak with a voice, before synthesis",
+    responses={404: {"model": ErrorResponse, "description": "Voice not found"}},
+)
+async def predict_duration(
+    request: DurationPredictionRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Predict speech duration from the voice's fitted speaking rate.
+
+    With target_duration, also reports how many characters fit and whether
+    the text fits (within DURATION_TOLERANCE), so the text can be fixed
+    before paying for a synthesis.
+    """
+    try:
+        voice = await voice_manager.get_voice_with_settings(request.voice_id, db)
+
+        if not voice:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Voice '{request.voice_id}' not found",
+            )
+
+        speed = request.speed or voice.speed or 1.0
+        rate = await speech_rate_model.rate_for(voice.id, db)
+        predicted = rate.predict(request.text, speed)
+
+        max_chars = None
+        fits = None
+        if request.target_duration:
+            max_chars = rate.max_chars(request.target_duration, speed)
+            fits = predicted <= request.target_duration * DURATION_TOLERANCE
+
+        return DurationPredictionResponse(
+            voice_id=voice.id,
+            predicted_duration=round(predicted, 2),
+            chars_per_second=rate.chars_per_second,
+            samples=rate.samples,
+            max_chars=max_chars,
+            fits=fits,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Duration prediction failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Duration prediction failed: {str(e)}",
+        )
+
+
 @router.get(
     "/voices",
     response_model=List[VoiceResponse],
     summary="Get Available Voices",
     description="Get all active voices with their settings",
 )
-async def get_voices(db: AsyncSession = Depends(get_db)):
+async def get_voices(request: Request, db: AsyncSession = Depends(get_db)):
     """
     Get all active voices ordered by priority
 
     Returns voice configurations with all settings that will be
-    automatically applied during generation.
+    automatically applied during generation. Served from the response
+    cache until a voice is written; rendered from the primary, since a
+    lagging replica read right after the invalidation would stay cached.
     """
-    try:
+    async def load():
         logger.info("📋 Fetching available voices")
 
         result = await db.execute(
@@ -252,6 +315,9 @@ async def get_voices(db: AsyncSession = Depends(get_db)):
 
         return [VoiceResponse.model_validate(voice) for voice in voices]
 
+    try:
+        return await response_cache.respond(request, VOICES, load)
+
     except Exception as e:
         logger.error(f"❌ Failed to fetch voices: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -268,7 +334,7 @@ async def get_voices(db: AsyncSession = Depends(get_db)):
     responses={404: {"model": ErrorResponse, "description": "Voice not found"}},
 )
 async def get_voice(voice_id: str, db: AsyncSession = Depends(get_db)):
-    """Get detailed information about a specific voice"""
+    """Get detailed information about a specific voice (read after settings edits)"""
     try:
         logger.info(f"🔍 Fetching voice: {voice_id}")
 
@@ -305,7 +371,7 @@ async def get_voice(voice_id: str, db: AsyncSession = Depends(get_db)):
 )
 async def get_recent_messages(
     limit: int = 10,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get recent audio messages (for Dashboard display)
@@ -316,11 +382,11 @@ async def get_recent_messages(
         logger.info(f"📋 Fetching {limit} recent messages")
 
         result = await db.execute(
-            select(AudioMessage)
+            select(*AUDIO_LIST_COLUMNS)
             .order_by(AudioMessage.created_at.desc())
             .limit(limit)
         )
-        messages = result.scalars().all()
+        messages = result.all()
 
         logger.info(f"✅ Retrieved {len(messages)} recent messages")
 
@@ -334,7 +400,7 @@ async def get_recent_messages(
                 "category_id": msg.category_id,
                 "duration": msg.duration,
                 "is_favorite": msg.is_favorite,
-                "created_at": msg.created_at.isoformat(),
+                "created_at": msg.created_at,
                 "audio_url": f"/storage/audio/{msg.filename}",
             }
             for msg in messages
@@ -455,9 +521,12 @@ async def delete_audio_message(
             except Exception as e:
                 logger.warning(f"Failed to delete file {file_path}: {e}")
 
+        audio_renditions.delete_files(audio_message.renditions)
+
         # Delete from database
         await db.delete(audio_message)
         await db.commit()
+        await response_cache.invalidate(SHORTCUTS)
 
         logger.info(f"Audio deleted: {filename}")
 
@@ -527,21 +596,28 @@ async def stream_audio(
     Stream an audio file with optional format conversion.
 
     - Without ?format: serves the original file as-is.
-    - With ?format=ogg: serves OGG/Opus version (converts and caches if needed).
+    - With ?format=ogg: serves the Opus rendition made at generation time,
+      or converts and caches one for older files.
 
     Used by OpenClaw to send WhatsApp-compatible voice notes.
     """
     # Sanitize filename to prevent path traversal
     safe_filename = os.path.basename(filename)
-    source_path = os.path.join(settings.AUDIO_PATH, safe_filename)
+    source_path = audio_storage.resolve(safe_filename)
 
-    if not os.path.isfile(source_path):
+    if not source_path:
         raise HTTPException(status_code=404, detail="Audio file not found")
 
     # No conversion requested — serve original
     if format != "ogg":
         return FileResponse(source_path, media_type="audio/mpeg", filename=safe_filename)
 
+    # Opus rendition encoded at generation time (no conversion needed)
+    rendition_filename = audio_renditions.rendition_filename(safe_filename, RENDITION_PROFILES["opus"])
+    rendition_path = audio_storage.resolve(rendition_filename)
+    if rendition_path:
+        return FileResponse(rendition_path, media_type="audio/ogg", filename=rendition_filename)
+
     # Build cached OGG path
     ogg_filename = os.path.splitext(safe_filename)[0] + ".ogg"
     cached_path = os.path.join(AUDIO_CACHE_DIR, ogg_filename)
@@ -3,11 +3,17 @@ Campaigns API Endpoints
 Campaign Manager module - uses Categories as campaigns
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, func
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
+from app.db.queries import with_child_counts, count_children
+from app.db.pagination import InvalidCursor, keyset_page
+from app.api.v1.serializers import AUDIO_LIST_COLUMNS
+from app.core.responses import FastJSONResponse
+from app.core.response_cache import response_cache, CATEGORIES
 from app.models.category import Category
 from app.models.audio import AudioMessage
 from app.schemas.campaign import (
@@ -15,7 +21,6 @@ from app.schemas.campaign import (
     CampaignCreate,
     CampaignUpdate,
     CampaignListResponse,
-    CampaignAudioResponse,
     CampaignAudiosListResponse
 )
 
@@ -41,27 +46,30 @@ def serialize_campaign(category: Category, audio_count: int) -> CampaignResponse
     )
 
 
-def serialize_audio(audio: AudioMessage) -> CampaignAudioResponse:
-    """Convert AudioMessage model to CampaignAudioResponse"""
-    return CampaignAudioResponse(
-        id=audio.id,
-        filename=audio.filename,
-        display_name=audio.display_name,
-        original_text=audio.original_text,
-        voice_id=audio.voice_id,
-        duration=audio.duration,
-        has_jingle=audio.has_jingle,
-        music_file=audio.music_file,
-        is_favorite=audio.is_favorite,
-        status=audio.status,
-        audio_url=f"/storage/audio/{audio.filename}",
-        created_at=audio.created_at
-    )
+def serialize_audio(audio: AudioMessage) -> dict:
+    """
+    Convert AudioMessage model (or AUDIO_LIST_COLUMNS row) to the
+    CampaignAudioResponse fields, without building the pydantic model.
+    """
+    return {
+        "id": audio.id,
+        "filename": audio.filename,
+        "display_name": audio.display_name,
+        "original_text": audio.original_text,
+        "voice_id": audio.voice_id,
+        "duration": audio.duration,
+        "has_jingle": audio.has_jingle,
+        "music_file": audio.music_file,
+        "is_favorite": audio.is_favorite,
+        "status": audio.status,
+        "audio_url": f"/storage/audio/{audio.filename}",
+        "created_at": audio.created_at,
+    }
 
 
 @router.get("", response_model=CampaignListResponse)
 async def get_campaigns(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     active_only: bool = True
 ):
     """
@@ -76,19 +84,14 @@ async def get_campaigns(
         query = query.filter(Category.active == True)
     query = query.order_by(Category.order.asc())
 
-    result = await db.execute(query)
-    categories = result.scalars().all()
-
-    campaigns = []
-    for cat in categories:
-        # Count audios for this category
-        count_query = select(func.count(AudioMessage.id)).filter(
-            AudioMessage.category_id == cat.id
-        )
-        count_result = await db.execute(count_query)
-        audio_count = count_result.scalar() or 0
-
-        campaigns.append(serialize_campaign(cat, audio_count))
+    # Audio counts for all campaigns in one grouped aggregate
+    result = await db.execute(
+        with_child_counts(query, Category.id, AudioMessage.category_id)
+    )
+    campaigns = [
+        serialize_campaign(cat, audio_count)
+        for cat, audio_count in result.all()
+    ]
 
     logger.info(f"Listed {len(campaigns)} campaigns")
     return CampaignListResponse(campaigns=campaigns, total=len(campaigns))
@@ -97,7 +100,7 @@ async def get_campaigns(
 @router.get("/{campaign_id}", response_model=CampaignResponse)
 async def get_campaign(
     campaign_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get a campaign by ID with its audio count."""
     result = await db.execute(
@@ -112,12 +115,8 @@ async def get_campaign(
         )
 
     # Count audios
-    count_result = await db.execute(
-        select(func.count(AudioMessage.id)).filter(
-            AudioMessage.category_id == campaign_id
-        )
-    )
-    audio_count = count_result.scalar() or 0
+    counts = await count_children(db, AudioMessage.category_id, [campaign_id])
+    audio_count = counts[campaign_id]
 
     return serialize_campaign(category, audio_count)
 
@@ -156,6 +155,7 @@ async def create_campaign(
 
     db.add(category)
     await db.commit()
+    await response_cache.invalidate(CATEGORIES)
     await db.refresh(category)
 
     logger.info(f"Created campaign: {category.id}")
@@ -191,15 +191,12 @@ async def update_campaign(
         setattr(category, field, value)
 
     await db.commit()
+    await response_cache.invalidate(CATEGORIES)
     await db.refresh(category)
 
     # Get audio count
-    count_result = await db.execute(
-        select(func.count(AudioMessage.id)).filter(
-            AudioMessage.category_id == campaign_id
-        )
-    )
-    audio_count = count_result.scalar() or 0
+    counts = await count_children(db, AudioMessage.category_id, [campaign_id])
+    audio_count = counts[campaign_id]
 
     logger.info(f"Updated campaign: {campaign_id}")
     return serialize_campaign(category, audio_count)
@@ -208,11 +205,17 @@ async def update_campaign(
 @router.get("/{campaign_id}/audios", response_model=CampaignAudiosListResponse)
 async def get_campaign_audios(
     campaign_id: str,
-    db: AsyncSession = Depends(get_db),
-    limit: int = 50,
-    offset: int = 0
+    db: AsyncSession = Depends(get_read_db),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    count: str = Query("exact", pattern="^(exact|approximate|none)$"),
 ):
-    """List audios belonging to a specific campaign."""
+    """
+    List audios belonging to a specific campaign, newest first.
+
+    Page with offset, or with cursor (next_cursor of the previous page).
+    """
     # Verify campaign exists
     result = await db.execute(
         select(Category).filter(Category.id == campaign_id)
@@ -224,31 +227,24 @@ async def get_campaign_audios(
         )
 
     # Get audios (exclude deleted)
-    query = (
-        select(AudioMessage)
-        .filter(
-            AudioMessage.category_id == campaign_id,
-            AudioMessage.status != "deleted"
-        )
-        .order_by(AudioMessage.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+    query = select(*AUDIO_LIST_COLUMNS).filter(
+        AudioMessage.category_id == campaign_id,
+        AudioMessage.status != "deleted"
     )
-    result = await db.execute(query)
-    audios = result.scalars().all()
-
-    # Count total (exclude deleted)
-    count_result = await db.execute(
-        select(func.count(AudioMessage.id)).filter(
-            AudioMessage.category_id == campaign_id,
-            AudioMessage.status != "deleted"
+    try:
+        page = await keyset_page(
+            db, query, AudioMessage.created_at, AudioMessage.id,
+            limit=limit, cursor=cursor, offset=offset, scalars=False, count=count,
         )
-    )
-    total = count_result.scalar() or 0
-
-    return CampaignAudiosListResponse(
-        audios=[serialize_audio(a) for a in audios],
-        total=total,
-        limit=limit,
-        offset=offset
-    )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Returned as-is: response_model documents the schema without re-validating
+    return FastJSONResponse({
+        "audios": [serialize_audio(a) for a in page.items],
+        "total": page.total,
+        "total_is_estimate": page.total_is_estimate,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": page.next_cursor,
+    })
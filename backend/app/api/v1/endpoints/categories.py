@@ -4,11 +4,12 @@ Handles category management for library organization - v2.1
 """
 import logging
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.db.session import get_db
+from app.core.response_cache import response_cache, CATEGORIES
 from app.models.category import Category
 
 logger = logging.getLogger(__name__)
@@ -22,14 +23,15 @@ router = APIRouter()
     description="Get all active categories ordered by order field",
 )
 async def get_categories(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get all active categories for library organization.
 
-    Returns categories ordered by the 'order' field.
+    Returns categories ordered by the 'order' field (response-cached).
     """
-    try:
+    async def load():
         logger.info("📂 Fetching categories")
 
         result = await db.execute(
@@ -53,6 +55,9 @@ async def get_categories(
             for cat in categories
         ]
 
+    try:
+        return await response_cache.respond(request, CATEGORIES, load)
+
     except Exception as e:
         logger.error(f"❌ Failed to fetch categories: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -8,13 +8,15 @@ Other endpoints use Depends(get_db) normally (auto-commit at end).
 import json
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.queries import conversation_messages_query
 from app.db.session import get_db, AsyncSessionLocal
+from app.db.pagination import InvalidCursor, keyset_page
 from app.models.chat import ChatConversation, ChatMessage
 from app.services.chat.chat_service import chat_service
 
@@ -36,6 +38,11 @@ class ConversationSummary(BaseModel):
     updated_at: str
 
 
+class ConversationPage(BaseModel):
+    conversations: list[ConversationSummary]
+    next_cursor: Optional[str] = None  # None on the last page
+
+
 class MessageResponse(BaseModel):
     id: int
     role: str
@@ -75,30 +82,46 @@ async def send_message(request: ChatSendRequest):
     )
 
 
-@router.get("/conversations", response_model=list[ConversationSummary])
-async def list_conversations(limit: int = 20, db: AsyncSession = Depends(get_db)):
-    """List recent conversations (uses subquery for message count)."""
+@router.get("/conversations", response_model=ConversationPage)
+async def list_conversations(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    List recent conversations (uses subquery for message count).
+
+    Pass next_cursor of the previous page as cursor to read the next one.
+    """
     msg_count = (
         select(func.count(ChatMessage.id))
         .where(ChatMessage.conversation_id == ChatConversation.id)
         .correlate(ChatConversation)
         .scalar_subquery()
     )
-    result = await db.execute(
-        select(ChatConversation, msg_count.label("message_count"))
-        .filter(ChatConversation.is_active == True)
-        .order_by(ChatConversation.updated_at.desc())
-        .limit(limit)
-    )
-    return [
-        ConversationSummary(
-            id=conv.id, title=conv.title, is_active=conv.is_active,
-            message_count=count,
-            created_at=conv.created_at.isoformat() if conv.created_at else "",
-            updated_at=conv.updated_at.isoformat() if conv.updated_at else "",
+    try:
+        page = await keyset_page(
+            db,
+            select(ChatConversation, msg_count.label("message_count"))
+            .filter(ChatConversation.is_active == True),
+            ChatConversation.updated_at, ChatConversation.id,
+            limit=limit, cursor=cursor, scalars=False,
         )
-        for conv, count in result.all()
-    ]
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ConversationPage(
+        conversations=[
+            ConversationSummary(
+                id=conv.id, title=conv.title, is_active=conv.is_active,
+                message_count=count,
+                created_at=conv.created_at.isoformat() if conv.created_at else "",
+                updated_at=conv.updated_at.isoformat() if conv.updated_at else "",
+            )
+            for conv, count in page.items
+        ],
+        next_cursor=page.next_cursor,
+    )
 
 
 @router.get("/conversations/{conversation_id}")
@@ -112,12 +135,7 @@ async def get_conversation(conversation_id: int, db: AsyncSession = Depends(get_
         raise HTTPException(status_code=404, detail="Conversación no encontrada")
 
     msg_result = await db.execute(
-        select(ChatMessage)
-        .filter(
-            ChatMessage.conversation_id == conversation_id,
-            ChatMessage.role.in_(["user", "assistant"]),
-        )
-        .order_by(ChatMessage.created_at)
+        conversation_messages_query(conversation_id, "user", "assistant")
     )
     messages = msg_result.scalars().all()
 
@@ -2,9 +2,10 @@
 Config API endpoints
 Exposes tenant configuration to frontend
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from pydantic import BaseModel
 from app.core.config import settings
+from app.core.response_cache import response_cache, CONFIG
 
 router = APIRouter()
 
@@ -22,13 +23,18 @@ class TenantConfigResponse(BaseModel):
 
 
 @router.get("/tenant", response_model=TenantConfigResponse)
-async def get_tenant_config():
+async def get_tenant_config(request: Request):
     """
     Get tenant configuration for frontend branding.
 
     Returns tenant-specific settings like name, logo, and colors
-    that the frontend uses to customize the UI.
+    that the frontend uses to customize the UI. The values come from
+    settings, so the cached response is invalidated on every startup.
     """
+    return await response_cache.respond(request, CONFIG, _tenant_config)
+
+
+async def _tenant_config() -> TenantConfigResponse:
     return TenantConfigResponse(
         tenant_id=settings.TENANT_ID,
         tenant_name=settings.TENANT_NAME,
@@ -9,13 +9,18 @@ from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
-from pydub import AudioSegment
-
-from app.db.session import get_db
+from sqlalchemy import select
+
+from app.db.queries import library_messages_query
+from app.db.session import get_db, get_read_db
+from app.db.pagination import InvalidCursor, keyset_page
+from app.api.v1.serializers import AUDIO_LIST_COLUMNS, AUDIO_LIST_FIELDS, serialize_library_message
+from app.core.response_cache import response_cache, SHORTCUTS
+from app.core.responses import FastJSONResponse
 from app.models.audio import AudioMessage
 from app.models.category import Category
-from app.core.config import settings
+from app.services.storage import audio_storage
+from app.services.audio.probe import audio_probe
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +38,11 @@ async def get_library_messages(
     is_favorite: Optional[bool] = Query(None, description="Filter by favorite status"),
     sort_by: str = Query("created_at", description="Sort field"),
     sort_order: str = Query("desc", description="Sort order (asc/desc)"),
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored with cursor)"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    count: str = Query("exact", pattern="^(exact|approximate|none)$", description="Total: exact, approximate or none"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get library messages with filtering and pagination.
@@ -45,90 +52,50 @@ async def get_library_messages(
     - Category filter
     - Favorite filter
     - Sorting by any field
-    - Pagination
+    - Pagination by page number or by cursor (next_cursor, constant cost)
     """
     try:
         logger.info(f"📚 Library request: page={page}, per_page={per_page}, search={search}")
 
         # Build base query - ALWAYS filter by is_favorite=True (only show saved messages)
         # and exclude deleted messages
-        query = select(AudioMessage).filter(
-            AudioMessage.is_favorite == True,
-            AudioMessage.status != "deleted"
+        query = library_messages_query(
+            *AUDIO_LIST_COLUMNS, search=search, category_id=category_id
         )
 
-        # Apply additional filters
-        if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                or_(
-                    AudioMessage.display_name.ilike(search_term),
-                    AudioMessage.original_text.ilike(search_term)
-                )
-            )
-
-        if category_id == "__uncategorized__":
-            query = query.filter(AudioMessage.category_id.is_(None))
-        elif category_id:
-            query = query.filter(AudioMessage.category_id == category_id)
-
         # Note: is_favorite parameter is kept for API compatibility but ignored
         # Library always shows only saved messages (is_favorite=True)
 
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply sorting
-        sort_column = getattr(AudioMessage, sort_by, AudioMessage.created_at)
-        if sort_order.lower() == "desc":
-            query = query.order_by(sort_column.desc())
-        else:
-            query = query.order_by(sort_column.asc())
-
-        # Apply pagination
-        offset = (page - 1) * per_page
-        query = query.offset(offset).limit(per_page)
-
-        # Execute query
-        result = await db.execute(query)
-        messages = result.scalars().all()
+        # Sort by any column (id breaks ties), then page by cursor or page number
+        if sort_by not in AUDIO_LIST_FIELDS:
+            sort_by = "created_at"
+        result = await keyset_page(
+            db, query,
+            getattr(AudioMessage, sort_by), AudioMessage.id,
+            limit=per_page,
+            cursor=cursor,
+            descending=sort_order.lower() == "desc",
+            offset=(page - 1) * per_page,
+            scalars=False,
+            count=count,
+        )
+        messages = result.items
+        total = result.total
 
         logger.info(f"✅ Retrieved {len(messages)} messages (total: {total})")
 
-        return {
-            "messages": [
-                {
-                    "id": msg.id,
-                    "filename": msg.filename,
-                    "display_name": msg.display_name,
-                    "file_path": msg.file_path,
-                    "file_size": msg.file_size,
-                    "duration": msg.duration,
-                    "format": msg.format,
-                    "original_text": msg.original_text,
-                    "voice_id": msg.voice_id,
-                    "category_id": msg.category_id,
-                    "is_favorite": msg.is_favorite,
-                    "volume_adjustment": msg.volume_adjustment,
-                    "has_jingle": msg.has_jingle,
-                    "music_file": msg.music_file,
-                    "status": msg.status,
-                    "sent_to_player": msg.sent_to_player,
-                    "priority": msg.priority,
-                    "created_at": msg.created_at.isoformat() if msg.created_at else None,
-                    "updated_at": msg.updated_at.isoformat() if msg.updated_at else None,
-                    "audio_url": f"/storage/audio/{msg.filename}",
-                }
-                for msg in messages
-            ],
+        return FastJSONResponse({
+            "messages": [serialize_library_message(msg) for msg in messages],
             "total": total,
+            "total_is_estimate": result.total_is_estimate,
             "page": page,
             "per_page": per_page,
-            "total_pages": (total + per_page - 1) // per_page if total > 0 else 1,
-        }
+            "total_pages": None if total is None else max(1, (total + per_page - 1) // per_page),
+            "next_cursor": result.next_cursor,
+        })
 
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"❌ Failed to fetch library: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -144,7 +111,7 @@ async def get_library_messages(
 )
 async def get_message(
     message_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get a single audio message by ID"""
     try:
@@ -159,28 +126,7 @@ async def get_message(
                 detail=f"Message {message_id} not found",
             )
 
-        return {
-            "id": msg.id,
-            "filename": msg.filename,
-            "display_name": msg.display_name,
-            "file_path": msg.file_path,
-            "file_size": msg.file_size,
-            "duration": msg.duration,
-            "format": msg.format,
-            "original_text": msg.original_text,
-            "voice_id": msg.voice_id,
-            "category_id": msg.category_id,
-            "is_favorite": msg.is_favorite,
-            "volume_adjustment": msg.volume_adjustment,
-            "has_jingle": msg.has_jingle,
-            "music_file": msg.music_file,
-            "status": msg.status,
-            "sent_to_player": msg.sent_to_player,
-            "priority": msg.priority,
-            "created_at": msg.created_at.isoformat() if msg.created_at else None,
-            "updated_at": msg.updated_at.isoformat() if msg.updated_at else None,
-            "audio_url": f"/storage/audio/{msg.filename}",
-        }
+        return serialize_library_message(msg)
 
     except HTTPException:
         raise
@@ -223,32 +169,12 @@ async def update_message(
 
         await db.commit()
         await db.refresh(msg)
+        await response_cache.invalidate(SHORTCUTS)
 
         logger.info(f"✅ Updated message {message_id}")
 
         # Return complete message object (same structure as GET)
-        return {
-            "id": msg.id,
-            "filename": msg.filename,
-            "display_name": msg.display_name,
-            "file_path": msg.file_path,
-            "file_size": msg.file_size,
-            "duration": msg.duration,
-            "format": msg.format,
-            "original_text": msg.original_text,
-            "voice_id": msg.voice_id,
-            "category_id": msg.category_id,
-            "is_favorite": msg.is_favorite,
-            "volume_adjustment": msg.volume_adjustment,
-            "has_jingle": msg.has_jingle,
-            "music_file": msg.music_file,
-            "status": msg.status,
-            "sent_to_player": msg.sent_to_player,
-            "priority": msg.priority,
-            "created_at": msg.created_at.isoformat() if msg.created_at else None,
-            "updated_at": msg.updated_at.isoformat() if msg.updated_at else None,
-            "audio_url": f"/storage/audio/{msg.filename}",
-        }
+        return serialize_library_message(msg)
 
     except HTTPException:
         raise
@@ -286,6 +212,7 @@ async def delete_message(
         # Soft delete by setting status
         msg.status = "deleted"
         await db.commit()
+        await response_cache.invalidate(SHORTCUTS)
 
         logger.info(f"✅ Deleted message {message_id}")
 
@@ -328,6 +255,7 @@ async def batch_delete_messages(
             deleted_count += 1
 
         await db.commit()
+        await response_cache.invalidate(SHORTCUTS)
 
         logger.info(f"✅ Batch deleted {deleted_count} messages")
 
@@ -414,24 +342,19 @@ async def upload_audio(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         unique_id = str(uuid.uuid4())[:8]
         filename = f"upload_{timestamp}_{unique_id}.{ext}"
-        file_path = os.path.join(settings.AUDIO_PATH, filename)
-
-        # Ensure directory exists
-        os.makedirs(settings.AUDIO_PATH, exist_ok=True)
 
-        # Save file
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        # Save file (atomic, sharded)
+        file_path = audio_storage.write_bytes(filename, file_content)
 
         logger.info(f"💾 File saved: {filename}")
 
-        # Extract audio metadata using pydub
-        try:
-            audio_segment = AudioSegment.from_file(file_path)
-            duration = len(audio_segment) / 1000.0  # milliseconds to seconds
-        except Exception as e:
-            # If pydub fails, still save but without duration
-            logger.warning(f"⚠️ Could not extract audio metadata: {e}")
+        # Extract audio metadata with ffprobe (headers only, no decode)
+        metadata = await audio_probe.probe(file_path)
+        if metadata:
+            duration = metadata.duration
+        else:
+            # If probing fails, still save but without duration
+            logger.warning(f"⚠️ Could not extract audio metadata: {filename}")
             duration = None
 
         # Determine display name
@@ -462,21 +385,7 @@ async def upload_audio(
 
         return {
             "success": True,
-            "data": {
-                "id": audio_message.id,
-                "filename": audio_message.filename,
-                "display_name": audio_message.display_name,
-                "file_size": audio_message.file_size,
-                "duration": audio_message.duration,
-                "format": audio_message.format,
-                "original_text": audio_message.original_text,
-                "voice_id": audio_message.voice_id,
-                "category_id": audio_message.category_id,
-                "is_favorite": audio_message.is_favorite,
-                "status": audio_message.status,
-                "created_at": audio_message.created_at.isoformat() if audio_message.created_at else None,
-                "audio_url": f"/storage/audio/{audio_message.filename}",
-            }
+            "data": serialize_library_message(audio_message),
         }
 
     except HTTPException:
@@ -535,9 +444,9 @@ async def send_to_radio(
                 detail="Cannot send deleted message to radio",
             )
 
-        # Build the file path
-        file_path = os.path.join(settings.AUDIO_PATH, msg.filename)
-        if not os.path.exists(file_path):
+        # Locate the file (sharded or legacy flat layout)
+        file_path = audio_storage.resolve(msg.filename)
+        if not file_path:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Audio file not found: {msg.filename}",
@@ -574,7 +483,7 @@ async def send_to_radio(
                 "filename": msg.filename,
                 "display_name": msg.display_name,
                 "sent_to_player": msg.sent_to_player,
-                "delivered_at": msg.delivered_at.isoformat() if msg.delivered_at else None,
+                "delivered_at": msg.delivered_at,
                 "azuracast": azuracast_result,
             }
         }
@@ -11,7 +11,6 @@ from sqlalchemy import select
 from pydub import AudioSegment
 
 from app.db.session import get_db
-from app.models.voice_settings import VoiceSettings
 from app.models.audio import AudioMessage
 from app.models.message_template import MessageTemplate
 from app.schemas.operations import (
@@ -26,6 +25,10 @@ from app.schemas.operations import (
 )
 from app.services.tts import voice_manager
 from app.services.audio import jingle_service
+from app.services.audio.probe import audio_probe
+from app.services.storage import audio_storage
+from app.services.text import compile_template, template_cache
+from app.services.text.template_store import template_store
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -157,13 +160,10 @@ async def preview_text(
     template_text = None
     use_announcement_sound = False
 
-    result_db = await db.execute(
-        select(MessageTemplate).filter(MessageTemplate.id == request.template)
-    )
-    db_template = result_db.scalar_one_or_none()
+    db_template = await template_store.load(request.template, db)
 
     if db_template:
-        template_text = db_template.template_text
+        compiled = template_cache.get(db_template)
         use_announcement_sound = db_template.use_announcement_sound
     else:
         # Fallback to hardcoded templates
@@ -175,10 +175,10 @@ async def preview_text(
         if not template_text:
             # Use default template
             template_text = DEFAULT_TEMPLATES[0]["template_text"]
+        compiled = compile_template(template_text)
 
     # Replace variables in template
-    text = template_text.replace("{nombre}", request.nombre)
-    text = text.replace("{ubicacion}", request.ubicacion)
+    text = compiled.render({"nombre": request.nombre, "ubicacion": request.ubicacion})
 
     return EmployeeCallPreviewResponse(
         original=text,
@@ -217,10 +217,7 @@ async def generate_call_announcement(
         )
 
         # Get voice configuration
-        result = await db.execute(
-            select(VoiceSettings).filter(VoiceSettings.id == request.voice_id)
-        )
-        voice = result.scalar_one_or_none()
+        voice = await voice_manager.get_voice_with_settings(request.voice_id, db)
 
         if not voice:
             logger.warning(f"Voice not found: {request.voice_id}")
@@ -240,13 +237,10 @@ async def generate_call_announcement(
         template_text = None
         use_announcement_sound = False
 
-        result_template = await db.execute(
-            select(MessageTemplate).filter(MessageTemplate.id == request.template)
-        )
-        db_template = result_template.scalar_one_or_none()
+        db_template = await template_store.load(request.template, db)
 
         if db_template:
-            template_text = db_template.template_text
+            compiled = template_cache.get(db_template)
             use_announcement_sound = db_template.use_announcement_sound
             logger.info(f"Using database template: {db_template.id}")
         else:
@@ -258,6 +252,9 @@ async def generate_call_announcement(
 
             if not template_text:
                 template_text = DEFAULT_TEMPLATES[0]["template_text"]
+            compiled = compile_template(template_text)
+        template_text = compiled.source
+        variables = {"nombre": request.nombre, "ubicacion": request.ubicacion}
 
         # Allow request to override template's announcement sound setting
         if request.use_announcement_sound is not None:
@@ -269,41 +266,54 @@ async def generate_call_announcement(
             text = request.custom_text
             logger.info(f"Using custom text: {text[:100]}...")
         else:
-            text = template_text.replace("{nombre}", request.nombre)
-            text = text.replace("{ubicacion}", request.ubicacion)
+            text = compiled.render(variables)
             logger.info(f"Generated text: {text[:100]}...")
 
-        # Generate TTS audio
-        audio_bytes, voice_used, _ = await voice_manager.generate_with_voice(
-            text=text,
-            voice_id=request.voice_id,
-            db=db,
+        # Segmented synthesis only applies to template-generated text
+        use_segmented = (
+            request.segmented if request.segmented is not None
+            else settings.TTS_SEGMENTED_SYNTHESIS
         )
 
+        # Generate TTS audio
+        if use_segmented and not request.custom_text:
+            audio_bytes, voice_used, _ = await voice_manager.generate_segmented(
+                template_text=template_text,
+                variables=variables,
+                voice_id=request.voice_id,
+                db=db,
+            )
+        else:
+            audio_bytes, voice_used, _ = await voice_manager.generate_with_voice(
+                text=text,
+                voice_id=request.voice_id,
+                db=db,
+            )
+
         # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        generated_at = datetime.now()
         name_clean = request.nombre.replace(" ", "_").lower()[:20]
-        filename = f"call_{timestamp}_{name_clean}_{voice.id}.mp3"
-        file_path = os.path.join(settings.AUDIO_PATH, filename)
-
-        # Ensure directory exists
-        os.makedirs(settings.AUDIO_PATH, exist_ok=True)
+        filename = audio_storage.new_filename(
+            "call", name_clean, voice.id, now=generated_at
+        )
 
-        # Save audio file
-        with open(file_path, "wb") as f:
-            f.write(audio_bytes)
+        # Save audio file (atomic, sharded)
+        file_path = audio_storage.write_bytes(filename, audio_bytes)
 
         logger.info(f"TTS audio saved: {filename}")
 
-        # Get audio metadata
-        audio = AudioSegment.from_file(file_path)
-        duration = len(audio) / 1000.0
+        # Get audio metadata (header probe, no decode)
+        metadata = await audio_probe.probe(file_path)
+        if metadata:
+            duration = metadata.duration
+        else:
+            duration = len(AudioSegment.from_file(file_path)) / 1000.0
         file_size = os.path.getsize(file_path)
 
         # Apply volume adjustment if configured
         if voice.volume_adjustment != 0:
             logger.info(f"Applying volume adjustment: {voice.volume_adjustment} dB")
-            adjusted_audio = audio + voice.volume_adjustment
+            adjusted_audio = AudioSegment.from_file(file_path) + voice.volume_adjustment
             adjusted_audio.export(file_path, format="mp3", bitrate="192k")
             file_size = os.path.getsize(file_path)
 
@@ -312,8 +322,10 @@ async def generate_call_announcement(
         if use_announcement_sound:
             logger.info("Adding announcement sounds (intro + outro)")
 
-            announcement_filename = f"call_ann_{timestamp}_{name_clean}_{voice.id}.mp3"
-            announcement_path = os.path.join(settings.AUDIO_PATH, announcement_filename)
+            announcement_filename = audio_storage.new_filename(
+                "call_ann", name_clean, voice.id, now=generated_at
+            )
+            announcement_path = audio_storage.reserve_path(announcement_filename)
 
             announcement_result = await jingle_service.add_announcement_sounds(
                 voice_audio_path=file_path,
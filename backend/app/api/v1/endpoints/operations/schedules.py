@@ -11,7 +11,6 @@ from sqlalchemy import select
 from pydub import AudioSegment
 
 from app.db.session import get_db
-from app.models.voice_settings import VoiceSettings
 from app.models.audio import AudioMessage
 from app.models.message_template import MessageTemplate
 from app.schemas.operations import (
@@ -26,7 +25,10 @@ from app.schemas.operations import (
 )
 from app.services.tts import voice_manager
 from app.services.audio import jingle_service
-from app.core.config import settings
+from app.services.audio.probe import audio_probe
+from app.services.storage import audio_storage
+from app.services.text import compile_template, template_cache
+from app.services.text.template_store import template_store
 
 logger = logging.getLogger(__name__)
 
@@ -119,16 +121,10 @@ async def get_announcement_text(
     use_announcement_sound = False
 
     # Try to load from database
-    result = await db.execute(
-        select(MessageTemplate).filter(
-            MessageTemplate.id == template_id,
-            MessageTemplate.active == True
-        )
-    )
-    db_template = result.scalar_one_or_none()
+    db_template = await template_store.load(template_id, db, active_only=True)
 
     if db_template:
-        template_text = db_template.template_text
+        compiled = template_cache.get(db_template)
         use_announcement_sound = db_template.use_announcement_sound
         logger.info(f"Using database template: {template_id} (announcement_sound={use_announcement_sound})")
     else:
@@ -140,18 +136,15 @@ async def get_announcement_text(
             template_text = SCHEDULE_TEMPLATES.get(fallback_id, "")
             template_id = fallback_id
         logger.info(f"Using hardcoded template: {template_id}")
+        compiled = compile_template(template_text)
 
-    if not template_text:
+    if not compiled.source:
         raise ValueError(f"No template found for {schedule_type}/{variant}")
 
-    # Replace minutes placeholder if present
-    if "{minutes}" in template_text:
-        if minutes:
-            template_text = template_text.replace("{minutes}", str(minutes))
-        else:
-            template_text = template_text.replace("{minutes}", "15")  # Default
+    # Fill minutes placeholder if present (15 by default)
+    text = compiled.render({"minutes": str(minutes or 15)})
 
-    return template_text, template_id, use_announcement_sound
+    return text, template_id, use_announcement_sound
 
 
 # ============================================
@@ -246,10 +239,7 @@ async def generate_schedule_announcement(
         )
 
         # Get voice configuration
-        result = await db.execute(
-            select(VoiceSettings).filter(VoiceSettings.id == request.voice_id)
-        )
-        voice = result.scalar_one_or_none()
+        voice = await voice_manager.get_voice_with_settings(request.voice_id, db)
 
         if not voice:
             logger.warning(f"Voice not found: {request.voice_id}")
@@ -301,29 +291,29 @@ async def generate_schedule_announcement(
         )
 
         # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        generated_at = datetime.now()
         type_short = "open" if request.schedule_type == ScheduleType.OPENING else "close"
-        filename = f"schedule_{type_short}_{timestamp}_{voice.id}.mp3"
-        file_path = os.path.join(settings.AUDIO_PATH, filename)
-
-        # Ensure directory exists
-        os.makedirs(settings.AUDIO_PATH, exist_ok=True)
+        filename = audio_storage.new_filename(
+            f"schedule_{type_short}", voice.id, now=generated_at
+        )
 
-        # Save audio file
-        with open(file_path, "wb") as f:
-            f.write(audio_bytes)
+        # Save audio file (atomic, sharded)
+        file_path = audio_storage.write_bytes(filename, audio_bytes)
 
         logger.info(f"TTS audio saved: {filename}")
 
-        # Get audio metadata
-        audio = AudioSegment.from_file(file_path)
-        duration = len(audio) / 1000.0
+        # Get audio metadata (header probe, no decode)
+        metadata = await audio_probe.probe(file_path)
+        if metadata:
+            duration = metadata.duration
+        else:
+            duration = len(AudioSegment.from_file(file_path)) / 1000.0
         file_size = os.path.getsize(file_path)
 
         # Apply volume adjustment if configured
         if voice.volume_adjustment != 0:
             logger.info(f"Applying volume adjustment: {voice.volume_adjustment} dB")
-            adjusted_audio = audio + voice.volume_adjustment
+            adjusted_audio = AudioSegment.from_file(file_path) + voice.volume_adjustment
             adjusted_audio.export(file_path, format="mp3", bitrate="192k")
             file_size = os.path.getsize(file_path)
 
@@ -333,8 +323,10 @@ async def generate_schedule_announcement(
         if use_announcement_sound:
             logger.info("Adding announcement sounds (intro + outro)")
 
-            announcement_filename = f"schedule_ann_{type_short}_{timestamp}_{voice.id}.mp3"
-            announcement_path = os.path.join(settings.AUDIO_PATH, announcement_filename)
+            announcement_filename = audio_storage.new_filename(
+                f"schedule_ann_{type_short}", voice.id, now=generated_at
+            )
+            announcement_path = audio_storage.reserve_path(announcement_filename)
 
             announcement_result = await jingle_service.add_announcement_sounds(
                 voice_audio_path=file_path,
@@ -356,8 +348,10 @@ async def generate_schedule_announcement(
         elif request.music_file:
             logger.info(f"Creating jingle with music: {request.music_file}")
 
-            jingle_filename = f"schedule_jingle_{type_short}_{timestamp}_{voice.id}.mp3"
-            jingle_path = os.path.join(settings.AUDIO_PATH, jingle_filename)
+            jingle_filename = audio_storage.new_filename(
+                f"schedule_jingle_{type_short}", voice.id, now=generated_at
+            )
+            jingle_path = audio_storage.reserve_path(jingle_filename)
 
             voice_jingle_settings = voice.jingle_settings if voice.jingle_settings else None
 
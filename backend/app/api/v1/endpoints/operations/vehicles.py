@@ -11,7 +11,6 @@ from sqlalchemy import select
 from pydub import AudioSegment
 
 from app.db.session import get_db
-from app.models.voice_settings import VoiceSettings
 from app.models.audio import AudioMessage
 from app.models.message_template import MessageTemplate
 from app.schemas.operations import (
@@ -30,8 +29,12 @@ from app.schemas.operations import (
     AnnouncementComponents,
 )
 from app.services.text import text_normalizer
+from app.services.text.lexicon import pronunciation_lexicon
+from app.services.text.template_store import template_store
 from app.services.tts import voice_manager
 from app.services.audio import jingle_service
+from app.services.audio.probe import audio_probe
+from app.services.storage import audio_storage
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -212,10 +215,7 @@ async def preview_text(
     # Try to load template from database
     custom_template_text = None
     use_announcement_sound = False
-    result_db = await db.execute(
-        select(MessageTemplate).filter(MessageTemplate.id == request.template)
-    )
-    db_template = result_db.scalar_one_or_none()
+    db_template = await template_store.load(request.template, db)
     if db_template:
         custom_template_text = db_template.template_text
         use_announcement_sound = db_template.use_announcement_sound
@@ -226,7 +226,8 @@ async def preview_text(
         patente=request.patente,
         template=request.template,
         number_mode=request.number_mode.value,
-        custom_template_text=custom_template_text
+        custom_template_text=custom_template_text,
+        lexicon=await pronunciation_lexicon.matcher_for(None, db),
     )
 
     return TextPreviewResponse(
@@ -266,10 +267,7 @@ async def generate_vehicle_announcement(
         )
 
         # Get voice configuration
-        result = await db.execute(
-            select(VoiceSettings).filter(VoiceSettings.id == request.voice_id)
-        )
-        voice = result.scalar_one_or_none()
+        voice = await voice_manager.get_voice_with_settings(request.voice_id, db)
 
         if not voice:
             logger.warning(f"Voice not found: {request.voice_id}")
@@ -288,10 +286,7 @@ async def generate_vehicle_announcement(
         # Try to load template from database
         custom_template_text = None
         use_announcement_sound = False
-        result_template = await db.execute(
-            select(MessageTemplate).filter(MessageTemplate.id == request.template)
-        )
-        db_template = result_template.scalar_one_or_none()
+        db_template = await template_store.load(request.template, db)
         if db_template:
             custom_template_text = db_template.template_text
             use_announcement_sound = db_template.use_announcement_sound
@@ -314,26 +309,12 @@ async def generate_vehicle_announcement(
                 number_mode=request.number_mode.value
             )
 
-            # Build possible plate formats to search for in the text
-            # The user sees the plate in readable format, we need to replace it
-            clean_plate = request.patente.upper().replace(" ", "").replace("-", "").replace(",", "")
-            plate_variants = [
-                request.patente.upper(),  # As provided: "JK,KJ32"
-                clean_plate,  # No separators: "JKKJ32"
-                f"{clean_plate[:2]}.{clean_plate[2:4]}.{clean_plate[4:]}",  # Dotted: "JK.KJ.32"
-                f"{clean_plate[:2]}-{clean_plate[2:4]}-{clean_plate[4:]}",  # Dashed: "JK-KJ-32"
-                f"{clean_plate[:2]} {clean_plate[2:4]} {clean_plate[4:]}",  # Spaced: "JK KJ 32"
-                f"{clean_plate[:4]}-{clean_plate[4:]}",  # Standard new format: "JKKJ-32"
-                f"{clean_plate[:4]} {clean_plate[4:]}",  # Standard with space: "JKKJ 32"
-            ]
-
             # Replace the plate in the text with the normalized version
-            normalized_text = original_text
-            for variant in plate_variants:
-                if variant in normalized_text:
-                    normalized_text = normalized_text.replace(variant, patente_normalized)
-                    logger.info(f"Replaced plate '{variant}' with normalized version")
-                    break
+            # The user sees the plate in readable format ("JK-KJ-32", "JK.KJ.32",
+            # "JKKJ 32"...); any separators between its characters match
+            normalized_text = text_normalizer.replace_plate(
+                original_text, request.patente, patente_normalized
+            )
 
             logger.info(f"Using custom text with normalized plate: {normalized_text[:100]}...")
         else:
@@ -344,7 +325,8 @@ async def generate_vehicle_announcement(
                 patente=request.patente,
                 template=request.template,
                 number_mode=request.number_mode.value,
-                custom_template_text=custom_template_text
+                custom_template_text=custom_template_text,
+                lexicon=await pronunciation_lexicon.matcher_for(request.voice_id, db),
             )
 
             original_text = normalized_result["original"]
@@ -353,37 +335,51 @@ async def generate_vehicle_announcement(
 
             logger.info(f"Normalized text: {normalized_text[:100]}...")
 
-        # Generate TTS audio with the normalized text
-        audio_bytes, voice_used, _ = await voice_manager.generate_with_voice(
-            text=normalized_text,
-            voice_id=request.voice_id,
-            db=db,
+        # Segmented synthesis only applies to template-generated text
+        use_segmented = (
+            request.segmented if request.segmented is not None
+            else settings.TTS_SEGMENTED_SYNTHESIS
         )
 
+        # Generate TTS audio with the normalized text
+        if use_segmented and not request.custom_text:
+            audio_bytes, voice_used, _ = await voice_manager.generate_segmented(
+                template_text=normalized_result["template_text"],
+                variables=normalized_result["tts_variables"],
+                voice_id=request.voice_id,
+                db=db,
+            )
+        else:
+            audio_bytes, voice_used, _ = await voice_manager.generate_with_voice(
+                text=normalized_text,
+                voice_id=request.voice_id,
+                db=db,
+            )
+
         # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        generated_at = datetime.now()
         plate_clean = request.patente.replace("-", "").replace(" ", "").upper()
-        filename = f"vehicle_{timestamp}_{plate_clean}_{voice.id}.mp3"
-        file_path = os.path.join(settings.AUDIO_PATH, filename)
-
-        # Ensure directory exists
-        os.makedirs(settings.AUDIO_PATH, exist_ok=True)
+        filename = audio_storage.new_filename(
+            "vehicle", plate_clean, voice.id, now=generated_at
+        )
 
-        # Save audio file
-        with open(file_path, "wb") as f:
-            f.write(audio_bytes)
+        # Save audio file (atomic, sharded)
+        file_path = audio_storage.write_bytes(filename, audio_bytes)
 
         logger.info(f"TTS audio saved: {filename}")
 
-        # Get audio metadata
-        audio = AudioSegment.from_file(file_path)
-        duration = len(audio) / 1000.0
+        # Get audio metadata (header probe, no decode)
+        metadata = await audio_probe.probe(file_path)
+        if metadata:
+            duration = metadata.duration
+        else:
+            duration = len(AudioSegment.from_file(file_path)) / 1000.0
         file_size = os.path.getsize(file_path)
 
         # Apply volume adjustment if configured
         if voice.volume_adjustment != 0:
             logger.info(f"Applying volume adjustment: {voice.volume_adjustment} dB")
-            adjusted_audio = audio + voice.volume_adjustment
+            adjusted_audio = AudioSegment.from_file(file_path) + voice.volume_adjustment
             adjusted_audio.export(file_path, format="mp3", bitrate="192k")
             file_size = os.path.getsize(file_path)
 
@@ -393,8 +389,10 @@ async def generate_vehicle_announcement(
         if use_announcement_sound:
             logger.info("Adding announcement sounds (intro + outro)")
 
-            announcement_filename = f"vehicle_ann_{timestamp}_{plate_clean}_{voice.id}.mp3"
-            announcement_path = os.path.join(settings.AUDIO_PATH, announcement_filename)
+            announcement_filename = audio_storage.new_filename(
+                "vehicle_ann", plate_clean, voice.id, now=generated_at
+            )
+            announcement_path = audio_storage.reserve_path(announcement_filename)
 
             announcement_result = await jingle_service.add_announcement_sounds(
                 voice_audio_path=file_path,
@@ -416,8 +414,10 @@ async def generate_vehicle_announcement(
         elif request.music_file:
             logger.info(f"Creating jingle with music: {request.music_file}")
 
-            jingle_filename = f"vehicle_jingle_{timestamp}_{plate_clean}_{voice.id}.mp3"
-            jingle_path = os.path.join(settings.AUDIO_PATH, jingle_filename)
+            jingle_filename = audio_storage.new_filename(
+                "vehicle_jingle", plate_clean, voice.id, now=generated_at
+            )
+            jingle_path = audio_storage.reserve_path(jingle_filename)
 
             voice_jingle_settings = voice.jingle_settings if voice.jingle_settings else None
 
@@ -11,7 +11,9 @@ from sqlalchemy import select, and_, delete
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel, Field
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
+from app.db.pagination import InvalidCursor, keyset_page
+from app.core.responses import FastJSONResponse
 from app.models.schedule import Schedule, ScheduleLog
 from app.models.audio import AudioMessage
 from app.services.scheduler.calculator import calculate_next_execution
@@ -97,8 +99,33 @@ class ScheduleResponse(BaseModel):
         from_attributes = True
 
 
-def schedule_to_dict(schedule: Schedule) -> dict:
-    """Convert Schedule model to response dictionary"""
+# Columns of the schedules list: the schedule plus the audio's name only
+SCHEDULE_LIST_COLUMNS = (
+    Schedule.id,
+    Schedule.audio_message_id,
+    Schedule.schedule_type,
+    Schedule.interval_minutes,
+    Schedule.specific_times,
+    Schedule.days_of_week,
+    Schedule.start_date,
+    Schedule.end_date,
+    Schedule.active,
+    Schedule.priority,
+    Schedule.last_executed_at,
+    Schedule.next_execution_at,
+    Schedule.created_at,
+    Schedule.updated_at,
+    AudioMessage.display_name.label("audio_display_name"),
+    AudioMessage.filename.label("audio_filename"),
+)
+
+
+def schedule_fields(schedule) -> dict:
+    """
+    Schedule fields of a response (Schedule model or SCHEDULE_LIST_COLUMNS row).
+
+    Datetimes are left to the response class to encode.
+    """
     return {
         "id": schedule.id,
         "audio_message_id": schedule.audio_message_id,
@@ -106,14 +133,21 @@ def schedule_to_dict(schedule: Schedule) -> dict:
         "interval_minutes": schedule.interval_minutes,
         "specific_times": schedule.specific_times,
         "days_of_week": schedule.days_of_week,
-        "start_date": schedule.start_date.isoformat() if schedule.start_date else None,
-        "end_date": schedule.end_date.isoformat() if schedule.end_date else None,
+        "start_date": schedule.start_date,
+        "end_date": schedule.end_date,
         "active": schedule.active,
         "priority": schedule.priority,
-        "last_executed_at": schedule.last_executed_at.isoformat() if schedule.last_executed_at else None,
-        "next_execution_at": schedule.next_execution_at.isoformat() if schedule.next_execution_at else None,
-        "created_at": schedule.created_at.isoformat() if schedule.created_at else None,
-        "updated_at": schedule.updated_at.isoformat() if schedule.updated_at else None,
+        "last_executed_at": schedule.last_executed_at,
+        "next_execution_at": schedule.next_execution_at,
+        "created_at": schedule.created_at,
+        "updated_at": schedule.updated_at,
+    }
+
+
+def schedule_to_dict(schedule: Schedule) -> dict:
+    """Convert Schedule model to response dictionary"""
+    return {
+        **schedule_fields(schedule),
         "audio_message": {
             "display_name": schedule.audio_message.display_name,
             "filename": schedule.audio_message.filename,
@@ -121,6 +155,17 @@ def schedule_to_dict(schedule: Schedule) -> dict:
     }
 
 
+def schedule_row_to_dict(row) -> dict:
+    """Convert a SCHEDULE_LIST_COLUMNS row to response dictionary"""
+    return {
+        **schedule_fields(row),
+        "audio_message": {
+            "display_name": row.audio_display_name,
+            "filename": row.audio_filename,
+        } if row.audio_filename is not None else None,
+    }
+
+
 def parse_date(date_str: str, required: bool = False) -> Optional[datetime]:
     """Parse date string to datetime, handling various formats"""
     if not date_str or not date_str.strip():
@@ -287,21 +332,29 @@ async def list_schedules(
     audio_message_id: Optional[int] = Query(None, description="Filter by audio message ID"),
     active: Optional[bool] = Query(None, description="Filter by active status"),
     schedule_type: Optional[str] = Query(None, description="Filter by schedule type"),
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(200, ge=1, le=500, description="Schedules per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    count: str = Query("exact", pattern="^(exact|approximate|none)$", description="Total: exact, approximate or none"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
-    List all schedules with optional filters.
+    List schedules with optional filters, newest first, one page at a time.
 
     Can filter by:
     - audio_message_id: Get schedules for a specific audio
     - active: Get only active or inactive schedules
     - schedule_type: Filter by type (interval, specific, once)
+
+    Follow next_cursor until it is null to read every schedule.
     """
     try:
         logger.info(f"📋 List schedules: audio_id={audio_message_id}, active={active}")
 
         # Build query
-        query = select(Schedule).options(selectinload(Schedule.audio_message))
+        query = (
+            select(*SCHEDULE_LIST_COLUMNS)
+            .outerjoin(AudioMessage, AudioMessage.id == Schedule.audio_message_id)
+        )
 
         # Apply filters
         if audio_message_id is not None:
@@ -313,20 +366,25 @@ async def list_schedules(
         if schedule_type is not None:
             query = query.filter(Schedule.schedule_type == schedule_type)
 
-        # Order by created_at desc
-        query = query.order_by(Schedule.created_at.desc())
-
-        result = await db.execute(query)
-        schedules = result.scalars().all()
+        # Newest first
+        result = await keyset_page(
+            db, query, Schedule.created_at, Schedule.id,
+            limit=limit, cursor=cursor, scalars=False, count=count,
+        )
+        schedules = result.items
 
         logger.info(f"✅ Retrieved {len(schedules)} schedules")
 
-        return {
+        return FastJSONResponse({
             "success": True,
-            "data": [schedule_to_dict(s) for s in schedules],
-            "total": len(schedules),
-        }
-
+            "data": [schedule_row_to_dict(s) for s in schedules],
+            "total": result.total,
+            "total_is_estimate": result.total_is_estimate,
+            "next_cursor": result.next_cursor,
+        })
+
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"❌ Failed to list schedules: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -342,7 +400,7 @@ async def list_schedules(
 )
 async def get_schedule(
     schedule_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get a single schedule by ID"""
     try:
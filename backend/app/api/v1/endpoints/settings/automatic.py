@@ -16,6 +16,9 @@ from app.models.voice_settings import VoiceSettings
 from app.models.music_track import MusicTrack
 from app.models.audio import AudioMessage
 from app.core.config import settings
+from app.services.tts import voice_manager, speech_rate_model
+from app.services.tts.speech_rate import DEFAULT_RATE, DURATION_TOLERANCE, trim_to_duration
+from app.services.storage import audio_storage
 from app.schemas.automatic import (
     AutomaticGenerateRequest,
     AutomaticGenerateResponse,
@@ -26,15 +29,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Word limits configuration (based on target duration)
-WORD_LIMITS = {
-    5: {"min": 5, "max": 8},
-    10: {"min": 10, "max": 15},
-    15: {"min": 15, "max": 20},
-    20: {"min": 20, "max": 30},
-    25: {"min": 30, "max": 40},
-}
-
 AVAILABLE_DURATIONS = [5, 10, 15, 20, 25]
 
 
@@ -65,11 +59,17 @@ async def get_automatic_config(
         )
         default_music = result.scalar_one_or_none()
 
+        # Word limits from the default voice's fitted speaking rate
+        rate, speed = DEFAULT_RATE, 1.0
+        if default_voice:
+            rate = await speech_rate_model.rate_for(default_voice.id, db)
+            speed = default_voice.speed or 1.0
+
         return AutomaticConfigResponse(
             default_voice_id=default_voice.id if default_voice else None,
             default_music=default_music.filename if default_music else None,
             available_durations=AVAILABLE_DURATIONS,
-            word_limits=WORD_LIMITS,
+            word_limits=rate.word_limit_table(AVAILABLE_DURATIONS, speed),
         )
 
     except Exception as e:
@@ -100,10 +100,7 @@ async def generate_automatic_jingle(
         logger.info(f"🎙️ Starting automatic generation: voice={request.voice_id}, duration={request.target_duration}s")
 
         # 1. Get voice settings
-        result = await db.execute(
-            select(VoiceSettings).filter(VoiceSettings.id == request.voice_id)
-        )
-        voice = result.scalar_one_or_none()
+        voice = await voice_manager.get_voice_with_settings(request.voice_id, db)
 
         if not voice:
             raise HTTPException(
@@ -125,9 +122,10 @@ async def generate_automatic_jingle(
             logger.info("🤖 Improving text with Claude AI...")
             from app.services.ai.claude import claude_service
 
-            # Get word limits for target duration
-            word_limit = WORD_LIMITS.get(request.target_duration, {"min": 20, "max": 30})
-            min_words, max_words = word_limit["min"], word_limit["max"]
+            # Word limits from this voice's fitted speaking rate
+            rate = await speech_rate_model.rate_for(voice.id, db)
+            speed = voice.speed or 1.0
+            min_words, max_words = rate.word_limits(request.target_duration, speed)
 
             try:
                 improved_text = await claude_service.improve_text(
@@ -135,9 +133,17 @@ async def generate_automatic_jingle(
                     max_words=max_words,
                 )
 
+                # Drop trailing sentences that would overrun the target before paying for TTS
+                improved_text = trim_to_duration(
+                    improved_text, request.target_duration * DURATION_TOLERANCE, rate, speed
+                )
+
                 # Validate word count
                 word_count = len(improved_text.split())
-                logger.info(f"✅ Text improved: {word_count} words (target: {min_words}-{max_words})")
+                logger.info(
+                    f"✅ Text improved: {word_count} words, ~{rate.predict(improved_text, speed):.1f}s "
+                    f"(target: {min_words}-{max_words} words, {request.target_duration}s)"
+                )
 
             except Exception as ai_error:
                 logger.warning(f"⚠️ AI improvement failed, using original text: {ai_error}")
@@ -145,7 +151,7 @@ async def generate_automatic_jingle(
 
         # 3. Generate TTS with ElevenLabs
         logger.info("🔊 Generating TTS audio...")
-        from app.services.tts.elevenlabs import elevenlabs_service
+        from app.services.tts.take_cache import voice_take_cache
 
         voice_settings = {
             "style": voice.style,
@@ -154,9 +160,10 @@ async def generate_automatic_jingle(
             "use_speaker_boost": voice.use_speaker_boost,
         }
 
-        tts_audio = await elevenlabs_service.generate_speech(
-            text=improved_text,
-            voice_id=voice.elevenlabs_id,
+        # Same text/voice/settings reuse the previous take (e.g. "try another bed")
+        tts_audio = await voice_take_cache.get_or_generate(
+            text=await voice_manager.prepare_text(improved_text, voice.id, db),
+            elevenlabs_id=voice.elevenlabs_id,
             voice_settings=voice_settings,
         )
 
@@ -170,7 +177,7 @@ async def generate_automatic_jingle(
         with open(temp_voice_path, "wb") as f:
             f.write(tts_audio)
 
-        output_path = os.path.join(settings.AUDIO_PATH, filename)
+        output_path = audio_storage.reserve_path(filename)
         final_duration = None
 
         # 6. Mix with music if provided
@@ -194,6 +201,8 @@ async def generate_automatic_jingle(
                 music_filename=request.music_file,
                 output_path=output_path,
                 config=jingle_config,
+                use_cache=True,
+                backend=request.mix_backend,
             )
 
             if not jingle_result['success']:
@@ -209,7 +218,7 @@ async def generate_automatic_jingle(
         # Get final duration if not set
         if final_duration is None:
             from app.services.audio.jingle import jingle_service
-            final_duration = jingle_service._get_audio_duration(output_path)
+            final_duration = await jingle_service.get_audio_duration(output_path)
 
         # Clean up temp file
         if os.path.exists(temp_voice_path):
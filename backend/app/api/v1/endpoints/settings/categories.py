@@ -6,9 +6,11 @@ import logging
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, func
 
 from app.db.session import get_db
+from app.db.queries import with_child_counts, count_children
+from app.core.response_cache import response_cache, CATEGORIES
 from app.models.category import Category
 from app.models.audio import AudioMessage
 from app.schemas.category import (
@@ -41,19 +43,14 @@ async def get_all_categories_settings(
         if not include_inactive:
             query = query.filter(Category.active == True)
 
-        result = await db.execute(query)
-        categories = result.scalars().all()
+        # Message counts come from one grouped aggregate
+        result = await db.execute(
+            with_child_counts(query, Category.id, AudioMessage.category_id)
+        )
+        rows = result.all()
 
-        # Get message counts for each category
         response_list = []
-        for cat in categories:
-            # Count messages in this category
-            count_result = await db.execute(
-                select(AudioMessage)
-                .filter(AudioMessage.category_id == cat.id)
-            )
-            message_count = len(count_result.scalars().all())
-
+        for cat, message_count in rows:
             response_list.append(
                 CategoryResponse(
                     id=cat.id,
@@ -68,7 +65,7 @@ async def get_all_categories_settings(
                 )
             )
 
-        logger.info(f"✅ Retrieved {len(categories)} categories")
+        logger.info(f"✅ Retrieved {len(rows)} categories")
         return response_list
 
     except Exception as e:
@@ -102,11 +99,8 @@ async def get_category_settings(
             )
 
         # Get message count
-        count_result = await db.execute(
-            select(AudioMessage)
-            .filter(AudioMessage.category_id == cat.id)
-        )
-        message_count = len(count_result.scalars().all())
+        counts = await count_children(db, AudioMessage.category_id, [cat.id])
+        message_count = counts[cat.id]
 
         return CategoryResponse(
             id=cat.id,
@@ -158,9 +152,9 @@ async def create_category(
         # Get next order number if not provided
         order = category_data.order
         if order is None:
-            result = await db.execute(select(Category))
-            all_categories = result.scalars().all()
-            order = max([c.order for c in all_categories], default=-1) + 1
+            result = await db.execute(select(func.max(Category.order)))
+            max_order = result.scalar()
+            order = (max_order if max_order is not None else -1) + 1
 
         # Create category
         category = Category(
@@ -174,6 +168,7 @@ async def create_category(
 
         db.add(category)
         await db.commit()
+        await response_cache.invalidate(CATEGORIES)
         await db.refresh(category)
 
         logger.info(f"✅ Category created: {category.id}")
@@ -232,14 +227,12 @@ async def update_category(
             setattr(category, field, value)
 
         await db.commit()
+        await response_cache.invalidate(CATEGORIES)
         await db.refresh(category)
 
         # Get message count
-        count_result = await db.execute(
-            select(AudioMessage)
-            .filter(AudioMessage.category_id == category.id)
-        )
-        message_count = len(count_result.scalars().all())
+        counts = await count_children(db, AudioMessage.category_id, [category.id])
+        message_count = counts[category.id]
 
         logger.info(f"✅ Category updated: {category.id}")
 
@@ -292,11 +285,8 @@ async def delete_category(
             )
 
         # Check if category has messages
-        count_result = await db.execute(
-            select(AudioMessage)
-            .filter(AudioMessage.category_id == category_id)
-        )
-        message_count = len(count_result.scalars().all())
+        counts = await count_children(db, AudioMessage.category_id, [category_id])
+        message_count = counts[category_id]
 
         if message_count > 0 and not force:
             raise HTTPException(
@@ -316,6 +306,7 @@ async def delete_category(
         # Delete category
         await db.delete(category)
         await db.commit()
+        await response_cache.invalidate(CATEGORIES)
 
         logger.info(f"✅ Category deleted: {category_id}")
 
@@ -351,6 +342,7 @@ async def reorder_categories(
             )
 
         await db.commit()
+        await response_cache.invalidate(CATEGORIES)
 
         logger.info("✅ Categories reordered")
 
@@ -6,13 +6,14 @@ import os
 import logging
 import shutil
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Request, status, UploadFile, File, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 
 from app.db.session import get_db
 from app.models.music_track import MusicTrack
 from app.core.config import settings
+from app.core.response_cache import response_cache, MUSIC
 from app.schemas.music import (
     MusicTrackResponse,
     MusicTrackUpdate,
@@ -20,6 +21,7 @@ from app.schemas.music import (
 )
 from app.api.v1.serializers import serialize_music_track
 from app.services.audio.utils import get_audio_metadata
+from app.services.audio.music_analysis import music_analyzer
 
 logger = logging.getLogger(__name__)
 
@@ -33,11 +35,12 @@ router = APIRouter()
     description="Get all music tracks for jingle generation",
 )
 async def get_all_music(
+    request: Request,
     active_only: bool = False,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get all music tracks ordered by order field"""
-    try:
+    """Get all music tracks ordered by order field (response-cached)"""
+    async def load():
         logger.info("🎵 Fetching all music tracks")
 
         query = select(MusicTrack).order_by(MusicTrack.order.asc())
@@ -51,6 +54,9 @@ async def get_all_music(
 
         return [serialize_music_track(t) for t in tracks]
 
+    try:
+        return await response_cache.respond(request, MUSIC, load)
+
     except Exception as e:
         logger.error(f"❌ Failed to fetch music: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -148,8 +154,8 @@ async def upload_music(
 
         logger.info(f"💾 File saved: {file_path}")
 
-        # Get audio metadata
-        metadata = get_audio_metadata(file_path)
+        # Container metadata only; decoding analysis runs in the background
+        metadata = await get_audio_metadata(file_path)
 
         # Get next order number
         result = await db.execute(select(MusicTrack))
@@ -169,6 +175,7 @@ async def upload_music(
             duration=metadata.get("duration"),
             bitrate=metadata.get("bitrate"),
             sample_rate=metadata.get("sample_rate"),
+            analysis_status="pending",
             format=file_ext[1:],
             is_default=False,
             active=True,
@@ -180,8 +187,12 @@ async def upload_music(
 
         db.add(track)
         await db.commit()
+        await response_cache.invalidate(MUSIC)
         await db.refresh(track)
 
+        # Loudness, silence, loop points and peaks (stored when done)
+        music_analyzer.schedule(track.id)
+
         logger.info(f"✅ Music track created: {track.display_name} (ID={track.id})")
 
         return serialize_music_track(track)
@@ -199,6 +210,49 @@ async def upload_music(
         )
 
 
+@router.post(
+    "/music/{track_id}/analyze",
+    response_model=MusicTrackResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Analyze Music Track",
+    description="Queue loudness, silence, loop point and peak analysis for a track",
+)
+async def analyze_music_track(
+    track_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """(Re)run the background analysis of a music track"""
+    try:
+        result = await db.execute(
+            select(MusicTrack).filter(MusicTrack.id == track_id)
+        )
+        track = result.scalar_one_or_none()
+
+        if not track:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Music track with ID {track_id} not found",
+            )
+
+        track.analysis_status = "pending"
+        await db.commit()
+        await response_cache.invalidate(MUSIC)
+
+        music_analyzer.schedule(track.id)
+        logger.info(f"🔬 Music analysis queued: {track.display_name}")
+
+        return serialize_music_track(track)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Failed to queue analysis: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to queue analysis: {str(e)}",
+        )
+
+
 @router.patch(
     "/music/{track_id}",
     response_model=MusicTrackResponse,
@@ -230,6 +284,7 @@ async def update_music_track(
             setattr(track, field, value)
 
         await db.commit()
+        await response_cache.invalidate(MUSIC)
         await db.refresh(track)
 
         logger.info(f"✅ Music track updated: {track.display_name}")
@@ -279,6 +334,7 @@ async def delete_music_track(
         # Delete database record
         await db.delete(track)
         await db.commit()
+        await response_cache.invalidate(MUSIC)
 
         logger.info(f"✅ Music track deleted: {track.display_name}")
 
@@ -324,6 +380,7 @@ async def set_default_music(
         # Set new default
         track.is_default = True
         await db.commit()
+        await response_cache.invalidate(MUSIC)
 
         logger.info(f"✅ Default music set: {track.display_name}")
 
@@ -359,6 +416,7 @@ async def reorder_music(
             )
 
         await db.commit()
+        await response_cache.invalidate(MUSIC)
 
         logger.info("✅ Music tracks reordered")
 
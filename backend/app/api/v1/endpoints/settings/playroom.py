@@ -3,11 +3,15 @@ Automatic Playroom API Endpoints
 Experimental clone of Automatic Mode for UI testing - 100% independent
 """
 import os
+import json
+import time
 import uuid
 import shutil
+import asyncio
 import logging
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -16,28 +20,30 @@ from app.models.voice_settings import VoiceSettings
 from app.models.music_track import MusicTrack
 from app.models.audio import AudioMessage
 from app.core.config import settings
+from app.services.tts import voice_manager, speech_rate_model
+from app.services.tts.speech_rate import DEFAULT_RATE, DURATION_TOLERANCE, trim_to_duration
+from app.services.storage import audio_storage
 from app.schemas.automatic import (
     AutomaticGenerateRequest,
     AutomaticGenerateResponse,
     AutomaticConfigResponse,
+    PlayroomPreviewRequest,
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Word limits configuration (based on target duration)
-# Average speaking rate: ~2.5 words/second (150 words/minute)
-WORD_LIMITS = {
-    5: {"min": 10, "max": 15},
-    10: {"min": 20, "max": 30},
-    15: {"min": 35, "max": 45},
-    20: {"min": 45, "max": 55},
-    25: {"min": 55, "max": 70},
-}
-
 AVAILABLE_DURATIONS = [5, 10, 15, 20, 25]
 
+# Bed previews are copied out of the (evictable) mix cache into
+# STORAGE_PATH/previews and kept this long for the client to fetch them
+PREVIEW_DIR = "previews"
+PREVIEW_TTL_SECONDS = 3600
+
+# Preview mixes running at once in this worker, across all requests
+_preview_slots = asyncio.Semaphore(max(1, settings.JINGLE_PREVIEW_CONCURRENCY))
+
 
 @router.get(
     "/playroom/config",
@@ -66,11 +72,17 @@ async def get_playroom_config(
         )
         default_music = result.scalar_one_or_none()
 
+        # Word limits from the default voice's fitted speaking rate
+        rate, speed = DEFAULT_RATE, 1.0
+        if default_voice:
+            rate = await speech_rate_model.rate_for(default_voice.id, db)
+            speed = default_voice.speed or 1.0
+
         return AutomaticConfigResponse(
             default_voice_id=default_voice.id if default_voice else None,
             default_music=default_music.filename if default_music else None,
             available_durations=AVAILABLE_DURATIONS,
-            word_limits=WORD_LIMITS,
+            word_limits=rate.word_limit_table(AVAILABLE_DURATIONS, speed),
         )
 
     except Exception as e:
@@ -101,10 +113,7 @@ async def generate_playroom_jingle(
         logger.info(f"🎙️ [PLAYROOM] Starting generation: voice={request.voice_id}, duration={request.target_duration}s")
 
         # 1. Get voice settings
-        result = await db.execute(
-            select(VoiceSettings).filter(VoiceSettings.id == request.voice_id)
-        )
-        voice = result.scalar_one_or_none()
+        voice = await voice_manager.get_voice_with_settings(request.voice_id, db)
 
         if not voice:
             raise HTTPException(
@@ -126,9 +135,10 @@ async def generate_playroom_jingle(
             logger.info("🤖 [PLAYROOM] Improving text with Claude AI...")
             from app.services.ai.claude import claude_service
 
-            # Get word limits for target duration
-            word_limit = WORD_LIMITS.get(request.target_duration, {"min": 20, "max": 30})
-            min_words, max_words = word_limit["min"], word_limit["max"]
+            # Word limits from this voice's fitted speaking rate
+            rate = await speech_rate_model.rate_for(voice.id, db)
+            speed = voice.speed or 1.0
+            min_words, max_words = rate.word_limits(request.target_duration, speed)
 
             try:
                 improved_text = await claude_service.improve_text(
@@ -136,9 +146,17 @@ async def generate_playroom_jingle(
                     max_words=max_words,
                 )
 
+                # Drop trailing sentences that would overrun the target before paying for TTS
+                improved_text = trim_to_duration(
+                    improved_text, request.target_duration * DURATION_TOLERANCE, rate, speed
+                )
+
                 # Validate word count
                 word_count = len(improved_text.split())
-                logger.info(f"✅ [PLAYROOM] Text improved: {word_count} words (target: {min_words}-{max_words})")
+                logger.info(
+                    f"✅ [PLAYROOM] Text improved: {word_count} words, ~{rate.predict(improved_text, speed):.1f}s "
+                    f"(target: {min_words}-{max_words} words, {request.target_duration}s)"
+                )
 
             except Exception as ai_error:
                 logger.warning(f"⚠️ [PLAYROOM] AI improvement failed, using original text: {ai_error}")
@@ -146,7 +164,7 @@ async def generate_playroom_jingle(
 
         # 3. Generate TTS with ElevenLabs
         logger.info("🔊 [PLAYROOM] Generating TTS audio...")
-        from app.services.tts.elevenlabs import elevenlabs_service
+        from app.services.tts.take_cache import voice_take_cache
 
         voice_settings = {
             "style": voice.style,
@@ -155,9 +173,10 @@ async def generate_playroom_jingle(
             "use_speaker_boost": voice.use_speaker_boost,
         }
 
-        tts_audio = await elevenlabs_service.generate_speech(
-            text=improved_text,
-            voice_id=voice.elevenlabs_id,
+        # Same text/voice/settings reuse the previous take (e.g. "try another bed")
+        tts_audio = await voice_take_cache.get_or_generate(
+            text=await voice_manager.prepare_text(improved_text, voice.id, db),
+            elevenlabs_id=voice.elevenlabs_id,
             voice_settings=voice_settings,
         )
 
@@ -171,7 +190,7 @@ async def generate_playroom_jingle(
         with open(temp_voice_path, "wb") as f:
             f.write(tts_audio)
 
-        output_path = os.path.join(settings.AUDIO_PATH, filename)
+        output_path = audio_storage.reserve_path(filename)
         final_duration = None
 
         # 6. Mix with music if provided
@@ -195,6 +214,8 @@ async def generate_playroom_jingle(
                 music_filename=request.music_file,
                 output_path=output_path,
                 config=jingle_config,
+                use_cache=True,
+                backend=request.mix_backend,
             )
 
             if not jingle_result['success']:
@@ -210,7 +231,7 @@ async def generate_playroom_jingle(
         # Get final duration if not set
         if final_duration is None:
             from app.services.audio.jingle import jingle_service
-            final_duration = jingle_service._get_audio_duration(output_path)
+            final_duration = await jingle_service.get_audio_duration(output_path)
 
         # Clean up temp file
         if os.path.exists(temp_voice_path):
@@ -277,3 +298,160 @@ async def generate_playroom_jingle(
             error=str(e),
             audio_id=None,
         )
+
+
+def _sweep_previews(preview_dir: str) -> None:
+    """Delete bed previews older than PREVIEW_TTL_SECONDS"""
+    cutoff = time.time() - PREVIEW_TTL_SECONDS
+    try:
+        entries = list(os.scandir(preview_dir))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _sse_event(event_type: str, data: dict) -> str:
+    payload = json.dumps({"type": event_type, **data}, ensure_ascii=False, default=str)
+    return f"event: {event_type}\ndata: {payload}\n\n"
+
+
+@router.post(
+    "/playroom/preview",
+    summary="Preview Music Beds (SSE stream)",
+    description="Voice the text once and render it over several music beds in parallel",
+)
+async def preview_playroom_beds(
+    request: PlayroomPreviewRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    SSE stream: voice_ready, preview_ready / preview_error (one per music
+    file, in completion order), done.
+
+    The TTS take is generated (or reused) once; each bed is mixed by its own
+    FFmpeg process, up to JINGLE_PREVIEW_CONCURRENCY at a time per worker.
+    Mixes are reused from the jingle mix cache; previews are served from
+    STORAGE_PATH/previews for PREVIEW_TTL_SECONDS and are not saved to the
+    library.
+    """
+    voice = await voice_manager.get_voice_with_settings(request.voice_id, db)
+
+    if not voice:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Voice '{request.voice_id}' not found",
+        )
+
+    if not voice.active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Voice '{voice.name}' is not active",
+        )
+
+    # Resolved before streaming: the request session is not used by the generator
+    tts_text = await voice_manager.prepare_text(request.text.strip(), voice.id, db)
+
+    music_files = list(dict.fromkeys(request.music_files))
+    logger.info(f"🎚️ [PLAYROOM] Previewing {len(music_files)} beds: voice={request.voice_id}")
+
+    async def event_generator():
+        from app.services.tts.take_cache import voice_take_cache
+        from app.services.audio.jingle import jingle_service, JingleConfig
+
+        unique_id = uuid.uuid4().hex[:8]
+        temp_voice_path = os.path.join(settings.TEMP_PATH, f"voice_{unique_id}.mp3")
+        preview_dir = os.path.join(settings.STORAGE_PATH, PREVIEW_DIR)
+
+        async def render(index: int, music_file: str) -> dict:
+            filename = f"preview_{unique_id}_{index}.mp3"
+            output_path = os.path.join(preview_dir, filename)
+            async with _preview_slots:
+                result = await jingle_service.create_jingle(
+                    voice_audio_path=temp_voice_path,
+                    music_filename=music_file,
+                    output_path=output_path,
+                    config=JingleConfig(),
+                    voice_jingle_settings=voice.jingle_settings,
+                    use_cache=True,
+                    preview=request.preview,
+                    backend=request.mix_backend,
+                )
+            if result.get("success") and os.path.exists(output_path):
+                result["audio_url"] = f"/storage/{PREVIEW_DIR}/{filename}"
+            elif os.path.exists(output_path):
+                os.remove(output_path)
+            result["music_file"] = music_file
+            return result
+
+        try:
+            voice_settings = {
+                "style": voice.style,
+                "stability": voice.stability,
+                "similarity_boost": voice.similarity_boost,
+                "use_speaker_boost": voice.use_speaker_boost,
+            }
+            tts_audio = await voice_take_cache.get_or_generate(
+                text=tts_text,
+                elevenlabs_id=voice.elevenlabs_id,
+                voice_settings=voice_settings,
+            )
+
+            os.makedirs(settings.TEMP_PATH, exist_ok=True)
+            os.makedirs(preview_dir, exist_ok=True)
+            await asyncio.to_thread(_sweep_previews, preview_dir)
+            with open(temp_voice_path, "wb") as f:
+                f.write(tts_audio)
+
+            voice_duration = await jingle_service.get_audio_duration(temp_voice_path)
+            yield _sse_event("voice_ready", {
+                "voice_used": voice.name,
+                "voice_duration": voice_duration,
+                "count": len(music_files),
+            })
+
+            tasks = [
+                asyncio.create_task(render(index, music_file))
+                for index, music_file in enumerate(music_files)
+            ]
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    result = await finished
+                    if result.get("audio_url"):
+                        yield _sse_event("preview_ready", {
+                            "music_file": result["music_file"],
+                            "audio_url": result["audio_url"],
+                            "duration": result.get("duration"),
+                            "cached": result.get("cached", False),
+                        })
+                    else:
+                        yield _sse_event("preview_error", {
+                            "music_file": result["music_file"],
+                            "error": result.get("error") or "Preview not available",
+                        })
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            yield _sse_event("done", {})
+
+        except Exception as e:
+            logger.error(f"❌ [PLAYROOM] Preview failed: {str(e)}", exc_info=True)
+            yield _sse_event("error", {"message": str(e)})
+        finally:
+            if os.path.exists(temp_voice_path):
+                os.remove(temp_voice_path)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
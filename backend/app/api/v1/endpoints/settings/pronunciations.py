@@ -0,0 +1,224 @@
+"""
+Pronunciation Lexicon Settings API Endpoints
+Manage the pronunciation fixes applied to every TTS input
+"""
+import logging
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+
+from app.db.session import get_db
+from app.models.pronunciation import PronunciationEntry
+from app.models.voice_settings import VoiceSettings
+from app.schemas.pronunciation import (
+    PronunciationEntryCreate,
+    PronunciationEntryUpdate,
+    PronunciationEntryResponse,
+    PronunciationPreviewRequest,
+    PronunciationPreviewResponse,
+)
+from app.services.text.lexicon import pronunciation_lexicon
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+async def _check_unique(
+    db: AsyncSession, term: str, voice_id: Optional[str], exclude_id: Optional[int] = None
+) -> None:
+    """Reject a second entry for the same term and scope (case-insensitive)"""
+    query = select(PronunciationEntry.id).filter(
+        func.lower(PronunciationEntry.term) == term.lower(),
+        PronunciationEntry.voice_id == voice_id if voice_id else PronunciationEntry.voice_id.is_(None),
+    )
+    if exclude_id is not None:
+        query = query.filter(PronunciationEntry.id != exclude_id)
+    if (await db.execute(query)).first():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Pronunciation for '{term}' already exists ({voice_id or 'all voices'})",
+        )
+
+
+async def _check_voice(db: AsyncSession, voice_id: Optional[str]) -> None:
+    if voice_id and not await db.get(VoiceSettings, voice_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Voice '{voice_id}' not found",
+        )
+
+
+@router.get(
+    "/pronunciations",
+    response_model=List[PronunciationEntryResponse],
+    summary="Get Pronunciation Entries",
+    description="List lexicon entries, optionally only those of one voice (plus global ones)",
+)
+async def get_pronunciations(
+    voice_id: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """List pronunciation entries"""
+    try:
+        query = select(PronunciationEntry).order_by(PronunciationEntry.term.asc())
+        if voice_id:
+            query = query.filter(
+                (PronunciationEntry.voice_id == voice_id) | PronunciationEntry.voice_id.is_(None)
+            )
+
+        result = await db.execute(query)
+        entries = result.scalars().all()
+
+        logger.info(f"🔤 Retrieved {len(entries)} pronunciation entries")
+        return entries
+
+    except Exception as e:
+        logger.error(f"❌ Failed to fetch pronunciations: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch pronunciations: {str(e)}",
+        )
+
+
+@router.post(
+    "/pronunciations",
+    response_model=PronunciationEntryResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create Pronunciation Entry",
+)
+async def create_pronunciation(
+    entry_data: PronunciationEntryCreate,
+    db: AsyncSession = Depends(get_db),
+):
+    """Create a pronunciation entry"""
+    try:
+        logger.info(f"➕ Creating pronunciation: {entry_data.term}")
+
+        await _check_voice(db, entry_data.voice_id)
+        await _check_unique(db, entry_data.term, entry_data.voice_id)
+
+        entry = PronunciationEntry(**entry_data.model_dump())
+        db.add(entry)
+        await db.commit()
+        await db.refresh(entry)
+        pronunciation_lexicon.invalidate()
+
+        logger.info(f"✅ Pronunciation created: {entry.term} -> {entry.replacement}")
+        return entry
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Failed to create pronunciation: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create pronunciation: {str(e)}",
+        )
+
+
+@router.patch(
+    "/pronunciations/{entry_id}",
+    response_model=PronunciationEntryResponse,
+    summary="Update Pronunciation Entry",
+)
+async def update_pronunciation(
+    entry_id: int,
+    entry_data: PronunciationEntryUpdate,
+    db: AsyncSession = Depends(get_db),
+):
+    """Update a pronunciation entry"""
+    try:
+        entry = await db.get(PronunciationEntry, entry_id)
+        if not entry:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Pronunciation entry {entry_id} not found",
+            )
+
+        update_data = entry_data.model_dump(exclude_unset=True)
+        if "term" in update_data or "voice_id" in update_data:
+            voice_id = update_data.get("voice_id", entry.voice_id)
+            await _check_voice(db, voice_id)
+            await _check_unique(db, update_data.get("term", entry.term), voice_id, exclude_id=entry.id)
+
+        for field, value in update_data.items():
+            setattr(entry, field, value)
+
+        await db.commit()
+        await db.refresh(entry)
+        pronunciation_lexicon.invalidate()
+
+        logger.info(f"✅ Pronunciation updated: {entry.term} -> {entry.replacement}")
+        return entry
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Failed to update pronunciation: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to update pronunciation: {str(e)}",
+        )
+
+
+@router.delete(
+    "/pronunciations/{entry_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete Pronunciation Entry",
+)
+async def delete_pronunciation(
+    entry_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """Delete a pronunciation entry"""
+    try:
+        entry = await db.get(PronunciationEntry, entry_id)
+        if not entry:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Pronunciation entry {entry_id} not found",
+            )
+
+        await db.delete(entry)
+        await db.commit()
+        pronunciation_lexicon.invalidate()
+
+        logger.info(f"🗑️ Pronunciation deleted: {entry_id}")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Failed to delete pronunciation: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to delete pronunciation: {str(e)}",
+        )
+
+
+@router.post(
+    "/pronunciations/preview",
+    response_model=PronunciationPreviewResponse,
+    summary="Preview Pronunciation Lexicon",
+    description="Show a text as it would be sent to TTS",
+)
+async def preview_pronunciation(
+    request: PronunciationPreviewRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """Apply the lexicon to a text without generating audio"""
+    try:
+        matcher = await pronunciation_lexicon.matcher_for(request.voice_id, db)
+        return PronunciationPreviewResponse(
+            text=request.text,
+            tts_text=matcher.rewrite(request.text),
+            lexicon_version=pronunciation_lexicon.version,
+        )
+
+    except Exception as e:
+        logger.error(f"❌ Failed to preview pronunciation: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to preview pronunciation: {str(e)}",
+        )
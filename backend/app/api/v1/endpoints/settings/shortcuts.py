@@ -10,6 +10,7 @@ from sqlalchemy import select, and_, func
 from sqlalchemy.orm import selectinload
 
 from app.db.session import get_db
+from app.core.response_cache import response_cache, SHORTCUTS
 from app.models.shortcut import Shortcut
 from app.models.audio import AudioMessage
 from app.schemas.shortcut import (
@@ -191,6 +192,7 @@ async def create_shortcut(
 
         db.add(shortcut)
         await db.commit()
+        await response_cache.invalidate(SHORTCUTS)
 
         # Reload with audio_message relationship
         result = await db.execute(
@@ -251,6 +253,7 @@ async def update_shortcut(
             setattr(shortcut, field, value)
 
         await db.commit()
+        await response_cache.invalidate(SHORTCUTS)
 
         # Reload with audio_message relationship
         result = await db.execute(
@@ -306,6 +309,7 @@ async def update_shortcut_position(
 
         shortcut.position = position_data.position
         await db.commit()
+        await response_cache.invalidate(SHORTCUTS)
 
         # Reload with audio_message relationship
         result = await db.execute(
@@ -357,6 +361,7 @@ async def delete_shortcut(
 
         await db.delete(shortcut)
         await db.commit()
+        await response_cache.invalidate(SHORTCUTS)
 
         logger.info(f"✅ Shortcut deleted: {shortcut_id}")
 
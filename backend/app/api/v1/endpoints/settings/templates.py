@@ -3,13 +3,13 @@ Message Template Settings API Endpoints
 Handles template management for the Template Manager - v2.1 Playground
 """
 import logging
-import re
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 
 from app.db.session import get_db
+from app.core.response_cache import response_cache, TEMPLATES
 from app.models.message_template import MessageTemplate
 from app.schemas.templates import (
     TemplateCreate,
@@ -19,6 +19,8 @@ from app.schemas.templates import (
     TemplatePreviewRequest,
     TemplatePreviewResponse,
 )
+from app.services.text import CompiledTemplate, compile_template, template_cache
+from app.services.text.templates import HINTS
 
 logger = logging.getLogger(__name__)
 
@@ -51,12 +53,13 @@ def serialize_template(template: MessageTemplate) -> dict:
     description="Get all message templates (optionally filtered by module)",
 )
 async def get_all_templates(
+    request: Request,
     module: Optional[str] = Query(None, description="Filter by module"),
     include_inactive: bool = Query(True, description="Include inactive templates"),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get all templates for settings management"""
-    try:
+    """Get all templates for settings management (response-cached)"""
+    async def load():
         logger.info(f"📝 Fetching templates (module={module}, include_inactive={include_inactive})")
 
         query = select(MessageTemplate).order_by(
@@ -76,6 +79,9 @@ async def get_all_templates(
         logger.info(f"✅ Retrieved {len(templates)} templates")
         return [serialize_template(t) for t in templates]
 
+    try:
+        return await response_cache.respond(request, TEMPLATES, load)
+
     except Exception as e:
         logger.error(f"❌ Failed to fetch templates: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -144,9 +150,10 @@ async def create_template(
             )
 
         # Extract variables from template text if not provided
+        compiled = compiled_or_400(template_data.template_text)
         variables = template_data.variables
         if not variables:
-            variables = extract_variables(template_data.template_text)
+            variables = list(compiled.variables)
 
         # Get next order number if not provided
         order = template_data.order
@@ -184,6 +191,7 @@ async def create_template(
 
         db.add(template)
         await db.commit()
+        await response_cache.invalidate(TEMPLATES)
         await db.refresh(template)
 
         logger.info(f"✅ Template created: {template.id}")
@@ -230,8 +238,10 @@ async def update_template(
         update_data = template_data.model_dump(exclude_unset=True)
 
         # If template_text changed and variables not provided, extract them
-        if "template_text" in update_data and "variables" not in update_data:
-            update_data["variables"] = extract_variables(update_data["template_text"])
+        if "template_text" in update_data:
+            compiled = compiled_or_400(update_data["template_text"])
+            if "variables" not in update_data:
+                update_data["variables"] = list(compiled.variables)
 
         # If setting as default, unset other defaults in the module
         if update_data.get("is_default"):
@@ -247,7 +257,9 @@ async def update_template(
             setattr(template, field, value)
 
         await db.commit()
+        await response_cache.invalidate(TEMPLATES)
         await db.refresh(template)
+        template_cache.invalidate(template_id)
 
         logger.info(f"✅ Template updated: {template.id}")
 
@@ -304,6 +316,8 @@ async def delete_template(
 
         await db.delete(template)
         await db.commit()
+        await response_cache.invalidate(TEMPLATES)
+        template_cache.invalidate(template_id)
 
         logger.info(f"✅ Template deleted: {template_id}")
 
@@ -338,6 +352,7 @@ async def reorder_templates(
             )
 
         await db.commit()
+        await response_cache.invalidate(TEMPLATES)
 
         logger.info("✅ Templates reordered")
 
@@ -362,24 +377,12 @@ async def preview_template(
 ):
     """Preview a template with variables replaced"""
     try:
-        template_text = request.template_text
-        variables = request.variables
-
-        # Find all variables in template
-        template_vars = extract_variables(template_text)
-
-        # Find missing variables
-        missing = [v for v in template_vars if v not in variables]
-
-        # Replace variables
-        rendered = template_text
-        for var_name, var_value in variables.items():
-            rendered = rendered.replace(f"{{{var_name}}}", str(var_value))
+        compiled = compile_template(request.template_text)
 
         return TemplatePreviewResponse(
-            original=template_text,
-            rendered=rendered,
-            missing_variables=missing,
+            original=request.template_text,
+            rendered=compiled.render(request.variables),
+            missing_variables=compiled.missing(request.variables),
         )
 
     except Exception as e:
@@ -455,11 +458,15 @@ async def get_modules(
         )
 
 
-def extract_variables(template_text: str) -> List[str]:
-    """Extract variable names from a template string"""
-    # Find all {variable_name} patterns
-    pattern = r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}'
-    matches = re.findall(pattern, template_text)
-    # Return unique variables preserving order
-    seen = set()
-    return [v for v in matches if not (v in seen or seen.add(v))]
+def compiled_or_400(template_text: str) -> CompiledTemplate:
+    """Compile a template, rejecting unknown placeholder hints"""
+    compiled = compile_template(template_text)
+    if compiled.invalid_hints:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Unknown placeholder hint(s): {', '.join(compiled.invalid_hints)}. "
+                f"Valid hints: {', '.join(HINTS)}"
+            ),
+        )
+    return compiled
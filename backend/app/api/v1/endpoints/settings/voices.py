@@ -5,7 +5,6 @@ Handles voice configuration management - v2.1 Playground
 import io
 import os
 import logging
-from datetime import datetime
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,7 +14,7 @@ from pydub import AudioSegment
 from app.db.session import get_db
 from app.models.voice_settings import VoiceSettings
 from app.services.tts import elevenlabs_service, voice_manager
-from app.core.config import settings
+from app.services.storage import audio_storage
 from app.schemas.voice import (
     VoiceSettingsCreate,
     VoiceSettingsUpdate,
@@ -145,6 +144,8 @@ async def create_voice(
         await db.commit()
         await db.refresh(voice)
 
+        # New voice may become the default/first-active voice
+        await voice_manager.invalidate_cache(voice.id)
         logger.info(f"✅ Voice created: {voice.id}")
 
         return serialize_voice(voice)
@@ -193,7 +194,7 @@ async def update_voice(
         await db.refresh(voice)
 
         # Invalidate cache so changes take effect immediately
-        voice_manager.invalidate_cache(voice_id)
+        await voice_manager.invalidate_cache(voice_id)
         logger.info(f"✅ Voice updated: {voice.id} (cache invalidated)")
 
         return serialize_voice(voice)
@@ -244,7 +245,7 @@ async def delete_voice(
         await db.commit()
 
         # Invalidate cache for deleted voice
-        voice_manager.invalidate_cache(voice_id)
+        await voice_manager.invalidate_cache(voice_id)
         logger.info(f"✅ Voice deleted: {voice_id} (cache invalidated)")
 
     except HTTPException:
@@ -292,7 +293,7 @@ async def set_default_voice(
         await db.commit()
 
         # Invalidate all cache since is_default changed for multiple voices
-        voice_manager.invalidate_cache()
+        await voice_manager.invalidate_cache()
         logger.info(f"✅ Default voice set: {voice_id} (all cache invalidated)")
 
         return {"success": True, "message": f"Voice '{voice.name}' is now the default"}
@@ -331,7 +332,7 @@ async def reorder_voices(
         await db.commit()
 
         # Invalidate all cache since order changed for multiple voices
-        voice_manager.invalidate_cache()
+        await voice_manager.invalidate_cache()
         logger.info("✅ Voices reordered (all cache invalidated)")
 
         return {"success": True, "message": "Voices reordered successfully"}
@@ -382,7 +383,7 @@ async def test_voice(
         }
 
         audio_bytes = await elevenlabs_service.generate_speech(
-            text=request.text,
+            text=await voice_manager.prepare_text(request.text, voice.id, db),
             voice_id=voice.elevenlabs_id,
             voice_settings=voice_settings,
         )
@@ -401,15 +402,8 @@ async def test_voice(
             logger.info(f"✅ Volume adjusted by {volume_adjustment} dB")
 
         # Save to temp file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"test_{voice_id}_{timestamp}.mp3"
-        file_path = os.path.join(settings.AUDIO_PATH, filename)
-
-        # Ensure directory exists
-        os.makedirs(settings.AUDIO_PATH, exist_ok=True)
-
-        with open(file_path, "wb") as f:
-            f.write(audio_bytes)
+        filename = audio_storage.new_filename("test", voice_id)
+        file_path = audio_storage.write_bytes(filename, audio_bytes)
 
         # Get duration (simple estimate based on file size)
         file_size = os.path.getsize(file_path)
@@ -3,12 +3,13 @@ Shortcuts Public API Endpoints
 Returns active shortcuts for mobile page
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from sqlalchemy.orm import selectinload
 
 from app.db.session import get_db
+from app.core.response_cache import response_cache, SHORTCUTS
 from app.models.shortcut import Shortcut
 from app.models.audio import AudioMessage
 
@@ -38,10 +39,11 @@ def serialize_shortcut_public(shortcut: Shortcut) -> dict:
     description="Get shortcuts that have a position assigned (1-6) for mobile display",
 )
 async def get_active_shortcuts(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get only shortcuts with assigned positions (max 6) for mobile page"""
-    try:
+    """Get only shortcuts with assigned positions (max 6) for mobile page (response-cached)"""
+    async def load():
         logger.info("📱 Fetching active shortcuts for mobile")
 
         result = await db.execute(
@@ -61,6 +63,9 @@ async def get_active_shortcuts(
 
         return [serialize_shortcut_public(s) for s in shortcuts]
 
+    try:
+        return await response_cache.respond(request, SHORTCUTS, load)
+
     except Exception as e:
         logger.error(f"❌ Failed to fetch shortcuts: {str(e)}", exc_info=True)
         raise HTTPException(
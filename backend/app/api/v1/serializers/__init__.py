@@ -5,5 +5,17 @@ Shared serialization functions for consistent response formatting
 from app.api.v1.serializers.voice_serializer import serialize_voice
 from app.api.v1.serializers.music_serializer import serialize_music_track
 from app.api.v1.serializers.ai_client_serializer import serialize_ai_client
+from app.api.v1.serializers.audio_serializer import (
+    AUDIO_LIST_COLUMNS,
+    AUDIO_LIST_FIELDS,
+    serialize_library_message,
+)
 
-__all__ = ["serialize_voice", "serialize_music_track", "serialize_ai_client"]
+__all__ = [
+    "serialize_voice",
+    "serialize_music_track",
+    "serialize_ai_client",
+    "serialize_library_message",
+    "AUDIO_LIST_COLUMNS",
+    "AUDIO_LIST_FIELDS",
+]
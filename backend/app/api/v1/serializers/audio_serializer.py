@@ -0,0 +1,68 @@
+"""
+Audio Message Serializer
+Converts AudioMessage models or list projections to API response format
+"""
+from typing import Any, Dict
+
+from app.models.audio import AudioMessage
+
+# Columns read by list views. Selecting these instead of the entity skips
+# voice_settings_snapshot, renditions and loudness data, and the rows are
+# plain tuples outside the session's identity map.
+AUDIO_LIST_COLUMNS = (
+    AudioMessage.id,
+    AudioMessage.filename,
+    AudioMessage.display_name,
+    AudioMessage.file_path,
+    AudioMessage.file_size,
+    AudioMessage.duration,
+    AudioMessage.format,
+    AudioMessage.original_text,
+    AudioMessage.voice_id,
+    AudioMessage.category_id,
+    AudioMessage.is_favorite,
+    AudioMessage.volume_adjustment,
+    AudioMessage.has_jingle,
+    AudioMessage.music_file,
+    AudioMessage.status,
+    AudioMessage.sent_to_player,
+    AudioMessage.priority,
+    AudioMessage.created_at,
+    AudioMessage.updated_at,
+)
+AUDIO_LIST_FIELDS = frozenset(column.key for column in AUDIO_LIST_COLUMNS)
+
+
+def serialize_library_message(msg: Any) -> Dict[str, Any]:
+    """
+    Serialize an audio message for the library.
+
+    Args:
+        msg: AudioMessage instance or a row of AUDIO_LIST_COLUMNS
+
+    Returns:
+        Dictionary with message data formatted for API response
+        (datetimes are encoded by the response class)
+    """
+    return {
+        "id": msg.id,
+        "filename": msg.filename,
+        "display_name": msg.display_name,
+        "file_path": msg.file_path,
+        "file_size": msg.file_size,
+        "duration": msg.duration,
+        "format": msg.format,
+        "original_text": msg.original_text,
+        "voice_id": msg.voice_id,
+        "category_id": msg.category_id,
+        "is_favorite": msg.is_favorite,
+        "volume_adjustment": msg.volume_adjustment,
+        "has_jingle": msg.has_jingle,
+        "music_file": msg.music_file,
+        "status": msg.status,
+        "sent_to_player": msg.sent_to_player,
+        "priority": msg.priority,
+        "created_at": msg.created_at,
+        "updated_at": msg.updated_at,
+        "audio_url": f"/storage/audio/{msg.filename}",
+    }
@@ -23,6 +23,14 @@ def serialize_music_track(track: MusicTrack) -> MusicTrackResponse:
         file_size=track.file_size,
         duration=track.duration,
         bitrate=track.bitrate,
+        loudness_lufs=track.loudness_lufs,
+        true_peak_db=track.true_peak_db,
+        analysis_status=track.analysis_status,
+        leading_silence=track.leading_silence,
+        trailing_silence=track.trailing_silence,
+        loop_start=track.loop_start,
+        loop_end=track.loop_end,
+        peaks=track.peaks,
         is_default=track.is_default,
         active=track.active,
         order=track.order,
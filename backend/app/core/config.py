@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 import json
 
 
@@ -19,14 +19,32 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     DB_ECHO: bool = False
+    DATABASE_REPLICA_URL: Optional[str] = None  # Read replica for get_read_db endpoints
+    # Pool sizing per worker; unset values come from the APP_ENV preset (app/db/pool.py)
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[int] = None  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: Optional[int] = None  # Seconds before a connection is replaced
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = None  # asyncpg prepared statement cache (0 = off + unique names, for pgbouncer transaction mode)
+    DB_LONG_HELD_SECONDS: float = 30.0  # Checkouts held longer than this are logged
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_REDIS_ENABLED: bool = False  # Shared cache and invalidations in Redis (multi-worker)
+    CACHE_MEMORY_MAX_ENTRIES: int = 1024  # In-memory backend (single node or Redis unavailable)
+    CACHE_DEFAULT_TTL: int = 3600  # Seconds; safety net behind write invalidation
+    CACHE_MEMORY_TTL: int = 30  # Seconds; cap when other workers' invalidations cannot arrive (no Redis)
+    CACHE_LOCK_TIMEOUT: float = 10.0  # Single-flight load lease (seconds)
+    RESPONSE_CACHE_ENABLED: Optional[bool] = None  # ETag cache of voices/categories/music/templates/shortcuts (unset = only on Redis)
 
     # ElevenLabs
     ELEVENLABS_API_KEY: str
     ELEVENLABS_MODEL_ID: str = "eleven_multilingual_v2"
     ELEVENLABS_BASE_URL: str = "https://api.elevenlabs.io/v1"
+    TTS_SEGMENTED_SYNTHESIS: bool = False  # Cache static template parts (operations)
+    TTS_TAKE_CACHE_MAX_ENTRIES: int = 500  # Cached voice takes (playroom/automatic)
+    LEXICON_CHECK_SECONDS: int = 30  # Pronunciation lexicon change check interval per worker
+    TTS_NORMALIZE_TEXT: bool = True  # Numbers, prices, times, dates and acronyms in words before TTS
 
     # Anthropic Claude
     ANTHROPIC_API_KEY: str
@@ -64,8 +82,15 @@ class Settings(BaseSettings):
 
     # Audio Processing
     DEFAULT_TARGET_LUFS: float = -16.0
+    LOUDNESS_NORMALIZATION: bool = False  # Measure voices and normalize to DEFAULT_TARGET_LUFS
+    TTS_TRIM_SILENCE: bool = False  # Trim ElevenLabs edge silence before padding/mixing (no re-encode)
     DEFAULT_SAMPLE_RATE: int = 44100
     DEFAULT_BITRATE: str = "192k"
+    AUDIO_RENDITIONS: str = "opus,web"  # Extra encodings per message (see renditions.py)
+    JINGLE_MIX_BACKEND: str = "ffmpeg"  # "ffmpeg" or "numpy" (in-process, short jingles)
+    JINGLE_MIX_CACHE_MAX_ENTRIES: int = 200  # Cached voice+music mixes
+    JINGLE_PREVIEW_CONCURRENCY: int = 4  # Parallel FFmpeg mixes per preview request
+    MUSIC_ANALYSIS_WORKERS: int = 2  # Background music track analyses per process
 
     # Player Integration
     PLAYER_POLLING_INTERVAL: int = 2
@@ -0,0 +1,152 @@
+"""
+Response Cache
+Write-invalidated cache of rendered responses for read-mostly endpoints.
+
+Voices, categories, music tracks, templates, shortcuts and the tenant
+config change a few times a week but every client fetches them on every
+page load. Their GET endpoints render through respond(), which stores the
+rendered body in the shared cache keyed by APP_VERSION + route + query
+string and tagged with a scope ("voices", "music", ...). The version in
+the key keeps a deploy from serving bodies rendered by the previous
+release out of Redis; the tenant config, which comes from settings rather
+than the database, is invalidated on startup (CONFIG).
+
+Every committed write to a scope's tables must await invalidate(scope).
+With CACHE_REDIS_ENABLED the bodies live in Redis, so an invalidation on
+one worker is seen by all of them and a body is rendered once per change.
+The in-memory backend cannot see other workers' invalidations, so unless
+RESPONSE_CACHE_ENABLED is set explicitly (single-worker deployments) the
+cache is only active on Redis.
+
+Responses carry an ETag (hash of the body) and "Cache-Control: no-cache":
+browsers revalidate with If-None-Match and get a bodiless 304 while
+nothing changed.
+"""
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict
+from urllib.parse import urlencode
+
+from fastapi import Request, Response, status
+
+from app.core.config import settings
+from app.core.responses import FastJSONResponse, dumps
+from app.services.cache import (  # noqa: F401 - scopes re-exported for endpoints
+    shared_cache,
+    VOICES,
+    CATEGORIES,
+    MUSIC,
+    TEMPLATES,
+    SHORTCUTS,
+    CONFIG,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Rendered JSON responses in the shared cache.
+
+    - respond(): cached (or freshly built) response, 304 on a matching ETag
+    - invalidate(): make a scope's responses stale on every worker
+    """
+
+    def __init__(self):
+        self._hits = 0
+        self._misses = 0
+        self._not_modified = 0
+
+    async def respond(
+        self,
+        request: Request,
+        scope: str,
+        build: Callable[[], Awaitable[Any]],
+    ) -> Response:
+        """
+        Serve a GET request from the cache, building the content on a miss.
+
+        Args:
+            request: Incoming request (path + query string form the key,
+                together with APP_VERSION)
+            scope: Invalidation scope of the data (e.g. VOICES)
+            build: Coroutine function returning the JSON content
+
+        Returns:
+            200 response with ETag, or 304 if If-None-Match matches
+        """
+        if not self.enabled:
+            return FastJSONResponse(await build())
+
+        built = False
+
+        async def render() -> bytes:
+            nonlocal built
+            built = True
+            return dumps(await build())
+
+        body = await shared_cache.get_or_load_bytes(
+            f"responses:{settings.APP_VERSION}:{scope}:{self._request_key(request)}",
+            render,
+            tags=(scope,),
+        )
+        if built:
+            self._misses += 1
+        else:
+            self._hits += 1
+
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if self._etag_matches(request, etag):
+            self._not_modified += 1
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    @property
+    def enabled(self) -> bool:
+        """Explicit RESPONSE_CACHE_ENABLED, else only with a shared backend"""
+        if settings.RESPONSE_CACHE_ENABLED is not None:
+            return settings.RESPONSE_CACHE_ENABLED
+        return shared_cache.backend == "redis"
+
+    async def invalidate(self, *scopes: str) -> None:
+        """
+        Invalidate cached responses of the given scopes (all workers).
+
+        Args:
+            scopes: Scopes whose data changed (e.g. VOICES, CATEGORIES)
+        """
+        await shared_cache.invalidate(*scopes)
+
+    def clear(self) -> None:
+        """Reset statistics (entries live in the shared cache)"""
+        self._hits = 0
+        self._misses = 0
+        self._not_modified = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics for diagnostics"""
+        return {
+            "enabled": self.enabled,
+            "hits": self._hits,
+            "misses": self._misses,
+            "not_modified": self._not_modified,
+            "backend": shared_cache.backend,
+        }
+
+    @staticmethod
+    def _request_key(request: Request) -> str:
+        query = urlencode(sorted(request.query_params.multi_items()))
+        return f"{request.url.path}?{query}"
+
+    @staticmethod
+    def _etag_matches(request: Request, etag: str) -> bool:
+        header = request.headers.get("if-none-match")
+        if not header:
+            return False
+        candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+        return etag in candidates or "*" in candidates
+
+
+# Singleton instance
+response_cache = ResponseCache()
@@ -0,0 +1,63 @@
+"""
+JSON responses encoded with orjson.
+
+FastJSONResponse is the app's default response class. orjson encodes
+datetimes (ISO 8601, same text as isoformat()), dataclasses, UUIDs and
+numpy values natively, so serializers can return them as they are.
+Pydantic models are dumped by pydantic-core directly.
+
+Endpoints with large payloads return FastJSONResponse(...) themselves:
+FastAPI passes a returned Response through untouched, which skips both
+jsonable_encoder and the re-validation of the response_model (the
+decorator's response_model still documents the schema).
+
+Without orjson installed, responses fall back to the stdlib encoder.
+"""
+import json
+from decimal import Decimal
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+)
+
+
+def _default(obj: Any) -> Any:
+    """Types orjson does not encode natively"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return jsonable_encoder(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content as JSON bytes (orjson, or the stdlib encoder as fallback)"""
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode()
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,191 @@
+"""
+Keyset (cursor) pagination.
+
+A page is read as WHERE (sort_key, id) comes after the cursor, ordered by
+(sort_key, id), LIMIT n + 1; the extra row only tells whether another
+page exists. Unlike OFFSET, the cost of a page does not grow with its
+depth, and rows inserted meanwhile do not shift later pages.
+
+Cursors are opaque to clients: urlsafe base64 of the ordering, the sort
+value and the id of the last row of a page. A cursor is rejected
+(InvalidCursor) if it was issued for a different ordering.
+
+Totals are optional (TOTAL_MODES):
+
+    exact        COUNT over the filtered query
+    approximate  COUNT capped at APPROXIMATE_COUNT_CAP rows
+                 (total_is_estimate=True when the cap is reached)
+    none         no count query
+"""
+import json
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import DateTime, Select, and_, or_, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TOTAL_MODES = ("exact", "approximate", "none")
+APPROXIMATE_COUNT_CAP = 10000
+
+
+class InvalidCursor(ValueError):
+    """Cursor could not be decoded or belongs to another ordering"""
+
+
+@dataclass
+class Page:
+    """One page of a keyset-paginated query"""
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None  # None on the last page
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+
+def _ordering(column: Any, descending: bool) -> str:
+    return f"{column.key}:{'desc' if descending else 'asc'}"
+
+
+def _nullable(column: Any) -> bool:
+    return getattr(column.expression, "nullable", True)
+
+
+def encode_cursor(column: Any, descending: bool, value: Any, row_id: Any) -> str:
+    """Opaque cursor pointing after the row (value, row_id)"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([_ordering(column, descending), value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, column: Any, descending: bool) -> Tuple[Any, Any]:
+    """
+    (sort value, id) stored in a cursor.
+
+    Raises:
+        InvalidCursor: Malformed cursor or issued for another ordering
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ordering, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError, binascii.Error):
+        raise InvalidCursor("Invalid cursor")
+
+    if ordering != _ordering(column, descending):
+        raise InvalidCursor("Cursor belongs to a different sort order")
+
+    if value is not None and isinstance(column.type, DateTime):
+        try:
+            value = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            raise InvalidCursor("Invalid cursor")
+    return value, row_id
+
+
+def keyset_order(column: Any, id_column: Any, descending: bool) -> List[Any]:
+    """ORDER BY clauses of a keyset ordering (NULL sort values last)"""
+    order = column.desc() if descending else column.asc()
+    tiebreak = id_column.desc() if descending else id_column.asc()
+    if _nullable(column):
+        order = order.nulls_last()
+    return [order, tiebreak]
+
+
+def keyset_filter(column: Any, id_column: Any, descending: bool, value: Any, row_id: Any) -> Any:
+    """WHERE clause selecting the rows after (value, row_id) in keyset_order"""
+    after_id = id_column < row_id if descending else id_column > row_id
+    if value is None:
+        # NULLs sort last: only NULL rows with a later id remain
+        return and_(column.is_(None), after_id)
+
+    after_value = column < value if descending else column > value
+    condition = or_(after_value, and_(column == value, after_id))
+    if _nullable(column):
+        condition = or_(condition, column.is_(None))
+    return condition
+
+
+async def count_total(
+    db: AsyncSession, query: Select, mode: str = "exact"
+) -> Tuple[Optional[int], bool]:
+    """
+    Row count of a (filtered, unpaginated) query.
+
+    Returns:
+        (total, is_estimate); total is None when mode is "none"
+    """
+    if mode == "none":
+        return None, False
+
+    query = query.order_by(None)
+    if mode == "approximate":
+        query = query.limit(APPROXIMATE_COUNT_CAP)
+
+    result = await db.execute(select(func.count()).select_from(query.subquery()))
+    total = result.scalar() or 0
+    return total, mode == "approximate" and total >= APPROXIMATE_COUNT_CAP
+
+
+async def keyset_page(
+    db: AsyncSession,
+    query: Select,
+    column: Any,
+    id_column: Any,
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = True,
+    offset: int = 0,
+    scalars: bool = True,
+    count: str = "none",
+) -> Page:
+    """
+    Read one page of query ordered by (column, id_column).
+
+    Args:
+        db: Database session
+        query: Filtered select without ORDER BY / LIMIT
+        column: Sort column (mapped attribute of the first selected entity)
+        id_column: Unique tiebreaker column (primary key)
+        limit: Page size
+        cursor: next_cursor of the previous page (None for the first page)
+        descending: Sort direction
+        offset: Rows to skip when no cursor is given (page-number clients)
+        scalars: Items are the first entity of each row; False keeps full
+                 rows (column projections, or an entity plus extra columns)
+        count: Total mode (see TOTAL_MODES)
+
+    Returns:
+        Page with items, next_cursor and total
+
+    Raises:
+        InvalidCursor: Malformed cursor or issued for another ordering
+    """
+    after = decode_cursor(cursor, column, descending) if cursor else None
+    total, total_is_estimate = await count_total(db, query, count)
+
+    query = query.order_by(*keyset_order(column, id_column, descending))
+    if after is not None:
+        query = query.filter(keyset_filter(column, id_column, descending, *after))
+    elif offset:
+        query = query.offset(offset)
+
+    result = await db.execute(query.limit(limit + 1))
+    rows = result.scalars().all() if scalars else result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        if not scalars and not hasattr(last, column.key):
+            last = last[0]  # (entity, extra columns...) row
+        next_cursor = encode_cursor(
+            column, descending, getattr(last, column.key), getattr(last, id_column.key)
+        )
+    return Page(
+        items=list(rows),
+        next_cursor=next_cursor,
+        total=total,
+        total_is_estimate=total_is_estimate,
+    )
@@ -0,0 +1,221 @@
+"""
+Database connection pool configuration and metrics.
+
+Pool sizing comes from per-environment presets (POOL_PRESETS, selected by
+APP_ENV); each value can be overridden with its DB_* setting. With
+asyncpg, DB_STATEMENT_CACHE_SIZE sets SQLAlchemy's prepared statement
+cache. 0 also turns off asyncpg's own statement cache and gives every
+prepared statement a unique name, which is what pgbouncer in transaction
+mode needs (a statement prepared on one server connection may not exist
+on the next).
+
+PoolMetrics listens to the engine's pool events and times every checkout:
+
+- checked_out / overflow / size: current pool state
+- wait histogram: time spent obtaining a connection (a full pool shows up
+  here long before requests start failing with pool timeouts)
+- long-held connections: checkouts held longer than DB_LONG_HELD_SECONDS
+  are logged on return, and the ones still out are reported in stats()
+"""
+import time
+import uuid
+import logging
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Per-worker pools (production runs 4 uvicorn workers)
+POOL_PRESETS: Dict[str, Dict[str, int]] = {
+    "development": {"pool_size": 5, "max_overflow": 5, "pool_timeout": 30, "pool_recycle": 3600},
+    "test": {"pool_size": 2, "max_overflow": 2, "pool_timeout": 5, "pool_recycle": 3600},
+    "production": {"pool_size": 10, "max_overflow": 10, "pool_timeout": 10, "pool_recycle": 1800},
+}
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+SLOW_WAIT_SECONDS = 1.0  # Checkout waits logged as warnings
+
+
+def pool_settings() -> Dict[str, int]:
+    """Preset for APP_ENV with DB_* overrides applied"""
+    options = dict(POOL_PRESETS.get(settings.APP_ENV, POOL_PRESETS["development"]))
+    overrides = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    options.update({key: value for key, value in overrides.items() if value is not None})
+    return options
+
+
+def database_url(url: str) -> str:
+    """DATABASE_URL with the asyncpg statement cache size applied"""
+    parsed = make_url(url)
+    if (
+        parsed.drivername == "postgresql+asyncpg"
+        and settings.DB_STATEMENT_CACHE_SIZE is not None
+        and "prepared_statement_cache_size" not in parsed.query
+    ):
+        parsed = parsed.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+        )
+    return parsed.render_as_string(hide_password=False)
+
+
+def engine_options(url: str, metrics: Optional["PoolMetrics"] = None) -> Dict[str, Any]:
+    """
+    create_async_engine() pool arguments for a database URL.
+
+    The dialect's own pool class is kept (SQLite drivers use NullPool /
+    StaticPool), wrapped so checkouts are timed. Size, overflow and
+    timeout only apply to queue pools.
+    """
+    parsed = make_url(url)
+    pool_class = parsed.get_dialect().get_pool_class(parsed)
+    options = pool_settings()
+
+    engine_kwargs: Dict[str, Any] = {
+        "poolclass": instrumented_pool(pool_class, metrics or pool_metrics),
+        "pool_recycle": options["pool_recycle"],
+    }
+    if issubclass(pool_class, QueuePool):
+        engine_kwargs.update(
+            pool_size=options["pool_size"],
+            max_overflow=options["max_overflow"],
+            pool_timeout=options["pool_timeout"],
+        )
+    if parsed.drivername == "postgresql+asyncpg" and settings.DB_STATEMENT_CACHE_SIZE == 0:
+        engine_kwargs["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    return engine_kwargs
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4().hex}__"
+
+
+def instrumented_pool(pool_class: type, metrics: "PoolMetrics") -> type:
+    """Subclass of pool_class that records checkout wait time in metrics"""
+
+    class InstrumentedPool(pool_class):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except PoolTimeoutError:
+                metrics.record_timeout(time.perf_counter() - started)
+                raise
+            metrics.record_wait(time.perf_counter() - started)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    InstrumentedPool.__qualname__ = InstrumentedPool.__name__
+    return InstrumentedPool
+
+
+class PoolMetrics:
+    """
+    Connection pool counters for one engine (one per worker process).
+    """
+
+    def __init__(self):
+        self._pool = None
+        self._held: Dict[int, float] = {}  # id(connection record) -> checkout time
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero the counters (current checkouts are kept)"""
+        self._checkouts = 0
+        self._timeouts = 0
+        self._long_held = 0
+        self._wait_counts: List[int] = [0] * (len(WAIT_BUCKETS) + 1)
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._held_max = 0.0
+
+    def attach(self, engine) -> None:
+        """Listen to the checkout/checkin events of an (async) engine's pool"""
+        pool = engine.sync_engine.pool if hasattr(engine, "sync_engine") else engine.pool
+        self._pool = pool
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+
+    def record_wait(self, seconds: float) -> None:
+        """A connection was obtained after waiting seconds"""
+        self._checkouts += 1
+        self._wait_counts[bisect_left(WAIT_BUCKETS, seconds)] += 1
+        self._wait_total += seconds
+        self._wait_max = max(self._wait_max, seconds)
+        if seconds >= SLOW_WAIT_SECONDS:
+            logger.warning(f"⚠️ Waited {seconds:.2f}s for a DB connection ({self.pool_status()})")
+
+    def record_timeout(self, seconds: float) -> None:
+        """No connection was available within the pool timeout"""
+        self._timeouts += 1
+        logger.error(f"❌ DB pool exhausted after {seconds:.1f}s ({self.pool_status()})")
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        self._held[id(connection_record)] = time.monotonic()
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        checked_out_at = self._held.pop(id(connection_record), None)
+        if checked_out_at is None:
+            return
+        held = time.monotonic() - checked_out_at
+        self._held_max = max(self._held_max, held)
+        if held >= settings.DB_LONG_HELD_SECONDS:
+            self._long_held += 1
+            logger.warning(f"⚠️ DB connection held for {held:.1f}s ({self.pool_status()})")
+
+    def pool_status(self) -> str:
+        """Pool state as reported by SQLAlchemy"""
+        return self._pool.status() if self._pool is not None else "no pool"
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool state and checkout statistics for diagnostics"""
+        now = time.monotonic()
+        held = sorted((now - started for started in self._held.values()), reverse=True)
+        pool = self._pool
+
+        wait_histogram = {
+            f"le_{bound}": count for bound, count in zip(WAIT_BUCKETS, self._wait_counts)
+        }
+        wait_histogram["le_inf"] = self._wait_counts[-1]
+
+        return {
+            "pool": type(pool).__name__ if pool is not None else None,
+            "size": pool.size() if isinstance(pool, QueuePool) else None,
+            "checked_out": len(held),
+            "overflow": max(pool.overflow(), 0) if isinstance(pool, QueuePool) else None,
+            "checkouts": self._checkouts,
+            "timeouts": self._timeouts,
+            "wait_seconds": {
+                "histogram": wait_histogram,
+                "total": round(self._wait_total, 4),
+                "max": round(self._wait_max, 4),
+                "avg": round(self._wait_total / self._checkouts, 4) if self._checkouts else 0.0,
+            },
+            "held_seconds": {
+                "longest_current": round(held[0], 1) if held else 0.0,
+                "max": round(self._held_max, 1),
+                "long_held_current": sum(1 for seconds in held if seconds >= settings.DB_LONG_HELD_SECONDS),
+                "long_held_total": self._long_held,
+                "threshold": settings.DB_LONG_HELD_SECONDS,
+            },
+        }
+
+
+# Singleton instances (primary engine, read replica engine)
+pool_metrics = PoolMetrics()
+replica_pool_metrics = PoolMetrics()
@@ -0,0 +1,148 @@
+"""
+Reusable query helpers
+
+The hot queries (scheduler worker, library listing, temporary-message
+cleanup, chat history) are built here so the query-plan tests check the
+exact statements production runs.
+"""
+from datetime import datetime
+from typing import Any, Collection, Dict, Iterable, Optional
+
+from sqlalchemy import Select, select, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.audio import AudioMessage
+from app.models.chat import ChatMessage
+from app.models.schedule import Schedule
+
+
+def with_child_counts(
+    query: Select,
+    parent_key: Any,
+    child_fk: Any,
+    *child_filters: Any,
+    label: str = "child_count",
+) -> Select:
+    """
+    Add a child-row count column to an entity query (one grouped aggregate).
+
+    Children are counted once in a GROUP BY subquery and outer-joined to the
+    parents, instead of one COUNT query per parent row.
+
+    Args:
+        query: select(Parent) with any filters / ordering
+        parent_key: Parent primary key column (e.g. Category.id)
+        child_fk: Child foreign key column (e.g. AudioMessage.category_id)
+        *child_filters: Extra conditions on counted children
+        label: Name of the added column
+
+    Returns:
+        Query yielding (parent, count) rows; parents without children count 0
+
+    Example:
+        >>> query = with_child_counts(select(Category), Category.id, AudioMessage.category_id)
+        >>> for category, audio_count in (await db.execute(query)).all(): ...
+    """
+    counts = (
+        select(child_fk.label("parent_id"), func.count().label("child_count"))
+        .where(child_fk.isnot(None), *child_filters)
+        .group_by(child_fk)
+        .subquery()
+    )
+    return (
+        query.outerjoin(counts, counts.c.parent_id == parent_key)
+        .add_columns(func.coalesce(counts.c.child_count, 0).label(label))
+    )
+
+
+async def count_children(
+    db: AsyncSession,
+    child_fk: Any,
+    parent_ids: Iterable[Any],
+    *child_filters: Any,
+) -> Dict[Any, int]:
+    """
+    Child-row counts for a set of parents in one grouped query.
+
+    Returns:
+        {parent_id: count} (parents without children are 0)
+    """
+    parent_ids = list(parent_ids)
+    if not parent_ids:
+        return {}
+
+    result = await db.execute(
+        select(child_fk, func.count())
+        .where(child_fk.in_(parent_ids), *child_filters)
+        .group_by(child_fk)
+    )
+    counts = dict.fromkeys(parent_ids, 0)
+    counts.update({parent_id: count for parent_id, count in result.all()})
+    return counts
+
+
+def due_schedule_query(now: datetime) -> Select:
+    """Highest-priority active schedule due at `now` (scheduler worker tick)"""
+    return (
+        select(Schedule)
+        .where(
+            Schedule.active == True,
+            Schedule.next_execution_at != None,
+            Schedule.next_execution_at <= now,
+        )
+        .order_by(Schedule.priority.asc(), Schedule.next_execution_at.asc())
+        .limit(1)
+    )
+
+
+def library_messages_query(
+    *columns: Any,
+    search: Optional[str] = None,
+    category_id: Optional[str] = None,
+) -> Select:
+    """
+    Saved (favorite, not deleted) library messages with the list filters.
+
+    Args:
+        *columns: Entity or projected columns to select
+        search: Text searched in display_name and original_text
+        category_id: Category id, or "__uncategorized__" for none
+    """
+    query = select(*columns).filter(
+        AudioMessage.is_favorite == True,
+        AudioMessage.status != "deleted",
+    )
+    if search:
+        search_term = f"%{search}%"
+        query = query.filter(
+            or_(
+                AudioMessage.display_name.ilike(search_term),
+                AudioMessage.original_text.ilike(search_term),
+            )
+        )
+    if category_id == "__uncategorized__":
+        query = query.filter(AudioMessage.category_id.is_(None))
+    elif category_id:
+        query = query.filter(AudioMessage.category_id == category_id)
+    return query
+
+
+def temporary_messages_count_query() -> Select:
+    """Number of temporary (not saved) messages"""
+    return select(func.count()).where(AudioMessage.is_favorite == False)
+
+
+def oldest_temporary_messages_query(limit: int, keep_ids: Collection[int] = ()) -> Select:
+    """Oldest temporary messages, skipping keep_ids (e.g. used by shortcuts)"""
+    query = select(AudioMessage).where(AudioMessage.is_favorite == False)
+    if keep_ids:
+        query = query.where(AudioMessage.id.notin_(keep_ids))
+    return query.order_by(AudioMessage.created_at.asc()).limit(limit)
+
+
+def conversation_messages_query(conversation_id: int, *roles: str) -> Select:
+    """Messages of a conversation in order (optionally only some roles)"""
+    query = select(ChatMessage).filter(ChatMessage.conversation_id == conversation_id)
+    if roles:
+        query = query.filter(ChatMessage.role.in_(roles))
+    return query.order_by(ChatMessage.created_at)
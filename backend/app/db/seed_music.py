@@ -5,13 +5,14 @@ Populates the music_tracks table with existing music files
 import os
 import asyncio
 import logging
-from pydub import AudioSegment
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import AsyncSessionLocal
 from app.models.music_track import MusicTrack
 from app.core.config import settings
+from app.services.audio.utils import get_audio_metadata
+from app.services.audio.music_analysis import music_analyzer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -56,35 +57,6 @@ MUSIC_METADATA = {
 }
 
 
-def get_audio_metadata(file_path: str) -> dict:
-    """Extract audio metadata using pydub"""
-    try:
-        audio = AudioSegment.from_file(file_path)
-        duration = len(audio) / 1000.0  # ms to seconds
-
-        file_size = os.path.getsize(file_path)
-        if duration > 0:
-            bitrate_kbps = int((file_size * 8) / (duration * 1000))
-            bitrate = f"{bitrate_kbps}kbps"
-        else:
-            bitrate = "unknown"
-
-        return {
-            "duration": round(duration, 2),
-            "bitrate": bitrate,
-            "sample_rate": audio.frame_rate,
-            "file_size": file_size,
-        }
-    except Exception as e:
-        logger.warning(f"Could not extract audio metadata: {e}")
-        return {
-            "duration": None,
-            "bitrate": None,
-            "sample_rate": None,
-            "file_size": os.path.getsize(file_path) if os.path.exists(file_path) else None,
-        }
-
-
 async def seed_music():
     """Seed music tracks from existing files"""
     logger.info("🎵 Starting music seed...")
@@ -112,7 +84,7 @@ async def seed_music():
 
             # Get metadata
             meta = MUSIC_METADATA.get(filename, {})
-            audio_meta = get_audio_metadata(file_path)
+            audio_meta = await get_audio_metadata(file_path)
 
             # Create display name from filename if not in metadata
             display_name = meta.get("display_name", os.path.splitext(filename)[0])
@@ -125,6 +97,7 @@ async def seed_music():
                 duration=audio_meta.get("duration"),
                 bitrate=audio_meta.get("bitrate"),
                 sample_rate=audio_meta.get("sample_rate"),
+                analysis_status="pending",
                 format=os.path.splitext(filename)[1][1:],
                 is_default=(order == 0),  # First track is default
                 active=True,
@@ -139,6 +112,14 @@ async def seed_music():
         await db.commit()
         logger.info(f"🎉 Music seed completed! Added {len(files)} tracks.")
 
+        # Analyze seeded tracks (loudness, silence, loop points, peaks)
+        result = await db.execute(select(MusicTrack.id))
+        track_ids = result.scalars().all()
+
+    for track_id in track_ids:
+        await music_analyzer.analyze_track(track_id)
+    await music_analyzer.shutdown()
+
 
 if __name__ == "__main__":
     asyncio.run(seed_music())
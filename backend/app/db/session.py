@@ -1,13 +1,19 @@
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.db.pool import database_url, engine_options, pool_metrics, replica_pool_metrics
 
-# Create async engine
+# Create async engine (pool sizing per APP_ENV preset, see app/db/pool.py)
 engine = create_async_engine(
-    settings.DATABASE_URL,
+    database_url(settings.DATABASE_URL),
     echo=settings.DB_ECHO,
     future=True,
     pool_pre_ping=True,
+    **engine_options(settings.DATABASE_URL),
 )
+pool_metrics.attach(engine)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -18,6 +24,39 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Read-only engine: the replica when configured, otherwise the primary.
+# Transactions are started READ ONLY on PostgreSQL (ignored by SQLite).
+if settings.DATABASE_REPLICA_URL:
+    read_engine = create_async_engine(
+        database_url(settings.DATABASE_REPLICA_URL),
+        echo=settings.DB_ECHO,
+        future=True,
+        pool_pre_ping=True,
+        **engine_options(settings.DATABASE_REPLICA_URL, replica_pool_metrics),
+    )
+    replica_pool_metrics.attach(read_engine)
+else:
+    read_engine = engine
+
+
+class ReadOnlySession(Session):
+    """Session of read-only requests; flushing changes is an error"""
+
+
+@event.listens_for(ReadOnlySession, "before_flush")
+def _reject_flush(session, flush_context, instances):
+    raise InvalidRequestError("Read-only session: use get_db for writes")
+
+
+ReadOnlySessionLocal = async_sessionmaker(
+    read_engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    sync_session_class=ReadOnlySession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 
 async def get_db() -> AsyncSession:
     """Dependency to get database session"""
@@ -30,3 +69,19 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+async def get_read_db() -> AsyncSession:
+    """
+    Dependency for read-only endpoints.
+
+    Uses the replica when DATABASE_REPLICA_URL is set and never commits:
+    the transaction is rolled back at the end of the request. Replicas can
+    lag, so endpoints that must see a write made just before keep get_db.
+    """
+    async with ReadOnlySessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
@@ -1,10 +1,20 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import FileResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from app.core.config import settings
 from app.services.scheduler import scheduler_worker
+from app.services.cache import shared_cache, CONFIG
+from app.services.tts import voice_cache
+from app.services.audio.announcement_sounds import announcement_sound_cache
+from app.services.audio.music_analysis import music_analyzer
+from app.services.storage import audio_storage
+from app.db.pool import pool_metrics, replica_pool_metrics
+from app.core.responses import FastJSONResponse
+from app.core.response_cache import response_cache
 from pathlib import Path
+import asyncio
 import logging
 
 # Configure logging
@@ -21,6 +31,7 @@ app = FastAPI(
     debug=settings.DEBUG,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=FastJSONResponse,
 )
 
 # Auth version middleware - adds X-Auth-Version header to all responses
@@ -48,6 +59,16 @@ app.add_middleware(
     expose_headers=["X-Auth-Version"],
 )
 
+# Generated audio lives in hashed shard directories; resolve flat
+# /storage/audio/{filename} URLs before falling back to the static mount
+@app.api_route("/storage/audio/{filename}", methods=["GET", "HEAD"], include_in_schema=False)
+async def serve_audio_file(filename: str):
+    path = audio_storage.resolve(filename)
+    if not path:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return FileResponse(path)
+
+
 # Mount static files
 try:
     app.mount("/storage", StaticFiles(directory="storage"), name="storage")
@@ -71,6 +92,25 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/db")
+async def db_pool_health():
+    """Connection pool state and checkout metrics of this worker"""
+    return {
+        **pool_metrics.stats(),
+        "replica": replica_pool_metrics.stats() if settings.DATABASE_REPLICA_URL else None,
+    }
+
+
+@app.get("/health/cache")
+async def cache_health():
+    """Shared cache backend and hit rates of this worker"""
+    return {
+        "shared": shared_cache.stats(),
+        "responses": response_cache.stats(),
+        "voices": voice_cache.stats(),
+    }
+
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
@@ -82,6 +122,16 @@ async def startup_event():
     await scheduler_worker.start()
     logger.info("📅 Scheduler worker started")
 
+    # Shared cache (Redis when enabled) and cross-worker voice invalidations
+    await shared_cache.start()
+    await voice_cache.start()
+
+    # Tenant config is rendered from settings, which may have changed with this start
+    await response_cache.invalidate(CONFIG)
+
+    # Prepare intro/outro announcement sounds for the TTS output profile
+    await asyncio.to_thread(announcement_sound_cache.warm)
+
 
 # Shutdown event
 @app.on_event("shutdown")
@@ -90,6 +140,12 @@ async def shutdown_event():
     await scheduler_worker.stop()
     logger.info("📅 Scheduler worker stopped")
 
+    await voice_cache.stop()
+    await shared_cache.stop()
+
+    # Let queued music analyses finish
+    await music_analyzer.shutdown()
+
     logger.info("👋 Shutting down MediaFlowDemo")
 
 
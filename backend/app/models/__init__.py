@@ -14,6 +14,7 @@ from app.models.ai_client import AIClient
 from app.models.message_template import MessageTemplate
 from app.models.shortcut import Shortcut
 from app.models.chat import ChatConversation, ChatMessage
+from app.models.pronunciation import PronunciationEntry
 
 __all__ = [
     "Base",
@@ -30,4 +31,5 @@ __all__ = [
     "Shortcut",
     "ChatConversation",
     "ChatMessage",
+    "PronunciationEntry",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base, TimestampMixin
 from datetime import datetime
@@ -18,10 +18,20 @@ class AudioMessage(Base, TimestampMixin):
 
     # Audio metadata
     duration = Column(Float, nullable=True)  # seconds
+    speech_duration = Column(Float, nullable=True)  # trimmed voice take, before padding/jingle
     sample_rate = Column(Integer, nullable=True)
     bitrate = Column(String(20), nullable=True)
     format = Column(String(10), default="mp3")
 
+    # EBU R128 measurement of the synthesized voice and the gain applied to it
+    loudness_lufs = Column(Float, nullable=True)
+    true_peak_db = Column(Float, nullable=True)
+    loudness_gain_db = Column(Float, nullable=True)
+
+    # Extra encodings of the same audio, e.g.
+    # {"opus": {"filename": ..., "url": ..., "format": "ogg", "bitrate": "128k", ...}}
+    renditions = Column(JSON, nullable=True)
+
     # Content
     original_text = Column(Text, nullable=False)
     voice_id = Column(String(50), nullable=False)  # Reference to VoiceSettings
@@ -51,5 +61,13 @@ class AudioMessage(Base, TimestampMixin):
     # Priority for player queue
     priority = Column(Integer, default=4)  # 1-5 (1=critical, 5=low)
 
+    # Indexes for the hot queries (see tests/test_query_plans.py)
+    __table_args__ = (
+        Index("ix_audio_messages_created_at", "created_at"),  # Recent messages
+        Index("ix_audio_messages_favorite_created", "is_favorite", "created_at"),  # Library, cleanup
+        Index("ix_audio_messages_category_created", "category_id", "created_at"),  # Category filters, campaigns
+        Index("ix_audio_messages_voice_id", "voice_id", "id"),  # Speech rate history
+    )
+
     def __repr__(self):
         return f"<AudioMessage {self.display_name} (favorite={self.is_favorite})>"
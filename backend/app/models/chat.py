@@ -4,7 +4,7 @@ Chat conversation and message models.
 raw_content stores the full Anthropic structure (text + tool_use + tool_result)
 to reconstruct multi-turn history correctly.
 """
-from sqlalchemy import Column, Integer, String, Text, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Boolean, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base, TimestampMixin
 
@@ -20,6 +20,10 @@ class ChatConversation(Base, TimestampMixin):
                           order_by="ChatMessage.created_at",
                           cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_chat_conversations_active_updated", "is_active", "updated_at"),  # Recent list
+    )
+
 
 class ChatMessage(Base, TimestampMixin):
     """A single message in a conversation"""
@@ -40,3 +44,7 @@ class ChatMessage(Base, TimestampMixin):
     audio = relationship("AudioMessage", lazy="joined")
 
     conversation = relationship("ChatConversation", back_populates="messages")
+
+    __table_args__ = (
+        Index("ix_chat_messages_conversation_created", "conversation_id", "created_at"),  # History
+    )
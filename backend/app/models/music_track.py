@@ -2,7 +2,7 @@
 MusicTrack Model
 Stores music tracks for jingle generation - v2.1 Playground
 """
-from sqlalchemy import Column, Integer, String, Float, Boolean
+from sqlalchemy import Column, Integer, String, Float, Boolean, JSON
 from app.db.base import Base, TimestampMixin
 
 
@@ -24,6 +24,18 @@ class MusicTrack(Base, TimestampMixin):
     sample_rate = Column(Integer, nullable=True)     # 44100
     format = Column(String(10), default="mp3")
 
+    # EBU R128 measurement (measured once, on upload or first use)
+    loudness_lufs = Column(Float, nullable=True)     # integrated loudness
+    true_peak_db = Column(Float, nullable=True)      # dBTP
+
+    # Background analysis (music_analysis.py): pending, done, failed
+    analysis_status = Column(String(20), nullable=True)
+    leading_silence = Column(Float, nullable=True)   # seconds
+    trailing_silence = Column(Float, nullable=True)  # seconds
+    loop_start = Column(Float, nullable=True)        # seconds, loop segment used by jingles
+    loop_end = Column(Float, nullable=True)
+    peaks = Column(JSON, nullable=True)              # [0.0-1.0] x 200, waveform display
+
     # Status
     is_default = Column(Boolean, default=False, nullable=False)
     active = Column(Boolean, default=True, nullable=False)
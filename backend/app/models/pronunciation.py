@@ -0,0 +1,35 @@
+"""
+Pronunciation Entry Model
+Lexicon of TTS pronunciation fixes applied to every generated text
+"""
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, UniqueConstraint
+from app.db.base import Base, TimestampMixin
+
+
+class PronunciationEntry(Base, TimestampMixin):
+    """
+    A term and the spelling sent to TTS instead (e.g. 'Hyundai' -> 'Hiúndai').
+
+    Entries without voice_id apply to every voice; a voice entry for the
+    same term overrides the global one.
+    """
+    __tablename__ = "pronunciation_entries"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    term = Column(String(100), nullable=False)  # As written in announcements
+    replacement = Column(String(200), nullable=False)  # As sent to TTS
+    voice_id = Column(
+        String(50),
+        ForeignKey("voice_settings.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    case_sensitive = Column(Boolean, default=False, nullable=False)
+    active = Column(Boolean, default=True, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('term', 'voice_id', name='uq_pronunciation_term_voice'),
+    )
+
+    def __repr__(self):
+        return f"<PronunciationEntry {self.term} -> {self.replacement} ({self.voice_id or 'global'})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base, TimestampMixin
 from datetime import datetime
@@ -43,6 +43,11 @@ class Schedule(Base, TimestampMixin):
     # Priority
     priority = Column(Integer, default=4)
 
+    __table_args__ = (
+        Index("ix_schedules_active_next", "active", "next_execution_at"),  # Worker due scan
+        Index("ix_schedules_created_at", "created_at"),  # Paginated list
+    )
+
     def __repr__(self):
         return f"<Schedule {self.schedule_type} (active={self.active})>"
 
@@ -60,5 +65,9 @@ class ScheduleLog(Base, TimestampMixin):
     error_message = Column(Text, nullable=True)
     audio_generated_id = Column(Integer, ForeignKey("audio_messages.id"), nullable=True)
 
+    __table_args__ = (
+        Index("ix_schedule_logs_schedule_executed", "schedule_id", "executed_at"),  # Per-schedule history
+    )
+
     def __repr__(self):
         return f"<ScheduleLog {self.executed_at} (success={self.success})>"
@@ -124,6 +124,9 @@ class AudioGenerateResponse(BaseModel):
     file_size: int = Field(..., description="File size in bytes")
     duration: float = Field(..., description="Audio duration in seconds")
     status: str = Field(..., description="Generation status")
+    renditions: Optional[Dict[str, Dict[str, str]]] = Field(
+        None, description="Extra encodings (e.g. 'opus', 'web') with their URLs"
+    )
 
     # Voice information
     voice_id: str = Field(..., description="Voice used for generation")
@@ -159,6 +162,33 @@ class AudioGenerateResponse(BaseModel):
         }
 
 
+class DurationPredictionRequest(BaseModel):
+    """Request schema for predicting speech duration before synthesis"""
+
+    text: str = Field(..., min_length=1, max_length=5000, description="Text to be spoken")
+    voice_id: str = Field(..., description="Voice identifier")
+    speed: Optional[float] = Field(
+        default=None,
+        ge=0.7,
+        le=1.2,
+        description="Speed (0.7-1.2). If not provided, uses voice default.",
+    )
+    target_duration: Optional[float] = Field(
+        default=None, gt=0, description="Desired speech duration in seconds"
+    )
+
+
+class DurationPredictionResponse(BaseModel):
+    """Predicted speech duration of a text for a voice"""
+
+    voice_id: str
+    predicted_duration: float = Field(..., description="Predicted speech duration in seconds")
+    chars_per_second: float = Field(..., description="Fitted voice rate at speed 1.0")
+    samples: int = Field(..., description="Messages the rate was fitted from")
+    max_chars: Optional[int] = Field(None, description="Characters that fit target_duration")
+    fits: Optional[bool] = Field(None, description="Whether the text fits target_duration")
+
+
 class VoiceResponse(BaseModel):
     """Response schema for voice information"""
 
@@ -226,6 +256,8 @@ class AudioMessageResponse(BaseModel):
     file_size: Optional[int]
     duration: Optional[float]
     format: str
+    loudness_lufs: Optional[float] = None
+    renditions: Optional[Dict[str, Dict[str, str]]] = None
 
     # Content
     original_text: str
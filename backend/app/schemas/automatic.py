@@ -3,7 +3,7 @@ Automatic Mode API Schemas
 Pydantic models for automatic jingle generation - v2.1 Playground
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Literal
 
 
 class AutomaticGenerateRequest(BaseModel):
@@ -13,6 +13,9 @@ class AutomaticGenerateRequest(BaseModel):
     music_file: Optional[str] = Field(None, description="Music file for jingle (null for no music)")
     target_duration: int = Field(20, ge=5, le=30, description="Target duration in seconds (5, 10, 15, 20, 25)")
     improve_text: bool = Field(True, description="Whether to improve text with AI")
+    mix_backend: Optional[Literal["ffmpeg", "numpy"]] = Field(
+        None, description="Jingle mixing backend (defaults to server setting)"
+    )
 
 
 class AutomaticGenerateResponse(BaseModel):
@@ -28,6 +31,17 @@ class AutomaticGenerateResponse(BaseModel):
     audio_id: Optional[int] = None
 
 
+class PlayroomPreviewRequest(BaseModel):
+    """Request for rendering one voice take over several music beds"""
+    text: str = Field(..., min_length=1, max_length=2000, description="Final text to voice (not improved)")
+    voice_id: str = Field(..., description="Voice ID to use for TTS")
+    music_files: List[str] = Field(..., min_length=1, max_length=8, description="Music beds to compare")
+    preview: bool = Field(True, description="Low-bitrate previews instead of full quality")
+    mix_backend: Optional[Literal["ffmpeg", "numpy"]] = Field(
+        None, description="Jingle mixing backend (defaults to server setting)"
+    )
+
+
 class AutomaticConfigResponse(BaseModel):
     """Response with automatic mode configuration"""
     default_voice_id: Optional[str]
@@ -77,6 +77,8 @@ class CampaignAudioResponse(BaseModel):
 class CampaignAudiosListResponse(BaseModel):
     """List of audios in a campaign"""
     audios: List[CampaignAudioResponse]
-    total: int
+    total: Optional[int]  # None when count="none"
+    total_is_estimate: bool = False
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # None on the last page
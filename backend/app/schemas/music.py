@@ -14,6 +14,14 @@ class MusicTrackResponse(BaseModel):
     file_size: Optional[int] = None
     duration: Optional[float] = None
     bitrate: Optional[str] = None
+    loudness_lufs: Optional[float] = None
+    true_peak_db: Optional[float] = None
+    analysis_status: Optional[str] = None
+    leading_silence: Optional[float] = None
+    trailing_silence: Optional[float] = None
+    loop_start: Optional[float] = None
+    loop_end: Optional[float] = None
+    peaks: Optional[List[float]] = None
     is_default: bool
     active: bool
     order: int
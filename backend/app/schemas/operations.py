@@ -61,6 +61,10 @@ class VehicleAnnouncementRequest(BaseModel):
         None,
         description="Custom text to use instead of generating from template. Used for regeneration with edited text."
     )
+    segmented: Optional[bool] = Field(
+        None,
+        description="Synthesize only the variable parts and reuse cached audio for the rest. If None, uses server default."
+    )
 
 
 class PlateInfo(BaseModel):
@@ -358,6 +362,10 @@ class EmployeeCallRequest(BaseModel):
         None,
         description="Custom text for regeneration"
     )
+    segmented: Optional[bool] = Field(
+        None,
+        description="Synthesize only the variable parts and reuse cached audio for the rest. If None, uses server default."
+    )
 
 
 class EmployeeCallPreviewRequest(BaseModel):
@@ -0,0 +1,101 @@
+"""
+Pronunciation Lexicon Schemas
+Pydantic models for pronunciation entry management
+"""
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional
+from datetime import datetime
+
+
+class PronunciationEntryCreate(BaseModel):
+    """Schema for creating a pronunciation entry"""
+
+    term: str = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Word or phrase as written in announcements",
+        examples=["Hyundai", "Mall Plaza"],
+    )
+
+    replacement: str = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Spelling sent to TTS instead",
+        examples=["Hiúndai", "Mol Plása"],
+    )
+
+    voice_id: Optional[str] = Field(
+        None,
+        max_length=50,
+        description="Voice this entry applies to (all voices if omitted)",
+    )
+
+    case_sensitive: bool = Field(
+        default=False,
+        description="Only match the term with this exact capitalization",
+    )
+
+    active: bool = Field(default=True, description="Whether the entry is applied")
+
+    @field_validator("term", "replacement")
+    @classmethod
+    def validate_text(cls, v: str) -> str:
+        """Strip surrounding whitespace"""
+        v = v.strip()
+        if not v:
+            raise ValueError("Must not be blank")
+        return v
+
+
+class PronunciationEntryUpdate(BaseModel):
+    """Schema for updating a pronunciation entry"""
+
+    term: Optional[str] = Field(None, min_length=1, max_length=100)
+    replacement: Optional[str] = Field(None, min_length=1, max_length=200)
+    voice_id: Optional[str] = Field(None, max_length=50)
+    case_sensitive: Optional[bool] = None
+    active: Optional[bool] = None
+
+    @field_validator("term", "replacement")
+    @classmethod
+    def validate_text(cls, v: Optional[str]) -> Optional[str]:
+        """Strip surrounding whitespace"""
+        if v is None:
+            return v
+        v = v.strip()
+        if not v:
+            raise ValueError("Must not be blank")
+        return v
+
+
+class PronunciationEntryResponse(BaseModel):
+    """Response schema for a pronunciation entry"""
+
+    id: int
+    term: str
+    replacement: str
+    voice_id: Optional[str] = None
+    case_sensitive: bool
+    active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class PronunciationPreviewRequest(BaseModel):
+    """Request schema for previewing the lexicon on a text"""
+
+    text: str = Field(..., min_length=1, max_length=5000, description="Text to rewrite")
+    voice_id: Optional[str] = Field(None, description="Include this voice's entries")
+
+
+class PronunciationPreviewResponse(BaseModel):
+    """Text as it would be sent to TTS"""
+
+    text: str
+    tts_text: str
+    lexicon_version: int
@@ -333,7 +333,8 @@ Mensaje tres aquí
             client_context: Client/business context (system prompt)
             campaign_instructions: Campaign-specific AI instructions (added to prompt)
             mode: "normal" (2 suggestions) or "automatic" (1 suggestion)
-            word_limit: [min_words, max_words] for automatic mode
+            word_limit: [min_words, max_words]; defaults to 15-35 in automatic
+                mode and to _duration_to_word_limits(duration) in normal mode
 
         Returns:
             List of suggestions with metadata
@@ -447,7 +448,11 @@ Mensaje tres aquí
             return prompt
 
         # Normal mode: 2 options with word limits based on duration
-        min_words, max_words = self._duration_to_word_limits(duration)
+        # (or on the voice's speaking rate, when the caller provides them)
+        if word_limit:
+            min_words, max_words = word_limit
+        else:
+            min_words, max_words = self._duration_to_word_limits(duration)
 
         prompt = "Genera 2 opciones diferentes de anuncios para lo siguiente:\n\n"
         prompt += f"Contexto: {context}\n"
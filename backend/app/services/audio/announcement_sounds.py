@@ -0,0 +1,269 @@
+"""
+Announcement Sounds Cache
+Prepares intro/outro announcement sounds once and joins them to TTS audio
+by MP3 frame stream copy instead of decoding and re-encoding everything.
+
+Intro/outro assets in SOUNDS_PATH are transcoded (once per MP3 profile and
+per source file version) into SOUNDS_PATH/cache with the same sample rate,
+channel count and bitrate as the voice audio. The three files can then be
+concatenated with FFmpeg's concat demuxer and `-c copy`, which only moves
+frames around. If the voice file is not a plain MP3, or the copy fails, the
+full filter_complex re-encode is used as before.
+"""
+import os
+import logging
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Tuple
+
+from app.core.config import settings
+from app.services.audio.probe import audio_probe
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTRO_SOUND = "intro_announcement.mp3"
+DEFAULT_OUTRO_SOUND = "outro_announcement.mp3"
+
+# MPEG audio header lookup tables (index -> value)
+_MPEG_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),   # MPEG-1
+    2: (22050, 24000, 16000),   # MPEG-2
+    0: (11025, 12000, 8000),    # MPEG-2.5
+}
+_LAYER3_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# How far into the file to look for the first frame (after ID3v2)
+_MAX_SYNC_SCAN = 64 * 1024
+
+
+@dataclass(frozen=True)
+class Mp3Profile:
+    """Stream parameters that must match for frame-level concatenation"""
+    sample_rate: int
+    channels: int
+    bitrate_kbps: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.sample_rate}_{self.channels}ch_{self.bitrate_kbps}k"
+
+
+# ElevenLabs default output (mp3_44100_128, mono)
+ELEVENLABS_MP3_PROFILE = Mp3Profile(sample_rate=44100, channels=1, bitrate_kbps=128)
+
+
+def read_mp3_profile(file_path: str) -> Optional[Mp3Profile]:
+    """
+    Read the profile of an MP3 file from its first Layer III frame header.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Mp3Profile, or None if the file is not an MPEG Layer III stream
+    """
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(10)
+            offset = 0
+            if len(head) == 10 and head[:3] == b"ID3":
+                # Skip ID3v2 tag (syncsafe size, optional footer)
+                size = (
+                    (head[6] & 0x7F) << 21 | (head[7] & 0x7F) << 14
+                    | (head[8] & 0x7F) << 7 | (head[9] & 0x7F)
+                )
+                offset = 10 + size + (10 if head[5] & 0x10 else 0)
+            f.seek(offset)
+            data = f.read(_MAX_SYNC_SCAN)
+    except OSError:
+        return None
+
+    for i in range(len(data) - 3):
+        if data[i] != 0xFF or (data[i + 1] & 0xE0) != 0xE0:
+            continue
+        version = (data[i + 1] >> 3) & 0x03
+        layer = (data[i + 1] >> 1) & 0x03
+        bitrate_index = (data[i + 2] >> 4) & 0x0F
+        sample_rate_index = (data[i + 2] >> 2) & 0x03
+        channel_mode = (data[i + 3] >> 6) & 0x03
+
+        if version == 1 or layer != 1:  # reserved version / not Layer III
+            continue
+        if bitrate_index in (0, 15) or sample_rate_index == 3:
+            continue
+
+        bitrates = _LAYER3_BITRATES[3 if version == 3 else 2]
+        return Mp3Profile(
+            sample_rate=_MPEG_SAMPLE_RATES[version][sample_rate_index],
+            channels=1 if channel_mode == 3 else 2,
+            bitrate_kbps=bitrates[bitrate_index],
+        )
+
+    return None
+
+
+class AnnouncementSoundCache:
+    """
+    Prepared intro/outro sounds keyed by (sound, source version, MP3 profile).
+
+    Prepared files live on disk, so they survive restarts and are shared by
+    all workers; a change to the source file changes its version and
+    triggers a new preparation on next use.
+    """
+
+    def __init__(self):
+        self.sounds_path = settings.SOUNDS_PATH
+        self.cache_dir = os.path.join(settings.SOUNDS_PATH, "cache")
+        self.temp_path = settings.TEMP_PATH
+        # (sound_name, profile) -> (source version, prepared path, duration)
+        self._prepared: Dict[Tuple[str, Mp3Profile], Tuple[str, str, float]] = {}
+
+    def _source_version(self, source_path: str) -> Optional[str]:
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        return f"{stat.st_mtime_ns:x}{stat.st_size:x}"
+
+    def _probe_duration(self, file_path: str) -> float:
+        metadata = audio_probe.probe_sync(file_path)
+        return metadata.duration if metadata else 0.0
+
+    def get_prepared(
+        self, sound_name: str, profile: Mp3Profile
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Get a sound transcoded to the given MP3 profile, preparing it if needed.
+
+        Args:
+            sound_name: Filename in SOUNDS_PATH
+            profile: Target MP3 profile (usually the voice file's)
+
+        Returns:
+            (prepared_path, duration_seconds) or None if unavailable
+        """
+        source_path = os.path.abspath(os.path.join(self.sounds_path, sound_name))
+        version = self._source_version(source_path)
+        if version is None:
+            return None
+
+        key = (sound_name, profile)
+        cached = self._prepared.get(key)
+        if cached and cached[0] == version and os.path.exists(cached[1]):
+            return cached[1], cached[2]
+
+        stem = os.path.splitext(sound_name)[0]
+        prepared_path = os.path.abspath(
+            os.path.join(self.cache_dir, f"{stem}_{profile.key}_{version}.mp3")
+        )
+
+        if not os.path.exists(prepared_path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{prepared_path}.{os.getpid()}.tmp.mp3"
+            cmd = [
+                'ffmpeg', '-y',
+                '-i', source_path,
+                '-map', '0:a:0',
+                '-ac', str(profile.channels),
+                '-ar', str(profile.sample_rate),
+                '-codec:a', 'libmp3lame',
+                '-b:a', f'{profile.bitrate_kbps}k',
+                '-write_xing', '0',
+                '-id3v2_version', '0',
+                tmp_path
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            if result.returncode != 0:
+                logger.error(f"Failed to prepare {sound_name}: {result.stderr[:500]}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return None
+            # Atomic publish: concurrent workers may prepare the same file
+            os.replace(tmp_path, prepared_path)
+            logger.info(f"🔔 Prepared announcement sound: {os.path.basename(prepared_path)}")
+
+        duration = self._probe_duration(prepared_path)
+        self._prepared[key] = (version, prepared_path, duration)
+        return prepared_path, duration
+
+    def warm(
+        self,
+        profile: Mp3Profile = ELEVENLABS_MP3_PROFILE,
+        intro_sound: str = DEFAULT_INTRO_SOUND,
+        outro_sound: str = DEFAULT_OUTRO_SOUND,
+    ) -> None:
+        """Prepare the default intro/outro for the usual TTS output profile"""
+        for sound in (intro_sound, outro_sound):
+            try:
+                self.get_prepared(sound, profile)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not prepare announcement sound {sound}: {e}")
+
+    def concat_stream_copy(
+        self,
+        voice_path: str,
+        output_path: str,
+        intro_sound: str = DEFAULT_INTRO_SOUND,
+        outro_sound: str = DEFAULT_OUTRO_SOUND,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Join intro + voice + outro without re-encoding.
+
+        Args:
+            voice_path: Absolute path of the voice MP3
+            output_path: Absolute output path
+            intro_sound: Intro filename in SOUNDS_PATH
+            outro_sound: Outro filename in SOUNDS_PATH
+
+        Returns:
+            Result dict like JingleService.add_announcement_sounds, or None
+            if stream copy is not possible (caller should re-encode)
+        """
+        profile = read_mp3_profile(voice_path)
+        if profile is None:
+            return None
+
+        intro = self.get_prepared(intro_sound, profile)
+        outro = self.get_prepared(outro_sound, profile)
+        if intro is None or outro is None:
+            return None
+
+        os.makedirs(self.temp_path, exist_ok=True)
+        fd, list_path = tempfile.mkstemp(suffix=".txt", dir=self.temp_path)
+        try:
+            with os.fdopen(fd, "w") as f:
+                for path in (intro[0], voice_path, outro[0]):
+                    escaped = path.replace("'", "'\\''")
+                    f.write(f"file '{escaped}'\n")
+
+            cmd = [
+                'ffmpeg', '-y',
+                '-f', 'concat', '-safe', '0',
+                '-i', list_path,
+                '-c', 'copy',
+                output_path
+            ]
+            logger.debug(f"FFmpeg cmd: {' '.join(cmd)}")
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        finally:
+            os.remove(list_path)
+
+        if result.returncode != 0:
+            logger.warning(f"Stream-copy concat failed, falling back: {result.stderr[:300]}")
+            return None
+
+        voice_duration = self._probe_duration(voice_path)
+        return {
+            'success': True,
+            'duration': intro[1] + voice_duration + outro[1],
+            'intro_sound': intro_sound,
+            'outro_sound': outro_sound
+        }
+
+
+# Singleton instance
+announcement_sound_cache = AnnouncementSoundCache()
@@ -11,14 +11,18 @@ from datetime import datetime
 from typing import Optional, Dict
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from pydub import AudioSegment
 
+from app.core.config import settings
 from app.models.audio import AudioMessage
-from app.models.voice_settings import VoiceSettings
 from app.services.tts import voice_manager
 from app.services.audio.jingle import jingle_service
-from app.core.config import settings
+from app.services.audio.probe import audio_probe
+from app.services.audio.renditions import audio_renditions
+from app.services.audio.loudness import loudness_analyzer, normalization_gain_db
+from app.services.audio.music_analysis import music_analyzer
+from app.services.audio.silence import trim_file, trim_silence
+from app.services.storage import audio_storage
 
 logger = logging.getLogger(__name__)
 
@@ -80,10 +84,7 @@ async def generate_audio(
     # ------------------------------------------------------------------
     # 1. Look up and validate voice
     # ------------------------------------------------------------------
-    result = await db.execute(
-        select(VoiceSettings).filter(VoiceSettings.id == voice_id)
-    )
-    voice = result.scalar_one_or_none()
+    voice = await voice_manager.get_voice_with_settings(voice_id, db)
 
     if not voice:
         raise VoiceNotFoundError(voice_id)
@@ -104,64 +105,103 @@ async def generate_audio(
     # ------------------------------------------------------------------
     # 3. Save raw TTS to file
     # ------------------------------------------------------------------
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"tts_{timestamp}_{voice.id}.mp3"
-    file_path = os.path.join(settings.AUDIO_PATH, filename)
-    os.makedirs(settings.AUDIO_PATH, exist_ok=True)
-
-    with open(file_path, "wb") as f:
-        f.write(audio_bytes)
+    generated_at = datetime.now()
+    filename = audio_storage.new_filename("tts", voice.id, now=generated_at)
+    file_path = audio_storage.write_bytes(filename, audio_bytes)
 
     logger.info(f"💾 TTS audio saved: {filename}")
 
     # ------------------------------------------------------------------
     # 4. Audio post-processing
     # ------------------------------------------------------------------
-    audio = AudioSegment.from_file(file_path)
-    duration = len(audio) / 1000.0
-    file_size = os.path.getsize(file_path)
+    creates_jingle = bool(add_jingles and music_file)
+
+    # Loudness: measured once per take; the gain is applied in an encode that
+    # happens anyway (volume adjustment below, or the jingle mix)
+    loudness = None
+    loudness_gain = 0.0
+    if settings.LOUDNESS_NORMALIZATION:
+        loudness = await loudness_analyzer.measure(file_path)
+        if loudness:
+            loudness_gain = normalization_gain_db(
+                loudness.integrated_lufs, loudness.true_peak_dbtp
+            )
 
-    # Volume adjustment
+    # Edits of the raw take share one decode and one encode:
+    # volume adjustment (+ normalization for plain TTS) and TTS padding
+    # (only when NOT creating a jingle). The edge-silence trim rides on that
+    # encode; takes used as delivered are trimmed with a stream copy instead.
     volume_adj = effective_settings.get("volume_adjustment", voice.volume_adjustment)
-    if volume_adj != 0:
-        logger.info(f"🔊 Applying volume adjustment: {volume_adj} dB")
-        adjusted_audio = audio + volume_adj
-        adjusted_audio.export(file_path, format="mp3", bitrate="192k")
-        file_size = os.path.getsize(file_path)
+    total_gain = volume_adj + (0.0 if creates_jingle else loudness_gain)
+    tts_settings = {} if creates_jingle else (voice.tts_settings or {})
+    intro_silence = tts_settings.get("intro_silence", 0)
+    outro_silence = tts_settings.get("outro_silence", 0)
+
+    needs_edit = total_gain != 0 or intro_silence > 0 or outro_silence > 0
+
+    if settings.TTS_TRIM_SILENCE and not needs_edit:
+        await trim_file(file_path)
+
+    if needs_edit:
+        audio = AudioSegment.from_file(file_path)
+
+        if settings.TTS_TRIM_SILENCE:
+            try:
+                audio = trim_silence(audio)
+            except Exception as e:
+                logger.warning(f"⚠️ Silence trim skipped: {e}")
+
+        if total_gain != 0:
+            logger.info(f"🔊 Applying volume adjustment: {total_gain} dB")
+            audio = audio + total_gain
+
+        speech_duration = len(audio) / 1000.0
 
-    # TTS silence padding (only when NOT creating a jingle)
-    if not (add_jingles and music_file):
-        tts_settings = voice.tts_settings or {}
-        intro_silence = tts_settings.get("intro_silence", 0)
-        outro_silence = tts_settings.get("outro_silence", 0)
         if intro_silence > 0 or outro_silence > 0:
             logger.info(
                 f"🔇 Applying TTS padding: intro={intro_silence}s, outro={outro_silence}s"
             )
-            audio = AudioSegment.from_file(file_path)
             if intro_silence > 0:
                 audio = AudioSegment.silent(duration=int(intro_silence * 1000)) + audio
             if outro_silence > 0:
                 audio = audio + AudioSegment.silent(duration=int(outro_silence * 1000))
-            audio.export(file_path, format="mp3", bitrate="192k")
-            duration = len(audio) / 1000.0
-            file_size = os.path.getsize(file_path)
-            logger.info(f"✅ TTS padding applied, new duration: {duration:.2f}s")
+
+        audio.export(file_path, format="mp3", bitrate="192k")
+        duration = len(audio) / 1000.0
+        file_size = os.path.getsize(file_path)
+        logger.info(f"✅ TTS post-processing applied, new duration: {duration:.2f}s")
+    else:
+        # Header probe only; the take is used as delivered
+        metadata = await audio_probe.probe(file_path)
+        if metadata:
+            duration = metadata.duration
+        else:
+            duration = len(AudioSegment.from_file(file_path)) / 1000.0
+        file_size = os.path.getsize(file_path)
+        speech_duration = duration
 
     # ------------------------------------------------------------------
     # 5. Jingle creation (mix TTS with background music)
     # ------------------------------------------------------------------
-    if add_jingles and music_file:
+    renditions = None
+    if creates_jingle:
         logger.info(f"🎵 Creating jingle with music: {music_file}")
-        jingle_filename = f"jingle_{timestamp}_{voice.id}.mp3"
-        jingle_path = os.path.join(settings.AUDIO_PATH, jingle_filename)
+        jingle_filename = audio_storage.new_filename("jingle", voice.id, now=generated_at)
+        jingle_path = audio_storage.reserve_path(jingle_filename)
         voice_jingle_settings = voice.jingle_settings if voice.jingle_settings else None
+        rendition_targets = audio_renditions.plan(jingle_filename)
+        # Stored track analysis: loop segment and normalization gain
+        music_params = await music_analyzer.jingle_params(music_file, db)
 
+        # Renditions are encoded from the same mix graph (single decode)
         jingle_result = await jingle_service.create_jingle(
             voice_audio_path=file_path,
             music_filename=music_file,
             output_path=jingle_path,
             voice_jingle_settings=voice_jingle_settings,
+            renditions=rendition_targets,
+            voice_gain_db=loudness_gain,
+            **music_params,
         )
 
         if jingle_result["success"]:
@@ -170,18 +210,25 @@ async def generate_audio(
             file_path = jingle_path
             duration = jingle_result["duration"]
             file_size = os.path.getsize(file_path)
+            renditions = jingle_result.get("renditions")
             logger.info(f"🎉 Jingle created successfully: {filename} ({duration:.2f}s)")
         else:
+            audio_renditions.delete(rendition_targets)
             logger.warning(
                 f"⚠️ Jingle creation failed: {jingle_result.get('error')}, "
                 f"using TTS-only audio"
             )
 
+    if not renditions:
+        renditions = await audio_renditions.render(file_path, filename)
+
     # ------------------------------------------------------------------
     # 6. Build and persist AudioMessage
     # ------------------------------------------------------------------
     display_name = text[:50] + "..." if len(text) > 50 else text
-    settings_snapshot = voice_manager.get_voice_settings_snapshot(voice)
+    settings_snapshot = voice_manager.get_voice_settings_snapshot(
+        voice, effective_settings
+    )
 
     audio_message = AudioMessage(
         filename=filename,
@@ -190,6 +237,11 @@ async def generate_audio(
         file_size=file_size,
         duration=duration,
         format="mp3",
+        renditions=renditions or None,
+        speech_duration=speech_duration,
+        loudness_lufs=loudness.integrated_lufs if loudness else None,
+        true_peak_db=loudness.true_peak_dbtp if loudness else None,
+        loudness_gain_db=loudness_gain if loudness else None,
         original_text=text,
         voice_id=voice.id,
         voice_settings_snapshot=settings_snapshot,
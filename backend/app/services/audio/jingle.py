@@ -3,17 +3,27 @@ Jingle Service - Mixes TTS audio with background music
 Based on legacy jingle-service.php logic, adapted for Python/FastAPI
 """
 import os
+import math
+import asyncio
 import logging
 import subprocess
 import tempfile
 import shutil
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass, replace
 
 from app.core.config import settings
+from app.services.audio.announcement_sounds import announcement_sound_cache
+from app.services.audio.probe import audio_probe
+from app.services.audio.jingle_cache import jingle_mix_cache
+from app.services.audio.pcm_mixer import pcm_mixer
+from app.services.audio.renditions import audio_renditions, RenditionTarget
 
 logger = logging.getLogger(__name__)
 
+OUTPUT_BITRATE = "192k"
+PREVIEW_BITRATE = "64k"    # Low-bitrate previews for comparing music beds
+
 
 @dataclass
 class JingleConfig:
@@ -38,20 +48,10 @@ class JingleService:
         self.music_path = settings.MUSIC_PATH
         self.temp_path = settings.TEMP_PATH
 
-    def _get_audio_duration(self, file_path: str) -> float:
-        """Get duration of audio file using ffprobe"""
-        try:
-            cmd = [
-                'ffprobe', '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'csv=p=0',
-                file_path
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            return float(result.stdout.strip())
-        except Exception as e:
-            logger.error(f"Error getting audio duration: {e}")
-            return 0.0
+    async def get_audio_duration(self, file_path: str) -> float:
+        """Get duration of audio file using ffprobe (cached by path/mtime/size, non-blocking)"""
+        metadata = await audio_probe.probe(file_path)
+        return metadata.duration if metadata else 0.0
 
     def _find_music_file(self, music_filename: str) -> Optional[str]:
         """Find music file in storage"""
@@ -73,6 +73,40 @@ class JingleService:
         logger.error(f"Music file not found: {music_filename}")
         return None
 
+    def _music_source(
+        self,
+        music_file: str,
+        total_duration: float,
+        segment: Optional[Tuple[float, float]] = None
+    ) -> Tuple[list, str]:
+        """
+        Input options and looping filter for the music bed.
+
+        Without analysis the whole file is decoded and looped (aloop buffers
+        all of it). With an analyzed loop segment (MusicTrack.loop_start/end)
+        only the segment is decoded, which skips the silent intro, and it is
+        looped from a segment-sized buffer only if the jingle is longer.
+        """
+        if not segment:
+            return (
+                ['-i', music_file],
+                f"[0:a]aloop=loop=-1:size=2e+09,atrim=0:{total_duration:.1f},"
+            )
+
+        start, end = segment
+        length = end - start
+        if length >= total_duration:
+            return (
+                ['-ss', f'{start:.3f}', '-t', f'{total_duration:.1f}', '-i', music_file],
+                f"[0:a]atrim=0:{total_duration:.1f},"
+            )
+
+        loop_samples = int(math.ceil(length * 44100))
+        return (
+            ['-ss', f'{start:.3f}', '-t', f'{length:.3f}', '-i', music_file],
+            f"[0:a]aresample=44100,aloop=loop=-1:size={loop_samples},atrim=0:{total_duration:.1f},"
+        )
+
     def _build_ducking_command(
         self,
         music_file: str,
@@ -81,10 +115,13 @@ class JingleService:
         config: JingleConfig,
         voice_duration: float,
         total_duration: float,
-        fade_out_start: float
+        fade_out_start: float,
+        bitrate: str = OUTPUT_BITRATE,
+        segment: Optional[Tuple[float, float]] = None
     ) -> list:
         """Build FFmpeg command with sidechaincompress ducking"""
         intro_ms = int(config.intro_silence * 1000)
+        music_input, music_filter = self._music_source(music_file, total_duration, segment)
 
         # Calculate threshold from duck_level
         # Higher duck_level = lower threshold = more ducking
@@ -98,7 +135,7 @@ class JingleService:
 
         # Build complex filter
         filter_complex = (
-            f"[0:a]aloop=loop=-1:size=2e+09,atrim=0:{total_duration:.1f},"
+            f"{music_filter}"
             f"volume={config.music_volume:.2f}[music_loop];"
             f"[1:a]adelay={intro_ms}|{intro_ms},volume={config.voice_volume:.2f},"
             f"apad=whole_dur={total_duration:.1f}[voice_pad];"
@@ -112,7 +149,7 @@ class JingleService:
 
         cmd = [
             'ffmpeg', '-y',
-            '-i', music_file,
+            *music_input,
             '-i', voice_file,
             '-filter_complex', filter_complex,
             '-map', '[out]',
@@ -121,7 +158,7 @@ class JingleService:
             '-ac', '2',
             '-ar', '44100',
             '-codec:a', 'libmp3lame',
-            '-b:a', '192k',
+            '-b:a', bitrate,
             output_file
         ]
 
@@ -134,13 +171,16 @@ class JingleService:
         output_file: str,
         config: JingleConfig,
         total_duration: float,
-        fade_out_start: float
+        fade_out_start: float,
+        bitrate: str = OUTPUT_BITRATE,
+        segment: Optional[Tuple[float, float]] = None
     ) -> list:
         """Build FFmpeg command for simple mix without ducking"""
         intro_ms = int(config.intro_silence * 1000)
+        music_input, music_filter = self._music_source(music_file, total_duration, segment)
 
         filter_complex = (
-            f"[0:a]aloop=loop=-1:size=2e+09,atrim=0:{total_duration:.1f},"
+            f"{music_filter}"
             f"volume={config.music_volume:.2f},"
             f"afade=t=in:d={config.fade_in:.1f},"
             f"afade=t=out:st={fade_out_start:.1f}:d={config.fade_out:.1f}[music];"
@@ -151,7 +191,7 @@ class JingleService:
 
         cmd = [
             'ffmpeg', '-y',
-            '-i', music_file,
+            *music_input,
             '-i', voice_file,
             '-filter_complex', filter_complex,
             '-map', '[out]',
@@ -160,19 +200,64 @@ class JingleService:
             '-ac', '2',
             '-ar', '44100',
             '-codec:a', 'libmp3lame',
-            '-b:a', '192k',
+            '-b:a', bitrate,
             output_file
         ]
 
         return cmd
 
+    def _add_rendition_outputs(
+        self, cmd: list, renditions: List[RenditionTarget], total_duration: float
+    ) -> list:
+        """Split the final mix so renditions are encoded from the same graph"""
+        labels = [f"[r{i}]" for i in range(len(renditions))]
+        filter_index = cmd.index('-filter_complex') + 1
+        cmd[filter_index] += f";[out]asplit={len(renditions) + 1}[main]{''.join(labels)}"
+        cmd[cmd.index('[out]')] = '[main]'
+        for target, label in zip(renditions, labels):
+            cmd += ['-t', f'{total_duration:.1f}'] + audio_renditions.output_args(target, label)
+        return cmd
+
+    async def _mix_numpy(
+        self,
+        voice_audio_path: str,
+        music_path: str,
+        output_path: str,
+        config: JingleConfig,
+        total_duration: float,
+        fade_out_start: float,
+        bitrate: str,
+        renditions: Optional[List[RenditionTarget]],
+        segment: Optional[Tuple[float, float]] = None
+    ) -> Optional[float]:
+        """Mix with the in-process NumPy backend; jingle duration, or None to use FFmpeg"""
+        try:
+            duration = await asyncio.to_thread(
+                pcm_mixer.mix_to_file,
+                voice_audio_path, music_path, output_path, config,
+                total_duration, fade_out_start, bitrate, renditions, segment
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ NumPy mix failed ({e}), using FFmpeg")
+            return None
+
+        logger.info("Jingle mixed in-process (numpy backend)")
+        return duration
+
     async def create_jingle(
         self,
         voice_audio_path: str,
         music_filename: str,
         output_path: str,
         config: Optional[JingleConfig] = None,
-        voice_jingle_settings: Optional[Dict[str, Any]] = None
+        voice_jingle_settings: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        preview: bool = False,
+        renditions: Optional[List[RenditionTarget]] = None,
+        backend: Optional[str] = None,
+        voice_gain_db: float = 0.0,
+        music_gain_db: float = 0.0,
+        music_segment: Optional[Tuple[float, float]] = None
     ) -> Dict[str, Any]:
         """
         Create a jingle by mixing voice audio with background music.
@@ -183,6 +268,15 @@ class JingleService:
             output_path: Path for the output jingle file
             config: Optional JingleConfig, uses defaults if not provided
             voice_jingle_settings: Optional voice-specific jingle settings from DB
+            use_cache: Reuse/store the result in the jingle mix cache
+            preview: Encode at PREVIEW_BITRATE for quick comparisons
+            renditions: Extra outputs (from audio_renditions.plan) to encode
+                in the same FFmpeg run; reported under 'renditions'
+            backend: 'ffmpeg' or 'numpy' (defaults to JINGLE_MIX_BACKEND)
+            voice_gain_db: Loudness normalization gain for the voice
+            music_gain_db: Loudness normalization gain for the music bed
+            music_segment: Analyzed (loop_start, loop_end) of the music bed;
+                the whole file is looped when not given
 
         Returns:
             Dict with success status, duration, and any error message
@@ -206,6 +300,14 @@ class JingleService:
             if 'outro_silence' in voice_jingle_settings:
                 config.outro_silence = voice_jingle_settings['outro_silence']
 
+        # Normalization gains ride on the existing volume filters (same encode)
+        if voice_gain_db or music_gain_db:
+            config = replace(
+                config,
+                voice_volume=config.voice_volume * 10 ** (voice_gain_db / 20),
+                music_volume=config.music_volume * 10 ** (music_gain_db / 20),
+            )
+
         try:
             # Find music file
             music_path = self._find_music_file(music_filename)
@@ -216,7 +318,7 @@ class JingleService:
                 }
 
             # Get voice duration
-            voice_duration = self._get_audio_duration(voice_audio_path)
+            voice_duration = await self.get_audio_duration(voice_audio_path)
             if voice_duration <= 0:
                 return {
                     'success': False,
@@ -229,6 +331,30 @@ class JingleService:
             voice_end_time = config.intro_silence + voice_duration
             total_duration = voice_end_time + config.outro_silence
             fade_out_start = max(voice_end_time, total_duration - config.fade_out)
+            bitrate = PREVIEW_BITRATE if preview else OUTPUT_BITRATE
+            backend = backend or settings.JINGLE_MIX_BACKEND
+            if backend == "numpy" and not pcm_mixer.supports(total_duration):
+                backend = "ffmpeg"
+
+            # Cached mixes have no rendition files: render those fresh
+            cache_key = None
+            if use_cache and not renditions:
+                cache_key = jingle_mix_cache.key_for(
+                    voice_audio_path, music_path, config, bitrate, backend, music_segment
+                )
+                cached_path = jingle_mix_cache.lookup(cache_key)
+                if cached_path:
+                    shutil.copyfile(cached_path, output_path)
+                    output_duration = await self.get_audio_duration(output_path)
+                    logger.info(f"♻️ Jingle served from mix cache: {output_duration:.2f}s")
+                    return {
+                        'success': True,
+                        'duration': output_duration,
+                        'total_duration': total_duration,
+                        'music_file': music_filename,
+                        'cached': True,
+                        'cache_key': cache_key
+                    }
 
             logger.info(
                 f"Jingle timings: intro={config.intro_silence}s, "
@@ -236,38 +362,62 @@ class JingleService:
                 f"fade_out_start={fade_out_start:.2f}s"
             )
 
-            # Build FFmpeg command
-            if config.ducking_enabled:
-                cmd = self._build_ducking_command(
-                    music_path, voice_audio_path, output_path,
-                    config, voice_duration, total_duration, fade_out_start
+            output_duration = None
+            if backend == "numpy":
+                output_duration = await self._mix_numpy(
+                    voice_audio_path, music_path, output_path, config,
+                    total_duration, fade_out_start, bitrate, renditions, music_segment
                 )
-            else:
-                cmd = self._build_simple_mix_command(
-                    music_path, voice_audio_path, output_path,
-                    config, total_duration, fade_out_start
+                if output_duration is None:
+                    backend = "ffmpeg"
+                    if cache_key:
+                        # Keyed by the backend that actually produces the mix
+                        cache_key = jingle_mix_cache.key_for(
+                            voice_audio_path, music_path, config, bitrate, backend, music_segment
+                        )
+
+            if output_duration is None:
+                # Build FFmpeg command
+                if config.ducking_enabled:
+                    cmd = self._build_ducking_command(
+                        music_path, voice_audio_path, output_path,
+                        config, voice_duration, total_duration, fade_out_start, bitrate,
+                        music_segment
+                    )
+                else:
+                    cmd = self._build_simple_mix_command(
+                        music_path, voice_audio_path, output_path,
+                        config, total_duration, fade_out_start, bitrate, music_segment
+                    )
+
+                if renditions:
+                    cmd = self._add_rendition_outputs(cmd, renditions, total_duration)
+
+                logger.info(f"Running FFmpeg command...")
+                logger.debug(f"FFmpeg cmd: {' '.join(cmd)}")
+
+                # Execute FFmpeg (in a thread, so concurrent mixes run in parallel)
+                result = await asyncio.to_thread(
+                    subprocess.run,
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=120  # 2 minute timeout
                 )
 
-            logger.info(f"Running FFmpeg command...")
-            logger.debug(f"FFmpeg cmd: {' '.join(cmd)}")
-
-            # Execute FFmpeg
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120  # 2 minute timeout
-            )
+                if result.returncode != 0:
+                    logger.error(f"FFmpeg error: {result.stderr}")
+                    return {
+                        'success': False,
+                        'error': f'FFmpeg processing failed: {result.stderr[:500]}'
+                    }
 
-            if result.returncode != 0:
-                logger.error(f"FFmpeg error: {result.stderr}")
-                return {
-                    'success': False,
-                    'error': f'FFmpeg processing failed: {result.stderr[:500]}'
-                }
+            if cache_key:
+                jingle_mix_cache.store(cache_key, output_path)
 
-            # Get output duration
-            output_duration = self._get_audio_duration(output_path)
+            # Get output duration (the NumPy backend knows it from the PCM)
+            if output_duration is None:
+                output_duration = await self.get_audio_duration(output_path)
 
             logger.info(f"Jingle created successfully: {output_duration:.2f}s")
 
@@ -275,7 +425,10 @@ class JingleService:
                 'success': True,
                 'duration': output_duration,
                 'total_duration': total_duration,
-                'music_file': music_filename
+                'music_file': music_filename,
+                'cache_key': cache_key,
+                'backend': backend,
+                'renditions': audio_renditions.describe(renditions or [])
             }
 
         except subprocess.TimeoutExpired:
@@ -304,8 +457,10 @@ class JingleService:
 
         Concatenates: intro_sound + voice_audio + outro_sound
 
-        Uses FFmpeg filter_complex with concat filter to handle mixed formats
-        (e.g., .m4a intro/outro with .mp3 voice).
+        When the voice is a plain MP3, intro/outro are taken from the prepared
+        sound cache (already matching the voice's MP3 profile) and joined by
+        stream copy. Otherwise falls back to FFmpeg filter_complex with concat
+        filter to handle mixed formats (e.g., .m4a intro/outro with .mp3 voice).
 
         Args:
             voice_audio_path: Path to the TTS audio file
@@ -346,7 +501,17 @@ class JingleService:
                     'error': f'Voice file not found: {voice_audio_path}'
                 }
 
-            # Use filter_complex with concat filter - handles mixed formats automatically
+            # Fast path: prepared intro/outro joined by MP3 frame stream copy
+            fast_result = announcement_sound_cache.concat_stream_copy(
+                voice_abs_path, output_abs_path, intro_sound, outro_sound
+            )
+            if fast_result:
+                logger.info(
+                    f"Announcement audio created (stream copy): {fast_result['duration']:.2f}s"
+                )
+                return fast_result
+
+            # Fallback: filter_complex with concat filter - handles mixed formats automatically
             # This approach decodes all inputs and re-encodes, so format differences don't matter
             filter_complex = "[0:a][1:a][2:a]concat=n=3:v=0:a=1[out]"
 
@@ -382,7 +547,7 @@ class JingleService:
                 }
 
             # Get output duration
-            output_duration = self._get_audio_duration(output_abs_path)
+            output_duration = await self.get_audio_duration(output_abs_path)
 
             logger.info(f"Announcement audio created successfully: {output_duration:.2f}s")
 
@@ -0,0 +1,103 @@
+"""
+Jingle Mix Cache
+Stores finished voice + music mixes so identical requests skip FFmpeg.
+
+A mix is identified by the content hash of the voice audio, the music
+file (name, mtime and size, so replacing a track invalidates its mixes)
+and every JingleConfig field. MIX_VERSION is part of the key and must be
+bumped whenever the FFmpeg filter graph in JingleService changes.
+"""
+import os
+import json
+import hashlib
+import logging
+from dataclasses import asdict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.services.storage.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+MIX_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(file_path: str) -> str:
+    """sha256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class JingleMixCache:
+    """
+    Disk-backed LRU of mixed jingles, shared by all workers.
+    """
+
+    def __init__(self):
+        self._cache = DiskCache("jingles", settings.JINGLE_MIX_CACHE_MAX_ENTRIES)
+
+    def key_for(
+        self,
+        voice_path: str,
+        music_path: str,
+        config: Any,
+        bitrate: str = "192k",
+        backend: str = "ffmpeg",
+        segment: Optional[Tuple[float, float]] = None,
+    ) -> str:
+        """
+        Build the cache key of a mix.
+
+        Args:
+            voice_path: Voice audio file
+            music_path: Resolved music file
+            config: JingleConfig with voice overrides already applied
+            bitrate: Output MP3 bitrate (full quality or preview)
+            backend: Mixing backend ('ffmpeg' or 'numpy')
+            segment: Music loop segment, if the track was analyzed
+
+        Returns:
+            str: Hex digest
+        """
+        music_stat = os.stat(music_path)
+        raw = json.dumps(
+            {
+                "v": MIX_VERSION,
+                "voice": file_digest(voice_path),
+                "music": [
+                    os.path.basename(music_path),
+                    music_stat.st_mtime_ns,
+                    music_stat.st_size,
+                ],
+                "config": asdict(config),
+                "bitrate": bitrate,
+                "backend": backend,
+                "segment": list(segment) if segment else None,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Path of a cached mix, or None"""
+        return self._cache.lookup(key)
+
+    def store(self, key: str, mixed_path: str) -> None:
+        """Keep a copy of a freshly mixed file"""
+        try:
+            self._cache.store_file(key, mixed_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache jingle mix: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics for diagnostics"""
+        return self._cache.stats()
+
+
+# Singleton instance
+jingle_mix_cache = JingleMixCache()
@@ -0,0 +1,163 @@
+"""
+Loudness Analysis
+EBU R128 measurements stored per asset and turned into a linear gain.
+
+Each asset is measured once with FFmpeg's loudnorm filter in analysis mode
+(integrated loudness, true peak, loudness range): voice takes right after
+synthesis, music tracks on upload (or on first use for older tracks). The
+values are stored on AudioMessage / MusicTrack, and normalization is a
+plain gain folded into the encode that already happens (volume adjustment
+or jingle mix) - no second loudnorm pass per generation.
+"""
+import json
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.music_track import MusicTrack
+
+logger = logging.getLogger(__name__)
+
+# Normalization never pushes the true peak above this
+MAX_TRUE_PEAK_DBTP = -1.0
+
+# Gains beyond this are treated as bad measurements (silence, noise)
+MAX_GAIN_DB = 20.0
+
+ANALYSIS_TIMEOUT = 120
+
+
+@dataclass(frozen=True)
+class LoudnessMeasurement:
+    """EBU R128 measurement of one file"""
+    integrated_lufs: float
+    true_peak_dbtp: float
+    loudness_range: Optional[float] = None
+
+
+def parse_loudnorm_output(stderr: str) -> Optional[LoudnessMeasurement]:
+    """
+    Extract the measurement from loudnorm's print_format=json report.
+
+    Args:
+        stderr: FFmpeg stderr (the JSON block is printed last)
+
+    Returns:
+        LoudnessMeasurement, or None if missing or not finite (silence)
+    """
+    start = stderr.rfind("{")
+    end = stderr.rfind("}")
+    if start < 0 or end < start:
+        return None
+    try:
+        data = json.loads(stderr[start:end + 1])
+        integrated = float(data["input_i"])
+        true_peak = float(data["input_tp"])
+        lra = float(data["input_lra"]) if "input_lra" in data else None
+    except (ValueError, KeyError, TypeError):
+        return None
+
+    # loudnorm reports -inf for silent input
+    if integrated in (float("inf"), float("-inf")) or integrated != integrated:
+        return None
+    return LoudnessMeasurement(integrated, true_peak, lra)
+
+
+def normalization_gain_db(
+    integrated_lufs: Optional[float],
+    true_peak_dbtp: Optional[float] = None,
+    target_lufs: Optional[float] = None,
+) -> float:
+    """
+    Linear gain (dB) that brings a measured asset to the target loudness.
+
+    The gain is reduced when it would push the true peak above
+    MAX_TRUE_PEAK_DBTP. Returns 0.0 when there is no measurement.
+    """
+    if integrated_lufs is None:
+        return 0.0
+    target = settings.DEFAULT_TARGET_LUFS if target_lufs is None else target_lufs
+    gain = target - integrated_lufs
+    if true_peak_dbtp is not None:
+        gain = min(gain, MAX_TRUE_PEAK_DBTP - true_peak_dbtp)
+    return max(-MAX_GAIN_DB, min(MAX_GAIN_DB, round(gain, 2)))
+
+
+class LoudnessAnalyzer:
+    """
+    Runs loudnorm analysis and keeps MusicTrack measurements up to date.
+    """
+
+    async def measure(self, file_path: str) -> Optional[LoudnessMeasurement]:
+        """
+        Measure a file (one decode, no output written).
+
+        Args:
+            file_path: Audio file
+
+        Returns:
+            LoudnessMeasurement, or None if analysis failed
+        """
+        cmd = [
+            'ffmpeg', '-hide_banner', '-nostats',
+            '-i', file_path,
+            '-af', f'loudnorm=I={settings.DEFAULT_TARGET_LUFS}:print_format=json',
+            '-f', 'null', '-'
+        ]
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=ANALYSIS_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"⚠️ Loudness analysis failed for {file_path}: {e}")
+            return None
+
+        if proc.returncode != 0:
+            logger.warning(f"⚠️ Loudness analysis failed for {file_path}")
+            return None
+
+        measurement = parse_loudnorm_output(stderr.decode(errors="replace"))
+        if measurement:
+            logger.info(
+                f"📏 Loudness: {measurement.integrated_lufs:.1f} LUFS, "
+                f"{measurement.true_peak_dbtp:.1f} dBTP"
+            )
+        return measurement
+
+    async def music_gain_db(self, music_filename: str, db: AsyncSession) -> float:
+        """
+        Normalization gain for a music track, measuring it on first use.
+
+        Tracks uploaded before loudness analysis existed are measured once
+        here and the values are stored on the MusicTrack row (committed
+        with the caller's transaction).
+        """
+        result = await db.execute(
+            select(MusicTrack).filter(MusicTrack.filename == music_filename)
+        )
+        track = result.scalar_one_or_none()
+        if not track:
+            return 0.0
+        return await self.track_gain_db(track)
+
+    async def track_gain_db(self, track: MusicTrack) -> float:
+        """Normalization gain for a loaded MusicTrack (measured if missing)"""
+        if track.loudness_lufs is None and track.file_path:
+            measurement = await self.measure(track.file_path)
+            if measurement:
+                track.loudness_lufs = measurement.integrated_lufs
+                track.true_peak_db = measurement.true_peak_dbtp
+
+        return normalization_gain_db(track.loudness_lufs, track.true_peak_db)
+
+
+# Singleton instance
+loudness_analyzer = LoudnessAnalyzer()
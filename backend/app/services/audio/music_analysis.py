@@ -0,0 +1,281 @@
+"""
+Music Analysis
+Background analysis of uploaded music tracks, stored on MusicTrack.
+
+Uploads only save the file and its container metadata; everything that
+needs a full decode runs afterwards in a small worker pool:
+
+    loudness   EBU R128 integrated loudness / true peak (loudness.py)
+    silence    leading and trailing silence of the bed
+    loop       a segment [loop_start, loop_end) that wraps smoothly
+    peaks      PEAK_BUCKETS normalized peak values for waveform display
+
+Jingle generation reads the stored values instead of analyzing per mix:
+the silent intro is skipped and only the loop segment is decoded and
+looped (see JingleService._music_source).
+"""
+import asyncio
+import logging
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.core.response_cache import response_cache, MUSIC
+from app.models.music_track import MusicTrack
+from app.services.audio.loudness import loudness_analyzer
+
+logger = logging.getLogger(__name__)
+
+# Analysis runs on a mono downmix; loop points need ~ms precision only
+ANALYSIS_SAMPLE_RATE = 22050
+FRAME_SIZE = 512                # ~23 ms envelope frames
+
+SILENCE_THRESHOLD_DB = -50.0    # Frames below this are silence
+MIN_LOOP_SECONDS = 10.0         # Shorter loops sound repetitive under a voice
+MATCH_WINDOW_SECONDS = 2.0      # Envelope compared around the loop seam
+LENGTH_PENALTY_DB = 3.0         # Preference for longer loops at equal match
+
+PEAK_BUCKETS = 200
+
+DECODE_TIMEOUT = 120
+
+
+@dataclass
+class MusicAnalysis:
+    """Result of analyzing one music track (seconds)"""
+    leading_silence: float
+    trailing_silence: float
+    loop_start: Optional[float] = None
+    loop_end: Optional[float] = None
+    peaks: List[float] = field(default_factory=list)
+
+
+def decode_mono(file_path: str) -> np.ndarray:
+    """Decode a file to ANALYSIS_SAMPLE_RATE mono int16 with FFmpeg"""
+    cmd = [
+        'ffmpeg', '-v', 'error', '-i', file_path,
+        '-f', 's16le', '-acodec', 'pcm_s16le',
+        '-ac', '1', '-ar', str(ANALYSIS_SAMPLE_RATE),
+        'pipe:1'
+    ]
+    result = subprocess.run(cmd, capture_output=True, timeout=DECODE_TIMEOUT)
+    if result.returncode != 0:
+        raise RuntimeError(f"decode failed: {result.stderr.decode(errors='replace')[:300]}")
+    return np.frombuffer(result.stdout, dtype='<i2')
+
+
+def frame_levels_db(pcm: np.ndarray, frame_size: int = FRAME_SIZE) -> np.ndarray:
+    """RMS level (dBFS) of consecutive frames; a trailing partial frame is dropped"""
+    frames = len(pcm) // frame_size
+    if frames == 0:
+        return np.zeros(0, dtype=np.float64)
+    blocks = pcm[:frames * frame_size].astype(np.float64).reshape(frames, frame_size) / 32768.0
+    rms = np.sqrt(np.mean(blocks ** 2, axis=1))
+    return 20 * np.log10(np.maximum(rms, 1e-6))
+
+
+def find_loop_segment(
+    levels: np.ndarray,
+    start: int,
+    end: int,
+    frame_seconds: float,
+) -> Tuple[int, int]:
+    """
+    Pick loop points (frame indices) inside the audible part [start, end).
+
+    The loop end is the frame whose following MATCH_WINDOW_SECONDS of
+    envelope best matches the envelope after the loop start, so jumping
+    back to the start continues at the same level and rhythm. Longer loops
+    win ties (up to LENGTH_PENALTY_DB of mismatch).
+    """
+    window = max(1, int(round(MATCH_WINDOW_SECONDS / frame_seconds)))
+    min_loop = int(round(MIN_LOOP_SECONDS / frame_seconds))
+    first = start + min_loop
+    last = end - window
+    if last < first:
+        return start, end
+
+    reference = levels[start:start + window]
+    candidates = np.lib.stride_tricks.sliding_window_view(levels[first:last + window], window)
+    mismatch = np.mean(np.abs(candidates - reference), axis=1)
+    positions = np.arange(first, last + 1)
+    score = mismatch + LENGTH_PENALTY_DB * (1.0 - (positions - start) / float(end - start))
+    return start, int(positions[np.argmin(score)])
+
+
+def snap_to_zero_crossing(pcm: np.ndarray, index: int, radius: int) -> int:
+    """Nearest rising zero crossing within radius samples (index if none)"""
+    lo = max(1, index - radius)
+    hi = min(len(pcm), index + radius + 1)
+    if hi <= lo:
+        return index
+    window = pcm[lo - 1:hi].astype(np.int32)
+    crossings = np.nonzero((window[:-1] < 0) & (window[1:] >= 0))[0] + lo
+    if len(crossings) == 0:
+        return index
+    return int(crossings[np.argmin(np.abs(crossings - index))])
+
+
+def compute_peaks(pcm: np.ndarray, buckets: int = PEAK_BUCKETS) -> List[float]:
+    """Peak amplitude (0-1) of buckets equal slices, for waveform previews"""
+    if len(pcm) == 0:
+        return []
+    edges = np.linspace(0, len(pcm), buckets + 1).astype(np.int64)
+    magnitude = np.abs(pcm.astype(np.int32))
+    peaks = np.maximum.reduceat(magnitude, edges[:-1][edges[:-1] < len(pcm)])
+    return [round(float(p) / 32768.0, 3) for p in peaks]
+
+
+def analyze_pcm(pcm: np.ndarray, sample_rate: int = ANALYSIS_SAMPLE_RATE) -> MusicAnalysis:
+    """
+    Analyze mono int16 PCM.
+
+    Returns:
+        MusicAnalysis (no loop points when the track is silent)
+    """
+    frame_seconds = FRAME_SIZE / sample_rate
+    duration = len(pcm) / sample_rate
+    levels = frame_levels_db(pcm)
+    audible = np.nonzero(levels > SILENCE_THRESHOLD_DB)[0]
+    peaks = compute_peaks(pcm)
+
+    if len(audible) == 0:
+        return MusicAnalysis(leading_silence=round(duration, 3), trailing_silence=0.0, peaks=peaks)
+
+    start, end = int(audible[0]), int(audible[-1]) + 1
+    loop_start, loop_end = find_loop_segment(levels, start, end, frame_seconds)
+
+    start_sample = snap_to_zero_crossing(pcm, loop_start * FRAME_SIZE, FRAME_SIZE)
+    end_sample = snap_to_zero_crossing(pcm, loop_end * FRAME_SIZE, FRAME_SIZE)
+
+    return MusicAnalysis(
+        leading_silence=round(start * frame_seconds, 3),
+        trailing_silence=round(max(0.0, duration - end * frame_seconds), 3),
+        loop_start=round(start_sample / sample_rate, 3),
+        loop_end=round(end_sample / sample_rate, 3),
+        peaks=peaks,
+    )
+
+
+def analyze_file(file_path: str) -> MusicAnalysis:
+    """Decode and analyze a music file (blocking; runs in the worker pool)"""
+    return analyze_pcm(decode_mono(file_path))
+
+
+class MusicAnalyzer:
+    """
+    Schedules track analysis in a worker pool and exposes the stored
+    results to jingle generation.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.MUSIC_ANALYSIS_WORKERS,
+                thread_name_prefix="music-analysis",
+            )
+        return self._executor
+
+    async def analyze_track(self, track_id: int) -> bool:
+        """
+        Analyze a track and store the results (own DB session).
+
+        Returns:
+            True if the analysis completed
+        """
+        async with AsyncSessionLocal() as db:
+            track = await db.get(MusicTrack, track_id)
+            if not track:
+                return False
+            file_path, filename = track.file_path, track.filename
+
+            logger.info(f"🔬 Analyzing music track: {filename}")
+            loop = asyncio.get_running_loop()
+            analysis, loudness = await asyncio.gather(
+                loop.run_in_executor(self._pool(), analyze_file, file_path),
+                loudness_analyzer.measure(file_path),
+                return_exceptions=True,
+            )
+
+            if isinstance(analysis, BaseException):
+                logger.warning(f"⚠️ Music analysis failed for {filename}: {analysis}")
+                track.analysis_status = "failed"
+                await db.commit()
+                await response_cache.invalidate(MUSIC)
+                return False
+
+            if loudness and not isinstance(loudness, BaseException):
+                track.loudness_lufs = loudness.integrated_lufs
+                track.true_peak_db = loudness.true_peak_dbtp
+
+            track.leading_silence = analysis.leading_silence
+            track.trailing_silence = analysis.trailing_silence
+            track.loop_start = analysis.loop_start
+            track.loop_end = analysis.loop_end
+            track.peaks = analysis.peaks
+            track.analysis_status = "done"
+            await db.commit()
+            await response_cache.invalidate(MUSIC)
+
+        logger.info(
+            f"✅ Music analyzed: {filename} (intro silence {analysis.leading_silence:.2f}s, "
+            f"loop {analysis.loop_start}-{analysis.loop_end}s)"
+        )
+        return True
+
+    def schedule(self, track_id: int) -> None:
+        """Queue a track for analysis without blocking the caller"""
+        task = asyncio.get_running_loop().create_task(self._run(track_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, track_id: int) -> None:
+        try:
+            await self.analyze_track(track_id)
+        except Exception as e:
+            logger.error(f"❌ Music analysis task failed for track {track_id}: {e}", exc_info=True)
+
+    async def jingle_params(self, music_filename: str, db: AsyncSession) -> Dict[str, Any]:
+        """
+        Stored per-track values for JingleService.create_jingle.
+
+        Returns:
+            Dict with 'music_segment' (when analyzed) and 'music_gain_db'
+            (when LOUDNESS_NORMALIZATION is on)
+        """
+        result = await db.execute(
+            select(MusicTrack).filter(MusicTrack.filename == music_filename)
+        )
+        track = result.scalar_one_or_none()
+        if not track:
+            return {}
+
+        params: Dict[str, Any] = {}
+        if track.loop_start is not None and track.loop_end is not None:
+            params["music_segment"] = (track.loop_start, track.loop_end)
+        if settings.LOUDNESS_NORMALIZATION:
+            params["music_gain_db"] = await loudness_analyzer.track_gain_db(track)
+        return params
+
+    async def shutdown(self) -> None:
+        """Wait for queued analyses and stop the worker pool"""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+# Singleton instance
+music_analyzer = MusicAnalyzer()
@@ -0,0 +1,355 @@
+"""
+PCM Mixer - In-process NumPy backend for JingleService
+Reproduces the FFmpeg jingle graph on decoded PCM arrays.
+
+For 15-30 s jingles most of the FFmpeg backend's time goes into spawning
+the process and decoding the music bed again. Here music beds are decoded
+once (first MUSIC_PCM_MAX_SECONDS, cached by path/mtime/size) and the mix
+is plain array math. FFmpeg encodes the result; it also decodes the voice
+take, which is cached too, so previews of one take over several beds
+decode it once. The output length is known from the PCM, so the mix needs
+no ffprobe either.
+
+Signal chain (same as JingleService._build_ducking_command):
+    music: loop -> trim(T) -> volume -> sidechain duck(voice) -> fade in/out
+    voice: delay(intro) -> volume -> pad(T)
+    out:   amix(music, voice) = (music + voice) / 2
+
+The sidechain envelope follows FFmpeg's sidechaincompress (RMS detection,
+channel average, knee 2.83) but runs at a control rate of CONTROL_BLOCK
+samples; the follower, gain computation, interpolation, fades and summing
+are vectorized. Values are rounded exactly as the FFmpeg command formats them
+so both backends produce matching output.
+"""
+import os
+import math
+import logging
+import subprocess
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.audio.renditions import audio_renditions, RenditionTarget
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 44100
+CHANNELS = 2
+
+# Music beds are decoded up to this length; longer jingles use FFmpeg
+MUSIC_PCM_MAX_SECONDS = 120
+MUSIC_CACHE_SIZE = 8
+VOICE_CACHE_SIZE = 4
+
+# sidechaincompress settings used by the FFmpeg graph
+DUCK_RATIO = 6.0
+DUCK_ATTACK_MS = 5.0
+DUCK_RELEASE_MS = 200.0
+DUCK_KNEE = 2.82843
+
+# Envelope control rate (samples per step, ~0.7 ms at 44.1 kHz)
+CONTROL_BLOCK = 32
+
+# Follower steps solved at once stay within e**-FOLLOW_LOG_RANGE of decay
+# (float64 range for the cumulative product)
+FOLLOW_LOG_RANGE = 600.0
+
+DECODE_TIMEOUT = 60
+ENCODE_TIMEOUT = 120
+
+
+def decode_pcm(file_path: str, max_seconds: Optional[float] = None) -> np.ndarray:
+    """
+    Decode an audio file to 44.1 kHz stereo int16 with FFmpeg.
+
+    Returns:
+        Array of shape (samples, 2)
+    """
+    cmd = ['ffmpeg', '-v', 'error', '-i', file_path]
+    if max_seconds:
+        cmd += ['-t', str(max_seconds)]
+    cmd += [
+        '-f', 's16le', '-acodec', 'pcm_s16le',
+        '-ac', str(CHANNELS), '-ar', str(SAMPLE_RATE),
+        'pipe:1'
+    ]
+    result = subprocess.run(cmd, capture_output=True, timeout=DECODE_TIMEOUT)
+    if result.returncode != 0:
+        raise RuntimeError(f"decode failed: {result.stderr.decode(errors='replace')[:300]}")
+    return np.frombuffer(result.stdout, dtype='<i2').reshape(-1, CHANNELS)
+
+
+def _hermite(x, x0, x1, p0, p1, m0, m1):
+    width = x1 - x0
+    t = (x - x0) / width
+    m0 *= width
+    m1 *= width
+    ct2 = -3 * p0 - 2 * m0 + 3 * p1 - m1
+    ct3 = 2 * p0 + m0 - 2 * p1 + m1
+    return ct3 * t ** 3 + ct2 * t ** 2 + m0 * t + p0
+
+
+def _linear_follow(values: np.ndarray, keep: np.ndarray, level: float) -> np.ndarray:
+    """level[i] = keep[i] * level[i-1] + (1 - keep[i]) * values[i], in closed form"""
+    decay = np.cumprod(keep)
+    return decay * (level + np.cumsum((1.0 - keep) * values / decay))
+
+
+def follow_envelope(values: np.ndarray, attack: float, release: float) -> np.ndarray:
+    """
+    One-pole attack/release follower starting at 0.
+
+    Each step moves the level towards the input by the attack coefficient
+    when the input is above the level, else by the release coefficient.
+    Once that choice is known for every step the follower is a linear
+    recurrence, so it is solved per chunk with cumulative products: the
+    choices are guessed, the levels computed, and the guesses replaced from
+    the first step that disagrees with those levels (all steps before it
+    are exact), until none does.
+
+    Args:
+        values: Detector values per step
+        attack, release: Per-step coefficients in [0, 1]
+
+    Returns:
+        Float64 array of levels (same length as values)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    envelope = np.empty_like(values)
+    # Indexed by "rising" (False: release, True: attack)
+    keep = np.maximum([1.0 - release, 1.0 - attack], np.finfo(np.float64).tiny)
+    decay = -math.log(keep.min())
+    chunk = max(1, int(FOLLOW_LOG_RANGE / decay)) if decay > 0 else max(1, len(values))
+
+    level = 0.0
+    for start in range(0, len(values), chunk):
+        segment = values[start:start + chunk]
+        rising = segment > level
+        first = 0
+        while True:
+            levels = _linear_follow(segment, keep[rising.astype(np.intp)], level)
+            actual = segment > np.concatenate(([level], levels[:-1]))
+            wrong = np.flatnonzero(actual[first:] != rising[first:])
+            if not wrong.size:
+                break
+            first += int(wrong[0])
+            rising[first:] = actual[first:]
+        envelope[start:start + len(segment)] = levels
+        level = float(levels[-1])
+    return envelope
+
+
+def ducking_gain(
+    sidechain: np.ndarray,
+    threshold: float,
+    ratio: float = DUCK_RATIO,
+    attack_ms: float = DUCK_ATTACK_MS,
+    release_ms: float = DUCK_RELEASE_MS,
+    knee: float = DUCK_KNEE,
+    block: int = CONTROL_BLOCK,
+) -> np.ndarray:
+    """
+    Per-sample gain of a downward compressor keyed by the sidechain.
+
+    Args:
+        sidechain: Float PCM (samples, channels) driving the compressor
+        threshold: Linear threshold (FFmpeg 'threshold')
+        ratio, attack_ms, release_ms, knee: FFmpeg sidechaincompress options
+        block: Samples per envelope step
+
+    Returns:
+        Float32 array (samples,) of gains in (0, 1]
+    """
+    n = len(sidechain)
+    if n == 0:
+        return np.ones(0, dtype=np.float32)
+
+    # RMS detection on the channel average (link=average)
+    detector = np.abs(sidechain).mean(axis=1) ** 2
+    steps = -(-n // block)
+    padded = np.zeros(steps * block, dtype=np.float64)
+    padded[:n] = detector
+    block_detector = padded.reshape(steps, block).mean(axis=1)
+
+    # One-pole attack/release follower; per-sample coefficients as in FFmpeg,
+    # compounded over a block
+    attack = min(1.0, 1.0 / (attack_ms * SAMPLE_RATE / 4000.0))
+    release = min(1.0, 1.0 / (release_ms * SAMPLE_RATE / 4000.0))
+    attack_block = 1.0 - (1.0 - attack) ** block
+    release_block = 1.0 - (1.0 - release) ** block
+
+    envelope = follow_envelope(block_detector, attack_block, release_block)
+
+    thres = math.log(threshold)
+    lin_knee_start = threshold / math.sqrt(knee)
+    knee_start = math.log(lin_knee_start)
+    knee_stop = math.log(threshold * math.sqrt(knee))
+    compressed_knee_stop = (knee_stop - thres) / ratio + thres
+
+    gain = np.ones(steps, dtype=np.float64)
+    active = envelope > lin_knee_start ** 2
+    if active.any():
+        slope = 0.5 * np.log(envelope[active])
+        out = (slope - thres) / ratio + thres
+        in_knee = slope < knee_stop
+        out[in_knee] = _hermite(
+            slope[in_knee], knee_start, knee_stop,
+            knee_start, compressed_knee_stop, 1.0, 1.0 / ratio
+        )
+        gain[active] = np.exp(out - slope)
+
+    centers = np.arange(steps) * block + (block - 1) / 2.0
+    return np.interp(np.arange(n), centers, gain).astype(np.float32)
+
+
+def mix_jingle(
+    music: np.ndarray,
+    voice: np.ndarray,
+    config: Any,
+    total_duration: float,
+    fade_out_start: float,
+) -> np.ndarray:
+    """
+    Mix voice over a music bed like the FFmpeg jingle graph.
+
+    Args:
+        music: int16 PCM (samples, 2) of the music bed (looped as needed)
+        voice: int16 PCM (samples, 2) of the voice take
+        config: JingleConfig
+        total_duration: Jingle length in seconds
+        fade_out_start: Music fade-out start in seconds
+
+    Returns:
+        Float32 PCM (samples, 2) in [-1, 1]
+    """
+    # Same rounding as the FFmpeg command strings
+    total = round(total_duration, 1)
+    n = int(round(total * SAMPLE_RATE))
+    intro = int(config.intro_silence * 1000) * SAMPLE_RATE // 1000
+
+    bed = music[np.arange(n) % len(music)].astype(np.float32) / 32768.0
+    bed *= round(config.music_volume, 2)
+
+    track = np.zeros((n, CHANNELS), dtype=np.float32)
+    if intro < n:
+        take = voice[:n - intro].astype(np.float32) / 32768.0
+        track[intro:intro + len(take)] = take * round(config.voice_volume, 2)
+
+    if config.ducking_enabled:
+        threshold = round(max(0.01, min(0.9, 1.0 - config.duck_level)), 3)
+        bed *= ducking_gain(track, threshold)[:, None]
+
+    # afade (linear 'tri' curve)
+    t = np.arange(n, dtype=np.float32) / SAMPLE_RATE
+    fade_in = round(config.fade_in, 1)
+    fade_out = round(config.fade_out, 1)
+    envelope = np.ones(n, dtype=np.float32)
+    if fade_in > 0:
+        envelope *= np.clip(t / fade_in, 0.0, 1.0)
+    if fade_out > 0:
+        envelope *= np.clip(1.0 - (t - round(fade_out_start, 1)) / fade_out, 0.0, 1.0)
+    bed *= envelope[:, None]
+
+    # amix with two active inputs scales each by 1/2
+    out = (bed + track) * 0.5
+    return np.clip(out, -1.0, 1.0, out=out)
+
+
+class PcmMixer:
+    """
+    NumPy jingle backend with a cache of decoded music beds.
+    """
+
+    def __init__(self):
+        self._music: "OrderedDict[Tuple[str, int, int], np.ndarray]" = OrderedDict()
+        self._voices: "OrderedDict[Tuple[str, int, int], np.ndarray]" = OrderedDict()
+
+    @staticmethod
+    def _decoded(
+        cache: "OrderedDict[Tuple[str, int, int], np.ndarray]",
+        path: str,
+        max_size: int,
+        max_seconds: Optional[float] = None,
+    ) -> Tuple[np.ndarray, bool]:
+        """Decoded PCM of a file from an LRU keyed by path/mtime/size, and whether it was decoded now"""
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        pcm = cache.get(key)
+        if pcm is not None:
+            cache.move_to_end(key)
+            return pcm, False
+
+        pcm = decode_pcm(path, max_seconds)
+        cache[key] = pcm
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+        return pcm, True
+
+    def _music_pcm(self, music_path: str) -> np.ndarray:
+        pcm, decoded = self._decoded(self._music, music_path, MUSIC_CACHE_SIZE, MUSIC_PCM_MAX_SECONDS)
+        if decoded:
+            logger.info(f"🎼 Decoded music bed to PCM: {os.path.basename(music_path)}")
+        return pcm
+
+    def supports(self, total_duration: float) -> bool:
+        """Whether a jingle of this length can be mixed in-process"""
+        return total_duration <= MUSIC_PCM_MAX_SECONDS
+
+    def mix_to_file(
+        self,
+        voice_path: str,
+        music_path: str,
+        output_path: str,
+        config: Any,
+        total_duration: float,
+        fade_out_start: float,
+        bitrate: str,
+        renditions: Optional[List[RenditionTarget]] = None,
+        segment: Optional[Tuple[float, float]] = None,
+    ) -> float:
+        """
+        Mix and encode a jingle (blocking; run in a worker thread).
+
+        Returns:
+            Duration of the jingle in seconds
+
+        Raises:
+            RuntimeError: decoding or encoding failed
+        """
+        music = self._music_pcm(music_path)
+        if segment:
+            # Analyzed loop segment (clamped to the decoded part)
+            music = music[int(segment[0] * SAMPLE_RATE):int(segment[1] * SAMPLE_RATE)]
+        if len(music) == 0:
+            raise RuntimeError("empty music bed")
+        voice, _ = self._decoded(self._voices, voice_path, VOICE_CACHE_SIZE)
+
+        pcm = mix_jingle(music, voice, config, total_duration, fade_out_start)
+        data = (pcm * 32767.0).astype('<i2').tobytes()
+
+        cmd = [
+            'ffmpeg', '-y', '-v', 'error',
+            '-f', 's16le', '-ar', str(SAMPLE_RATE), '-ac', str(CHANNELS),
+            '-i', 'pipe:0',
+            '-map', '0:a:0',
+            '-codec:a', 'libmp3lame',
+            '-b:a', bitrate,
+            output_path
+        ]
+        for target in renditions or []:
+            cmd += audio_renditions.output_args(target, '0:a:0')
+
+        result = subprocess.run(cmd, input=data, capture_output=True, timeout=ENCODE_TIMEOUT)
+        if result.returncode != 0:
+            raise RuntimeError(f"encode failed: {result.stderr.decode(errors='replace')[:300]}")
+        return len(pcm) / SAMPLE_RATE
+
+    def clear(self) -> None:
+        """Drop cached music and voice PCM"""
+        self._music.clear()
+        self._voices.clear()
+
+
+# Singleton instance
+pcm_mixer = PcmMixer()
@@ -0,0 +1,195 @@
+"""
+Audio Probe
+Reads audio metadata with ffprobe instead of decoding the whole file.
+
+pydub's AudioSegment.from_file decodes the entire file to PCM in memory
+just to learn its length; ffprobe reads container/stream headers only.
+Results are cached by (path, mtime, size), so a file that is rewritten
+(volume adjustment, padding) is probed again automatically.
+"""
+import os
+import json
+import asyncio
+import logging
+import subprocess
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple, List
+
+logger = logging.getLogger(__name__)
+
+PROBE_CACHE_SIZE = 1024
+PROBE_TIMEOUT = 30
+
+
+@dataclass(frozen=True)
+class AudioMetadata:
+    """Metadata of the first audio stream of a file"""
+    duration: float                 # seconds
+    sample_rate: Optional[int]      # Hz
+    channels: Optional[int]
+    bitrate: Optional[int]          # bits per second
+    codec: Optional[str]            # e.g. 'mp3', 'aac', 'opus'
+    format_name: Optional[str]      # container, e.g. 'mp3', 'mov,mp4,m4a,...'
+    file_size: int
+
+    @property
+    def bitrate_kbps(self) -> Optional[int]:
+        return self.bitrate // 1000 if self.bitrate else None
+
+
+def _build_command(file_path: str) -> List[str]:
+    return [
+        'ffprobe', '-v', 'error',
+        '-select_streams', 'a:0',
+        '-show_entries',
+        'format=duration,bit_rate,format_name:stream=codec_name,sample_rate,channels,bit_rate,duration',
+        '-of', 'json',
+        file_path
+    ]
+
+
+def parse_ffprobe_output(output: str, file_size: int) -> Optional[AudioMetadata]:
+    """
+    Build AudioMetadata from ffprobe JSON output.
+
+    Args:
+        output: stdout of ffprobe -of json
+        file_size: Size of the probed file in bytes
+
+    Returns:
+        AudioMetadata, or None if no audio stream/duration was found
+    """
+    try:
+        data = json.loads(output or "{}")
+    except ValueError:
+        return None
+
+    streams = data.get("streams") or []
+    if not streams:
+        return None
+    stream = streams[0]
+    fmt = data.get("format") or {}
+
+    def _number(value, cast):
+        try:
+            return cast(value) if value not in (None, "N/A") else None
+        except (TypeError, ValueError):
+            return None
+
+    duration = _number(fmt.get("duration"), float) or _number(stream.get("duration"), float)
+    if not duration:
+        return None
+
+    bitrate = _number(stream.get("bit_rate"), int) or _number(fmt.get("bit_rate"), int)
+    if not bitrate and duration > 0:
+        bitrate = int(file_size * 8 / duration)
+
+    return AudioMetadata(
+        duration=duration,
+        sample_rate=_number(stream.get("sample_rate"), int),
+        channels=_number(stream.get("channels"), int),
+        bitrate=bitrate,
+        codec=stream.get("codec_name"),
+        format_name=fmt.get("format_name"),
+        file_size=file_size,
+    )
+
+
+class AudioProbe:
+    """
+    ffprobe wrapper with an LRU cache keyed by (path, mtime, size).
+    """
+
+    def __init__(self):
+        self._cache: "OrderedDict[Tuple[str, int, int], AudioMetadata]" = OrderedDict()
+
+    def _cache_key(self, file_path: str) -> Optional[Tuple[str, int, int]]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+    def _cached(self, key: Tuple[str, int, int]) -> Optional[AudioMetadata]:
+        metadata = self._cache.get(key)
+        if metadata is not None:
+            self._cache.move_to_end(key)
+        return metadata
+
+    def _store(self, key: Tuple[str, int, int], metadata: Optional[AudioMetadata]) -> None:
+        if metadata is None:
+            return
+        self._cache[key] = metadata
+        while len(self._cache) > PROBE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    async def probe(self, file_path: str) -> Optional[AudioMetadata]:
+        """
+        Probe an audio file without blocking the event loop.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            AudioMetadata, or None if the file is missing or unreadable
+        """
+        key = self._cache_key(file_path)
+        if key is None:
+            return None
+        cached = self._cached(key)
+        if cached:
+            return cached
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *_build_command(file_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=PROBE_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            logger.error(f"ffprobe timed out: {file_path}")
+            return None
+        except Exception as e:
+            logger.error(f"Error probing audio file: {e}")
+            return None
+
+        if proc.returncode != 0:
+            logger.warning(f"ffprobe failed for {file_path}: {stderr.decode(errors='replace')[:300]}")
+            return None
+
+        metadata = parse_ffprobe_output(stdout.decode(errors="replace"), key[2])
+        self._store(key, metadata)
+        return metadata
+
+    def probe_sync(self, file_path: str) -> Optional[AudioMetadata]:
+        """Blocking variant of probe() for synchronous code paths"""
+        key = self._cache_key(file_path)
+        if key is None:
+            return None
+        cached = self._cached(key)
+        if cached:
+            return cached
+
+        try:
+            result = subprocess.run(
+                _build_command(file_path),
+                capture_output=True, text=True, timeout=PROBE_TIMEOUT
+            )
+        except Exception as e:
+            logger.error(f"Error probing audio file: {e}")
+            return None
+
+        if result.returncode != 0:
+            logger.warning(f"ffprobe failed for {file_path}: {result.stderr[:300]}")
+            return None
+
+        metadata = parse_ffprobe_output(result.stdout, key[2])
+        self._store(key, metadata)
+        return metadata
+
+
+# Singleton instance
+audio_probe = AudioProbe()
@@ -0,0 +1,168 @@
+"""
+Audio Renditions
+Extra encodings of a generated message, produced in the same FFmpeg run.
+
+The primary file stays the 192k MP3 that goes to the radio. Additional
+renditions (Opus voice notes for messaging, a light MP3 for the web
+player) are written as extra outputs of a single FFmpeg command, so the
+audio is decoded once instead of once per format:
+
+    jingle mix:  ... [out]asplit=3[main][r0][r1] -> main.mp3, r0, r1
+    plain TTS:   -i voice.mp3 -> r0, r1 (one decode, N encodes)
+
+Rendition files are stored next to the primary file in audio_storage as
+"{stem}.{profile}.{ext}" and recorded in AudioMessage.renditions.
+"""
+import os
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.storage import audio_storage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RenditionProfile:
+    """One output encoding"""
+    name: str
+    ext: str
+    media_type: str
+    codec_args: Tuple[str, ...]
+    bitrate: str
+
+
+RENDITION_PROFILES: Dict[str, RenditionProfile] = {
+    # WhatsApp-compatible voice note (same encoding as /audio/stream?format=ogg)
+    "opus": RenditionProfile(
+        name="opus",
+        ext="ogg",
+        media_type="audio/ogg",
+        codec_args=("-c:a", "libopus", "-ar", "48000", "-ac", "1"),
+        bitrate="128k",
+    ),
+    # Light file for browser playback
+    "web": RenditionProfile(
+        name="web",
+        ext="mp3",
+        media_type="audio/mpeg",
+        codec_args=("-c:a", "libmp3lame", "-ar", "44100", "-ac", "2"),
+        bitrate="96k",
+    ),
+}
+
+# (profile, absolute output path)
+RenditionTarget = Tuple[RenditionProfile, str]
+
+
+class AudioRenditions:
+    """
+    Plans and renders the renditions configured in AUDIO_RENDITIONS.
+    """
+
+    def enabled_profiles(self) -> List[RenditionProfile]:
+        """Profiles listed in AUDIO_RENDITIONS (unknown names are ignored)"""
+        names = [n.strip() for n in settings.AUDIO_RENDITIONS.split(",") if n.strip()]
+        return [RENDITION_PROFILES[n] for n in names if n in RENDITION_PROFILES]
+
+    def rendition_filename(self, filename: str, profile: RenditionProfile) -> str:
+        """Rendition filename for a primary filename"""
+        return f"{os.path.splitext(filename)[0]}.{profile.name}.{profile.ext}"
+
+    def plan(self, filename: str) -> List[RenditionTarget]:
+        """Output paths (directories created) for every enabled profile"""
+        return [
+            (profile, audio_storage.reserve_path(self.rendition_filename(filename, profile)))
+            for profile in self.enabled_profiles()
+        ]
+
+    def output_args(self, target: RenditionTarget, source: str) -> List[str]:
+        """FFmpeg output options writing one rendition from a stream/label"""
+        profile, path = target
+        return [
+            '-map', source,
+            '-map_metadata', '-1',
+            *profile.codec_args,
+            '-b:a', profile.bitrate,
+            path,
+        ]
+
+    def describe(self, targets: List[RenditionTarget]) -> Dict[str, Dict[str, str]]:
+        """
+        Build the AudioMessage.renditions value for targets that were written.
+
+        Returns:
+            {profile: {"filename", "url", "format", "bitrate", "media_type"}}
+        """
+        renditions = {}
+        for profile, path in targets:
+            if not os.path.exists(path) or os.path.getsize(path) == 0:
+                continue
+            filename = os.path.basename(path)
+            renditions[profile.name] = {
+                "filename": filename,
+                "url": audio_storage.url_for(filename),
+                "format": profile.ext,
+                "bitrate": profile.bitrate,
+                "media_type": profile.media_type,
+            }
+        return renditions
+
+    async def render(self, source_path: str, filename: str) -> Dict[str, Dict[str, str]]:
+        """
+        Encode all enabled renditions of an existing file in one FFmpeg run.
+
+        Args:
+            source_path: Primary audio file
+            filename: Primary filename (rendition names derive from it)
+
+        Returns:
+            AudioMessage.renditions value ({} if nothing was rendered)
+        """
+        try:
+            targets = self.plan(filename)
+            if not targets:
+                return {}
+
+            cmd = ['ffmpeg', '-y', '-i', source_path]
+            for target in targets:
+                cmd += self.output_args(target, '0:a:0')
+
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await proc.communicate()
+            if proc.returncode != 0:
+                logger.warning(f"⚠️ Rendition encode failed: {stderr.decode(errors='replace')[:300]}")
+                self.delete(targets)
+                return {}
+        except Exception as e:
+            logger.warning(f"⚠️ Could not render renditions for {filename}: {e}")
+            return {}
+
+        return self.describe(targets)
+
+    def delete(self, targets: List[RenditionTarget]) -> None:
+        """Remove rendition files (used on failures)"""
+        for _, path in targets:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def delete_files(self, renditions: Optional[Dict[str, Dict[str, str]]]) -> None:
+        """Remove the files recorded in an AudioMessage.renditions value"""
+        for rendition in (renditions or {}).values():
+            path = audio_storage.resolve(rendition.get("filename", ""))
+            if path:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warning(f"Failed to delete rendition {path}: {e}")
+
+
+# Singleton instance
+audio_renditions = AudioRenditions()
@@ -0,0 +1,179 @@
+"""
+Silence Trimming
+Vectorized edge-silence detection for TTS takes.
+
+ElevenLabs takes start and end with a variable amount of silence, so the
+fixed intro/outro padding and the jingle intro landed at a different
+offset on every take. Takes are trimmed to their audible part plus a fixed
+margin. Frame levels are computed in one NumPy pass over the samples
+instead of pydub's chunk-by-chunk detect_leading_silence loop.
+
+- trim_silence(): on the AudioSegment the generator already decodes for
+  volume and padding (the trim rides on that encode)
+- trim_file(): takes used as delivered; the bounds are measured on a
+  low-rate mono decode and the file is cut with a stream copy, so the
+  take is never re-encoded
+"""
+import asyncio
+import logging
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+from pydub import AudioSegment
+
+logger = logging.getLogger(__name__)
+
+SILENCE_THRESHOLD_DBFS = -50.0
+FRAME_MS = 10
+
+# Margins kept around the audible part (natural attack / decay)
+KEEP_LEADING_MS = 30
+KEEP_TRAILING_MS = 150
+
+# Analysis decode of trim_file (mono, enough rate for 10 ms frames)
+ANALYSIS_SAMPLE_RATE = 16000
+FFMPEG_TIMEOUT = 60
+
+
+def audible_bounds(
+    samples: np.ndarray,
+    sample_rate: int,
+    channels: int,
+    max_amplitude: float,
+    threshold_dbfs: float = SILENCE_THRESHOLD_DBFS,
+    frame_ms: int = FRAME_MS,
+) -> Optional[Tuple[int, int]]:
+    """
+    Locate the audible part of interleaved PCM.
+
+    Args:
+        samples: Interleaved integer samples
+        sample_rate: Frames per second
+        channels: Interleaved channel count
+        max_amplitude: Full-scale sample value
+        threshold_dbfs: Frames with an RMS below this are silence
+        frame_ms: Analysis frame length
+
+    Returns:
+        (start_ms, end_ms) at frame precision, or None if the audio is silent
+    """
+    frame = max(1, sample_rate * frame_ms // 1000) * channels
+    frames = len(samples) // frame
+    if frames == 0:
+        return None
+
+    blocks = samples[:frames * frame].astype(np.float64).reshape(frames, frame)
+    rms = np.sqrt(np.mean(blocks ** 2, axis=1)) / max_amplitude
+    audible = np.nonzero(rms >= 10 ** (threshold_dbfs / 20))[0]
+    if len(audible) == 0:
+        return None
+    return int(audible[0]) * frame_ms, (int(audible[-1]) + 1) * frame_ms
+
+
+def trim_silence(
+    audio: AudioSegment,
+    threshold_dbfs: float = SILENCE_THRESHOLD_DBFS,
+    keep_leading_ms: int = KEEP_LEADING_MS,
+    keep_trailing_ms: int = KEEP_TRAILING_MS,
+) -> AudioSegment:
+    """
+    Trim edge silence, keeping fixed margins around the audible part.
+
+    Returns:
+        The trimmed segment (unchanged if it is entirely silent)
+    """
+    bounds = audible_bounds(
+        np.asarray(audio.get_array_of_samples()),
+        audio.frame_rate,
+        audio.channels,
+        audio.max_possible_amplitude,
+        threshold_dbfs,
+    )
+    if bounds is None:
+        return audio
+
+    start_ms, end_ms = trim_window(bounds, len(audio), keep_leading_ms, keep_trailing_ms)
+    return audio[start_ms:end_ms]
+
+
+def trim_window(
+    bounds: Tuple[int, int],
+    duration_ms: int,
+    keep_leading_ms: int = KEEP_LEADING_MS,
+    keep_trailing_ms: int = KEEP_TRAILING_MS,
+) -> Tuple[int, int]:
+    """(start_ms, end_ms) to keep: audible bounds plus margins, within the take"""
+    return max(0, bounds[0] - keep_leading_ms), min(duration_ms, bounds[1] + keep_trailing_ms)
+
+
+async def trim_file(
+    file_path: str,
+    threshold_dbfs: float = SILENCE_THRESHOLD_DBFS,
+    keep_leading_ms: int = KEEP_LEADING_MS,
+    keep_trailing_ms: int = KEEP_TRAILING_MS,
+) -> bool:
+    """
+    Trim edge silence of an encoded file in place, without re-encoding.
+
+    The cut is a stream copy, so it lands on codec frame boundaries
+    (~26 ms for MP3), well inside the kept margins.
+
+    Args:
+        file_path: Encoded take (e.g. the raw ElevenLabs MP3)
+
+    Returns:
+        True if the file was trimmed
+    """
+    pcm = await _ffmpeg(
+        '-i', file_path,
+        '-ac', '1', '-ar', str(ANALYSIS_SAMPLE_RATE),
+        '-f', 's16le', '-',
+    )
+    if pcm is None:
+        return False
+
+    samples = np.frombuffer(pcm, dtype=np.int16)
+    bounds = audible_bounds(samples, ANALYSIS_SAMPLE_RATE, 1, 32768, threshold_dbfs)
+    if bounds is None:
+        return False
+
+    duration_ms = len(samples) * 1000 // ANALYSIS_SAMPLE_RATE
+    start_ms, end_ms = trim_window(bounds, duration_ms, keep_leading_ms, keep_trailing_ms)
+    if start_ms == 0 and end_ms >= duration_ms:
+        return False
+
+    root, ext = os.path.splitext(file_path)
+    trimmed_path = f"{root}.trim{ext}"
+    result = await _ffmpeg(
+        '-y', '-ss', f"{start_ms / 1000:.3f}", '-i', file_path,
+        '-t', f"{(end_ms - start_ms) / 1000:.3f}",
+        '-c', 'copy', trimmed_path,
+    )
+    if result is None:
+        if os.path.exists(trimmed_path):
+            os.remove(trimmed_path)
+        return False
+
+    os.replace(trimmed_path, file_path)
+    logger.info(f"✂️ Edge silence trimmed: {start_ms}-{end_ms} of {duration_ms} ms")
+    return True
+
+
+async def _ffmpeg(*args: str) -> Optional[bytes]:
+    """Run ffmpeg and return its stdout (None on failure)"""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            'ffmpeg', '-hide_banner', '-nostats', '-v', 'error', *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=FFMPEG_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"⚠️ Silence trim skipped: {e}")
+        return None
+
+    if proc.returncode != 0:
+        logger.warning(f"⚠️ Silence trim skipped: {stderr.decode(errors='replace')[-300:]}")
+        return None
+    return stdout
@@ -4,15 +4,16 @@ Shared utility functions for audio processing
 """
 import os
 import logging
-from typing import Dict, Any, Optional
-from pydub import AudioSegment
+from typing import Dict, Any
+
+from app.services.audio.probe import audio_probe
 
 logger = logging.getLogger(__name__)
 
 
-def get_audio_metadata(file_path: str) -> Dict[str, Any]:
+async def get_audio_metadata(file_path: str) -> Dict[str, Any]:
     """
-    Extract audio metadata using pydub.
+    Extract audio metadata using ffprobe (no full decode).
 
     Args:
         file_path: Path to the audio file
@@ -20,29 +21,20 @@ def get_audio_metadata(file_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary with duration, bitrate, sample_rate, and file_size
     """
-    try:
-        audio = AudioSegment.from_file(file_path)
-        duration = len(audio) / 1000.0  # ms to seconds
-
-        # Estimate bitrate from file size and duration
-        file_size = os.path.getsize(file_path)
-        if duration > 0:
-            bitrate_kbps = int((file_size * 8) / (duration * 1000))
-            bitrate = f"{bitrate_kbps}kbps"
-        else:
-            bitrate = "unknown"
+    metadata = await audio_probe.probe(file_path)
 
-        return {
-            "duration": round(duration, 2),
-            "bitrate": bitrate,
-            "sample_rate": audio.frame_rate,
-            "file_size": file_size,
-        }
-    except Exception as e:
-        logger.warning(f"Could not extract audio metadata: {e}")
+    if metadata is None:
+        logger.warning(f"Could not extract audio metadata: {file_path}")
         return {
             "duration": None,
             "bitrate": None,
             "sample_rate": None,
             "file_size": os.path.getsize(file_path) if os.path.exists(file_path) else None,
         }
+
+    return {
+        "duration": round(metadata.duration, 2),
+        "bitrate": f"{metadata.bitrate_kbps}kbps" if metadata.bitrate_kbps else "unknown",
+        "sample_rate": metadata.sample_rate,
+        "file_size": metadata.file_size,
+    }
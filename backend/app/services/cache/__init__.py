@@ -0,0 +1,28 @@
+"""
+Cache services
+Shared cache (Redis or in-memory) with tag invalidation and pub/sub
+"""
+from app.services.cache.backends import MemoryBackend, RedisBackend
+from app.services.cache.shared import (
+    SharedCache,
+    shared_cache,
+    VOICES,
+    CATEGORIES,
+    MUSIC,
+    TEMPLATES,
+    SHORTCUTS,
+    CONFIG,
+)
+
+__all__ = [
+    "MemoryBackend",
+    "RedisBackend",
+    "SharedCache",
+    "shared_cache",
+    "VOICES",
+    "CATEGORIES",
+    "MUSIC",
+    "TEMPLATES",
+    "SHORTCUTS",
+    "CONFIG",
+]
@@ -0,0 +1,185 @@
+"""
+Cache Backends
+Storage, counters, locks and pub/sub for the shared cache.
+
+RedisBackend is used when CACHE_REDIS_ENABLED is set, so every API worker
+sees the same entries. MemoryBackend has the same semantics inside one
+process: it is the single-node fallback, and tests can share one instance
+between several SharedCache objects to stand in for several workers.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+
+
+class MemoryBackend:
+    """
+    In-process backend: LRU-bounded entries with TTL.
+
+    Counters (tag versions) live apart from the entries so LRU eviction
+    can never reset a version and resurrect stale entries.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1024):
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+        self._channels: Dict[str, Set[asyncio.Queue]] = {}
+        self._max_entries = max_entries
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """Values of the keys (None if missing or expired)"""
+        now = time.monotonic()
+        values = []
+        for key in keys:
+            if key in self._counters:
+                values.append(str(self._counters[key]).encode())
+                continue
+            entry = self._entries.get(key)
+            if entry is None:
+                values.append(None)
+            elif entry[1] is not None and entry[1] <= now:
+                del self._entries[key]
+                values.append(None)
+            else:
+                self._entries.move_to_end(key)
+                values.append(entry[0])
+        return values
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        """Store a value, expiring after ttl seconds"""
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def incr(self, key: str) -> int:
+        """Increment a counter and return its new value"""
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    @asynccontextmanager
+    async def lock(self, name: str, timeout: float) -> AsyncIterator[bool]:
+        """Mutual exclusion between coroutines of this process"""
+        lock, users = self._locks.get(name, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._locks[name] = (lock, users + 1)
+        try:
+            async with lock:
+                yield True
+        finally:
+            lock, users = self._locks[name]
+            if users <= 1:
+                del self._locks[name]
+            else:
+                self._locks[name] = (lock, users - 1)
+
+    async def publish(self, channel: str, payload: str) -> None:
+        """Deliver a message to every subscriber of the channel"""
+        for queue in self._channels.get(channel, ()):
+            queue.put_nowait(payload)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        """Messages published to the channel, until the consumer stops"""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._channels.setdefault(channel, set()).add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._channels[channel].discard(queue)
+
+    def clear(self) -> None:
+        """Drop entries and counters"""
+        self._entries.clear()
+        self._counters.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisBackend:
+    """
+    Redis backend shared by every API worker (redis.asyncio).
+
+    Locks are Redis leases (SET NX PX), so a crashed worker cannot hold
+    one for longer than its timeout.
+    """
+
+    name = "redis"
+
+    def __init__(self, client):
+        self._redis = client
+
+    @classmethod
+    async def connect(cls, url: str) -> "RedisBackend":
+        """Connect to Redis, failing fast if it is unreachable"""
+        import redis.asyncio as aioredis
+
+        client = aioredis.from_url(url)
+        try:
+            await client.ping()
+        except Exception:
+            await client.close()
+            raise
+        return cls(client)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """Values of the keys in one round trip (None if missing)"""
+        return await self._redis.mget(list(keys))
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        """Store a value, expiring after ttl seconds"""
+        await self._redis.set(key, value, ex=ttl or None)
+
+    async def incr(self, key: str) -> int:
+        """Increment a counter and return its new value"""
+        return await self._redis.incr(key)
+
+    @asynccontextmanager
+    async def lock(self, name: str, timeout: float) -> AsyncIterator[bool]:
+        """
+        Cluster-wide lease; yields False if it was not acquired in time.
+        """
+        from redis.exceptions import LockError
+
+        lock = self._redis.lock(name, timeout=timeout, blocking_timeout=timeout)
+        acquired = await lock.acquire()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                try:
+                    await lock.release()
+                except LockError:
+                    pass  # Lease expired while loading
+
+    async def publish(self, channel: str, payload: str) -> None:
+        """Publish a message to every subscribed worker"""
+        await self._redis.publish(channel, payload)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        """Messages published to the channel, until the consumer stops"""
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                data = message["data"]
+                yield data.decode() if isinstance(data, bytes) else data
+        finally:
+            await pubsub.close()
+
+    def clear(self) -> None:
+        """Redis entries are shared; they expire or go stale instead"""
+
+    async def close(self) -> None:
+        await self._redis.close()
@@ -0,0 +1,337 @@
+"""
+Shared Cache
+Tagged, TTL-bounded cache shared by all API workers.
+
+Values are stored in a backend (Redis when CACHE_REDIS_ENABLED, else an
+in-process MemoryBackend) together with the versions of their tags.
+invalidate(tag) increments the tag's version, which makes every entry
+stored under an older version stale at once, on every worker. A load
+that races an invalidation stores the versions it read before loading,
+so its result is never served.
+
+Misses are single-flight: one caller per key loads while the others
+wait for the lock and then read its result, so an invalidation does not
+send every worker to the database at once.
+
+Invalidations are also published on a channel. In-process caches that
+hold live objects (e.g. the voice cache) subscribe to their tag and drop
+their copy when another worker invalidates it.
+
+Without Redis (or while the listener is down) other workers'
+invalidations cannot arrive, so entries live at most CACHE_MEMORY_TTL
+seconds (local_ttl). A failed invalidation is logged as an error, its tags
+bypass the cache on this worker and it is retried until it goes through;
+a backend that fails on reads falls back to the loader.
+"""
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set
+
+from app.core.config import settings
+from app.core.responses import dumps
+from app.services.cache.backends import MemoryBackend, RedisBackend
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "mediaflow:cache:"
+INVALIDATION_CHANNEL = "mediaflow:cache:invalidate"
+
+# Tags (one per group of tables written together)
+VOICES = "voices"
+CATEGORIES = "categories"
+MUSIC = "music"
+TEMPLATES = "templates"
+SHORTCUTS = "shortcuts"
+CONFIG = "config"
+
+InvalidationHandler = Callable[[Sequence[str]], None]
+
+# Backoff between retries of a failed invalidation (seconds)
+RETRY_DELAYS = (1, 2, 5, 10, 30)
+
+
+class SharedCache:
+    """
+    Cache with tag invalidation, single-flight loads and pub/sub.
+
+    - get_or_load() / get_or_load_bytes(): cached value, loading it on a miss
+    - invalidate(): make a tag's entries stale everywhere and notify workers
+    - subscribe(): be called when another worker invalidates a tag
+    """
+
+    def __init__(self, backend=None):
+        if backend is None:
+            backend = MemoryBackend(settings.CACHE_MEMORY_MAX_ENTRIES)
+        self._backend = backend
+        self._handlers: Dict[str, List[InvalidationHandler]] = {}
+        self._instance_id = f"{os.getpid()}-{id(self)}"
+        self._listener_task: Optional[asyncio.Task] = None
+        self._dirty_tags: Set[str] = set()
+        self._retry_task: Optional[asyncio.Task] = None
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    @property
+    def backend(self) -> str:
+        """Name of the active backend ('redis' or 'memory')"""
+        return self._backend.name
+
+    @property
+    def receives_invalidations(self) -> bool:
+        """True while other workers' invalidations reach this worker"""
+        return (
+            self._backend.name == "redis"
+            and self._listener_task is not None
+            and not self._listener_task.done()
+        )
+
+    @property
+    def local_ttl(self) -> Optional[int]:
+        """
+        Max age of entries that rely on invalidations from other workers
+        (None while they arrive through Redis).
+        """
+        return None if self.receives_invalidations else settings.CACHE_MEMORY_TTL
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        tags: Sequence[str],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        JSON value of a key, loading (and storing) it on a miss.
+
+        None is cached like any other value, so "not found" results do
+        not reach the database again until their tags are invalidated.
+
+        Args:
+            key: Cache key (without prefix)
+            loader: Coroutine function returning a JSON-serializable value
+            tags: Tags whose invalidation makes the value stale
+            ttl: Seconds to keep the value (default CACHE_DEFAULT_TTL)
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        async def load_bytes() -> bytes:
+            return dumps(await loader())
+
+        return json.loads(await self.get_or_load_bytes(key, load_bytes, tags, ttl))
+
+    async def get_or_load_bytes(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[bytes]],
+        tags: Sequence[str],
+        ttl: Optional[int] = None,
+    ) -> bytes:
+        """
+        Raw bytes of a key, loading (and storing) them on a miss.
+
+        Args:
+            key: Cache key (without prefix)
+            loader: Coroutine function returning the bytes to cache
+            tags: Tags whose invalidation makes the value stale
+            ttl: Seconds to keep the value (default CACHE_DEFAULT_TTL)
+
+        Returns:
+            Cached or freshly loaded bytes
+        """
+        if self._dirty_tags.intersection(tags):
+            # A failed invalidation may have left stale entries behind
+            self._misses += 1
+            return await loader()
+
+        full_key = KEY_PREFIX + key
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        ttl = ttl or settings.CACHE_DEFAULT_TTL
+        if self._backend.name != "redis":
+            ttl = min(ttl, settings.CACHE_MEMORY_TTL)
+
+        value = None
+        loading = False
+        try:
+            value, _ = await self._read(full_key, tag_keys)
+            if value is not None:
+                self._hits += 1
+                return value
+
+            async with self._backend.lock(f"{KEY_PREFIX}lock:{key}", settings.CACHE_LOCK_TIMEOUT):
+                # Another caller may have loaded it while we waited for the lock
+                value, versions = await self._read(full_key, tag_keys)
+                if value is not None:
+                    self._hits += 1
+                    return value
+
+                self._misses += 1
+                loading = True
+                value = await loader()
+                loading = False
+                header = json.dumps(versions, separators=(",", ":")).encode()
+                await self._backend.set(full_key, header + b"\n" + value, ttl)
+                return value
+        except Exception as e:
+            if loading:
+                raise
+            # Backend failure: serve uncached rather than fail the request
+            self._errors += 1
+            logger.warning(f"⚠️ Shared cache unavailable for {key}, loading directly: {e}")
+            return value if value is not None else await loader()
+
+    async def invalidate(self, *tags: str) -> None:
+        """
+        Make every entry stored under the tags stale and notify other workers.
+
+        Args:
+            tags: Tags whose data changed (e.g. VOICES, TEMPLATES)
+        """
+        try:
+            await self._bump(tags)
+            logger.debug(f"🗑️ Shared cache invalidated: {', '.join(tags)}")
+        except Exception as e:
+            self._errors += 1
+            logger.error(
+                f"❌ Failed to invalidate shared cache ({', '.join(tags)}), other workers "
+                f"may serve stale data until it is retried: {e}",
+                exc_info=True,
+            )
+            self._dirty_tags.update(tags)
+            if self._retry_task is None or self._retry_task.done():
+                self._retry_task = asyncio.create_task(self._retry_invalidations())
+
+    async def _bump(self, tags: Sequence[str]) -> None:
+        for tag in tags:
+            await self._backend.incr(self._tag_key(tag))
+        await self._backend.publish(
+            INVALIDATION_CHANNEL,
+            json.dumps({"origin": self._instance_id, "tags": list(tags)}),
+        )
+
+    async def _retry_invalidations(self) -> None:
+        """Retry failed invalidations until they reach the backend"""
+        attempt = 0
+        while self._dirty_tags:
+            await asyncio.sleep(RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)])
+            tags = sorted(self._dirty_tags)
+            try:
+                await self._bump(tags)
+            except Exception as e:
+                attempt += 1
+                logger.error(f"❌ Shared cache invalidation retry failed ({', '.join(tags)}): {e}")
+                continue
+            self._dirty_tags.difference_update(tags)
+            logger.info(f"✅ Shared cache invalidation retried: {', '.join(tags)}")
+
+    def subscribe(self, tag: str, handler: InvalidationHandler) -> None:
+        """Call handler(tags) when another worker invalidates the tag"""
+        self._handlers.setdefault(tag, []).append(handler)
+
+    def unsubscribe(self, tag: str, handler: InvalidationHandler) -> None:
+        """Remove a handler registered with subscribe()"""
+        handlers = self._handlers.get(tag, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def clear(self) -> None:
+        """Drop local entries and reset statistics (Redis entries are kept)"""
+        self._backend.clear()
+        self._dirty_tags.clear()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics for diagnostics"""
+        return {
+            "backend": self._backend.name,
+            "entries": len(self._backend) if isinstance(self._backend, MemoryBackend) else None,
+            "receives_invalidations": self.receives_invalidations,
+            "dirty_tags": sorted(self._dirty_tags),
+            "hits": self._hits,
+            "misses": self._misses,
+            "errors": self._errors,
+        }
+
+    async def _read(self, full_key: str, tag_keys: List[str]):
+        """Current entry (None if missing or stale) and the tag versions"""
+        raw, *raw_versions = await self._backend.get_many([full_key, *tag_keys])
+        versions = [int(v) if v is not None else 0 for v in raw_versions]
+        if raw is None:
+            return None, versions
+
+        header, _, value = raw.partition(b"\n")
+        if json.loads(header) != versions:
+            return None, versions
+        return value, versions
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"{KEY_PREFIX}tag:{tag}"
+
+    # ------------------------------------------------------------------
+    # Lifecycle and cross-worker notifications
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Connect to Redis if enabled and listen for invalidations"""
+        if self._listener_task:
+            return
+
+        if settings.CACHE_REDIS_ENABLED:
+            try:
+                self._backend = await RedisBackend.connect(settings.REDIS_URL)
+                logger.info("📡 Shared cache using Redis")
+            except Exception as e:
+                logger.warning(f"⚠️ Shared cache running in memory (Redis unavailable): {e}")
+
+        self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening and close the backend"""
+        if self._retry_task:
+            self._retry_task.cancel()
+            self._retry_task = None
+
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        await self._backend.close()
+
+    async def _listen(self) -> None:
+        try:
+            async for message in self._backend.subscribe(INVALIDATION_CHANNEL):
+                try:
+                    payload = json.loads(message)
+                except (TypeError, ValueError):
+                    continue
+                if payload.get("origin") == self._instance_id:
+                    continue
+                tags = payload.get("tags") or []
+                for tag in tags:
+                    for handler in list(self._handlers.get(tag, ())):
+                        try:
+                            handler(tags)
+                        except Exception as e:
+                            logger.error(f"Shared cache invalidation handler failed: {e}", exc_info=True)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"❌ Shared cache listener stopped, falling back to {settings.CACHE_MEMORY_TTL}s "
+                f"local TTL: {e}",
+                exc_info=True,
+            )
+
+
+# Singleton instance
+shared_cache = SharedCache()
@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.config import settings
+from app.db.queries import conversation_messages_query
 from app.models.chat import ChatConversation, ChatMessage
 from app.services.ai.client_manager import ai_client_manager
 from app.services.chat.tools import CHAT_TOOLS
@@ -273,11 +274,7 @@ Tu rol es ayudar al usuario a:
         Rebuild Claude messages from DB using raw_content.
         Preserves tool_use/tool_result structure for multi-turn context.
         """
-        result = await db.execute(
-            select(ChatMessage)
-            .filter(ChatMessage.conversation_id == conversation_id)
-            .order_by(ChatMessage.created_at)
-        )
+        result = await db.execute(conversation_messages_query(conversation_id))
         db_messages = result.scalars().all()
         recent = db_messages[-MAX_HISTORY_MESSAGES:] if len(db_messages) > MAX_HISTORY_MESSAGES else db_messages
 
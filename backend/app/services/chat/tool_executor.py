@@ -15,6 +15,7 @@ from app.models.voice_settings import VoiceSettings
 from app.models.category import Category
 from app.services.ai.claude import claude_service
 from app.services.ai.client_manager import ai_client_manager
+from app.services.tts import voice_manager
 from app.services.audio.generator import (
     generate_audio,
     VoiceNotFoundError,
@@ -61,17 +62,7 @@ class ToolExecutor:
 
         # Default voice resolution (tool-only feature)
         if not voice_id:
-            result = await db.execute(
-                select(VoiceSettings).filter(
-                    VoiceSettings.is_default == True, VoiceSettings.active == True
-                )
-            )
-            default_voice = result.scalar_one_or_none()
-            if not default_voice:
-                result = await db.execute(
-                    select(VoiceSettings).filter(VoiceSettings.active == True).limit(1)
-                )
-                default_voice = result.scalar_one_or_none()
+            default_voice = await voice_manager.get_default_voice(db)
             if not default_voice:
                 return {"success": False, "message": "No hay voces configuradas"}
             voice_id = default_voice.id
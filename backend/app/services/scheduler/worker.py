@@ -14,6 +14,7 @@ import logging
 from sqlalchemy import select, update
 from sqlalchemy.orm import selectinload
 
+from app.db.queries import due_schedule_query
 from app.db.session import AsyncSessionLocal
 from app.models.schedule import Schedule
 from app.services.scheduler.calculator import calculate_next_execution
@@ -83,15 +84,7 @@ class SchedulerWorker:
                 # Step 1: FIRST check for due schedules (before recalculating next_execution_at)
                 # This prevents missing schedules that were due between ticks
                 result = await db.execute(
-                    select(Schedule)
-                    .where(
-                        Schedule.active == True,
-                        Schedule.next_execution_at != None,
-                        Schedule.next_execution_at <= now,
-                    )
-                    .order_by(Schedule.priority.asc(), Schedule.next_execution_at.asc())
-                    .limit(1)
-                    .with_for_update(skip_locked=True)
+                    due_schedule_query(now).with_for_update(skip_locked=True)
                 )
                 due_schedule = result.scalar_one_or_none()
 
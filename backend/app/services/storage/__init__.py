@@ -0,0 +1,6 @@
+"""
+Storage services
+"""
+from app.services.storage.audio_storage import audio_storage
+
+__all__ = ["audio_storage"]
@@ -0,0 +1,140 @@
+"""
+Audio Storage Service
+Collision-free, sharded file layout for generated and uploaded audio.
+
+Filenames stay flat and unique ("tts_20260101_100000_3f9a0c2b1d7e_juan.mp3")
+and are what the database, URLs and AzuraCast see. On disk each file lives
+in a two-level shard derived from a hash of its filename:
+
+    AUDIO_PATH/ab/cd/tts_20260101_100000_3f9a0c2b1d7e_juan.mp3
+
+so the location can always be recomputed from the filename alone. Files
+written before sharding remain in the flat AUDIO_PATH and are still found
+by resolve(). Public URLs keep the /storage/audio/{filename} form.
+"""
+import os
+import uuid
+import hashlib
+import logging
+from datetime import datetime
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+AUDIO_URL_PREFIX = "/storage/audio"
+
+
+class AudioStorage:
+    """
+    Assigns unique filenames and maps them to sharded paths under AUDIO_PATH.
+    """
+
+    def __init__(self, base_path: Optional[str] = None):
+        self.base_path = base_path or settings.AUDIO_PATH
+
+    def new_filename(
+        self, prefix: str, *parts: str, ext: str = "mp3", now: Optional[datetime] = None
+    ) -> str:
+        """
+        Build a unique filename: {prefix}_{YYYYmmdd_HHMMSS}_{uid}_{parts}.{ext}
+
+        The random component makes names unique across workers even when
+        the same voice generates twice in the same second.
+
+        Args:
+            prefix: Kind of audio (e.g., 'tts', 'vehicle', 'upload')
+            *parts: Extra descriptive parts (e.g., plate, voice id)
+            ext: File extension without dot
+            now: Timestamp to embed (defaults to current time)
+
+        Returns:
+            str: Filename (no directories)
+        """
+        timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
+        uid = uuid.uuid4().hex[:12]
+        name = "_".join([prefix, timestamp, uid, *[p for p in parts if p]])
+        return f"{name}.{ext}"
+
+    def shard_dir(self, filename: str) -> str:
+        """Shard directory for a filename (two levels of 256 buckets)"""
+        digest = hashlib.sha1(filename.encode("utf-8")).hexdigest()
+        return os.path.join(self.base_path, digest[:2], digest[2:4])
+
+    def path_for(self, filename: str) -> str:
+        """Absolute sharded path for a filename (may not exist yet)"""
+        return os.path.abspath(os.path.join(self.shard_dir(filename), filename))
+
+    def reserve_path(self, filename: str) -> str:
+        """Sharded path with its directory created, for tools that write files"""
+        os.makedirs(self.shard_dir(filename), exist_ok=True)
+        return self.path_for(filename)
+
+    def resolve(self, filename: str) -> Optional[str]:
+        """
+        Find an existing file by filename.
+
+        Args:
+            filename: Flat filename as stored in AudioMessage.filename
+
+        Returns:
+            Absolute path, or None if the file does not exist
+        """
+        safe_filename = os.path.basename(filename)
+        if not safe_filename or safe_filename in (".", ".."):
+            return None
+
+        sharded = self.path_for(safe_filename)
+        if os.path.isfile(sharded):
+            return sharded
+
+        legacy = os.path.abspath(os.path.join(self.base_path, safe_filename))
+        if os.path.isfile(legacy):
+            return legacy
+
+        return None
+
+    def write_bytes(self, filename: str, data: bytes) -> str:
+        """
+        Atomically write a file (temp file + fsync + rename).
+
+        Args:
+            filename: Target filename
+            data: File contents
+
+        Returns:
+            str: Absolute path of the written file
+        """
+        path = self.reserve_path(filename)
+        tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        logger.debug(f"💾 Stored {filename} ({len(data)} bytes)")
+        return path
+
+    def delete(self, filename: str) -> bool:
+        """Delete a stored file; returns True if a file was removed"""
+        path = self.resolve(filename)
+        if not path:
+            return False
+        os.remove(path)
+        return True
+
+    def url_for(self, filename: str) -> str:
+        """Public URL for a stored file"""
+        return f"{AUDIO_URL_PREFIX}/{filename}"
+
+
+# Singleton instance
+audio_storage = AudioStorage()
@@ -0,0 +1,169 @@
+"""
+Disk Cache
+Content-addressed file cache with an LRU size cap.
+
+Entries are files under STORAGE_PATH/cache/{namespace}/{key[:2]}/{key}{ext},
+published atomically, so every API worker (and restarts) can reuse what
+another one produced. Recency lives in the file mtime (a hit touches the
+file), so it is shared by all workers.
+
+The in-memory index is rebuilt from a directory scan on the first store,
+whenever it grows past max_entries and at least every RESCAN_SECONDS, so
+files written by other workers or earlier runs are counted and evicted
+(least recently used first) too.
+"""
+import os
+import time
+import shutil
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Max age of the index before a store rescans the directory
+RESCAN_SECONDS = 60
+
+# Temp files older than this were left by a crashed writer
+STALE_TMP_SECONDS = 3600
+
+
+class DiskCache:
+    """
+    LRU-capped file cache keyed by caller-computed hex digests.
+    """
+
+    def __init__(self, namespace: str, max_entries: int, ext: str = ".mp3",
+                 base_path: Optional[str] = None):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ext = ext
+        self.cache_dir = os.path.join(base_path or settings.STORAGE_PATH, "cache", namespace)
+        self._index: "OrderedDict[str, str]" = OrderedDict()
+        self._scanned_at: Optional[float] = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def path_for(self, key: str) -> str:
+        """Absolute path of an entry (may not exist)"""
+        return os.path.abspath(os.path.join(self.cache_dir, key[:2], f"{key}{self.ext}"))
+
+    def lookup(self, key: str) -> Optional[str]:
+        """
+        Find an entry and mark it as recently used.
+
+        Args:
+            key: Hex digest identifying the entry
+
+        Returns:
+            Path of the cached file, or None on a miss
+        """
+        path = self.path_for(key)
+        try:
+            os.utime(path)  # Recency seen by every worker's scan
+        except FileNotFoundError:
+            self._index.pop(key, None)
+            self._misses += 1
+            return None
+
+        self._index[key] = path
+        self._index.move_to_end(key)
+        self._hits += 1
+        return path
+
+    def store_bytes(self, key: str, data: bytes) -> str:
+        """Store data under key, returning the cached file path"""
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._added(key, path)
+        return path
+
+    def store_file(self, key: str, source_path: str) -> str:
+        """Copy an existing file into the cache, returning the cached path"""
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.copyfile(source_path, tmp_path)
+        os.replace(tmp_path, path)
+        self._added(key, path)
+        return path
+
+    def clear(self) -> None:
+        """Forget the in-memory index and counters (files are kept)"""
+        self._index.clear()
+        self._scanned_at = None
+        self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics for diagnostics"""
+        lookups = self._hits + self._misses
+        return {
+            "namespace": self.namespace,
+            "entries": len(self._index),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def _added(self, key: str, path: str) -> None:
+        self._index[key] = path
+        self._index.move_to_end(key)
+        if (
+            self._scanned_at is None
+            or len(self._index) > self.max_entries
+            or time.monotonic() - self._scanned_at > RESCAN_SECONDS
+        ):
+            self._rescan()
+
+    def _rescan(self) -> None:
+        """Rebuild the index from the directory and evict beyond max_entries"""
+        self._index = self._scan()
+        self._scanned_at = time.monotonic()
+        while len(self._index) > self.max_entries:
+            _, evicted = self._index.popitem(last=False)
+            self._evictions += 1
+            try:
+                os.remove(evicted)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"⚠️ Could not evict cache file {evicted}: {e}")
+
+    def _scan(self) -> "OrderedDict[str, str]":
+        """Entries on disk, least recently used first"""
+        # Same-tick mtimes fall back to this worker's order, then to older
+        rank = {key: position for position, key in enumerate(self._index)}
+        entries = []
+        now = time.time()
+        try:
+            shards = [entry.path for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+        except FileNotFoundError:
+            shards = []
+
+        for shard in shards:
+            with os.scandir(shard) as files:
+                for entry in files:
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except FileNotFoundError:
+                        continue
+                    if entry.name.endswith(self.ext):
+                        key = entry.name[:-len(self.ext)]
+                        entries.append((mtime, rank.get(key, -1), key, os.path.abspath(entry.path)))
+                    elif entry.name.endswith(".tmp") and now - mtime > STALE_TMP_SECONDS:
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+
+        entries.sort()
+        return OrderedDict((key, path) for _, _, key, path in entries)
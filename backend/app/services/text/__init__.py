@@ -1,7 +1,18 @@
 """
 Text Services Module
 Text normalization and processing for TTS
+
+Only the pure text modules are re-exported here, so the normalizer and
+template engine import without the database stack. Import the DB-backed
+services from their modules (text.lexicon, text.template_store).
 """
 from app.services.text.normalizer import TextNormalizer, text_normalizer
+from app.services.text.templates import CompiledTemplate, compile_template, template_cache
 
-__all__ = ["TextNormalizer", "text_normalizer"]
+__all__ = [
+    "TextNormalizer",
+    "text_normalizer",
+    "CompiledTemplate",
+    "compile_template",
+    "template_cache",
+]
@@ -0,0 +1,266 @@
+"""
+Pronunciation Lexicon
+Database-backed pronunciation fixes applied to every TTS input.
+
+Entries (PronunciationEntry) map a term to the spelling ElevenLabs should
+read, globally or per voice. They are compiled into an Aho-Corasick
+automaton, so a text is rewritten in one pass over its characters no
+matter how many entries exist. Matching is case-insensitive unless the
+entry says otherwise, respects word boundaries and prefers the leftmost,
+then longest term ("Mercedes Benz" over "Mercedes").
+
+Compiled matchers are cached per voice. Edits through the API call
+invalidate(), which bumps the version; other workers notice the change
+through a cheap fingerprint query (row count + last update) at most every
+LEXICON_CHECK_SECONDS.
+"""
+import time
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.pronunciation import PronunciationEntry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class LexiconTerm:
+    """A compiled lexicon entry"""
+    term: str
+    replacement: str
+    case_sensitive: bool = False
+
+
+def _fold(text: str) -> str:
+    """Lowercase text keeping its length (so match offsets map back)"""
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+class LexiconMatcher:
+    """
+    Aho-Corasick automaton over a set of terms.
+
+    Build cost is linear in the total length of the terms; rewrite() is
+    linear in the text length plus the number of matches.
+    """
+
+    def __init__(self, terms: Iterable[LexiconTerm]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[int] = [-1]       # term ending exactly at this node
+        self._next_output: List[int] = [-1]  # nearest suffix node with a term
+        self._terms: List[LexiconTerm] = []
+
+        for term in terms:
+            if term.term.strip():
+                self._insert(term)
+        self._build_links()
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def _insert(self, term: LexiconTerm) -> None:
+        node = 0
+        for char in _fold(term.term):
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(-1)
+                self._next_output.append(-1)
+            node = child
+
+        if self._output[node] == -1:
+            self._output[node] = len(self._terms)
+            self._terms.append(term)
+        else:
+            # Same folded spelling: keep the last one (voice entries come last)
+            self._terms[self._output[node]] = term
+
+    def _build_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                suffix = self._goto[fallback].get(char, 0)
+                self._fail[child] = suffix
+                self._next_output[child] = (
+                    suffix if self._output[suffix] != -1 else self._next_output[suffix]
+                )
+
+    def find(self, text: str) -> List[Tuple[int, int, LexiconTerm]]:
+        """
+        Non-overlapping whole-word matches, leftmost then longest.
+
+        Returns:
+            List of (start, end, term) in text order
+        """
+        if not self._terms or not text:
+            return []
+
+        folded = _fold(text)
+        longest: Dict[int, Tuple[int, LexiconTerm]] = {}
+        node = 0
+
+        for index, char in enumerate(folded):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+
+            candidate = node if self._output[node] != -1 else self._next_output[node]
+            while candidate > 0:
+                term = self._terms[self._output[candidate]]
+                end = index + 1
+                start = end - len(term.term)
+                if (
+                    (start == 0 or not text[start - 1].isalnum())
+                    and (end == len(text) or not text[end].isalnum())
+                    and (not term.case_sensitive or text[start:end] == term.term)
+                    and (start not in longest or longest[start][0] < end)
+                ):
+                    longest[start] = (end, term)
+                candidate = self._next_output[candidate]
+
+        matches = []
+        covered = 0
+        for start in sorted(longest):
+            if start >= covered:
+                end, term = longest[start]
+                matches.append((start, end, term))
+                covered = end
+        return matches
+
+    def rewrite(self, text: str) -> str:
+        """Replace every matched term with its replacement"""
+        matches = self.find(text)
+        if not matches:
+            return text
+
+        pieces = []
+        position = 0
+        for start, end, term in matches:
+            pieces.append(text[position:start])
+            pieces.append(term.replacement)
+            position = end
+        pieces.append(text[position:])
+        return "".join(pieces)
+
+
+class PronunciationLexicon:
+    """
+    Cached lexicon service.
+
+    - apply(): rewrite a TTS input for a voice
+    - invalidate(): drop compiled matchers after an edit (bumps the version)
+    """
+
+    def __init__(self):
+        self._entries: Optional[List[Tuple[Optional[str], LexiconTerm]]] = None
+        self._matchers: Dict[Optional[str], LexiconMatcher] = {}
+        self._version = 0
+        self._fingerprint: Optional[Tuple] = None
+        self._checked_at = 0.0
+
+    @property
+    def version(self) -> int:
+        """Current lexicon version (bumped on every invalidation)"""
+        return self._version
+
+    async def apply(self, text: str, voice_id: Optional[str], db: AsyncSession) -> str:
+        """
+        Rewrite text with the global entries plus those of voice_id.
+
+        Lexicon failures never block generation; the text is returned as is.
+        """
+        if not text:
+            return text
+        try:
+            matcher = await self.matcher_for(voice_id, db)
+        except Exception as e:
+            logger.warning(f"⚠️ Pronunciation lexicon unavailable: {e}")
+            return text
+
+        rewritten = matcher.rewrite(text)
+        if rewritten != text:
+            logger.debug(f"🔤 Pronunciation lexicon applied for voice '{voice_id}'")
+        return rewritten
+
+    async def matcher_for(self, voice_id: Optional[str], db: AsyncSession) -> LexiconMatcher:
+        """Compiled matcher for a voice (global entries only if voice_id is None)"""
+        entries = await self._load(db)
+
+        matcher = self._matchers.get(voice_id) if entries is self._entries else None
+        if matcher is None:
+            # Global entries first so voice entries win on the same term
+            matcher = LexiconMatcher(
+                term
+                for owner, term in sorted(entries, key=lambda entry: entry[0] is not None)
+                if owner in (None, voice_id)
+            )
+            if entries is self._entries:
+                self._matchers[voice_id] = matcher
+        return matcher
+
+    def invalidate(self) -> None:
+        """Drop loaded entries and compiled matchers; must follow every committed edit"""
+        self._version += 1
+        self._entries = None
+        self._matchers.clear()
+        self._fingerprint = None
+        logger.debug(f"🗑️ Pronunciation lexicon invalidated (v{self._version})")
+
+    async def _load(self, db: AsyncSession) -> List[Tuple[Optional[str], LexiconTerm]]:
+        """Active entries as (voice_id, term), reloaded when the table changed"""
+        now = time.monotonic()
+        if self._entries is not None and now - self._checked_at < settings.LEXICON_CHECK_SECONDS:
+            return self._entries
+
+        version = self._version
+        result = await db.execute(
+            select(func.count(PronunciationEntry.id), func.max(PronunciationEntry.updated_at))
+        )
+        fingerprint = tuple(result.one())
+        if self._entries is not None and fingerprint == self._fingerprint:
+            self._checked_at = now
+            return self._entries
+
+        result = await db.execute(
+            select(
+                PronunciationEntry.voice_id,
+                PronunciationEntry.term,
+                PronunciationEntry.replacement,
+                PronunciationEntry.case_sensitive,
+            ).filter(PronunciationEntry.active == True)
+        )
+        entries = [
+            (voice_id, LexiconTerm(term, replacement, bool(case_sensitive)))
+            for voice_id, term, replacement, case_sensitive in result.all()
+        ]
+
+        # Only store if no invalidation happened while we were querying
+        if version == self._version:
+            self._entries = entries
+            self._matchers.clear()
+            self._fingerprint = fingerprint
+            self._checked_at = now
+            logger.info(f"🔤 Pronunciation lexicon loaded: {len(entries)} entries")
+        return entries
+
+
+# Singleton instance
+pronunciation_lexicon = PronunciationLexicon()
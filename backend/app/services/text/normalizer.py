@@ -4,12 +4,16 @@ Normalizes text for TTS pronunciation in Chilean Spanish
 
 Handles:
 - Letter sequences (ABC → A. B. C.)
-- Numbers to words (45 → cuarenta y cinco)
+- Numbers to words (45 → cuarenta y cinco), any size
 - Chilean license plates (BBCL-45 → B. B. C. L. cuarenta y cinco)
+- Free text in one pass (plates, times, dates, prices, numbers, acronyms)
 """
 import re
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.services.text.templates import compile_template
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +39,70 @@ HUNDREDS = {
     800: "ochocientos", 900: "novecientos"
 }
 
+# Long scale (Chilean usage); accents omitted like the rest of the tables
+SCALES = [
+    (10 ** 18, "trillon", "trillones"),
+    (10 ** 12, "billon", "billones"),
+    (10 ** 6, "millon", "millones"),
+]
+
+MONTHS = [
+    "enero", "febrero", "marzo", "abril", "mayo", "junio", "julio",
+    "agosto", "septiembre", "octubre", "noviembre", "diciembre",
+]
+
+
+def _words_under_1000(n: int) -> str:
+    """Spanish words for 0-999 (used to build the lookup table)."""
+    if n <= 29:
+        return UNITS[n]
+    if n < 100:
+        tens, units = divmod(n, 10)
+        return TENS[tens * 10] if units == 0 else f"{TENS[tens * 10]} y {UNITS[units]}"
+    hundreds, remainder = divmod(n, 100)
+    if remainder == 0:
+        return HUNDREDS[hundreds * 100]
+    # "ciento" for 101-199
+    hundreds_word = "ciento" if hundreds == 1 else HUNDREDS[hundreds * 100]
+    return f"{hundreds_word} {_words_under_1000(remainder)}"
+
+
+# Every number below 1000, computed once
+_UNDER_1000 = [_words_under_1000(n) for n in range(1000)]
+
+
+def _apocope(words: str) -> str:
+    """'uno' before a noun or scale word: veintiuno mil → veintiun mil."""
+    return words[:-1] if words.endswith("uno") else words
+
+
+@lru_cache(maxsize=4096)
+def int_to_words(n: int) -> str:
+    """
+    Convert an integer of any size to Spanish words.
+
+    Example:
+        >>> int_to_words(21500)
+        "veintiun mil quinientos"
+        >>> int_to_words(2000000)
+        "dos millones"
+    """
+    if n < 0:
+        return "menos " + int_to_words(-n)
+    if n < 1000:
+        return _UNDER_1000[n]
+
+    for scale, singular, plural in SCALES:
+        if n >= scale:
+            high, low = divmod(n, scale)
+            head = f"un {singular}" if high == 1 else f"{_apocope(int_to_words(high))} {plural}"
+            return head if low == 0 else f"{head} {int_to_words(low)}"
+
+    high, low = divmod(n, 1000)
+    head = "mil" if high == 1 else f"{_apocope(int_to_words(high))} mil"
+    return head if low == 0 else f"{head} {_UNDER_1000[low]}"
+
+
 # Spanish letter pronunciations for TTS
 # Full phonetic dictionary for consistent pronunciation
 LETTER_PRONUNCIATIONS = {
@@ -66,21 +134,6 @@ LETTER_PRONUNCIATIONS = {
     "Z": "zeta",
 }
 
-# Brand pronunciations for TTS
-# Maps display names to accented versions for correct pronunciation
-BRAND_TTS_PRONUNCIATIONS = {
-    "Chevrolet": "Chévrolet",
-    "Subaru": "Subarú",
-    "Nissan": "Níssan",
-    "Hyundai": "Hiúndai",
-    "Kia": "Kía",
-    "Mazda": "Mázda",
-    "Suzuki": "Suzúki",
-    "Honda": "Hónda",
-    "Mitsubishi": "Mitsubíshi",
-    "Fiat": "Fíat",
-}
-
 # Message templates for vehicle announcements
 VEHICLE_TEMPLATES = {
     "default": (
@@ -107,6 +160,47 @@ VEHICLE_TEMPLATES = {
 }
 
 
+# Words that make a bare d/m token a date ("el 1/2", "hasta el 15/3");
+# without one, "1/2 kilo" is a fraction. d/m/y is always a date.
+DATE_CONTEXT_WORDS = {
+    "el", "del", "al", "desde", "hasta", "hoy", "dia", "día", "fecha", "vence",
+    "lunes", "martes", "miercoles", "miércoles", "jueves", "viernes",
+    "sabado", "sábado", "domingo",
+}
+
+# Denominators read as fractions (1/2 → medio, 3/4 → tres cuartos)
+FRACTION_WORDS = {2: "medio", 3: "tercio", 4: "cuarto"}
+
+# Acronyms spelled out even though they contain vowels
+# (all-caps words without vowels are always spelled out)
+SPELLED_ACRONYMS = {"AFP", "PDI", "SII", "UF", "USB", "RUT"}
+
+# One scan over the text; alternatives are tried left to right, so the
+# more specific tokens (plates, times, dates, prices) come before numbers
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<plate>\b(?:[A-Z]{4}[-.]?\d{2}|[A-Z]{2}[-.][A-Z]{2}[-.]\d{2}|[A-Z]{2}[-.]?\d{4})\b)
+    | (?P<time>\b(?:[01]?\d|2[0-3]):[0-5]\d\b)
+    | (?P<date>\b\d{1,2}/\d{1,2}(?:/(?:\d{4}|\d{2}))?\b)
+    | (?P<price>\$\s?(?:\d{1,3}(?:\.\d{3})+|\d+)(?:,\d{1,2})?)
+    | (?P<number>\b(?:\d{1,3}(?:\.\d{3})+|\d+)(?:,\d+)?(?:\s?%)?)
+    | (?P<acronym>\b[A-Z]{2,5}\b)
+    """,
+    re.VERBOSE,
+)
+
+_VOWELS = set("AEIOU")
+_PREVIOUS_WORD = re.compile(r"(\w+)\W*$")
+_PLATE_SEPARATORS = r"[\s.,-]*"
+
+
+@lru_cache(maxsize=256)
+def _plate_pattern(clean_plate: str) -> re.Pattern:
+    """Matches a plate written with any separators between its characters."""
+    body = _PLATE_SEPARATORS.join(re.escape(char) for char in clean_plate)
+    return re.compile(rf"(?<![A-Za-z0-9]){body}(?![A-Za-z0-9])", re.IGNORECASE)
+
+
 class TextNormalizer:
     """
     Normalizes text for TTS pronunciation in Chilean Spanish.
@@ -156,47 +250,12 @@ class TextNormalizer:
 
         return result
 
-    def _number_to_words_under_100(self, n: int) -> str:
-        """Convert number under 100 to Spanish words."""
-        if n < 0:
-            return "menos " + self._number_to_words_under_100(abs(n))
-
-        if n <= 29:
-            return UNITS.get(n, str(n))
-
-        if n < 100:
-            tens = (n // 10) * 10
-            units = n % 10
-            if units == 0:
-                return TENS[tens]
-            return f"{TENS[tens]} y {UNITS[units]}"
-
-        return str(n)
-
-    def _number_to_words_under_1000(self, n: int) -> str:
-        """Convert number under 1000 to Spanish words."""
-        if n < 100:
-            return self._number_to_words_under_100(n)
-
-        if n == 100:
-            return "cien"
-
-        hundreds = (n // 100) * 100
-        remainder = n % 100
-
-        if remainder == 0:
-            return HUNDREDS[hundreds]
-
-        # "ciento" for 100-199
-        hundreds_word = "ciento" if hundreds == 100 else HUNDREDS[hundreds]
-        return f"{hundreds_word} {self._number_to_words_under_100(remainder)}"
-
     def number_to_words(self, n: int) -> str:
         """
         Convert integer to Spanish words.
 
         Args:
-            n: Integer to convert (0-9999 supported)
+            n: Integer to convert (any size)
 
         Returns:
             Spanish word representation
@@ -206,29 +265,10 @@ class TextNormalizer:
             "cuarenta y cinco"
             >>> normalizer.number_to_words(1234)
             "mil doscientos treinta y cuatro"
+            >>> normalizer.number_to_words(3500000)
+            "tres millones quinientos mil"
         """
-        if n < 0:
-            return "menos " + self.number_to_words(abs(n))
-
-        if n < 1000:
-            return self._number_to_words_under_1000(n)
-
-        if n < 10000:
-            thousands = n // 1000
-            remainder = n % 1000
-
-            if thousands == 1:
-                thousands_word = "mil"
-            else:
-                thousands_word = f"{UNITS[thousands]} mil"
-
-            if remainder == 0:
-                return thousands_word
-
-            return f"{thousands_word} {self._number_to_words_under_1000(remainder)}"
-
-        # For larger numbers, just return the string
-        return str(n)
+        return int_to_words(n)
 
     def normalize_number(self, number_str: str, mode: str = "words") -> str:
         """
@@ -328,6 +368,181 @@ class TextNormalizer:
 
         return " ".join(result_parts)
 
+    def normalize_text(self, text: str, number_mode: str = "words") -> str:
+        """
+        Normalize free text for TTS in a single pass.
+
+        Recognizes plates, times (14:30), dates (15/03/2025), prices
+        ($12.990), integers of any size with Chilean separators (1.500.000,
+        2,5, 30%) and acronyms; everything else is left untouched.
+
+        Args:
+            text: Announcement text
+            number_mode: "words" or "digits" for plain numbers
+
+        Returns:
+            Normalized text
+
+        Example:
+            >>> normalizer.normalize_text("Oferta $12.990 hasta las 14:30")
+            "Oferta doce mil novecientos noventa pesos hasta las catorce treinta"
+        """
+        if not text:
+            return ""
+
+        def replace(match: re.Match) -> str:
+            kind = match.lastgroup
+            token = match.group(kind)
+            if kind == "plate":
+                return self.normalize_plate(token)
+            if kind == "time":
+                return self._normalize_time(token)
+            if kind == "date":
+                if token.count("/") == 2 or self._has_date_context(text, match.start()):
+                    return self._normalize_date(token)
+                return self._normalize_fraction(token)
+            if kind == "price":
+                return self._normalize_price(token)
+            if kind == "number":
+                return self._normalize_number_token(token, number_mode)
+            return self._normalize_acronym(token)
+
+        return TOKEN_PATTERN.sub(replace, text)
+
+    def normalize_batch(self, texts: Iterable[str], number_mode: str = "words") -> List[str]:
+        """
+        Normalize many texts (e.g. all messages of a schedule or campaign).
+
+        Repeated texts are normalized once.
+
+        Returns:
+            Normalized texts in input order
+        """
+        done: Dict[str, str] = {}
+        results = []
+        for text in texts:
+            if text not in done:
+                done[text] = self.normalize_text(text, number_mode=number_mode)
+            results.append(done[text])
+        return results
+
+    def replace_plate(self, text: str, plate: str, replacement: str) -> str:
+        """
+        Replace every occurrence of a plate in text, whatever its separators.
+
+        Covers "JKKJ32", "JKKJ-32", "JK.KJ.32", "JK-KJ-32", "JK KJ 32",
+        "jk,kj32"... in one scan.
+
+        Args:
+            text: Text containing the plate
+            plate: License plate as entered
+            replacement: Text to put in its place (e.g. normalize_plate output)
+
+        Returns:
+            Text with the plate replaced (unchanged if not found)
+        """
+        clean_plate = "".join(char for char in plate.upper() if char.isalnum())
+        if not clean_plate:
+            return text
+        return _plate_pattern(clean_plate).sub(lambda _: replacement, text)
+
+    def _integer_value(self, digits: str) -> int:
+        return int(digits.replace(".", ""))
+
+    def _normalize_number_token(self, token: str, number_mode: str) -> str:
+        percent = token.endswith("%")
+        token = token.rstrip("% ")
+        integer, _, decimals = token.partition(",")
+
+        if number_mode == "digits":
+            words = self.normalize_number(integer, mode="digits")
+        else:
+            words = int_to_words(self._integer_value(integer))
+        if decimals:
+            words += " coma " + self._decimal_words(decimals)
+        if percent:
+            words += " por ciento"
+        return words
+
+    def _decimal_words(self, decimals: str) -> str:
+        """Decimal part keeping leading zeros: "05" → "cero cinco" """
+        significant = decimals.lstrip("0")
+        zeros = ["cero"] * (len(decimals) - len(significant))
+        return " ".join(zeros + ([int_to_words(int(significant))] if significant else []))
+
+    def _normalize_price(self, token: str) -> str:
+        integer, _, cents = token.lstrip("$ ").partition(",")
+        amount = self._integer_value(integer)
+        words = _apocope(int_to_words(amount))
+        # "un millon de pesos"
+        if any(words.endswith(scale) for _, singular, plural in SCALES for scale in (singular, plural)):
+            words += " de"
+        words += " peso" if amount == 1 else " pesos"
+        if cents and int(cents):
+            words += f" con {int_to_words(int(cents))} centavos"
+        return words
+
+    def _normalize_time(self, token: str) -> str:
+        hours, minutes = (int(part) for part in token.split(":"))
+        if minutes == 0:
+            return int_to_words(hours)
+        if minutes < 10:
+            return f"{int_to_words(hours)} cero {UNITS[minutes]}"
+        return f"{int_to_words(hours)} {int_to_words(minutes)}"
+
+    def _normalize_date(self, token: str) -> str:
+        parts = [int(part) for part in token.split("/")]
+        day, month = parts[0], parts[1]
+        if not (1 <= day <= 31 and 1 <= month <= 12):
+            return re.sub(r"\d+", lambda m: int_to_words(int(m.group())), token)
+
+        words = f"{'primero' if day == 1 else int_to_words(day)} de {MONTHS[month - 1]}"
+        if len(parts) == 3:
+            year = parts[2] + 2000 if parts[2] < 100 else parts[2]
+            words += f" de {int_to_words(year)}"
+        return words
+
+    def _has_date_context(self, text: str, start: int) -> bool:
+        previous = _PREVIOUS_WORD.search(text, 0, start)
+        return bool(previous) and previous.group(1).lower() in DATE_CONTEXT_WORDS
+
+    def _normalize_fraction(self, token: str) -> str:
+        numerator, denominator = (int(part) for part in token.split("/"))
+        if numerator == 1 and denominator == 2:
+            return "medio"
+        if denominator in FRACTION_WORDS and numerator > 0:
+            noun = FRACTION_WORDS[denominator]
+            if numerator == 1:
+                return f"un {noun}"
+            return f"{int_to_words(numerator)} {noun}s"
+        return f"{int_to_words(numerator)} sobre {int_to_words(denominator)}"
+
+    def _normalize_acronym(self, token: str) -> str:
+        if token in SPELLED_ACRONYMS or not (_VOWELS & set(token)):
+            return " ".join(LETTER_PRONUNCIATIONS[letter] for letter in token)
+        return token
+
+    def normalize_value(self, value: str, hint: Optional[str], number_mode: str = "words") -> str:
+        """
+        Normalize a template variable value according to its hint.
+
+        Args:
+            value: Variable value
+            hint: "plate", "number", "text", or "brand"/"raw"/None (unchanged;
+                  brand pronunciations come from the pronunciation lexicon)
+            number_mode: "words" or "digits"
+
+        Returns:
+            TTS-friendly value
+        """
+        if hint == "plate":
+            return self.normalize_plate(value, number_mode=number_mode)
+        if hint == "number":
+            return self.normalize_number(value, mode=number_mode)
+        if hint == "text":
+            return self.normalize_text(value, number_mode=number_mode)
+        return value
+
     def validate_plate_format(self, plate: str) -> dict:
         """
         Validate and identify Chilean license plate format.
@@ -390,7 +605,8 @@ class TextNormalizer:
         patente: str,
         template: str = "default",
         number_mode: str = "words",
-        custom_template_text: str = None
+        custom_template_text: str = None,
+        lexicon: Optional[Any] = None,
     ) -> dict:
         """
         Generate normalized vehicle announcement text for TTS.
@@ -403,6 +619,9 @@ class TextNormalizer:
             number_mode: "words" or "digits" for plate number pronunciation
             custom_template_text: Optional custom template text from database.
                                   If provided, overrides the template parameter.
+            lexicon: Pronunciation lexicon matcher (LexiconMatcher) used for
+                     the brand; without it the brand is kept as given and
+                     the lexicon is applied at TTS time
 
         Returns:
             Dict with original and normalized text
@@ -420,25 +639,19 @@ class TextNormalizer:
             template_text = custom_template_text
         else:
             template_text = self.templates.get(template, self.templates["default"])
+        compiled = compile_template(template_text)
 
-        # Normalize the license plate
+        # TTS-friendly plate and brand (pronunciation from the lexicon)
         patente_normalized = self.normalize_plate(patente, number_mode=number_mode)
-
-        # Get TTS-friendly brand name (with accent for pronunciation)
-        marca_tts = BRAND_TTS_PRONUNCIATIONS.get(marca, marca)
-
-        # Generate original text (with raw plate and display brand name)
-        original_text = template_text.format(
-            marca=marca,
-            color=color,
-            patente=patente.upper()
-        )
-
-        # Generate normalized text (with TTS-friendly plate and brand pronunciation)
-        normalized_text = template_text.format(
-            marca=marca_tts,
-            color=color,
-            patente=patente_normalized
+        marca_tts = lexicon.rewrite(marca) if lexicon is not None else marca
+        tts_variables = {"marca": marca_tts, "color": color, "patente": patente_normalized}
+
+        # Original text (raw plate and display brand name); the normalized
+        # text applies each placeholder's hint in the same pass
+        values = {"marca": marca, "color": color, "patente": patente.upper()}
+        original_text = compiled.render(values)
+        normalized_text = compiled.render(
+            {**values, "marca": marca_tts}, normalizer=self, number_mode=number_mode
         )
 
         # Validate plate format
@@ -448,6 +661,8 @@ class TextNormalizer:
             "original": original_text,
             "normalized": normalized_text,
             "template_used": template,
+            "template_text": template_text,
+            "tts_variables": tts_variables,
             "plate_info": plate_info,
             "components": {
                 "marca": marca,
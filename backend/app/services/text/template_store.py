@@ -0,0 +1,70 @@
+"""
+Template Store
+MessageTemplate rows for the operations endpoints.
+
+Rows are kept in the shared cache under the TEMPLATES tag (every template
+write invalidates it) as plain snapshots, which the endpoints compile
+through template_cache.
+"""
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.message_template import MessageTemplate
+from app.services.cache import shared_cache, TEMPLATES
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateSnapshot:
+    """Fields of a MessageTemplate row used to render announcements"""
+    id: str
+    template_text: str
+    use_announcement_sound: bool
+    active: bool
+    updated_at: Optional[str] = None  # ISO 8601 (cache version of the compiled form)
+
+    @classmethod
+    def from_model(cls, template: MessageTemplate) -> "TemplateSnapshot":
+        return cls(
+            id=template.id,
+            template_text=template.template_text,
+            use_announcement_sound=bool(template.use_announcement_sound),
+            active=bool(template.active),
+            updated_at=template.updated_at.isoformat() if template.updated_at else None,
+        )
+
+
+class TemplateStore:
+    """MessageTemplate rows by id through the shared cache"""
+
+    async def load(
+        self, template_id: str, db: AsyncSession, active_only: bool = False
+    ) -> Optional[TemplateSnapshot]:
+        """
+        Template row by id, from the shared cache or the database.
+
+        Args:
+            template_id: MessageTemplate id
+            db: Database session used only on cache miss
+            active_only: Treat inactive templates as missing
+
+        Returns:
+            TemplateSnapshot or None if the template does not exist
+        """
+        async def query():
+            stmt = select(MessageTemplate).filter(MessageTemplate.id == template_id)
+            if active_only:
+                stmt = stmt.filter(MessageTemplate.active == True)
+            template = (await db.execute(stmt)).scalar_one_or_none()
+            return asdict(TemplateSnapshot.from_model(template)) if template else None
+
+        data = await shared_cache.get_or_load(
+            f"templates:{template_id}:{int(active_only)}", query, tags=(TEMPLATES,)
+        )
+        return TemplateSnapshot(**data) if data else None
+
+
+# Singleton instance
+template_store = TemplateStore()
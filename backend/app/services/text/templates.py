@@ -0,0 +1,172 @@
+"""
+Template Engine
+Compiled MessageTemplate rendering.
+
+A template is parsed once into a tuple of parts (literal text or
+variable), and each render is a single join over them. This replaces
+the per-variable str.replace / str.format passes and per-call variable
+regexes used by the template editor and operations endpoints.
+
+Placeholders are {name} or {name:hint}. The hint selects how the value
+is normalized for TTS (see TextNormalizer.normalize_value):
+
+    plate    license plate reading (B. B. C. L. cuarenta y cinco)
+    brand    brand name (pronounced through the pronunciation lexicon)
+    number   number in words or digits
+    text     free-text normalization (prices, times, dates...)
+    raw      value as given
+
+Variables without an explicit hint use DEFAULT_HINTS by name, so
+existing templates ({marca}, {patente}) keep their current reading.
+Placeholders without a value are kept literally.
+
+This module has no database imports so the normalizer can use it on its
+own; loading template rows lives in template_store.
+"""
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+VARIABLE_PATTERN = re.compile(r"\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?\}")
+
+HINTS = ("plate", "brand", "number", "text", "raw")
+DEFAULT_HINTS = {"patente": "plate", "marca": "brand"}
+
+COMPILED_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
+class TemplatePart:
+    """Literal text or a variable placeholder"""
+    text: str                   # Literal text, or the placeholder as written
+    name: Optional[str] = None  # Variable name (None for literals)
+    hint: Optional[str] = None  # Normalizer hint for the value
+
+
+class CompiledTemplate:
+    """
+    A parsed template.
+
+    - variables: unique variable names in order of appearance
+    - missing(): variables without a value
+    - render() / render_many(): fill (and optionally normalize) values
+    """
+
+    __slots__ = ("source", "parts", "variables", "invalid_hints")
+
+    def __init__(self, source: str):
+        parts: List[TemplatePart] = []
+        invalid_hints: List[str] = []
+        position = 0
+
+        for match in VARIABLE_PATTERN.finditer(source):
+            if match.start() > position:
+                parts.append(TemplatePart(source[position:match.start()]))
+            name, hint = match.group(1), match.group(2)
+            if hint and hint not in HINTS:
+                invalid_hints.append(hint)
+                hint = None
+            parts.append(TemplatePart(match.group(0), name, hint or DEFAULT_HINTS.get(name)))
+            position = match.end()
+        if position < len(source):
+            parts.append(TemplatePart(source[position:]))
+
+        self.source = source
+        self.parts: Tuple[TemplatePart, ...] = tuple(parts)
+        self.variables: Tuple[str, ...] = tuple(
+            dict.fromkeys(part.name for part in parts if part.name)
+        )
+        self.invalid_hints: Tuple[str, ...] = tuple(dict.fromkeys(invalid_hints))
+
+    def missing(self, values: Mapping[str, Any]) -> List[str]:
+        """Variables of the template without a value"""
+        return [name for name in self.variables if values.get(name) is None]
+
+    def render(
+        self,
+        values: Mapping[str, Any],
+        normalizer: Optional[Any] = None,
+        number_mode: str = "words",
+    ) -> str:
+        """
+        Fill the template.
+
+        Args:
+            values: Variable values
+            normalizer: TextNormalizer to apply each variable's hint
+                        (values are inserted as given if None)
+            number_mode: "words" or "digits" for plate/number hints
+
+        Returns:
+            Rendered text (placeholders without a value kept literally)
+        """
+        pieces = []
+        for part in self.parts:
+            if part.name is None:
+                pieces.append(part.text)
+                continue
+            value = values.get(part.name)
+            if value is None:
+                pieces.append(part.text)
+            elif normalizer is not None:
+                pieces.append(normalizer.normalize_value(str(value), part.hint, number_mode))
+            else:
+                pieces.append(str(value))
+        return "".join(pieces)
+
+    def render_many(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        normalizer: Optional[Any] = None,
+        number_mode: str = "words",
+    ) -> List[str]:
+        """Render the template once per variable set"""
+        return [self.render(values, normalizer, number_mode) for values in rows]
+
+
+@lru_cache(maxsize=COMPILED_CACHE_SIZE)
+def compile_template(template_text: str) -> CompiledTemplate:
+    """Compiled form of a template text (cached by content)"""
+    return CompiledTemplate(template_text)
+
+
+class TemplateCache:
+    """
+    Compiled MessageTemplates keyed by id, recompiled when updated_at changes.
+    """
+
+    def __init__(self, max_entries: int = COMPILED_CACHE_SIZE):
+        self._entries: "OrderedDict[str, Tuple[Any, CompiledTemplate]]" = OrderedDict()
+        self._max_entries = max_entries
+
+    def get(self, template) -> CompiledTemplate:
+        """
+        Compiled form of a MessageTemplate row.
+
+        Args:
+            template: MessageTemplate or TemplateSnapshot (id, updated_at, template_text)
+        """
+        cached = self._entries.get(template.id)
+        if cached and cached[0] == template.updated_at:
+            self._entries.move_to_end(template.id)
+            return cached[1]
+
+        compiled = CompiledTemplate(template.template_text)
+        self._entries[template.id] = (template.updated_at, compiled)
+        self._entries.move_to_end(template.id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return compiled
+
+    def invalidate(self, template_id: Optional[str] = None) -> None:
+        """Drop one compiled template (all if template_id is None)"""
+        if template_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(template_id, None)
+
+
+# Singleton instance
+template_cache = TemplateCache()
@@ -1,5 +1,16 @@
 """TTS Services"""
 from app.services.tts.elevenlabs import elevenlabs_service
+from app.services.tts.voice_cache import voice_cache
+from app.services.tts.segmented import segmented_tts
+from app.services.tts.take_cache import voice_take_cache
+from app.services.tts.speech_rate import speech_rate_model
 from app.services.tts.voice_manager import voice_manager
 
-__all__ = ["elevenlabs_service", "voice_manager"]
+__all__ = [
+    "elevenlabs_service",
+    "voice_cache",
+    "segmented_tts",
+    "voice_take_cache",
+    "speech_rate_model",
+    "voice_manager",
+]
@@ -25,6 +25,8 @@ class ElevenLabsService:
         voice_id: str,
         voice_settings: Optional[Dict[str, float]] = None,
         model_id: Optional[str] = None,
+        previous_text: Optional[str] = None,
+        next_text: Optional[str] = None,
     ) -> bytes:
         """
         Generate speech audio from text using ElevenLabs API
@@ -34,6 +36,8 @@ class ElevenLabsService:
             voice_id: ElevenLabs voice ID (e.g., 'G4IAP30yc6c1gK0csDfu')
             voice_settings: Voice configuration with style, stability, similarity_boost
             model_id: Optional ElevenLabs model (defaults to ELEVENLABS_MODEL_ID)
+            previous_text: Optional text spoken before this one (prosody context, not voiced)
+            next_text: Optional text spoken after this one (prosody context, not voiced)
 
         Returns:
             bytes: MP3 audio data
@@ -70,6 +74,10 @@ class ElevenLabsService:
                 "speed": voice_settings.get("speed", 1.0),  # ElevenLabs 2025
             },
         }
+        if previous_text:
+            payload["previous_text"] = previous_text
+        if next_text:
+            payload["next_text"] = next_text
 
         logger.info(f"🎙️ Generating TTS: voice_id={voice_id}, model={effective_model}, text_length={len(text)}")
         logger.debug(f"Voice settings: {payload['voice_settings']}")
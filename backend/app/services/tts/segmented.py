@@ -0,0 +1,253 @@
+"""
+Segmented TTS
+Synthesizes announcement templates piece by piece so that the fixed parts
+of a template are generated once per voice/settings and reused.
+
+A template such as "Se solicita al dueño del vehiculo marca {marca}, color
+{color}, patente {patente} que por favor se acerque..." is split at its
+variable boundaries. Long static runs are synthesized once and cached on
+disk (shared by all workers) and in memory; only the short dynamic parts
+(variables plus the few words glued to them) go to ElevenLabs on each
+request, with the neighbouring static text sent as prosody context.
+Segments are trimmed of edge silence and joined at PCM level.
+"""
+import io
+import os
+import json
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from pydub import AudioSegment
+from pydub.silence import detect_leading_silence
+
+from app.core.config import settings
+from app.services.tts.elevenlabs import elevenlabs_service
+from app.services.text.templates import compile_template
+
+logger = logging.getLogger(__name__)
+
+# Static runs shorter than this are voiced together with their variables
+MIN_STATIC_WORDS = 3
+
+# Pause inserted at each join, by the punctuation that ends the left segment
+SENTENCE_PAUSE_MS = 350
+CLAUSE_PAUSE_MS = 180
+WORD_PAUSE_MS = 50
+
+SILENCE_THRESHOLD_DBFS = -50.0
+MEMORY_CACHE_SIZE = 256
+
+# Matches ElevenLabs' default mp3_44100_128 output
+OUTPUT_BITRATE = "128k"
+
+
+@dataclass(frozen=True)
+class TemplateSegment:
+    """A piece of a filled template"""
+    text: str
+    is_static: bool
+
+
+def split_template(template_text: str, variables: Dict[str, str]) -> List[TemplateSegment]:
+    """
+    Split a template into static and dynamic segments.
+
+    Variables are replaced by their values. Static runs with fewer than
+    MIN_STATIC_WORDS words (e.g. ", color ") are folded into the dynamic
+    segment around them, so the result alternates static/dynamic.
+    Placeholders without a value are kept literally as static text.
+
+    Args:
+        template_text: Template with {variable} placeholders
+        variables: Values for the placeholders (already TTS-normalized)
+
+    Returns:
+        List of TemplateSegment in speaking order
+    """
+    pieces: List[TemplateSegment] = []
+    literal = ""
+
+    for part in compile_template(template_text).parts:
+        value = variables.get(part.name) if part.name else None
+        if value is None:
+            literal += part.text
+            continue
+        pieces.append(TemplateSegment(literal, True))
+        pieces.append(TemplateSegment(str(value), False))
+        literal = ""
+    pieces.append(TemplateSegment(literal, True))
+
+    segments: List[TemplateSegment] = []
+    for piece in pieces:
+        is_static = piece.is_static and len(piece.text.split()) >= MIN_STATIC_WORDS
+        if not is_static and segments and not segments[-1].is_static:
+            segments[-1] = TemplateSegment(segments[-1].text + piece.text, False)
+        elif is_static and segments and not segments[-1].is_static:
+            # Punctuation right after a variable belongs to the dynamic part
+            text = piece.text.lstrip()
+            body = text.lstrip(",;.:")
+            segments[-1] = TemplateSegment(segments[-1].text + text[:len(text) - len(body)], False)
+            segments.append(TemplateSegment(body, True))
+        else:
+            segments.append(TemplateSegment(piece.text, is_static))
+
+    return [
+        TemplateSegment(" ".join(segment.text.split()), segment.is_static)
+        for segment in segments
+        if segment.text.strip()
+    ]
+
+
+def _pause_after(text: str) -> int:
+    tail = text.rstrip()[-1:]
+    if tail in ".!?:":
+        return SENTENCE_PAUSE_MS
+    if tail in ",;":
+        return CLAUSE_PAUSE_MS
+    return WORD_PAUSE_MS
+
+
+def _trim_silence(audio: AudioSegment) -> AudioSegment:
+    start = detect_leading_silence(audio, silence_threshold=SILENCE_THRESHOLD_DBFS)
+    end = detect_leading_silence(audio.reverse(), silence_threshold=SILENCE_THRESHOLD_DBFS)
+    if start + end >= len(audio):
+        return audio
+    return audio[start:len(audio) - end]
+
+
+class SegmentedSynthesizer:
+    """
+    Template-aware TTS with a per-voice cache of static segments.
+
+    Cache keys include the ElevenLabs voice, model and effective voice
+    settings, so editing a voice never serves stale static audio.
+    """
+
+    def __init__(self):
+        self.cache_dir = os.path.join(settings.STORAGE_PATH, "cache", "tts_segments")
+        self._memory: "OrderedDict[str, AudioSegment]" = OrderedDict()
+
+    def _cache_key(
+        self, text: str, elevenlabs_id: str, voice_settings: Dict, model_id: Optional[str]
+    ) -> str:
+        raw = json.dumps(
+            {
+                "text": text,
+                "voice": elevenlabs_id,
+                "model": model_id or settings.ELEVENLABS_MODEL_ID,
+                "settings": voice_settings,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.mp3")
+
+    def _remember(self, key: str, audio: AudioSegment) -> None:
+        self._memory[key] = audio
+        self._memory.move_to_end(key)
+        while len(self._memory) > MEMORY_CACHE_SIZE:
+            self._memory.popitem(last=False)
+
+    async def _static_segment(
+        self, text: str, elevenlabs_id: str, voice_settings: Dict, model_id: Optional[str]
+    ) -> AudioSegment:
+        key = self._cache_key(text, elevenlabs_id, voice_settings, model_id)
+
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+            return audio
+
+        path = self._cache_path(key)
+        if os.path.exists(path):
+            audio = _trim_silence(AudioSegment.from_file(path, format="mp3"))
+            self._remember(key, audio)
+            return audio
+
+        audio_bytes = await elevenlabs_service.generate_speech(
+            text=text,
+            voice_id=elevenlabs_id,
+            voice_settings=voice_settings,
+            model_id=model_id,
+        )
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(audio_bytes)
+        os.replace(tmp_path, path)
+
+        logger.info(f"🧩 Cached static TTS segment ({len(text)} chars)")
+        audio = _trim_silence(AudioSegment.from_file(io.BytesIO(audio_bytes), format="mp3"))
+        self._remember(key, audio)
+        return audio
+
+    async def synthesize(
+        self,
+        segments: List[TemplateSegment],
+        elevenlabs_id: str,
+        voice_settings: Dict,
+        model_id: Optional[str] = None,
+    ) -> bytes:
+        """
+        Synthesize segments and join them into one MP3.
+
+        Args:
+            segments: Output of split_template()
+            elevenlabs_id: ElevenLabs voice ID
+            voice_settings: Settings in ElevenLabs format (0-1 scale)
+            model_id: Optional ElevenLabs model override
+
+        Returns:
+            bytes: MP3 audio data
+        """
+        parts: List[AudioSegment] = []
+        dynamic_chars = 0
+
+        for index, segment in enumerate(segments):
+            if segment.is_static:
+                audio = await self._static_segment(
+                    segment.text, elevenlabs_id, voice_settings, model_id
+                )
+            else:
+                previous_text = segments[index - 1].text if index > 0 else None
+                next_text = segments[index + 1].text if index + 1 < len(segments) else None
+                audio_bytes = await elevenlabs_service.generate_speech(
+                    text=segment.text,
+                    voice_id=elevenlabs_id,
+                    voice_settings=voice_settings,
+                    model_id=model_id,
+                    previous_text=previous_text,
+                    next_text=next_text,
+                )
+                audio = _trim_silence(AudioSegment.from_file(io.BytesIO(audio_bytes), format="mp3"))
+                dynamic_chars += len(segment.text)
+            parts.append(audio)
+
+        frame_rate = parts[0].frame_rate
+        channels = parts[0].channels
+        result = AudioSegment.empty().set_frame_rate(frame_rate).set_channels(channels)
+        for index, audio in enumerate(parts):
+            audio = audio.set_frame_rate(frame_rate).set_channels(channels)
+            if index > 0:
+                pause = _pause_after(segments[index - 1].text)
+                result += AudioSegment.silent(duration=pause, frame_rate=frame_rate).set_channels(channels)
+            result += audio
+
+        total_chars = sum(len(segment.text) for segment in segments)
+        logger.info(
+            f"🧩 Segmented TTS: {len(segments)} segments, "
+            f"{dynamic_chars}/{total_chars} chars synthesized"
+        )
+
+        buffer = io.BytesIO()
+        result.export(buffer, format="mp3", bitrate=OUTPUT_BITRATE)
+        return buffer.getvalue()
+
+
+# Singleton instance
+segmented_tts = SegmentedSynthesizer()
@@ -0,0 +1,196 @@
+"""
+Speech Rate Model
+Per-voice speaking rate learned from generated messages.
+
+Duration targets used to be turned into word counts with a fixed 2-3
+words/sec for every voice, so texts for slow voices came out too long and
+were synthesized again. Each voice's rate (characters per second at speed
+1.0) is fitted from its recent AudioMessages: the spoken length of
+original_text against speech_duration (the trimmed take, without padding
+or jingle) and the speed the take was generated at (the snapshot records
+per-request overrides, not just the voice default). Messages from before
+speech_duration was recorded only have the padded duration and are not
+fitted. Few samples are shrunk toward DEFAULT_CHARS_PER_SECOND, so new
+voices start from the old assumption and drift to their own rate as
+messages accumulate.
+"""
+import re
+import json
+import time
+import logging
+import statistics
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.audio import AudioMessage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHARS_PER_SECOND = 14.0   # ~2.5 words/sec of Spanish at speed 1.0
+PRIOR_WEIGHT = 5                  # Messages' worth of trust in the default
+MIN_TEXT_CHARS = 20               # Shorter takes are dominated by edge effects
+HISTORY_LIMIT = 200               # Recent messages fitted per voice
+MODEL_TTL_SECONDS = 600           # Refit interval
+
+AVG_WORD_CHARS = 6.0              # Spanish word plus its space
+DURATION_TOLERANCE = 1.15         # Predicted overrun accepted before trimming text
+MIN_WORDS_RATIO = 0.75            # Lower word limit relative to the upper one
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def spoken_length(text: str) -> int:
+    """Characters that drive speaking time (whitespace runs count once)"""
+    return len(" ".join(text.split()))
+
+
+@dataclass(frozen=True)
+class VoiceRate:
+    """Fitted speaking rate of one voice"""
+    chars_per_second: float     # at speed 1.0
+    samples: int
+
+    def predict(self, text: str, speed: float = 1.0) -> float:
+        """Predicted speech duration (seconds) of text"""
+        return spoken_length(text) / (self.chars_per_second * (speed or 1.0))
+
+    def max_chars(self, duration: float, speed: float = 1.0) -> int:
+        """Characters that fit in duration seconds"""
+        return int(duration * self.chars_per_second * (speed or 1.0))
+
+    def word_limits(self, duration: float, speed: float = 1.0) -> Tuple[int, int]:
+        """(min_words, max_words) for a text of duration seconds"""
+        max_words = max(1, int(self.max_chars(duration, speed) / AVG_WORD_CHARS))
+        return max(1, round(max_words * MIN_WORDS_RATIO)), max_words
+
+    def word_limit_table(
+        self, durations: Iterable[int], speed: float = 1.0
+    ) -> Dict[int, Dict[str, int]]:
+        """{duration: {"min": ..., "max": ...}} for config responses"""
+        table = {}
+        for duration in durations:
+            min_words, max_words = self.word_limits(duration, speed)
+            table[duration] = {"min": min_words, "max": max_words}
+        return table
+
+
+DEFAULT_RATE = VoiceRate(DEFAULT_CHARS_PER_SECOND, 0)
+
+
+def fit_rate(observations: Iterable[Tuple[int, float, float]]) -> VoiceRate:
+    """
+    Fit a voice's rate from (chars, seconds, speed) observations.
+
+    Uses the median per-message rate (robust to odd takes) shrunk toward
+    DEFAULT_CHARS_PER_SECOND by PRIOR_WEIGHT.
+    """
+    rates = [
+        chars / (seconds * speed)
+        for chars, seconds, speed in observations
+        if chars >= MIN_TEXT_CHARS and seconds > 0 and speed > 0
+    ]
+    if not rates:
+        return DEFAULT_RATE
+
+    n = len(rates)
+    cps = (n * statistics.median(rates) + PRIOR_WEIGHT * DEFAULT_CHARS_PER_SECOND) / (n + PRIOR_WEIGHT)
+    return VoiceRate(round(cps, 3), n)
+
+
+def trim_to_duration(text: str, max_seconds: float, rate: VoiceRate, speed: float = 1.0) -> str:
+    """
+    Drop trailing sentences until the predicted duration fits.
+
+    The first sentence is always kept; text without sentence breaks is
+    returned unchanged.
+    """
+    sentences = [s for s in _SENTENCE_END.split(text.strip()) if s]
+    if len(sentences) < 2 or rate.predict(text, speed) <= max_seconds:
+        return text
+
+    kept = sentences[0]
+    for sentence in sentences[1:]:
+        candidate = f"{kept} {sentence}"
+        if rate.predict(candidate, speed) > max_seconds:
+            break
+        kept = candidate
+    return kept
+
+
+class SpeechRateModel:
+    """
+    Per-voice rates fitted from message history, refitted every
+    MODEL_TTL_SECONDS per process.
+    """
+
+    def __init__(self):
+        self._rates: Dict[str, Tuple[float, VoiceRate]] = {}
+
+    async def rate_for(self, voice_id: str, db: AsyncSession) -> VoiceRate:
+        """
+        Fitted rate of a voice (DEFAULT_CHARS_PER_SECOND without history).
+        """
+        cached = self._rates.get(voice_id)
+        if cached and time.monotonic() - cached[0] < MODEL_TTL_SECONDS:
+            return cached[1]
+
+        result = await db.execute(
+            select(
+                AudioMessage.original_text,
+                AudioMessage.speech_duration,
+                AudioMessage.voice_settings_snapshot,
+            )
+            .filter(
+                AudioMessage.voice_id == voice_id,
+                AudioMessage.status == "ready",
+                AudioMessage.speech_duration.isnot(None),
+            )
+            .order_by(AudioMessage.id.desc())
+            .limit(HISTORY_LIMIT)
+        )
+
+        observations = []
+        for text, speech_duration, snapshot in result.all():
+            speed = 1.0
+            if snapshot:
+                try:
+                    speed = float(json.loads(snapshot).get("speed") or 1.0)
+                except (ValueError, TypeError, AttributeError):
+                    pass
+            observations.append((spoken_length(text), speech_duration, speed))
+
+        rate = fit_rate(observations)
+        self._rates[voice_id] = (time.monotonic(), rate)
+        logger.info(
+            f"🗣️ Speech rate for {voice_id}: {rate.chars_per_second:.1f} chars/s "
+            f"({rate.samples} messages)"
+        )
+        return rate
+
+    async def predict_duration(
+        self, text: str, voice_id: str, db: AsyncSession, speed: float = 1.0
+    ) -> float:
+        """Predicted speech duration (seconds) of text for a voice"""
+        rate = await self.rate_for(voice_id, db)
+        return rate.predict(text, speed)
+
+    async def word_limits(
+        self, voice_id: str, duration: float, db: AsyncSession, speed: float = 1.0
+    ) -> Tuple[int, int]:
+        """(min_words, max_words) that fit duration seconds for a voice"""
+        rate = await self.rate_for(voice_id, db)
+        return rate.word_limits(duration, speed)
+
+    def invalidate(self, voice_id: Optional[str] = None) -> None:
+        """Drop fitted rates (all voices if voice_id is None)"""
+        if voice_id is None:
+            self._rates.clear()
+        else:
+            self._rates.pop(voice_id, None)
+
+
+# Singleton instance
+speech_rate_model = SpeechRateModel()
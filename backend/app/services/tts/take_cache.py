@@ -0,0 +1,86 @@
+"""
+Voice Take Cache
+Reuses ElevenLabs audio for identical (text, voice, model, settings) requests.
+
+In the playroom and automatic modes operators regenerate the same text
+while trying different music beds or mix settings. Caching the take means
+those attempts skip the TTS call entirely, and since the cached bytes are
+identical, the jingle mix cache can recognise the voice as well.
+"""
+import json
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.services.storage.disk_cache import DiskCache
+from app.services.tts.elevenlabs import elevenlabs_service
+
+logger = logging.getLogger(__name__)
+
+
+class VoiceTakeCache:
+    """
+    Disk-backed cache of synthesized takes, shared by all workers.
+    """
+
+    def __init__(self):
+        self._cache = DiskCache("tts_takes", settings.TTS_TAKE_CACHE_MAX_ENTRIES)
+
+    def _cache_key(
+        self, text: str, elevenlabs_id: str, voice_settings: Dict, model_id: Optional[str]
+    ) -> str:
+        raw = json.dumps(
+            {
+                "text": text,
+                "voice": elevenlabs_id,
+                "model": model_id or settings.ELEVENLABS_MODEL_ID,
+                "settings": voice_settings,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get_or_generate(
+        self,
+        text: str,
+        elevenlabs_id: str,
+        voice_settings: Dict,
+        model_id: Optional[str] = None,
+    ) -> bytes:
+        """
+        Return a cached take or synthesize (and cache) a new one.
+
+        Args:
+            text: Text to synthesize
+            elevenlabs_id: ElevenLabs voice ID
+            voice_settings: Settings in ElevenLabs format
+            model_id: Optional ElevenLabs model override
+
+        Returns:
+            bytes: MP3 audio data
+        """
+        key = self._cache_key(text, elevenlabs_id, voice_settings, model_id)
+
+        path = self._cache.lookup(key)
+        if path:
+            logger.info(f"♻️ Reusing cached voice take ({len(text)} chars)")
+            with open(path, "rb") as f:
+                return f.read()
+
+        audio_bytes = await elevenlabs_service.generate_speech(
+            text=text,
+            voice_id=elevenlabs_id,
+            voice_settings=voice_settings,
+            model_id=model_id,
+        )
+        self._cache.store_bytes(key, audio_bytes)
+        return audio_bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics for diagnostics"""
+        return self._cache.stats()
+
+
+# Singleton instance
+voice_take_cache = VoiceTakeCache()
@@ -0,0 +1,255 @@
+"""
+Voice Cache
+Read-through, versioned in-process cache of voice configurations.
+
+Voices change a few times a week but are read on every TTS generation
+(generator, operations endpoints, chat tool). Entries are immutable
+VoiceSnapshot objects, never ORM instances, so they are safe to share
+across sessions and requests.
+
+Every write to voice_settings must call voice_manager.invalidate_cache(),
+which drops this worker's copy (invalidate(), bumping the version counter)
+and invalidates the VOICES tag of the shared cache. Other workers hear
+about it through the shared cache's pub/sub and drop theirs. A read that
+started before an invalidation never stores its (possibly stale) result.
+When those notifications cannot arrive (no Redis), entries are dropped
+after shared_cache.local_ttl seconds instead.
+"""
+import copy
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.voice_settings import VoiceSettings
+from app.services.cache import shared_cache, VOICES
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for "default voice not resolved yet"
+_UNRESOLVED = object()
+
+
+@dataclass(frozen=True, slots=True)
+class VoiceSnapshot:
+    """Immutable copy of a VoiceSettings row (same attribute names)"""
+    id: str
+    name: str
+    elevenlabs_id: str
+    active: bool
+    is_default: bool
+    order: int
+    gender: Optional[str] = None
+    accent: Optional[str] = None
+    description: Optional[str] = None
+    style: float = 0.0
+    stability: float = 50.0
+    similarity_boost: float = 75.0
+    use_speaker_boost: bool = True
+    speed: float = 1.0
+    volume_adjustment: float = 0.0
+    jingle_settings: Optional[Dict[str, Any]] = field(default=None, hash=False, compare=False)
+    tts_settings: Optional[Dict[str, Any]] = field(default=None, hash=False, compare=False)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_model(cls, voice: VoiceSettings) -> "VoiceSnapshot":
+        """Build a snapshot from an ORM row (JSON columns are deep-copied)"""
+        return cls(
+            id=voice.id,
+            name=voice.name,
+            elevenlabs_id=voice.elevenlabs_id,
+            active=voice.active,
+            is_default=voice.is_default,
+            order=voice.order,
+            gender=voice.gender,
+            accent=voice.accent,
+            description=voice.description,
+            style=voice.style,
+            stability=voice.stability,
+            similarity_boost=voice.similarity_boost,
+            use_speaker_boost=voice.use_speaker_boost,
+            speed=voice.speed,
+            volume_adjustment=voice.volume_adjustment,
+            jingle_settings=copy.deepcopy(voice.jingle_settings),
+            tts_settings=copy.deepcopy(voice.tts_settings),
+            created_at=voice.created_at,
+            updated_at=voice.updated_at,
+        )
+
+
+class VoiceCache:
+    """
+    Versioned read-through cache for voice configurations.
+
+    - get(): voice by id (None if it does not exist)
+    - get_default(): default active voice, falling back to the first active one
+    - invalidate(): drop entries and bump the version (this worker)
+    """
+
+    def __init__(self):
+        self._voices: Dict[str, VoiceSnapshot] = {}
+        self._default: Any = _UNRESOLVED
+        self._version = 0
+        self._filled_at: Optional[float] = None
+        self._hits = 0
+        self._misses = 0
+        self._subscribed = False
+
+    @property
+    def version(self) -> int:
+        """Current cache version (bumped on every invalidation)"""
+        return self._version
+
+    async def get(self, voice_id: str, db: AsyncSession) -> Optional[VoiceSnapshot]:
+        """
+        Get a voice snapshot, loading it from the database on a miss.
+
+        Args:
+            voice_id: Voice identifier (e.g., 'juan_carlos')
+            db: Database session used only on cache miss
+
+        Returns:
+            VoiceSnapshot or None if the voice does not exist
+        """
+        self._expire_if_stale()
+        snapshot = self._voices.get(voice_id)
+        if snapshot is not None:
+            self._hits += 1
+            return snapshot
+
+        self._misses += 1
+        version = self._version
+
+        result = await db.execute(
+            select(VoiceSettings).filter(VoiceSettings.id == voice_id)
+        )
+        voice = result.scalar_one_or_none()
+        if voice is None:
+            return None
+
+        snapshot = VoiceSnapshot.from_model(voice)
+        # Only store if no invalidation happened while we were querying
+        if version == self._version:
+            self._voices[voice_id] = snapshot
+            self._mark_filled()
+        return snapshot
+
+    async def get_default(self, db: AsyncSession) -> Optional[VoiceSnapshot]:
+        """
+        Get the default active voice, or the first active voice by order.
+
+        Args:
+            db: Database session used only on cache miss
+
+        Returns:
+            VoiceSnapshot or None if no active voice exists
+        """
+        self._expire_if_stale()
+        if self._default is not _UNRESOLVED:
+            self._hits += 1
+            return self._default
+
+        self._misses += 1
+        version = self._version
+
+        result = await db.execute(
+            select(VoiceSettings).filter(
+                VoiceSettings.is_default == True, VoiceSettings.active == True
+            )
+        )
+        voice = result.scalars().first()
+        if voice is None:
+            result = await db.execute(
+                select(VoiceSettings)
+                .filter(VoiceSettings.active == True)
+                .order_by(VoiceSettings.order.asc())
+                .limit(1)
+            )
+            voice = result.scalar_one_or_none()
+
+        snapshot = VoiceSnapshot.from_model(voice) if voice else None
+        if version == self._version:
+            self._default = snapshot
+            if snapshot is not None:
+                self._voices.setdefault(snapshot.id, snapshot)
+            self._mark_filled()
+        return snapshot
+
+    def invalidate(self, voice_id: Optional[str] = None) -> None:
+        """
+        Invalidate cached voices and bump the version.
+
+        The default-voice resolution is always dropped because any voice
+        change (active flag, is_default, order) can affect it.
+
+        Args:
+            voice_id: Specific voice to invalidate, or None for all
+        """
+        self._version += 1
+        self._default = _UNRESOLVED
+        if voice_id:
+            self._voices.pop(voice_id, None)
+            logger.debug(f"🗑️ Voice cache invalidated: {voice_id} (v{self._version})")
+        else:
+            self._voices.clear()
+            self._filled_at = None
+            logger.debug(f"🗑️ Voice cache cleared (v{self._version})")
+
+    def clear(self) -> None:
+        """Drop every entry and reset statistics (local only)"""
+        self._voices.clear()
+        self._default = _UNRESOLVED
+        self._version += 1
+        self._filled_at = None
+        self._hits = 0
+        self._misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics for diagnostics"""
+        return {
+            "version": self._version,
+            "entries": len(self._voices),
+            "hits": self._hits,
+            "misses": self._misses,
+            "shared_backend": shared_cache.backend,
+        }
+
+    def _mark_filled(self) -> None:
+        if self._filled_at is None:
+            self._filled_at = time.monotonic()
+
+    def _expire_if_stale(self) -> None:
+        """Drop everything once older than shared_cache.local_ttl (if set)"""
+        ttl = shared_cache.local_ttl
+        if ttl is not None and self._filled_at is not None:
+            if time.monotonic() - self._filled_at > ttl:
+                self.invalidate()
+
+    # ------------------------------------------------------------------
+    # Cross-worker invalidation (shared cache pub/sub)
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Drop this worker's copy when another worker invalidates VOICES"""
+        if not self._subscribed:
+            shared_cache.subscribe(VOICES, self._on_remote_invalidation)
+            self._subscribed = True
+
+    async def stop(self) -> None:
+        """Stop listening for cross-worker invalidations"""
+        if self._subscribed:
+            shared_cache.unsubscribe(VOICES, self._on_remote_invalidation)
+            self._subscribed = False
+
+    def _on_remote_invalidation(self, tags: Sequence[str]) -> None:
+        self.invalidate()
+
+
+# Singleton instance
+voice_cache = VoiceCache()
@@ -4,11 +4,17 @@ Manages voice settings and automatically applies them during TTS generation
 """
 import json
 import logging
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from app.core.config import settings
 from app.models.voice_settings import VoiceSettings
 from app.services.tts.elevenlabs import elevenlabs_service
+from app.services.cache import shared_cache, VOICES
+from app.services.tts.voice_cache import voice_cache, VoiceSnapshot
+from app.services.tts.segmented import segmented_tts, split_template, TemplateSegment
+from app.services.text import text_normalizer
+from app.services.text.lexicon import pronunciation_lexicon
 
 logger = logging.getLogger(__name__)
 
@@ -19,31 +25,25 @@ class VoiceManager:
     Critical component for v2.1 architecture
     """
 
-    def __init__(self):
-        self._cache: Dict[str, VoiceSettings] = {}
-        self._cache_loaded = False
-
     async def get_voice_with_settings(
         self, voice_id: str, db: AsyncSession
-    ) -> Optional[VoiceSettings]:
+    ) -> Optional[VoiceSnapshot]:
         """
         Get voice configuration with all predefined settings
 
+        Served from the shared voice cache; the database is only queried
+        on a miss. The result is an immutable snapshot, not an ORM object.
+
         Args:
             voice_id: Voice identifier (e.g., 'juan_carlos')
             db: Database session
 
         Returns:
-            VoiceSettings object or None if not found
+            VoiceSnapshot or None if not found
         """
-        # Always query database - don't cache ORM objects across sessions
-        result = await db.execute(
-            select(VoiceSettings).filter(VoiceSettings.id == voice_id)
-        )
-        voice = result.scalar_one_or_none()
+        voice = await voice_cache.get(voice_id, db)
 
         if voice:
-            logger.debug(f"✅ Voice '{voice_id}' loaded from database")
             return voice
 
         logger.warning(f"⚠️ Voice '{voice_id}' not found")
@@ -69,31 +69,28 @@ class VoiceManager:
         logger.info(f"📋 Retrieved {len(voices)} active voices")
         return voices
 
-    async def get_default_voice(self, db: AsyncSession) -> Optional[VoiceSettings]:
+    async def get_default_voice(self, db: AsyncSession) -> Optional[VoiceSnapshot]:
         """
-        Get the default voice
+        Get the default voice (first active voice if none is marked default)
 
         Args:
             db: Database session
 
         Returns:
-            Default VoiceSettings or None
+            Default VoiceSnapshot or None if there are no active voices
         """
-        result = await db.execute(
-            select(VoiceSettings).filter(
-                VoiceSettings.is_default == True, VoiceSettings.active == True
-            )
-        )
-        voice = result.scalar_one_or_none()
+        voice = await voice_cache.get_default(db)
 
         if voice:
-            logger.info(f"✅ Default voice: {voice.name}")
+            logger.debug(f"✅ Default voice: {voice.name}")
         else:
-            logger.warning("⚠️ No default voice configured")
+            logger.warning("⚠️ No active voices configured")
 
         return voice
 
-    def get_elevenlabs_settings(self, voice: VoiceSettings) -> Dict:
+    def get_elevenlabs_settings(
+        self, voice: Union[VoiceSettings, VoiceSnapshot]
+    ) -> Dict:
         """
         Convert VoiceSettings to ElevenLabs API format
 
@@ -128,7 +125,7 @@ class VoiceManager:
         db: AsyncSession,
         model_id: Optional[str] = None,
         settings_override: Optional[Dict] = None,
-    ) -> tuple[bytes, VoiceSettings, Dict]:
+    ) -> tuple[bytes, VoiceSnapshot, Dict]:
         """
         Generate TTS with automatic voice settings application
 
@@ -205,6 +202,8 @@ class VoiceManager:
             f"(elevenlabs_id={voice.elevenlabs_id})"
         )
 
+        text = await self.prepare_text(text, voice.id, db)
+
         # Generate audio with ElevenLabs
         audio_bytes = await elevenlabs_service.generate_speech(
             text=text,
@@ -220,12 +219,110 @@ class VoiceManager:
 
         return audio_bytes, voice, effective_settings
 
-    def get_voice_settings_snapshot(self, voice: VoiceSettings) -> str:
+    async def prepare_text(self, text: str, voice_id: str, db: AsyncSession) -> str:
+        """
+        Text as sent to ElevenLabs.
+
+        Applies the pronunciation lexicon (global + this voice) first, so
+        user-defined fixes win, then the text normalizer (numbers, prices,
+        times, dates, plates and acronyms in words).
+
+        Args:
+            text: Announcement text
+            voice_id: Voice identifier (voice-specific lexicon entries)
+            db: Database session (lexicon refresh)
+
+        Returns:
+            TTS-ready text
+        """
+        text = await pronunciation_lexicon.apply(text, voice_id, db)
+        if settings.TTS_NORMALIZE_TEXT:
+            text = text_normalizer.normalize_text(text)
+        return text
+
+    async def generate_segmented(
+        self,
+        template_text: str,
+        variables: Dict[str, str],
+        voice_id: str,
+        db: AsyncSession,
+        model_id: Optional[str] = None,
+    ) -> tuple[bytes, VoiceSnapshot, Dict]:
+        """
+        Generate TTS for a template, reusing cached audio for its static parts
+
+        Falls back to generate_with_voice() on the filled text when the
+        template has no static run worth caching or segmented synthesis fails.
+
+        Args:
+            template_text: Template with {variable} placeholders
+            variables: TTS-ready values for the placeholders
+            voice_id: Voice identifier
+            db: Database session
+            model_id: Optional ElevenLabs model override
+
+        Returns:
+            tuple: (audio_bytes, voice_settings_used, effective_settings)
+
+        Raises:
+            ValueError: If voice not found or inactive
+        """
+        segments = split_template(template_text, variables)
+        full_text = " ".join(segment.text for segment in segments)
+
+        if not any(segment.is_static for segment in segments):
+            return await self.generate_with_voice(full_text, voice_id, db, model_id=model_id)
+
+        voice = await self.get_voice_with_settings(voice_id, db)
+
+        if not voice:
+            raise ValueError(f"Voice '{voice_id}' not found")
+
+        if not voice.active:
+            raise ValueError(f"Voice '{voice_id}' is inactive")
+
+        effective_settings = {
+            "style": voice.style,
+            "stability": voice.stability,
+            "similarity_boost": voice.similarity_boost,
+            "speed": voice.speed,
+            "volume_adjustment": voice.volume_adjustment,
+        }
+
+        # Lexicon and normalization per segment keep static segments stable (and cached)
+        texts = [await pronunciation_lexicon.apply(segment.text, voice.id, db) for segment in segments]
+        if settings.TTS_NORMALIZE_TEXT:
+            texts = text_normalizer.normalize_batch(texts)
+        segments = [
+            TemplateSegment(text, segment.is_static) for text, segment in zip(texts, segments)
+        ]
+
+        try:
+            audio_bytes = await segmented_tts.synthesize(
+                segments,
+                elevenlabs_id=voice.elevenlabs_id,
+                voice_settings=self.get_elevenlabs_settings(voice),
+                model_id=model_id,
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Segmented TTS failed, generating full text: {e}")
+            return await self.generate_with_voice(full_text, voice_id, db, model_id=model_id)
+
+        return audio_bytes, voice, effective_settings
+
+    def get_voice_settings_snapshot(
+        self,
+        voice: Union[VoiceSettings, VoiceSnapshot],
+        effective_settings: Optional[Dict] = None,
+    ) -> str:
         """
         Create a JSON snapshot of voice settings for storage
 
         Args:
             voice: VoiceSettings object
+            effective_settings: Settings actually used for the generation
+                (as returned by generate_with_voice); they take precedence
+                over the voice defaults so per-request overrides are recorded
 
         Returns:
             str: JSON string with settings snapshot
@@ -242,6 +339,10 @@ class VoiceManager:
             "volume_adjustment": voice.volume_adjustment,
             "jingle_settings": voice.jingle_settings,
         }
+        if effective_settings:
+            snapshot.update(
+                {k: v for k, v in effective_settings.items() if k in snapshot}
+            )
 
         return json.dumps(snapshot)
 
@@ -261,8 +362,8 @@ class VoiceManager:
         await db.commit()
         await db.refresh(voice)
 
-        # Update cache
-        self._cache[voice.id] = voice
+        # A new voice can change the default/first-active resolution
+        await self.invalidate_cache(voice.id)
 
         logger.info(f"✅ Created new voice: {voice.name} (id={voice.id})")
         return voice
@@ -299,25 +400,22 @@ class VoiceManager:
         await db.refresh(voice)
 
         # Invalidate cache
-        if voice_id in self._cache:
-            del self._cache[voice_id]
+        await self.invalidate_cache(voice_id)
 
         logger.info(f"✅ Updated voice: {voice.name} (id={voice_id})")
         return voice
 
-    def invalidate_cache(self, voice_id: Optional[str] = None):
+    async def invalidate_cache(self, voice_id: Optional[str] = None):
         """
-        Invalidate voice cache
+        Invalidate voice cache and cached voice responses on every worker
+
+        Must be called after every committed write to voice_settings.
 
         Args:
             voice_id: Specific voice to invalidate, or None for all
         """
-        if voice_id:
-            self._cache.pop(voice_id, None)
-            logger.debug(f"🗑️ Cache invalidated for voice: {voice_id}")
-        else:
-            self._cache.clear()
-            logger.debug("🗑️ All voice cache cleared")
+        voice_cache.invalidate(voice_id)
+        await shared_cache.invalidate(VOICES)
 
 
 # Singleton instance
@@ -3,14 +3,18 @@ Shared test fixtures for MediaFlow tests.
 
 Provides:
 - Async SQLite in-memory database
-- FastAPI test client with dependency override
+- FastAPI test client with dependency override (and a seed() helper)
+- record_selects() to capture the SELECT statements a request runs
 - Common data factories (voices, categories, music tracks, audio messages)
 """
 import os
+from contextlib import contextmanager
+
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, patch
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from httpx import AsyncClient, ASGITransport
 
@@ -28,8 +32,27 @@ from app.models import (  # noqa: E402 - import all models to register them
     VoiceSettings, Category, AudioMessage, Schedule, MusicTrack,
     ChatConversation, ChatMessage,
 )
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db, ReadOnlySession
 from app.main import app
+from app.core.response_cache import response_cache
+from app.services.cache import shared_cache
+from app.services.tts import voice_cache
+
+
+# ---------------------------------------------------------------------------
+# Process-wide caches
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Each test gets a fresh database, so in-process caches must start empty."""
+    voice_cache.clear()
+    response_cache.clear()
+    shared_cache.clear()
+    yield
+    voice_cache.clear()
+    response_cache.clear()
+    shared_cache.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -72,7 +95,8 @@ async def db_session(db_engine):
 async def client(db_engine):
     """
     httpx.AsyncClient wired to the FastAPI app with DB dependency override.
-    Each request gets its own session from the test engine.
+    Each request gets its own session from the test engine (read-only
+    endpoints get a ReadOnlySession, as in production).
     """
     session_factory = async_sessionmaker(
         db_engine, class_=AsyncSession,
@@ -88,7 +112,20 @@ async def client(db_engine):
                 await session.rollback()
                 raise
 
+    read_session_factory = async_sessionmaker(
+        db_engine, class_=AsyncSession, sync_session_class=ReadOnlySession,
+        expire_on_commit=False, autocommit=False, autoflush=False,
+    )
+
+    async def override_get_read_db():
+        async with read_session_factory() as session:
+            try:
+                yield session
+            finally:
+                await session.rollback()
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_read_db
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as c:
@@ -99,6 +136,45 @@ async def client(db_engine):
     app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture
+async def seed(client):
+    """
+    Insert and commit objects through the client's test engine.
+
+    Usage: ``await seed(make_voice(), make_category())``
+    """
+    async def _seed(*objs):
+        async with client._test_session_factory() as session:
+            session.add_all(objs)
+            await session.commit()
+
+    return _seed
+
+
+@pytest.fixture
+def record_selects(db_engine):
+    """
+    Capture the SELECT statements executed on the test engine.
+
+    Usage: ``with record_selects() as statements: await client.get(...)``
+    """
+    @contextmanager
+    def _record():
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+    return _record
+
+
 # ---------------------------------------------------------------------------
 # Data factory helpers
 # ---------------------------------------------------------------------------
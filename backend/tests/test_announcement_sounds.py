@@ -0,0 +1,44 @@
+"""
+Tests for MP3 profile detection used by announcement stream-copy concat.
+"""
+from app.services.audio.announcement_sounds import Mp3Profile, read_mp3_profile
+
+
+def _id3_tag(payload_size: int) -> bytes:
+    size = bytes([
+        (payload_size >> 21) & 0x7F, (payload_size >> 14) & 0x7F,
+        (payload_size >> 7) & 0x7F, payload_size & 0x7F,
+    ])
+    return b"ID3\x04\x00\x00" + size + b"\x00" * payload_size
+
+
+def test_mpeg1_mono_128k(tmp_path):
+    # MPEG-1 Layer III, 128 kbps, 44.1 kHz, mono
+    path = tmp_path / "voice.mp3"
+    path.write_bytes(b"\xff\xfb\x90\xc4" + b"\x00" * 400)
+
+    assert read_mp3_profile(str(path)) == Mp3Profile(44100, 1, 128)
+
+
+def test_skips_id3_tag_and_reads_stereo(tmp_path):
+    # MPEG-1 Layer III, 192 kbps, 44.1 kHz, joint stereo
+    path = tmp_path / "intro.mp3"
+    path.write_bytes(_id3_tag(300) + b"\xff\xfb\xb0\x64" + b"\x00" * 400)
+
+    assert read_mp3_profile(str(path)) == Mp3Profile(44100, 2, 192)
+
+
+def test_mpeg2_low_sample_rate(tmp_path):
+    # MPEG-2 Layer III, 64 kbps, 22.05 kHz, mono
+    path = tmp_path / "low.mp3"
+    path.write_bytes(b"\xff\xf3\x80\xc4" + b"\x00" * 400)
+
+    assert read_mp3_profile(str(path)) == Mp3Profile(22050, 1, 64)
+
+
+def test_non_mp3_returns_none(tmp_path):
+    path = tmp_path / "sound.m4a"
+    path.write_bytes(b"\x00\x00\x00\x20ftypM4A " + b"\x00" * 100)
+
+    assert read_mp3_profile(str(path)) is None
+    assert read_mp3_profile(str(tmp_path / "missing.mp3")) is None
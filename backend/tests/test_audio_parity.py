@@ -94,7 +94,8 @@ async def _generate_via_tool(client) -> AudioMessage:
         ), patch(
             f"{GEN}.AudioSegment"
         ) as mock_pydub, patch(
-            f"{GEN}.os.makedirs",
+            f"{GEN}.audio_storage.write_bytes",
+            side_effect=lambda filename, data: f"/tmp/mediaflow-test/storage/audio/{filename}",
         ), patch(
             f"{GEN}.os.path.getsize",
             return_value=FAKE_FILE_SIZE,
@@ -144,7 +145,8 @@ async def _generate_via_endpoint(client) -> AudioMessage:
     ), patch(
         f"{GEN}.AudioSegment"
     ) as mock_pydub, patch(
-        f"{GEN}.os.makedirs",
+        f"{GEN}.audio_storage.write_bytes",
+        side_effect=lambda filename, data: f"/tmp/mediaflow-test/storage/audio/{filename}",
     ), patch(
         f"{GEN}.os.path.getsize",
         return_value=FAKE_FILE_SIZE,
@@ -279,3 +281,46 @@ async def test_parity_volume_adjustment(client):
 
     assert tool_audio.volume_adjustment == endpoint_audio.volume_adjustment
     assert tool_audio.volume_adjustment == 0.0
+
+
+async def test_snapshot_records_override_speed(client):
+    """A per-request speed override is what the snapshot stores, not the voice default."""
+    await _seed_voice(client)
+
+    mock_segment = MagicMock()
+    mock_segment.__len__ = lambda self: FAKE_DURATION_MS
+    effective = {**_fake_effective_settings(), "speed": 0.8}
+
+    with patch(
+        f"{GEN}.voice_manager.generate_with_voice",
+        new_callable=AsyncMock,
+        return_value=(FAKE_AUDIO_BYTES, _make_voice_obj(), effective),
+    ) as mock_generate, patch(
+        f"{GEN}.AudioSegment"
+    ) as mock_pydub, patch(
+        f"{GEN}.audio_storage.write_bytes",
+        side_effect=lambda filename, data: f"/tmp/mediaflow-test/storage/audio/{filename}",
+    ), patch(
+        f"{GEN}.os.path.getsize",
+        return_value=FAKE_FILE_SIZE,
+    ), patch("builtins.open", MagicMock()):
+        mock_pydub.from_file.return_value = mock_segment
+
+        resp = await client.post("/api/v1/audio/generate", json={
+            "text": FAKE_TEXT,
+            "voice_id": VOICE_ID,
+            "voice_settings": {"speed": 0.8},
+        })
+
+    assert resp.status_code == 201
+    assert mock_generate.call_args.kwargs["settings_override"] == {"speed": 0.8}
+
+    factory = client._test_session_factory
+    async with factory() as session:
+        audio = (await session.execute(
+            select(AudioMessage).filter(AudioMessage.id == resp.json()["audio_id"])
+        )).scalar_one()
+
+    snapshot = json.loads(audio.voice_settings_snapshot)
+    assert snapshot["speed"] == 0.8
+    assert snapshot["style"] == 10.0
@@ -0,0 +1,39 @@
+"""
+Tests for ffprobe output parsing.
+"""
+import json
+
+from app.services.audio.probe import parse_ffprobe_output
+
+
+def test_parses_stream_and_format():
+    output = json.dumps({
+        "streams": [{"codec_name": "mp3", "sample_rate": "44100", "channels": 1, "bit_rate": "128000"}],
+        "format": {"format_name": "mp3", "duration": "12.345000", "bit_rate": "128512"},
+    })
+
+    metadata = parse_ffprobe_output(output, file_size=197_000)
+
+    assert metadata.duration == 12.345
+    assert metadata.sample_rate == 44100
+    assert metadata.channels == 1
+    assert metadata.bitrate_kbps == 128
+    assert metadata.codec == "mp3"
+    assert metadata.format_name == "mp3"
+
+
+def test_bitrate_estimated_from_size_when_missing():
+    output = json.dumps({
+        "streams": [{"codec_name": "opus", "sample_rate": "48000", "channels": 2, "bit_rate": "N/A"}],
+        "format": {"format_name": "ogg", "duration": "10.0"},
+    })
+
+    metadata = parse_ffprobe_output(output, file_size=80_000)
+
+    assert metadata.bitrate == 64_000
+
+
+def test_no_audio_stream_or_bad_output():
+    assert parse_ffprobe_output(json.dumps({"streams": [], "format": {"duration": "1.0"}}), 10) is None
+    assert parse_ffprobe_output("not json", 10) is None
+    assert parse_ffprobe_output("", 10) is None
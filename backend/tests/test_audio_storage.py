@@ -0,0 +1,53 @@
+"""
+Tests for the sharded audio storage layout.
+"""
+import os
+from datetime import datetime
+
+from app.services.storage.audio_storage import AudioStorage
+
+
+def test_new_filenames_are_unique_within_same_second():
+    storage = AudioStorage(base_path="/unused")
+    now = datetime(2026, 1, 1, 10, 0, 0)
+
+    names = {storage.new_filename("tts", "juan", now=now) for _ in range(200)}
+
+    assert len(names) == 200
+    for name in names:
+        assert name.startswith("tts_20260101_100000_")
+        assert name.endswith("_juan.mp3")
+
+
+def test_write_bytes_uses_shard_and_resolves(tmp_path):
+    storage = AudioStorage(base_path=str(tmp_path))
+    filename = storage.new_filename("tts", "juan")
+
+    path = storage.write_bytes(filename, b"abc")
+
+    assert os.path.dirname(path) == os.path.abspath(storage.shard_dir(filename))
+    assert os.path.relpath(path, tmp_path).count(os.sep) == 2
+    assert storage.resolve(filename) == path
+    with open(path, "rb") as f:
+        assert f.read() == b"abc"
+    assert not [n for n in os.listdir(os.path.dirname(path)) if n.endswith(".tmp")]
+
+
+def test_resolve_finds_legacy_flat_files(tmp_path):
+    storage = AudioStorage(base_path=str(tmp_path))
+    legacy = tmp_path / "tts_20250101_120000_juan.mp3"
+    legacy.write_bytes(b"old")
+
+    assert storage.resolve("tts_20250101_120000_juan.mp3") == str(legacy)
+    assert storage.resolve("missing.mp3") is None
+    assert storage.resolve("../../etc/passwd") is None
+
+
+def test_delete(tmp_path):
+    storage = AudioStorage(base_path=str(tmp_path))
+    filename = storage.new_filename("upload")
+    storage.write_bytes(filename, b"x")
+
+    assert storage.delete(filename) is True
+    assert storage.resolve(filename) is None
+    assert storage.delete(filename) is False
@@ -0,0 +1,41 @@
+"""
+Tests for aggregated campaign / category audio counts.
+"""
+import pytest
+
+from tests.conftest import make_audio_message, make_category, make_voice
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _seed_campaigns(seed, count: int = 5):
+    categories = [make_category(id=f"cat_{i}", name=f"Cat {i}", order=i) for i in range(count)]
+    audios = [
+        make_audio_message(filename=f"a_{i}_{j}.mp3", category_id=f"cat_{i}")
+        for i in range(count)
+        for j in range(i)
+    ]
+    await seed(make_voice(), *categories, *audios)
+
+
+async def test_campaign_list_counts_in_one_query(client, seed, record_selects):
+    await _seed_campaigns(seed)
+
+    with record_selects() as statements:
+        response = await client.get("/api/v1/campaigns")
+
+    assert response.status_code == 200
+    counts = {c["id"]: c["audio_count"] for c in response.json()["campaigns"]}
+    assert counts == {f"cat_{i}": i for i in range(5)}
+    assert len(statements) == 1
+
+
+async def test_settings_categories_message_counts(client, seed):
+    await _seed_campaigns(seed, count=3)
+
+    response = await client.get("/api/v1/settings/categories")
+
+    assert response.status_code == 200
+    assert {c["id"]: c["message_count"] for c in response.json()} == {
+        "cat_0": 0, "cat_1": 1, "cat_2": 2,
+    }
@@ -16,22 +16,6 @@ from tests.conftest import make_audio_message, make_conversation, make_chat_mess
 pytestmark = pytest.mark.asyncio
 
 
-# ---------------------------------------------------------------------------
-# Helper to insert data via client's session factory
-# ---------------------------------------------------------------------------
-
-async def _seed(client, *objs):
-    """Insert objects via the test client's session factory and return them refreshed."""
-    factory = client._test_session_factory
-    async with factory() as session:
-        for obj in objs:
-            session.add(obj)
-        await session.commit()
-        for obj in objs:
-            await session.refresh(obj)
-    return objs
-
-
 # ---------------------------------------------------------------------------
 # GET /api/v1/chat/conversations
 # ---------------------------------------------------------------------------
@@ -40,38 +24,38 @@ async def test_list_conversations_empty(client):
     """Empty DB returns empty conversation list."""
     resp = await client.get("/api/v1/chat/conversations")
     assert resp.status_code == 200
-    assert resp.json() == []
+    assert resp.json() == {"conversations": [], "next_cursor": None}
 
 
-async def test_list_conversations_with_data(client):
+async def test_list_conversations_with_data(client, seed):
     """Returns conversations with correct message_count."""
     conv = ChatConversation(title="Test conv")
-    await _seed(client, conv)
+    await seed(conv)
 
     # Add messages
     m1 = ChatMessage(conversation_id=conv.id, role="user", content="Hello")
     m2 = ChatMessage(conversation_id=conv.id, role="assistant", content="Hi there")
     m3 = ChatMessage(conversation_id=conv.id, role="tool_result", content="")
-    await _seed(client, m1, m2, m3)
+    await seed(m1, m2, m3)
 
     resp = await client.get("/api/v1/chat/conversations")
     assert resp.status_code == 200
-    data = resp.json()
+    data = resp.json()["conversations"]
     assert len(data) == 1
     assert data[0]["id"] == conv.id
     assert data[0]["title"] == "Test conv"
     assert data[0]["message_count"] == 3  # all messages count
 
 
-async def test_list_conversations_excludes_inactive(client):
+async def test_list_conversations_excludes_inactive(client, seed):
     """Inactive conversations are not listed."""
     active = ChatConversation(title="Active")
     inactive = ChatConversation(title="Inactive", is_active=False)
-    await _seed(client, active, inactive)
+    await seed(active, inactive)
 
     resp = await client.get("/api/v1/chat/conversations")
     assert resp.status_code == 200
-    data = resp.json()
+    data = resp.json()["conversations"]
     assert len(data) == 1
     assert data[0]["title"] == "Active"
 
@@ -80,10 +64,10 @@ async def test_list_conversations_excludes_inactive(client):
 # GET /api/v1/chat/conversations/{id}
 # ---------------------------------------------------------------------------
 
-async def test_get_conversation_messages(client):
+async def test_get_conversation_messages(client, seed):
     """Returns messages filtering user and assistant roles only."""
     conv = ChatConversation(title="Detail test")
-    await _seed(client, conv)
+    await seed(conv)
 
     msgs = [
         ChatMessage(conversation_id=conv.id, role="user", content="Hi"),
@@ -91,7 +75,7 @@ async def test_get_conversation_messages(client):
         ChatMessage(conversation_id=conv.id, role="tool_result", content="{}"),
         ChatMessage(conversation_id=conv.id, role="user", content="Generate audio"),
     ]
-    await _seed(client, *msgs)
+    await seed(*msgs)
 
     resp = await client.get(f"/api/v1/chat/conversations/{conv.id}")
     assert resp.status_code == 200
@@ -110,17 +94,17 @@ async def test_get_conversation_not_found(client):
     assert resp.status_code == 404
 
 
-async def test_get_conversation_audio_url(client):
+async def test_get_conversation_audio_url(client, seed):
     """Messages with audio_id have audio_url resolved."""
     audio = make_audio_message(filename="chat_audio.mp3")
     conv = ChatConversation(title="Audio test")
-    await _seed(client, audio, conv)
+    await seed(audio, conv)
 
     msg = ChatMessage(
         conversation_id=conv.id, role="assistant",
         content="Here is your audio", audio_id=audio.id,
     )
-    await _seed(client, msg)
+    await seed(msg)
 
     resp = await client.get(f"/api/v1/chat/conversations/{conv.id}")
     assert resp.status_code == 200
@@ -130,13 +114,13 @@ async def test_get_conversation_audio_url(client):
     assert messages[0]["audio_id"] == audio.id
 
 
-async def test_get_conversation_no_audio_url_when_no_audio(client):
+async def test_get_conversation_no_audio_url_when_no_audio(client, seed):
     """Messages without audio_id have audio_url=None."""
     conv = ChatConversation(title="No audio")
-    await _seed(client, conv)
+    await seed(conv)
 
     msg = ChatMessage(conversation_id=conv.id, role="assistant", content="Just text")
-    await _seed(client, msg)
+    await seed(msg)
 
     resp = await client.get(f"/api/v1/chat/conversations/{conv.id}")
     messages = resp.json()["messages"]
@@ -148,10 +132,10 @@ async def test_get_conversation_no_audio_url_when_no_audio(client):
 # DELETE /api/v1/chat/conversations/{id}
 # ---------------------------------------------------------------------------
 
-async def test_delete_conversation_soft_delete(client):
+async def test_delete_conversation_soft_delete(client, seed):
     """DELETE sets is_active=False but record stays in DB."""
     conv = ChatConversation(title="To delete")
-    await _seed(client, conv)
+    await seed(conv)
 
     resp = await client.delete(f"/api/v1/chat/conversations/{conv.id}")
     assert resp.status_code == 200
@@ -160,7 +144,7 @@ async def test_delete_conversation_soft_delete(client):
 
     # Verify it's soft-deleted (not in list)
     list_resp = await client.get("/api/v1/chat/conversations")
-    assert len(list_resp.json()) == 0
+    assert len(list_resp.json()["conversations"]) == 0
 
     # But still in DB (via direct query)
     factory = client._test_session_factory
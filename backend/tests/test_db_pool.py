@@ -0,0 +1,73 @@
+"""
+Tests for database pool configuration and metrics.
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.pool import PoolMetrics, database_url, engine_options, pool_settings
+
+
+def test_pool_settings_preset_with_overrides(monkeypatch):
+    monkeypatch.setattr(settings, "APP_ENV", "production")
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+    options = pool_settings()
+    assert options["pool_size"] == 3
+    assert options["max_overflow"] == 10
+    assert options["pool_recycle"] == 1800
+
+
+def test_queue_pool_options_only_for_queue_pools():
+    postgres = engine_options("postgresql+asyncpg://user:pass@db/mediaflow", PoolMetrics())
+    assert "pool_size" in postgres and "pool_timeout" in postgres
+
+    sqlite = engine_options("sqlite+aiosqlite:///:memory:", PoolMetrics())
+    assert "pool_size" not in sqlite
+    assert sqlite["poolclass"].__name__.startswith("Instrumented")
+
+
+def test_statement_cache_size_added_to_asyncpg_url(monkeypatch):
+    monkeypatch.setattr(settings, "DB_STATEMENT_CACHE_SIZE", 0)
+    url = database_url("postgresql+asyncpg://user:pass@db/mediaflow")
+    assert "prepared_statement_cache_size=0" in url
+    assert database_url("sqlite+aiosqlite:///./mediaflow.db") == "sqlite+aiosqlite:///./mediaflow.db"
+
+
+def test_statement_cache_off_disables_asyncpg_cache(monkeypatch):
+    monkeypatch.setattr(settings, "DB_STATEMENT_CACHE_SIZE", 0)
+    connect_args = engine_options("postgresql+asyncpg://user:pass@db/mediaflow", PoolMetrics())["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+    assert "connect_args" not in engine_options("sqlite+aiosqlite:///:memory:", PoolMetrics())
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_checkouts_and_long_held(monkeypatch):
+    monkeypatch.setattr(settings, "DB_LONG_HELD_SECONDS", 0.0)
+    metrics = PoolMetrics()
+    url = "sqlite+aiosqlite:///:memory:"
+    engine = create_async_engine(url, **engine_options(url, metrics))
+    metrics.attach(engine)
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert metrics.stats()["checked_out"] == 1
+
+        stats = metrics.stats()
+        assert stats["checked_out"] == 0
+        assert stats["checkouts"] >= 1
+        assert sum(stats["wait_seconds"]["histogram"].values()) == stats["checkouts"]
+        assert stats["held_seconds"]["long_held_total"] >= 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_health_db_endpoint(client):
+    response = await client.get("/health/db")
+    assert response.status_code == 200
+    assert {"checked_out", "wait_seconds", "held_seconds"} <= response.json().keys()
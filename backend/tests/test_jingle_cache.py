@@ -0,0 +1,70 @@
+"""
+Tests for the jingle mix cache and its disk LRU.
+"""
+import os
+
+from app.services.audio.jingle import JingleConfig
+from app.services.audio.jingle_cache import jingle_mix_cache
+from app.services.storage.disk_cache import DiskCache
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache("test", max_entries=2, base_path=str(tmp_path))
+
+    first = cache.store_bytes("aa01", b"1")
+    cache.store_bytes("bb02", b"2")
+    assert cache.lookup("aa01") == first      # aa01 is now most recent
+    cache.store_bytes("cc03", b"3")           # evicts bb02
+
+    assert cache.lookup("bb02") is None
+    assert not os.path.exists(cache.path_for("bb02"))
+    assert cache.lookup("aa01") and cache.lookup("cc03")
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["misses"] == 1
+
+
+def test_disk_cache_adopts_files_from_other_workers(tmp_path):
+    producer = DiskCache("test", max_entries=10, base_path=str(tmp_path))
+    consumer = DiskCache("test", max_entries=10, base_path=str(tmp_path))
+
+    path = producer.store_bytes("dd04", b"mix")
+
+    assert consumer.lookup("dd04") == path
+    assert consumer.stats()["entries"] == 1
+
+
+def test_disk_cache_evicts_files_from_earlier_runs(tmp_path):
+    earlier = DiskCache("test", max_entries=10, base_path=str(tmp_path))
+    for age, key in enumerate(("aa01", "bb02", "cc03"), start=1):
+        os.utime(earlier.store_bytes(key, b"old"), (age, age))
+
+    cache = DiskCache("test", max_entries=2, base_path=str(tmp_path))
+    cache.store_bytes("dd04", b"new")
+
+    assert not os.path.exists(cache.path_for("aa01"))
+    assert not os.path.exists(cache.path_for("bb02"))
+    assert cache.lookup("cc03") and cache.lookup("dd04")
+    assert cache.stats()["evictions"] == 2
+
+
+def test_mix_key_tracks_voice_music_and_config(tmp_path):
+    voice = tmp_path / "voice.mp3"
+    voice.write_bytes(b"take-1")
+    music = tmp_path / "Cool.mp3"
+    music.write_bytes(b"music")
+
+    key = jingle_mix_cache.key_for(str(voice), str(music), JingleConfig())
+
+    assert key == jingle_mix_cache.key_for(str(voice), str(music), JingleConfig())
+    assert key != jingle_mix_cache.key_for(str(voice), str(music), JingleConfig(duck_level=0.5))
+    assert key != jingle_mix_cache.key_for(str(voice), str(music), JingleConfig(), bitrate="64k")
+
+    music.write_bytes(b"replaced music")
+    assert key != jingle_mix_cache.key_for(str(voice), str(music), JingleConfig())
+
+    music_key = jingle_mix_cache.key_for(str(voice), str(music), JingleConfig())
+    voice.write_bytes(b"take-2")
+    assert music_key != jingle_mix_cache.key_for(str(voice), str(music), JingleConfig())
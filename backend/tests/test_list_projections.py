@@ -0,0 +1,41 @@
+"""
+Tests for column-projected list queries.
+"""
+from datetime import datetime
+
+import pytest
+
+from app.models import Schedule
+from tests.conftest import make_audio_message, make_voice
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_library_list_skips_heavy_columns(client, seed, record_selects):
+    await seed(make_voice(), make_audio_message(
+        is_favorite=True, voice_settings_snapshot='{"speed": 1.0}',
+    ))
+
+    with record_selects() as statements:
+        response = await client.get("/api/v1/library")
+
+    assert response.status_code == 200
+    assert response.json()["messages"][0]["filename"] == "test_audio.mp3"
+    assert statements
+    assert not any("voice_settings_snapshot" in sql or "renditions" in sql for sql in statements)
+
+
+async def test_schedule_list_projects_audio_name(client, seed, record_selects):
+    audio = make_audio_message(display_name="Oferta", is_favorite=True)
+    await seed(make_voice(), audio)
+    await seed(Schedule(
+        audio_message_id=audio.id, schedule_type="interval",
+        start_date=datetime(2026, 1, 1), interval_minutes=30, active=True,
+    ))
+
+    with record_selects() as statements:
+        response = await client.get("/api/v1/schedules")
+
+    schedule = response.json()["data"][0]
+    assert schedule["audio_message"] == {"display_name": "Oferta", "filename": "test_audio.mp3"}
+    assert not any("original_text" in sql for sql in statements)
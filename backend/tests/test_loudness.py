@@ -0,0 +1,41 @@
+"""
+Tests for loudnorm report parsing and normalization gain.
+"""
+from app.services.audio.loudness import (
+    MAX_TRUE_PEAK_DBTP, normalization_gain_db, parse_loudnorm_output,
+)
+
+LOUDNORM_REPORT = """
+[Parsed_loudnorm_0 @ 0x55d5c8a2c7c0]
+{
+	"input_i" : "-23.41",
+	"input_tp" : "-4.20",
+	"input_lra" : "5.30",
+	"input_thresh" : "-33.76",
+	"output_i" : "-16.02",
+	"target_offset" : "0.02"
+}
+"""
+
+
+def test_parse_loudnorm_report():
+    measurement = parse_loudnorm_output("size=N/A time=00:00:12.00" + LOUDNORM_REPORT)
+
+    assert measurement.integrated_lufs == -23.41
+    assert measurement.true_peak_dbtp == -4.2
+    assert measurement.loudness_range == 5.3
+
+
+def test_parse_rejects_silence_and_garbage():
+    silent = LOUDNORM_REPORT.replace('"-23.41"', '"-inf"')
+
+    assert parse_loudnorm_output(silent) is None
+    assert parse_loudnorm_output("Invalid data found when processing input") is None
+
+
+def test_gain_reaches_target_unless_peak_would_clip():
+    assert normalization_gain_db(-23.0, -10.0, target_lufs=-16.0) == 7.0
+    # Only 3 dB of headroom below the true-peak ceiling
+    assert normalization_gain_db(-23.0, -4.0, target_lufs=-16.0) == MAX_TRUE_PEAK_DBTP + 4.0
+    assert normalization_gain_db(-10.0, -0.5, target_lufs=-16.0) == -6.0
+    assert normalization_gain_db(None) == 0.0
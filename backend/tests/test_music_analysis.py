@@ -0,0 +1,53 @@
+"""
+Tests for music track analysis and analyzed loop segments in the mix graph.
+"""
+import numpy as np
+import pytest
+
+from app.services.audio.jingle import jingle_service, JingleConfig
+from app.services.audio.music_analysis import (
+    ANALYSIS_SAMPLE_RATE, MIN_LOOP_SECONDS, PEAK_BUCKETS, analyze_pcm,
+)
+
+
+def _bed(silence_before: float, seconds: float, silence_after: float):
+    rate = ANALYSIS_SAMPLE_RATE
+    t = np.arange(int(seconds * rate)) / rate
+    # 2 s "bars": the level pattern repeats, so any multiple is a clean loop
+    tone = np.sin(2 * np.pi * 220 * t) * (0.6 + 0.3 * np.sin(2 * np.pi * t / 2.0)) * 16000
+    return np.concatenate([
+        np.zeros(int(silence_before * rate)),
+        tone,
+        np.zeros(int(silence_after * rate)),
+    ]).astype(np.int16)
+
+
+def test_analysis_finds_silence_and_loop_segment():
+    analysis = analyze_pcm(_bed(2.0, 30.0, 1.5))
+
+    assert analysis.leading_silence == pytest.approx(2.0, abs=0.05)
+    assert analysis.trailing_silence == pytest.approx(1.5, abs=0.05)
+    assert analysis.loop_start == pytest.approx(2.0, abs=0.05)
+    assert analysis.loop_end - analysis.loop_start >= MIN_LOOP_SECONDS
+    assert analysis.loop_end <= 32.0
+    assert len(analysis.peaks) == PEAK_BUCKETS
+    assert max(analysis.peaks) == pytest.approx(0.44, abs=0.02)
+
+
+def test_silent_track_has_no_loop():
+    analysis = analyze_pcm(np.zeros(ANALYSIS_SAMPLE_RATE * 3, dtype=np.int16))
+
+    assert analysis.loop_start is None
+    assert analysis.leading_silence == pytest.approx(3.0)
+
+
+def test_analyzed_segment_replaces_whole_file_loop():
+    cmd = jingle_service._build_simple_mix_command(
+        "music.mp3", "voice.mp3", "out.mp3", JingleConfig(), 20.0, 15.5,
+        segment=(1.5, 9.5)
+    )
+
+    filter_complex = cmd[cmd.index('-filter_complex') + 1]
+    assert cmd[:7] == ['ffmpeg', '-y', '-ss', '1.500', '-t', '8.000', '-i']
+    assert "aloop=loop=-1:size=352800," in filter_complex
+    assert "2e+09" not in filter_complex
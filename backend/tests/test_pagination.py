@@ -0,0 +1,104 @@
+"""
+Tests for keyset (cursor) pagination.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.db.pagination import InvalidCursor, decode_cursor, encode_cursor
+from app.models import AudioMessage
+from app.models.chat import ChatConversation
+from tests.conftest import make_audio_message, make_category, make_voice
+
+pytestmark = pytest.mark.asyncio
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0)
+
+
+async def _seed_library(client, count: int = 7):
+    audios = [
+        make_audio_message(
+            filename=f"lib_{i}.mp3",
+            is_favorite=True,
+            category_id="cat_1",
+            # Pairs share a timestamp so the id tiebreak matters
+            created_at=BASE_TIME - timedelta(minutes=i // 2),
+            duration=None if i % 3 == 0 else float(i),
+        )
+        for i in range(count)
+    ]
+    async with client._test_session_factory() as session:
+        session.add_all([make_voice(), make_category(id="cat_1"), *audios])
+        await session.commit()
+
+
+async def _walk(client, url: str, params: dict, key: str = "messages"):
+    ids, cursor = [], None
+    while True:
+        response = await client.get(url, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        body = response.json()
+        ids += [item["id"] for item in body[key]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            return ids
+
+
+async def test_cursor_roundtrip():
+    cursor = encode_cursor(AudioMessage.created_at, True, BASE_TIME, 42)
+    assert decode_cursor(cursor, AudioMessage.created_at, True) == (BASE_TIME, 42)
+
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, AudioMessage.created_at, False)
+    with pytest.raises(InvalidCursor):
+        decode_cursor("not-a-cursor", AudioMessage.created_at, True)
+
+
+@pytest.mark.parametrize("sort_by,sort_order", [
+    ("created_at", "desc"),
+    ("created_at", "asc"),
+    ("duration", "asc"),  # nullable: NULLs come last
+])
+async def test_library_cursor_pages_match_single_page(client, sort_by, sort_order):
+    await _seed_library(client)
+    params = {"sort_by": sort_by, "sort_order": sort_order}
+
+    everything = await client.get("/api/v1/library", params={**params, "per_page": 100})
+    expected = [message["id"] for message in everything.json()["messages"]]
+
+    assert len(expected) == 7
+    assert await _walk(client, "/api/v1/library", {**params, "per_page": 2, "count": "none"}) == expected
+
+
+async def test_library_page_numbers_still_supported(client):
+    await _seed_library(client)
+
+    response = await client.get("/api/v1/library", params={"page": 2, "per_page": 3})
+    body = response.json()
+
+    assert body["total"] == 7
+    assert body["total_pages"] == 3
+    assert len(body["messages"]) == 3
+    assert body["next_cursor"]
+
+
+async def test_campaign_audios_cursor(client):
+    await _seed_library(client)
+
+    ids = await _walk(client, "/api/v1/campaigns/cat_1/audios", {"limit": 3}, key="audios")
+    assert len(ids) == len(set(ids)) == 7
+
+
+async def test_chat_conversations_cursor_in_body(client, seed):
+    await seed(*[
+        ChatConversation(title=f"conv {i}", updated_at=BASE_TIME - timedelta(minutes=i))
+        for i in range(5)
+    ])
+
+    ids = await _walk(client, "/api/v1/chat/conversations", {"limit": 2}, key="conversations")
+    assert len(ids) == len(set(ids)) == 5
+
+
+async def test_invalid_cursor_is_rejected(client):
+    response = await client.get("/api/v1/library", params={"cursor": "bogus"})
+    assert response.status_code == 400
@@ -0,0 +1,94 @@
+"""
+Tests for the NumPy jingle backend, including parity with the FFmpeg graph.
+"""
+import shutil
+import wave
+
+import numpy as np
+import pytest
+
+from app.services.audio.jingle import jingle_service, JingleConfig
+from app.services.audio.pcm_mixer import (
+    SAMPLE_RATE, decode_pcm, ducking_gain, follow_envelope, mix_jingle,
+)
+
+
+def _tone(seconds: float, freq: float, amplitude: int, channels: int = 2):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    mono = (np.sin(2 * np.pi * freq * t) * amplitude).astype(np.int16)
+    return np.stack([mono] * channels, axis=1)
+
+
+def _write_wav(path, pcm):
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(pcm.shape[1])
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(pcm.astype("<i2").tobytes())
+
+
+def test_ducking_gain_is_unity_in_silence_and_ducks_under_voice():
+    sidechain = np.zeros((SAMPLE_RATE * 2, 2), dtype=np.float32)
+    sidechain[SAMPLE_RATE:] = 0.5
+
+    gain = ducking_gain(sidechain, threshold=0.05)
+
+    assert np.allclose(gain[:SAMPLE_RATE - 64], 1.0)
+    assert gain[-1] < 0.5
+
+
+def test_vectorized_follower_matches_step_by_step():
+    values = np.random.default_rng(0).random(5000) ** 4
+    values[:1000] = 0.0
+    attack, release = 0.44, 0.014
+
+    expected, level = [], 0.0
+    for value in values:
+        level += (value - level) * (attack if value > level else release)
+        expected.append(level)
+
+    assert np.allclose(follow_envelope(values, attack, release), expected, rtol=1e-9, atol=0)
+
+
+def test_mix_layout_follows_jingle_timings():
+    config = JingleConfig(intro_silence=2.0, outro_silence=1.0, fade_in=0.5, fade_out=1.0)
+    music = _tone(1.0, 220, 3000)      # shorter than the jingle: must loop
+    voice = _tone(2.0, 440, 8000)
+
+    out = mix_jingle(music, voice, config, total_duration=5.0, fade_out_start=4.0)
+
+    assert out.shape == (5 * SAMPLE_RATE, 2)
+    assert abs(out[0]).max() < 1e-3                        # fade in starts silent
+    assert abs(out[-1]).max() < 1e-3                       # fade out ends silent
+    assert abs(out[int(1.2 * SAMPLE_RATE):int(1.4 * SAMPLE_RATE)]).max() > 0.05  # looped bed
+
+
+@pytest.mark.skipif(not shutil.which("ffmpeg"), reason="ffmpeg not installed")
+def test_parity_with_ffmpeg_graph(tmp_path):
+    import subprocess
+
+    config = JingleConfig(intro_silence=2.0, outro_silence=2.0)
+    music_path, voice_path = tmp_path / "music.wav", tmp_path / "voice.wav"
+    _write_wav(music_path, _tone(10.0, 220, 3000))
+    _write_wav(voice_path, _tone(3.0, 440, 6000, channels=1))
+    total, fade_out_start = 7.0, 5.0
+
+    reference_path = tmp_path / "ffmpeg.wav"
+    cmd = jingle_service._build_ducking_command(
+        str(music_path), str(voice_path), str(reference_path),
+        config, 3.0, total, fade_out_start
+    )
+    codec = cmd.index('-codec:a')
+    cmd[codec:codec + 4] = ['-codec:a', 'pcm_s16le']
+    subprocess.run(cmd, check=True, capture_output=True)
+
+    reference = decode_pcm(str(reference_path)).astype(np.float32) / 32768.0
+    mixed = mix_jingle(
+        decode_pcm(str(music_path)), decode_pcm(str(voice_path)),
+        config, total, fade_out_start
+    )
+
+    n = min(len(reference), len(mixed))
+    error = np.sqrt(np.mean((reference[:n] - mixed[:n]) ** 2))
+    level = np.sqrt(np.mean(reference[:n] ** 2))
+    assert error / level < 0.1     # within -20 dB of the FFmpeg render
@@ -0,0 +1,56 @@
+"""
+Tests for the Aho-Corasick pronunciation lexicon matcher.
+"""
+import re
+
+from app.services.text import text_normalizer
+from app.services.text.lexicon import LexiconMatcher, LexiconTerm
+
+
+def _matcher(*pairs, **kwargs):
+    return LexiconMatcher(LexiconTerm(term, replacement, **kwargs) for term, replacement in pairs)
+
+
+def test_rewrites_whole_words_case_insensitively():
+    matcher = _matcher(("Kia", "Kía"), ("Hyundai", "Hiúndai"))
+    assert matcher.rewrite("Un KIA, un hyundai y un kiosko") == "Un Kía, un Hiúndai y un kiosko"
+
+
+def test_prefers_longest_match_at_same_start():
+    matcher = _matcher(("Mercedes", "Mérsedes"), ("Mercedes Benz", "Mérsedes Bens"))
+    assert matcher.rewrite("Mercedes Benz y Mercedes") == "Mérsedes Bens y Mérsedes"
+
+
+def test_overlapping_suffix_terms():
+    matcher = _matcher(("he", "1"), ("she", "2"), ("hers", "3"))
+    assert matcher.rewrite("she hers he ushers") == "2 3 1 ushers"
+
+
+def test_case_sensitive_entry():
+    matcher = LexiconMatcher([LexiconTerm("AFP", "a efe pe", case_sensitive=True)])
+    assert matcher.rewrite("AFP y afp") == "a efe pe y afp"
+
+
+def test_later_entry_overrides_same_term():
+    # Voice entries are inserted after global ones
+    matcher = _matcher(("Kia", "Kía"), ("kia", "Kiá"))
+    assert len(matcher) == 1
+    assert matcher.rewrite("Kia") == "Kiá"
+
+
+def test_matches_regex_alternation_on_many_terms():
+    terms = [f"marca{i}" for i in range(2000)]
+    matcher = _matcher(*((term, "X") for term in terms))
+    text = " ".join(f"marca{i} otra{i}" for i in range(0, 4000, 7))
+    pattern = re.compile(r"\b(" + "|".join(sorted(terms, key=len, reverse=True)) + r")\b")
+    assert matcher.rewrite(text) == pattern.sub("X", text)
+
+
+def test_vehicle_brand_comes_from_the_lexicon():
+    result = text_normalizer.normalize_vehicle_announcement(
+        "Hyundai", "rojo", "BBCL-45", lexicon=_matcher(("Hyundai", "Hiúndai")),
+    )
+
+    assert result["tts_variables"]["marca"] == "Hiúndai"
+    assert "Hiúndai" in result["normalized"]
+    assert "Hyundai" in result["original"]
@@ -0,0 +1,172 @@
+"""
+Query-plan regression tests for the hot queries.
+
+Seeds realistic volumes, runs ANALYZE and checks with EXPLAIN QUERY PLAN
+that the worker, library, cleanup and chat history queries are served by
+their indexes instead of scanning the table. The statements come from the
+builders in app.db.queries, the same ones production executes.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Select, insert, select
+
+from app.api.v1.serializers import AUDIO_LIST_COLUMNS
+from app.db.pagination import keyset_filter, keyset_order
+from app.db.queries import (
+    conversation_messages_query,
+    due_schedule_query,
+    library_messages_query,
+    oldest_temporary_messages_query,
+    temporary_messages_count_query,
+)
+from app.models import AudioMessage, ChatConversation, ChatMessage, Schedule
+from app.models.schedule import ScheduleLog
+from tests.conftest import make_category, make_voice
+
+pytestmark = pytest.mark.asyncio
+
+NOW = datetime(2026, 1, 1, 12, 0)
+AUDIO_ROWS = 3000
+SCHEDULE_ROWS = 300
+CONVERSATIONS = 50
+MESSAGES_PER_CONVERSATION = 40
+CATEGORIES = 8
+
+
+@pytest_asyncio.fixture
+async def seeded(db_session):
+    db_session.add(make_voice())
+    db_session.add_all(
+        make_category(id=f"cat_{i}", name=f"Cat {i}", order=i) for i in range(CATEGORIES)
+    )
+    await db_session.flush()
+
+    await db_session.execute(insert(AudioMessage), [
+        {
+            "filename": f"audio_{i}.mp3",
+            "display_name": f"Audio {i}",
+            "file_path": f"/tmp/audio_{i}.mp3",
+            "original_text": "Texto de prueba",
+            "voice_id": "test_voice",
+            "category_id": f"cat_{i % CATEGORIES}" if i % 4 else None,
+            "is_favorite": i % 10 != 0,
+            "status": "deleted" if i % 50 == 0 else "ready",
+            "created_at": NOW - timedelta(minutes=i),
+            "updated_at": NOW - timedelta(minutes=i),
+        }
+        for i in range(AUDIO_ROWS)
+    ])
+    await db_session.execute(insert(Schedule), [
+        {
+            "schedule_type": "interval",
+            "start_date": NOW,
+            "interval_minutes": 60,
+            "active": i % 3 == 0,
+            "next_execution_at": NOW + timedelta(minutes=i - 10),
+            "priority": i % 5 + 1,
+        }
+        for i in range(SCHEDULE_ROWS)
+    ])
+    await db_session.execute(insert(ScheduleLog), [
+        {"schedule_id": i % SCHEDULE_ROWS + 1, "success": True, "executed_at": NOW + timedelta(seconds=i)}
+        for i in range(AUDIO_ROWS)
+    ])
+    await db_session.execute(insert(ChatConversation), [
+        {"title": f"Chat {i}"} for i in range(CONVERSATIONS)
+    ])
+    await db_session.execute(insert(ChatMessage), [
+        {
+            "conversation_id": i % CONVERSATIONS + 1,
+            "role": "user",
+            "content": "hola",
+            "created_at": NOW + timedelta(seconds=i),
+            "updated_at": NOW + timedelta(seconds=i),
+        }
+        for i in range(CONVERSATIONS * MESSAGES_PER_CONVERSATION)
+    ])
+    await db_session.flush()
+
+    conn = await db_session.connection()
+    await conn.exec_driver_sql("ANALYZE")
+    return db_session
+
+
+async def explain(session, query: Select) -> str:
+    """SQLite query plan of a statement, one step per line"""
+    conn = await session.connection()
+    compiled = query.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+    return "\n".join(row[-1] for row in result.all())
+
+
+def assert_uses_index(plan: str, table: str, index: str):
+    assert f"{table} USING INDEX {index}" in plan or f"{table} USING COVERING INDEX {index}" in plan, plan
+    assert f"SCAN {table}\n" not in f"{plan}\n", plan
+
+
+async def test_worker_due_schedule_uses_index(seeded):
+    query = due_schedule_query(NOW)
+    assert_uses_index(await explain(seeded, query), "schedules", "ix_schedules_active_next")
+
+
+async def test_library_listing_uses_index(seeded):
+    query = (
+        library_messages_query(*AUDIO_LIST_COLUMNS)
+        .order_by(*keyset_order(AudioMessage.created_at, AudioMessage.id, True))
+        .limit(21)
+    )
+    plan = await explain(seeded, query)
+    assert_uses_index(plan, "audio_messages", "ix_audio_messages_favorite_created")
+    assert "TEMP B-TREE" not in plan, plan
+
+    # Later pages seek into the index from the cursor instead of skipping rows
+    after_cursor = query.filter(
+        keyset_filter(AudioMessage.created_at, AudioMessage.id, True, NOW - timedelta(days=1), 1500)
+    )
+    plan = await explain(seeded, after_cursor)
+    assert "ix_audio_messages_favorite_created (is_favorite=? AND created_at<?)" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+
+async def test_library_category_filter_uses_index(seeded):
+    query = (
+        library_messages_query(*AUDIO_LIST_COLUMNS, category_id="cat_1")
+        .order_by(*keyset_order(AudioMessage.created_at, AudioMessage.id, True))
+        .limit(21)
+    )
+    assert_uses_index(await explain(seeded, query), "audio_messages", "ix_audio_messages_category_created")
+
+
+async def test_cleanup_oldest_temporary_uses_index(seeded):
+    query = oldest_temporary_messages_query(10, keep_ids={1, 2, 3})
+    plan = await explain(seeded, query)
+    assert_uses_index(plan, "audio_messages", "ix_audio_messages_favorite_created")
+    assert "TEMP B-TREE" not in plan, plan
+
+    assert_uses_index(await explain(seeded, temporary_messages_count_query()), "audio_messages", "ix_audio_messages_favorite_created")
+
+
+async def test_recent_messages_use_index(seeded):
+    query = select(AudioMessage).order_by(AudioMessage.created_at.desc()).limit(10)
+    plan = await explain(seeded, query)
+    assert "ix_audio_messages_created_at" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+
+async def test_chat_history_uses_index(seeded):
+    query = conversation_messages_query(7)
+    plan = await explain(seeded, query)
+    assert_uses_index(plan, "chat_messages", "ix_chat_messages_conversation_created")
+    assert "TEMP B-TREE" not in plan, plan
+
+
+async def test_schedule_logs_use_index(seeded):
+    query = (
+        select(ScheduleLog.id)
+        .filter(ScheduleLog.schedule_id == 3)
+        .order_by(ScheduleLog.executed_at.desc())
+    )
+    assert_uses_index(await explain(seeded, query), "schedule_logs", "ix_schedule_logs_schedule_executed")
@@ -0,0 +1,33 @@
+"""
+Tests for the read-only session dependency.
+"""
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.session import ReadOnlySession
+from tests.conftest import make_audio_message, make_voice
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_read_only_session_rejects_writes(db_engine):
+    factory = async_sessionmaker(db_engine, class_=AsyncSession, sync_session_class=ReadOnlySession)
+    async with factory() as session:
+        session.add(make_voice())
+        with pytest.raises(InvalidRequestError):
+            await session.flush()
+
+
+async def test_read_endpoints_use_read_session(client):
+    async with client._test_session_factory() as session:
+        session.add_all([make_voice(), make_audio_message(is_favorite=True)])
+        await session.commit()
+
+    voices = await client.get("/api/v1/audio/voices")
+    library = await client.get("/api/v1/library")
+
+    assert voices.status_code == 200
+    assert [voice["id"] for voice in voices.json()] == ["test_voice"]
+    assert library.status_code == 200
+    assert library.json()["total"] == 1
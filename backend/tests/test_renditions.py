@@ -0,0 +1,34 @@
+"""
+Tests for single-pass rendition command building.
+"""
+from app.services.audio.jingle import jingle_service, JingleConfig
+from app.services.audio.renditions import audio_renditions, RENDITION_PROFILES
+
+
+def test_rendition_filenames_derive_from_primary():
+    opus = RENDITION_PROFILES["opus"]
+    web = RENDITION_PROFILES["web"]
+
+    assert audio_renditions.rendition_filename("tts_1_abc_juan.mp3", opus) == "tts_1_abc_juan.opus.ogg"
+    assert audio_renditions.rendition_filename("tts_1_abc_juan.mp3", web) == "tts_1_abc_juan.web.mp3"
+
+
+def test_jingle_graph_splits_into_rendition_outputs():
+    targets = [
+        (RENDITION_PROFILES["opus"], "/out/a.opus.ogg"),
+        (RENDITION_PROFILES["web"], "/out/a.web.mp3"),
+    ]
+    cmd = jingle_service._build_simple_mix_command(
+        "music.mp3", "voice.mp3", "/out/a.mp3", JingleConfig(), 20.0, 15.5
+    )
+
+    cmd = jingle_service._add_rendition_outputs(cmd, targets, 20.0)
+
+    filter_complex = cmd[cmd.index('-filter_complex') + 1]
+    assert filter_complex.endswith(";[out]asplit=3[main][r0][r1]")
+    assert '[out]' not in cmd
+    # Two inputs only: the mix is decoded once for all outputs
+    assert cmd.count('-i') == 2
+    assert cmd.index('/out/a.mp3') < cmd.index('[r0]') < cmd.index('/out/a.opus.ogg')
+    assert cmd[cmd.index('/out/a.opus.ogg') - 1] == "128k"
+    assert cmd[-1] == "/out/a.web.mp3"
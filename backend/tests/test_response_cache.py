@@ -0,0 +1,82 @@
+"""
+Tests for the write-invalidated response cache (app.core.response_cache).
+"""
+import pytest
+
+from app.core.config import settings
+from app.core.response_cache import response_cache
+from tests.conftest import make_voice
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(autouse=True)
+def enable_response_cache(monkeypatch):
+    """The test process is a single worker, so the memory backend is safe"""
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+
+
+async def test_voices_are_cached_and_revalidated(client, seed):
+    await seed(make_voice())
+
+    first = await client.get("/api/v1/audio/voices")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert [voice["id"] for voice in first.json()] == ["test_voice"]
+
+    # Rows added behind the API's back stay invisible until a write invalidates
+    await seed(make_voice(id="other_voice", name="Other"))
+    again = await client.get("/api/v1/audio/voices")
+    assert again.content == first.content
+
+    not_modified = await client.get("/api/v1/audio/voices", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert response_cache.stats()["misses"] == 1
+
+
+async def test_settings_write_invalidates(client, seed):
+    await seed(make_voice())
+    etag = (await client.get("/api/v1/audio/voices")).headers["etag"]
+
+    updated = await client.patch("/api/v1/settings/voices/test_voice", json={"name": "Renamed"})
+    assert updated.status_code == 200
+
+    response = await client.get("/api/v1/audio/voices", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()[0]["name"] == "Renamed"
+
+
+async def test_query_string_is_part_of_the_key(client):
+    all_templates = await client.get("/api/v1/settings/templates")
+    filtered = await client.get("/api/v1/settings/templates", params={"include_inactive": "false"})
+
+    await client.get("/api/v1/settings/templates")
+    await client.get("/api/v1/settings/templates", params={"include_inactive": "false"})
+
+    assert all_templates.status_code == filtered.status_code == 200
+    assert response_cache.stats()["misses"] == 2
+    assert response_cache.stats()["hits"] == 2
+
+
+async def test_new_release_does_not_serve_old_bodies(client, seed, monkeypatch):
+    await seed(make_voice())
+    first = await client.get("/api/v1/audio/voices")
+
+    await seed(make_voice(id="other_voice", name="Other"))
+    monkeypatch.setattr(settings, "APP_VERSION", "99.0.0")
+    after_deploy = await client.get("/api/v1/audio/voices")
+
+    assert len(after_deploy.json()) == 2
+    assert after_deploy.headers["etag"] != first.headers["etag"]
+
+
+async def test_memory_backend_is_not_used_by_default(client, monkeypatch):
+    # Other workers would never see this worker's invalidations
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", None)
+
+    response = await client.get("/api/v1/audio/voices")
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
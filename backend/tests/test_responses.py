@@ -0,0 +1,38 @@
+"""
+Tests for the orjson response class.
+"""
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from app.core.responses import FastJSONResponse
+
+
+class Item(BaseModel):
+    name: str
+    created_at: datetime
+
+
+def test_datetimes_render_like_isoformat():
+    moment = datetime(2026, 1, 1, 12, 30, 15, 250000)
+    body = json.loads(FastJSONResponse({"at": moment, "none": None}).body)
+
+    assert body == {"at": moment.isoformat(), "none": None}
+
+
+def test_models_and_fallback_types():
+    moment = datetime(2026, 1, 1, 12, 0)
+    response = FastJSONResponse({
+        "item": Item(name="Oferta", created_at=moment),
+        "price": Decimal("1.5"),
+        "tags": {"a"},
+    })
+
+    assert json.loads(response.body) == {
+        "item": {"name": "Oferta", "created_at": moment.isoformat()},
+        "price": 1.5,
+        "tags": ["a"],
+    }
+    assert json.loads(FastJSONResponse(Item(name="x", created_at=moment)).body)["name"] == "x"
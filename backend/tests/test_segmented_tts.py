@@ -0,0 +1,38 @@
+"""
+Tests for template splitting used by segmented TTS.
+"""
+from app.services.text.normalizer import VEHICLE_TEMPLATES
+from app.services.tts.segmented import TemplateSegment, split_template
+
+
+def test_vehicle_template_alternates_static_and_dynamic():
+    segments = split_template(
+        VEHICLE_TEMPLATES["formal"],
+        {"marca": "Toyota", "color": "rojo", "patente": "B. B. C. L. cuarenta y cinco"},
+    )
+
+    assert segments == [
+        TemplateSegment("Estimados usuarios. Se solicita al propietario del vehiculo", True),
+        TemplateSegment("Toyota, color rojo, patente B. B. C. L. cuarenta y cinco,", False),
+        TemplateSegment("que por favor retire su vehiculo del area.", True),
+    ]
+
+
+def test_static_parts_do_not_depend_on_values():
+    first = split_template(VEHICLE_TEMPLATES["default"], {"marca": "Kia", "color": "azul", "patente": "X"})
+    second = split_template(VEHICLE_TEMPLATES["default"], {"marca": "Fíat", "color": "gris", "patente": "Y"})
+
+    assert [s.text for s in first if s.is_static] == [s.text for s in second if s.is_static]
+    assert sum(1 for s in first if s.is_static) == 3
+
+
+def test_only_variables_yields_single_dynamic_segment():
+    assert split_template("{nombre} {ubicacion}", {"nombre": "Ana", "ubicacion": "caja"}) == [
+        TemplateSegment("Ana caja", False),
+    ]
+
+
+def test_unknown_placeholder_kept_as_text():
+    segments = split_template("Llamado a {nombre} en {ubicacion} ahora mismo", {"nombre": "Ana"})
+
+    assert segments[-1] == TemplateSegment("en {ubicacion} ahora mismo", True)
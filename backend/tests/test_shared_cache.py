@@ -0,0 +1,149 @@
+"""
+Tests for the shared cache (app.services.cache) on the in-memory backend.
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.services.cache import MemoryBackend, SharedCache, TEMPLATES, VOICES
+
+pytestmark = pytest.mark.asyncio
+
+
+class FlakyBackend(MemoryBackend):
+    """MemoryBackend whose writes or reads can be made to fail"""
+
+    def __init__(self):
+        super().__init__()
+        self.fail_writes = False
+        self.fail_reads = False
+
+    async def incr(self, key):
+        if self.fail_writes:
+            raise ConnectionError("backend down")
+        return await super().incr(key)
+
+    async def get_many(self, keys):
+        if self.fail_reads:
+            raise ConnectionError("backend down")
+        return await super().get_many(keys)
+
+
+def _counting_loader(value="v", delay=0.01):
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return value
+
+    return load, calls
+
+
+async def test_tag_invalidation_reloads():
+    cache = SharedCache(MemoryBackend())
+    load, calls = _counting_loader({"name": "Uno"})
+
+    assert await cache.get_or_load("k", load, tags=(VOICES,)) == {"name": "Uno"}
+    assert await cache.get_or_load("k", load, tags=(VOICES,)) == {"name": "Uno"}
+    assert len(calls) == 1
+
+    await cache.invalidate(TEMPLATES)
+    await cache.get_or_load("k", load, tags=(VOICES,))
+    assert len(calls) == 1
+
+    await cache.invalidate(VOICES)
+    await cache.get_or_load("k", load, tags=(VOICES,))
+    assert len(calls) == 2
+
+
+async def test_concurrent_misses_load_once():
+    cache = SharedCache(MemoryBackend())
+    load, calls = _counting_loader()
+
+    results = await asyncio.gather(*[cache.get_or_load("k", load, tags=(VOICES,)) for _ in range(5)])
+
+    assert results == ["v"] * 5
+    assert len(calls) == 1
+
+
+async def test_load_racing_invalidation_is_not_served():
+    cache = SharedCache(MemoryBackend())
+
+    async def load_then_invalidate():
+        await cache.invalidate(VOICES)
+        return "stale"
+
+    assert await cache.get_or_load("k", load_then_invalidate, tags=(VOICES,)) == "stale"
+
+    load, calls = _counting_loader("fresh")
+    assert await cache.get_or_load("k", load, tags=(VOICES,)) == "fresh"
+    assert len(calls) == 1
+
+
+async def test_entries_expire():
+    cache = SharedCache(MemoryBackend())
+    load, calls = _counting_loader(delay=0)  # A frozen clock would stall timed sleeps
+
+    with patch("app.services.cache.backends.time.monotonic", return_value=1000.0):
+        await cache.get_or_load("k", load, tags=(), ttl=60)
+    with patch("app.services.cache.backends.time.monotonic", return_value=1061.0):
+        await cache.get_or_load("k", load, tags=(), ttl=60)
+
+    assert len(calls) == 2
+
+
+async def test_invalidation_reaches_other_workers():
+    backend = MemoryBackend()
+    worker_a, worker_b = SharedCache(backend), SharedCache(backend)
+    received = []
+    worker_b.subscribe(VOICES, received.append)
+    await worker_a.start()
+    await worker_b.start()
+    try:
+        await asyncio.sleep(0)
+        await worker_a.invalidate(VOICES)
+        for _ in range(5):
+            await asyncio.sleep(0)
+    finally:
+        await worker_a.stop()
+        await worker_b.stop()
+
+    # Only the other worker is notified
+    assert received == [["voices"]]
+
+
+async def test_failed_invalidation_bypasses_cache_until_retried(monkeypatch):
+    monkeypatch.setattr("app.services.cache.shared.RETRY_DELAYS", (0,))
+    backend = FlakyBackend()
+    cache = SharedCache(backend)
+    load, calls = _counting_loader(delay=0)
+    await cache.get_or_load("k", load, tags=(VOICES,))
+
+    backend.fail_writes = True
+    await cache.invalidate(VOICES)
+    await cache.get_or_load("k", load, tags=(VOICES,))
+    assert len(calls) == 2
+    assert cache.stats()["dirty_tags"] == ["voices"]
+
+    backend.fail_writes = False
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert cache.stats()["dirty_tags"] == []
+
+    # The retried invalidation made the old entry stale
+    await cache.get_or_load("k", load, tags=(VOICES,))
+    await cache.get_or_load("k", load, tags=(VOICES,))
+    assert len(calls) == 3
+
+
+async def test_backend_read_failure_falls_back_to_loader():
+    backend = FlakyBackend()
+    backend.fail_reads = True
+    cache = SharedCache(backend)
+    load, calls = _counting_loader(delay=0)
+
+    assert await cache.get_or_load("k", load, tags=(VOICES,)) == "v"
+    assert len(calls) == 1
+    assert cache.stats()["errors"] == 1
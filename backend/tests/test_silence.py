@@ -0,0 +1,63 @@
+"""
+Tests for vectorized TTS edge-silence trimming.
+"""
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+from app.services.audio.silence import (
+    KEEP_LEADING_MS, KEEP_TRAILING_MS, audible_bounds, trim_file, trim_silence,
+)
+
+RATE = 44100
+
+
+def _take(lead_ms: int, speech_ms: int, tail_ms: int) -> np.ndarray:
+    t = np.arange(RATE * speech_ms // 1000) / RATE
+    speech = (np.sin(2 * np.pi * 180 * t) * 8000).astype(np.int16)
+    mono = np.concatenate([
+        np.zeros(RATE * lead_ms // 1000, dtype=np.int16),
+        speech,
+        np.zeros(RATE * tail_ms // 1000, dtype=np.int16),
+    ])
+    return np.stack([mono, mono], axis=1).reshape(-1)     # interleaved stereo
+
+
+def test_audible_bounds_on_interleaved_pcm():
+    bounds = audible_bounds(_take(300, 1200, 500), RATE, 2, 32768)
+
+    assert bounds == (300, 1500)
+
+
+def test_silent_pcm_has_no_bounds():
+    assert audible_bounds(np.zeros(RATE * 2, dtype=np.int16), RATE, 2, 32768) is None
+
+
+def test_trim_keeps_fixed_margins():
+    pcm = _take(420, 1000, 800)
+    audio = AudioSegment(pcm.tobytes(), frame_rate=RATE, sample_width=2, channels=2)
+
+    trimmed = trim_silence(audio)
+
+    assert len(trimmed) == pytest.approx(1000 + KEEP_LEADING_MS + KEEP_TRAILING_MS, abs=10)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not shutil.which("ffmpeg"), reason="ffmpeg not installed")
+async def test_trim_file_cuts_without_reencoding(tmp_path):
+    path = tmp_path / "take.mp3"
+    subprocess.run([
+        "ffmpeg", "-v", "error",
+        "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono:d=0.5",
+        "-f", "lavfi", "-i", "sine=f=300:r=44100:d=1",
+        "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono:d=0.8",
+        "-filter_complex", "concat=n=3:v=0:a=1", "-b:a", "128k", str(path),
+    ], check=True)
+
+    assert await trim_file(str(path))
+
+    trimmed = AudioSegment.from_file(path)
+    assert len(trimmed) == pytest.approx(1000 + KEEP_LEADING_MS + KEEP_TRAILING_MS, abs=80)
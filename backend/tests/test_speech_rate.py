@@ -0,0 +1,44 @@
+"""
+Tests for the per-voice speech rate model.
+"""
+import pytest
+
+from app.services.tts.speech_rate import (
+    DEFAULT_CHARS_PER_SECOND, VoiceRate, fit_rate, trim_to_duration,
+)
+
+
+def test_fit_uses_median_and_normalizes_speed():
+    # 12 chars/s at speed 1.0, one take at speed 1.2, one outlier
+    observations = [(120, 10.0, 1.0)] * 14 + [(144, 10.0, 1.2), (120, 2.0, 1.0)]
+
+    rate = fit_rate(observations)
+
+    assert rate.samples == 16
+    assert rate.chars_per_second == pytest.approx(
+        (16 * 12.0 + 5 * DEFAULT_CHARS_PER_SECOND) / 21, abs=1e-3
+    )
+
+
+def test_without_history_falls_back_to_default():
+    rate = fit_rate([(10, 1.0, 1.0)])      # too short to count
+
+    assert rate == VoiceRate(DEFAULT_CHARS_PER_SECOND, 0)
+
+
+def test_prediction_and_word_limits_follow_rate():
+    slow = VoiceRate(10.0, 50)
+
+    assert slow.predict("x" * 100) == pytest.approx(10.0)
+    assert slow.predict("x" * 100, speed=1.25) == pytest.approx(8.0)
+    assert slow.word_limits(12) == (15, 20)
+    assert slow.word_limit_table([12, 24]) == {12: {"min": 15, "max": 20}, 24: {"min": 30, "max": 40}}
+
+
+def test_trim_drops_trailing_sentences_only():
+    rate = VoiceRate(10.0, 50)
+    text = "Primera frase de prueba. Segunda frase aqui. Tercera frase final."
+
+    assert trim_to_duration(text, 5.0, rate) == "Primera frase de prueba. Segunda frase aqui."
+    assert trim_to_duration(text, 1.0, rate) == "Primera frase de prueba."
+    assert trim_to_duration(text, 60.0, rate) == text
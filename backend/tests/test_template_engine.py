@@ -0,0 +1,59 @@
+"""
+Tests for compiled MessageTemplate rendering.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.services.text import text_normalizer
+from app.services.text.normalizer import VEHICLE_TEMPLATES
+from app.services.text.templates import CompiledTemplate, TemplateCache, compile_template
+
+
+def test_parse_parts_and_variables():
+    compiled = compile_template("Llamado a {nombre} en {ubicacion}. {nombre}, gracias")
+    assert compiled.variables == ("nombre", "ubicacion")
+    assert [part.name for part in compiled.parts] == [None, "nombre", None, "ubicacion", None, "nombre", None]
+
+
+def test_render_keeps_missing_placeholders():
+    compiled = compile_template("{nombre} a {ubicacion:raw}")
+    assert compiled.render({"nombre": "Ana"}) == "Ana a {ubicacion:raw}"
+    assert compiled.missing({"nombre": "Ana"}) == ["ubicacion"]
+
+
+def test_render_matches_str_format():
+    values = {"marca": "Toyota", "color": "rojo", "patente": "BBCL-45"}
+    for template_text in VEHICLE_TEMPLATES.values():
+        assert compile_template(template_text).render(values) == template_text.format(**values)
+
+
+def test_render_applies_hints_in_one_pass():
+    compiled = compile_template("{marca} patente {patente}, {cantidad:number} autos")
+    rendered = compiled.render(
+        {"marca": "Hyundai", "patente": "BBCL-45", "cantidad": "21"}, normalizer=text_normalizer
+    )
+    assert rendered == (
+        f"Hyundai patente {text_normalizer.normalize_plate('BBCL-45')}, veintiuno autos"
+    )
+
+
+def test_unknown_hint_is_reported():
+    compiled = CompiledTemplate("{nombre:shout}")
+    assert compiled.invalid_hints == ("shout",)
+    assert compiled.render({"nombre": "Ana"}, normalizer=text_normalizer) == "Ana"
+
+
+def test_render_many():
+    compiled = compile_template("{nombre} a caja")
+    assert compiled.render_many([{"nombre": "Ana"}, {"nombre": "Luis"}]) == ["Ana a caja", "Luis a caja"]
+
+
+def test_cache_recompiles_on_update():
+    cache = TemplateCache()
+    template = SimpleNamespace(id="t", template_text="Hola {nombre}", updated_at=datetime(2026, 1, 1))
+    first = cache.get(template)
+    assert cache.get(template) is first
+
+    template.template_text = "Chao {nombre}"
+    template.updated_at = datetime(2026, 1, 2)
+    assert cache.get(template).render({"nombre": "Ana"}) == "Chao Ana"
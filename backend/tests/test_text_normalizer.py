@@ -0,0 +1,64 @@
+"""
+Tests for the single-pass text normalizer.
+"""
+import pytest
+
+from app.services.text.normalizer import int_to_words, text_normalizer
+
+
+@pytest.mark.parametrize("number,words", [
+    (21, "veintiuno"),
+    (101, "ciento uno"),
+    (21000, "veintiun mil"),
+    (2500000, "dos millones quinientos mil"),
+    (1000000000, "mil millones"),
+])
+def test_int_to_words_any_size(number, words):
+    assert int_to_words(number) == words
+    assert text_normalizer.number_to_words(number) == words
+
+
+def test_normalize_text_single_pass():
+    text = "Oferta $12.990 hasta las 14:30 del 15/03/2025, 30% en TV"
+    assert text_normalizer.normalize_text(text) == (
+        "Oferta doce mil novecientos noventa pesos hasta las catorce treinta "
+        "del quince de marzo de dos mil veinticinco, treinta por ciento en te ve"
+    )
+
+
+def test_normalize_text_prices_and_times():
+    assert text_normalizer.normalize_text("$1.000.000") == "un millon de pesos"
+    assert text_normalizer.normalize_text("a las 9:05") == "a las nueve cero cinco"
+    assert text_normalizer.normalize_text("a las 18:00") == "a las dieciocho"
+
+
+def test_decimals_keep_leading_zeros():
+    assert text_normalizer.normalize_text("1,05") == "uno coma cero cinco"
+    assert text_normalizer.normalize_text("1,5") == "uno coma cinco"
+
+
+def test_bare_day_month_needs_date_context():
+    assert text_normalizer.normalize_text("1/2 kilo") == "medio kilo"
+    assert text_normalizer.normalize_text("3/4 de litro") == "tres cuartos de litro"
+    assert text_normalizer.normalize_text("hasta el 1/2") == "hasta el primero de febrero"
+    assert text_normalizer.normalize_text("1/2/2026") == "primero de febrero de dos mil veintiseis"
+
+
+def test_normalize_text_plate_uses_plate_reading():
+    assert text_normalizer.normalize_text("BBCL-45") == text_normalizer.normalize_plate("BBCL-45")
+
+
+def test_normalize_batch_keeps_order():
+    assert text_normalizer.normalize_batch(["10", "1.500", "10"]) == [
+        "diez", "mil quinientos", "diez",
+    ]
+
+
+@pytest.mark.parametrize("written", ["JKKJ32", "JK-KJ-32", "JK.KJ.32", "JK KJ 32", "jkkj-32"])
+def test_replace_plate_any_separators(written):
+    text = f"Vehiculo {written} mal estacionado"
+    assert text_normalizer.replace_plate(text, "JK,KJ32", "<P>") == "Vehiculo <P> mal estacionado"
+
+
+def test_replace_plate_respects_boundaries():
+    assert text_normalizer.replace_plate("XJKKJ32", "JKKJ32", "<P>") == "XJKKJ32"
@@ -88,7 +88,8 @@ async def test_tool_generate_audio(db_session, executor):
     ), patch(
         f"{GEN}.AudioSegment"
     ) as mock_pydub, patch(
-        f"{GEN}.os.makedirs",
+        f"{GEN}.audio_storage.write_bytes",
+        side_effect=lambda filename, data: f"/tmp/mediaflow-test/storage/audio/{filename}",
     ), patch(
         f"{GEN}.os.path.getsize",
         return_value=504,
@@ -141,7 +142,8 @@ async def test_tool_generate_audio_default_voice(db_session, executor):
     ), patch(
         f"{GEN}.AudioSegment"
     ) as mock_pydub, patch(
-        f"{GEN}.os.makedirs",
+        f"{GEN}.audio_storage.write_bytes",
+        side_effect=lambda filename, data: f"/tmp/mediaflow-test/storage/audio/{filename}",
     ), patch(
         f"{GEN}.os.path.getsize",
         return_value=100,
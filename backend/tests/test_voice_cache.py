@@ -0,0 +1,116 @@
+"""
+Tests for the versioned voice settings cache (app.services.tts.voice_cache).
+"""
+import pytest
+from unittest.mock import patch
+
+from sqlalchemy import update
+
+from app.models.voice_settings import VoiceSettings
+from app.services.tts.voice_cache import VoiceCache, VoiceSnapshot
+from app.services.tts import voice_cache
+
+from tests.conftest import make_voice
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_get_returns_snapshot_and_caches(db_session):
+    """First read hits the DB, second read is served from memory."""
+    db_session.add(make_voice(id="v1", name="Uno"))
+    await db_session.flush()
+
+    cache = VoiceCache()
+    first = await cache.get("v1", db_session)
+    assert isinstance(first, VoiceSnapshot)
+    assert first.name == "Uno"
+
+    with patch.object(db_session, "execute", side_effect=AssertionError("DB hit")):
+        second = await cache.get("v1", db_session)
+
+    assert second is first
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+async def test_get_missing_voice_returns_none(db_session):
+    cache = VoiceCache()
+    assert await cache.get("nope", db_session) is None
+    assert cache.stats()["entries"] == 0
+
+
+async def test_invalidate_reloads_changed_voice(db_session):
+    db_session.add(make_voice(id="v1", name="Uno"))
+    await db_session.flush()
+
+    cache = VoiceCache()
+    await cache.get("v1", db_session)
+
+    await db_session.execute(
+        update(VoiceSettings).where(VoiceSettings.id == "v1").values(name="Renamed")
+    )
+    await db_session.flush()
+    db_session.expire_all()
+
+    assert (await cache.get("v1", db_session)).name == "Uno"
+    cache.invalidate("v1")
+    assert (await cache.get("v1", db_session)).name == "Renamed"
+
+
+async def test_read_racing_invalidation_is_not_stored(db_session):
+    """A load that started before an invalidation must not populate the cache."""
+    db_session.add(make_voice(id="v1"))
+    await db_session.flush()
+
+    cache = VoiceCache()
+    original_execute = db_session.execute
+
+    async def execute_then_invalidate(*args, **kwargs):
+        result = await original_execute(*args, **kwargs)
+        cache.invalidate("v1")
+        return result
+
+    with patch.object(db_session, "execute", side_effect=execute_then_invalidate):
+        assert await cache.get("v1", db_session) is not None
+
+    assert cache.stats()["entries"] == 0
+
+
+async def test_default_voice_falls_back_to_first_active(db_session):
+    second = make_voice(id="second", name="Second")
+    second.order = 2
+    first = make_voice(id="first", name="First")
+    first.order = 1
+    db_session.add_all([second, first, make_voice(id="off", active=False)])
+    await db_session.flush()
+
+    cache = VoiceCache()
+    default = await cache.get_default(db_session)
+    assert default.id == "first"
+
+
+async def test_default_voice_prefers_is_default(db_session):
+    db_session.add_all([
+        make_voice(id="a"),
+        make_voice(id="b", is_default=True),
+    ])
+    await db_session.flush()
+
+    cache = VoiceCache()
+    assert (await cache.get_default(db_session)).id == "b"
+
+
+async def test_update_endpoint_invalidates_shared_cache(client):
+    factory = client._test_session_factory
+    async with factory() as session:
+        session.add(make_voice(id="v1", name="Uno"))
+        await session.commit()
+
+    async with factory() as session:
+        assert (await voice_cache.get("v1", session)).name == "Uno"
+
+    resp = await client.patch("/api/v1/settings/voices/v1", json={"name": "Dos"})
+    assert resp.status_code == 200
+
+    async with factory() as session:
+        assert (await voice_cache.get("v1", session)).name == "Dos"
@@ -107,6 +107,21 @@ export const apiClient = {
   async delete<T = void>(url: string, config?: any): Promise<T> {
     const response = await axiosInstance.delete<T>(url, config)
     return response.data
+  },
+
+  /**
+   * GET every item of a cursor-paginated list, following next_cursor until null
+   */
+  async getAllPages<T>(url: string, params: URLSearchParams, key: string = 'data'): Promise<T[]> {
+    const items: T[] = []
+    let cursor: string | null = null
+    do {
+      if (cursor) params.set('cursor', cursor)
+      const page: Record<string, any> = await apiClient.get(`${url}?${params.toString()}`)
+      items.push(...(page[key] as T[]))
+      cursor = page.next_cursor ?? null
+    } while (cursor)
+    return items
   }
 }
 
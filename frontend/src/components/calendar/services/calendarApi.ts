@@ -5,7 +5,7 @@ const BASE_URL = '/api/v1'
 
 export const calendarApi = {
   /**
-   * Get all schedules with optional filters
+   * Get all schedules with optional filters (follows the list's cursor pages)
    */
   async getSchedules(filters: Partial<CalendarFilters> = {}): Promise<{ success: boolean; data: Schedule[]; total: number }> {
     const params = new URLSearchParams()
@@ -16,11 +16,11 @@ export const calendarApi = {
     if (filters.schedule_type) {
       params.append('schedule_type', filters.schedule_type)
     }
+    params.append('limit', '500')
+    params.append('count', 'none')
 
-    const queryString = params.toString()
-    const url = `${BASE_URL}/schedules${queryString ? `?${queryString}` : ''}`
-
-    return apiClient.get(url)
+    const schedules = await apiClient.getAllPages<Schedule>(`${BASE_URL}/schedules`, params)
+    return { success: true, data: schedules, total: schedules.length }
   },
 
   /**
@@ -55,7 +55,13 @@ export const calendarApi = {
    * Get schedules for a specific audio message
    */
   async getSchedulesForAudio(audioMessageId: number): Promise<{ success: boolean; data: Schedule[]; total: number }> {
-    return apiClient.get(`${BASE_URL}/schedules?audio_message_id=${audioMessageId}`)
+    const params = new URLSearchParams({
+      audio_message_id: String(audioMessageId),
+      limit: '500',
+      count: 'none'
+    })
+    const schedules = await apiClient.getAllPages<Schedule>(`${BASE_URL}/schedules`, params)
+    return { success: true, data: schedules, total: schedules.length }
   },
 
   /**
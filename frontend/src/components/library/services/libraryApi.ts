@@ -11,9 +11,14 @@ const BASE_URL = '/api/v1'
 
 export const libraryApi = {
   /**
-   * Get paginated list of messages with filters
+   * Get one page of messages with filters.
+   * Pass the previous page's next_cursor for later pages; only the first
+   * page asks for a (capped) total.
    */
-  async getMessages(filters: Partial<LibraryFilters> = {}): Promise<LibraryPaginatedResponse> {
+  async getMessages(
+    filters: Partial<LibraryFilters> = {},
+    cursor: string | null = null
+  ): Promise<LibraryPaginatedResponse> {
     const params = new URLSearchParams()
 
     if (filters.search) params.append('search', filters.search)
@@ -23,8 +28,9 @@ export const libraryApi = {
     }
     if (filters.sort_by) params.append('sort_by', filters.sort_by)
     if (filters.sort_order) params.append('sort_order', filters.sort_order)
-    if (filters.page) params.append('page', String(filters.page))
     if (filters.per_page) params.append('per_page', String(filters.per_page))
+    if (cursor) params.append('cursor', cursor)
+    params.append('count', cursor ? 'none' : 'approximate')
 
     const queryString = params.toString()
     const url = `${BASE_URL}/library${queryString ? `?${queryString}` : ''}`
@@ -123,13 +129,12 @@ export const libraryApi = {
   },
 
   /**
-   * Get schedules for a message
+   * Get schedules for a message (follows the list's cursor pages)
    */
   async getSchedules(audioMessageId?: number): Promise<Schedule[]> {
-    const url = audioMessageId
-      ? `${BASE_URL}/schedules?audio_message_id=${audioMessageId}`
-      : `${BASE_URL}/schedules`
-    return apiClient.get<Schedule[]>(url)
+    const params = new URLSearchParams({ limit: '500', count: 'none' })
+    if (audioMessageId) params.append('audio_message_id', String(audioMessageId))
+    return apiClient.getAllPages<Schedule>(`${BASE_URL}/schedules`, params)
   },
 
   /**
@@ -11,7 +11,12 @@ export const useLibraryStore = defineStore('library', () => {
   const isLoading = ref(false)
   const error = ref<string | null>(null)
   const total = ref(0)
+  const totalIsEstimate = ref(false)
   const currentPage = ref(1)
+  // Cursor of each visited page (index 0 = first page); keyset pages cost
+  // the same at any depth, and only the first page counts rows
+  const cursors = ref<(string | null)[]>([null])
+  const nextCursor = ref<string | null>(null)
   const perPage = ref(20)
   const viewMode = ref<ViewMode>('grid')
 
@@ -27,7 +32,7 @@ export const useLibraryStore = defineStore('library', () => {
 
   // Computed
   const totalPages = computed(() => Math.ceil(total.value / perPage.value))
-  const hasNextPage = computed(() => currentPage.value < totalPages.value)
+  const hasNextPage = computed(() => nextCursor.value !== null)
   const hasPrevPage = computed(() => currentPage.value > 1)
   const isEmpty = computed(() => messages.value.length === 0 && !isLoading.value)
 
@@ -37,10 +42,17 @@ export const useLibraryStore = defineStore('library', () => {
     error.value = null
 
     try {
-      const response = await libraryApi.getMessages(filters.value)
+      const response = await libraryApi.getMessages(
+        filters.value,
+        cursors.value[filters.value.page - 1] ?? null
+      )
       messages.value = response.messages
-      total.value = response.total
-      currentPage.value = response.page
+      nextCursor.value = response.next_cursor
+      if (response.total !== null) {
+        total.value = response.total
+        totalIsEstimate.value = response.total_is_estimate
+      }
+      currentPage.value = filters.value.page
     } catch (err: any) {
       error.value = err.message || 'Error loading messages'
       console.error('[LibraryStore] fetchMessages error:', err)
@@ -129,15 +141,21 @@ export const useLibraryStore = defineStore('library', () => {
     }
   }
 
+  function resetPages() {
+    filters.value.page = 1
+    cursors.value = [null]
+    nextCursor.value = null
+  }
+
   function setFilter<K extends keyof LibraryFilters>(key: K, value: LibraryFilters[K]) {
     filters.value[key] = value
-    filters.value.page = 1 // Reset page on filter change
+    resetPages() // Reset page on filter change
     fetchMessages()
   }
 
   function setFilters(newFilters: Partial<LibraryFilters>) {
     Object.assign(filters.value, newFilters)
-    filters.value.page = 1
+    resetPages()
     fetchMessages()
   }
 
@@ -151,11 +169,13 @@ export const useLibraryStore = defineStore('library', () => {
       page: 1,
       per_page: 20
     }
+    resetPages()
     fetchMessages()
   }
 
   function nextPage() {
     if (hasNextPage.value) {
+      cursors.value[filters.value.page] = nextCursor.value
       filters.value.page++
       fetchMessages()
     }
@@ -168,8 +188,9 @@ export const useLibraryStore = defineStore('library', () => {
     }
   }
 
+  // Only pages already visited have a cursor
   function goToPage(page: number) {
-    if (page >= 1 && page <= totalPages.value) {
+    if (page >= 1 && page <= cursors.value.length) {
       filters.value.page = page
       fetchMessages()
     }
@@ -196,6 +217,7 @@ export const useLibraryStore = defineStore('library', () => {
     isLoading,
     error,
     total,
+    totalIsEstimate,
     currentPage,
     perPage,
     filters,
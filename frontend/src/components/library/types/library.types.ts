@@ -13,10 +13,12 @@ export interface LibraryFilters {
 
 export interface LibraryPaginatedResponse {
   messages: import('@/types/audio').AudioMessage[]
-  total: number
+  total: number | null          // null when count=none (later pages)
+  total_is_estimate: boolean
   page: number
   per_page: number
-  total_pages: number
+  total_pages: number | null
+  next_cursor: string | null    // null on the last page
 }
 
 export interface Schedule {
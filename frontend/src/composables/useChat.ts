@@ -5,7 +5,7 @@
  */
 import { ref, computed } from 'vue'
 import { apiClient } from '@/api/client'
-import type { ChatMessage, ChatConversation, SSEEvent } from '@/types/chat'
+import type { ChatMessage, ChatConversation, ChatConversationPage, SSEEvent } from '@/types/chat'
 
 // ─── Shared state (module-level singleton) ───
 const messages = ref<ChatMessage[]>([])
@@ -169,7 +169,8 @@ export function useChat() {
   async function loadConversations() {
     try {
       isLoading.value = true
-      conversations.value = await apiClient.get<ChatConversation[]>('/api/v1/chat/conversations')
+      const page = await apiClient.get<ChatConversationPage>('/api/v1/chat/conversations')
+      conversations.value = page.conversations
     } catch (e) {
       console.error('Failed to load conversations:', e)
     } finally {
@@ -11,6 +11,11 @@ export interface ChatConversation {
   updated_at: string
 }
 
+export interface ChatConversationPage {
+  conversations: ChatConversation[]
+  next_cursor: string | null  // null on the last page
+}
+
 export interface ChatMessage {
   id: string | number
   role: 'user' | 'assistant'